@@ -0,0 +1,55 @@
+class AgrupadorEventos:
+    """
+    Assinante que acumula eventos de alteração e os entrega em lote.
+
+    Eventos do mesmo campo da mesma tarefa são combinados (fica o primeiro valor anterior
+    e o último valor novo); combinações que voltam ao valor original são descartadas.
+    Assim, um painel que recebe o lote só processa o estado final de cada campo.
+
+    Uso:
+        agrupador = AgrupadorEventos(lambda eventos: print(len(eventos)))
+        trilha.assinar(agrupador)
+        with agrupador:
+            ... várias alterações ...
+        # ao sair do bloco, o destino recebe a lista combinada
+    """
+
+    def __init__(self, destino=None):
+        """
+        Parâmetros:
+            destino: função chamada com a lista de eventos em descarregar() (opcional).
+        """
+        self.__destino = destino
+        # (id(tarefa), campo) -> evento combinado, na ordem da primeira ocorrência.
+        self.__pendentes = {}
+
+    def __call__(self, evento):
+        """Recebe um evento (é assim que Aula, Curso e Trilha entregam os eventos)."""
+        chave = (id(evento.tarefa), evento.campo)
+        anterior = self.__pendentes.get(chave)
+        self.__pendentes[chave] = evento if anterior is None else anterior.combinar(evento)
+
+    @property
+    def quantidade_pendente(self):
+        return len(self.__pendentes)
+
+    def descarregar(self):
+        """
+        Entrega os eventos combinados ao destino (se houver) e os retorna.
+        Eventos sem mudança líquida (valor novo igual ao anterior) são descartados.
+        """
+        eventos = [
+            evento for evento in self.__pendentes.values()
+            if evento.valor_novo != evento.valor_anterior
+        ]
+        self.__pendentes.clear()
+
+        if self.__destino is not None and eventos:
+            self.__destino(eventos)
+        return eventos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.descarregar()
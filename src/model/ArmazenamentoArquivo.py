@@ -0,0 +1,151 @@
+import json
+import os
+import threading
+from .ArmazenamentoTrilha import ArmazenamentoTrilha
+
+
+class ArmazenamentoArquivo(ArmazenamentoTrilha):
+    """
+    Armazenamento em uma pasta:
+        trilha.json          → nome, cursos e os resumos das aulas de cada curso
+        aulas/<chave>.jsonl  → tarefas de uma aula (um registro do SerializadorTrilha por linha)
+
+    trilha.json é pequeno (sem tarefas) e fica em memória; o arquivo de uma aula só é
+    lido quando as tarefas dela são usadas. As escritas vão para um arquivo temporário
+    e substituem o original de uma vez (os.replace), então uma falha no meio não
+    deixa arquivos pela metade.
+    """
+
+    ESTRUTURA = "trilha.json"
+    PASTA_AULAS = "aulas"
+
+    def __init__(self, pasta):
+        self.__pasta = pasta
+        os.makedirs(os.path.join(pasta, ArmazenamentoArquivo.PASTA_AULAS), exist_ok=True)
+        self.__trava = threading.Lock()
+
+        caminho = os.path.join(pasta, ArmazenamentoArquivo.ESTRUTURA)
+        if os.path.exists(caminho):
+            with open(caminho, "r", encoding="utf-8") as arquivo:
+                self.__estrutura = json.load(arquivo)
+        else:
+            self.__estrutura = {"nome": None, "proxima_chave": 1, "cursos": []}
+        # chave da aula -> resumo {"chave", "titulo", "quantidade", "progresso"} dentro da estrutura.
+        self.__aulas = {
+            aula["chave"]: aula for curso in self.__estrutura["cursos"] for aula in curso["aulas"]
+        }
+        self.__estrutura_alterada = False
+
+    @property
+    def pasta(self):
+        return self.__pasta
+
+    # --- leitura ---
+
+    def ler_trilha(self):
+        with self.__trava:
+            if self.__estrutura["nome"] is None:
+                return None
+            cursos = [
+                (
+                    curso["chave"],
+                    curso["titulo"],
+                    curso["carga_horas"],
+                    len(curso["aulas"]),
+                    sum(aula["progresso"] for aula in curso["aulas"]),
+                )
+                for curso in self.__estrutura["cursos"]
+            ]
+            return self.__estrutura["nome"], cursos
+
+    def ler_aulas(self, chave_curso):
+        with self.__trava:
+            for curso in self.__estrutura["cursos"]:
+                if curso["chave"] == chave_curso:
+                    return [
+                        (aula["chave"], aula["titulo"], aula["quantidade"], aula["progresso"])
+                        for aula in curso["aulas"]
+                    ]
+        return []
+
+    def ler_tarefas(self, chave_aula):
+        caminho = self.__caminho_aula(chave_aula)
+        if not os.path.exists(caminho):
+            return []
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            return [json.loads(linha) for linha in arquivo if linha.strip()]
+
+    # --- gravação ---
+
+    def nova_chave(self):
+        with self.__trava:
+            chave = self.__estrutura["proxima_chave"]
+            self.__estrutura["proxima_chave"] = chave + 1
+            self.__estrutura_alterada = True
+            return chave
+
+    def gravar_tarefas(self, chave_aula, registros, progresso):
+        linhas = "".join(json.dumps(registro, ensure_ascii=False) + "\n" for registro in registros)
+        ArmazenamentoArquivo.__substituir(self.__caminho_aula(chave_aula), linhas)
+
+        with self.__trava:
+            resumo = self.__aulas.get(chave_aula)
+            if resumo is not None:
+                resumo["quantidade"] = len(registros)
+                resumo["progresso"] = progresso
+                self.__estrutura_alterada = True
+
+    def gravar_estrutura(self, nome, cursos):
+        with self.__trava:
+            aulas_anteriores = {
+                curso["chave"]: curso["aulas"] for curso in self.__estrutura["cursos"]
+            }
+            novos_cursos = []
+            for chave, titulo, carga_horas, aulas in cursos:
+                if aulas is None:
+                    resumos = aulas_anteriores.get(chave, [])
+                else:
+                    resumos = [
+                        {"chave": chave_aula, "titulo": titulo_aula, "quantidade": quantidade, "progresso": progresso}
+                        for chave_aula, titulo_aula, quantidade, progresso in aulas
+                    ]
+                novos_cursos.append(
+                    {"chave": chave, "titulo": titulo, "carga_horas": carga_horas, "aulas": resumos}
+                )
+
+            removidas = set(self.__aulas)
+            self.__estrutura["nome"] = nome
+            self.__estrutura["cursos"] = novos_cursos
+            self.__aulas = {aula["chave"]: aula for curso in novos_cursos for aula in curso["aulas"]}
+            removidas.difference_update(self.__aulas)
+            self.__estrutura_alterada = True
+
+        for chave_aula in removidas:
+            caminho = self.__caminho_aula(chave_aula)
+            if os.path.exists(caminho):
+                os.remove(caminho)
+
+    def confirmar(self):
+        with self.__trava:
+            if not self.__estrutura_alterada:
+                return
+            conteudo = json.dumps(self.__estrutura, ensure_ascii=False)
+            self.__estrutura_alterada = False
+        ArmazenamentoArquivo.__substituir(
+            os.path.join(self.__pasta, ArmazenamentoArquivo.ESTRUTURA), conteudo
+        )
+
+    def fechar(self):
+        self.confirmar()
+
+    # --- auxiliares ---
+
+    def __caminho_aula(self, chave_aula):
+        return os.path.join(self.__pasta, ArmazenamentoArquivo.PASTA_AULAS, f"{chave_aula}.jsonl")
+
+    @staticmethod
+    def __substituir(caminho, conteudo):
+        temporario = caminho + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+        os.replace(temporario, caminho)
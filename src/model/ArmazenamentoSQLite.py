@@ -0,0 +1,152 @@
+import json
+import sqlite3
+import threading
+from .ArmazenamentoTrilha import ArmazenamentoTrilha
+
+
+class ArmazenamentoSQLite(ArmazenamentoTrilha):
+    """
+    Armazenamento em um banco SQLite (um arquivo, ou ":memory:").
+
+    Tabelas:
+        trilha  (nome, próxima chave)
+        cursos  (chave, posição, título, carga_horas)
+        aulas   (chave, curso, posição, título, quantidade, progresso)  → resumo da aula
+        tarefas (aula, posição, registro JSON)
+
+    O resumo de cada curso (quantidade de aulas e soma dos progressos) sai de uma
+    única consulta agrupada sobre "aulas", sem tocar na tabela de tarefas.
+    A conexão é compartilhada entre threads, protegida por uma trava.
+    """
+
+    def __init__(self, caminho):
+        self.__caminho = caminho
+        self.__conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.__trava = threading.Lock()
+        with self.__trava:
+            self.__conexao.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS trilha (
+                    id INTEGER PRIMARY KEY CHECK (id = 1), nome TEXT, proxima_chave INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS cursos (
+                    chave INTEGER PRIMARY KEY, posicao INTEGER, titulo TEXT, carga_horas INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS aulas (
+                    chave INTEGER PRIMARY KEY, curso INTEGER, posicao INTEGER, titulo TEXT,
+                    quantidade INTEGER, progresso REAL
+                );
+                CREATE INDEX IF NOT EXISTS aulas_por_curso ON aulas (curso, posicao);
+                CREATE TABLE IF NOT EXISTS tarefas (
+                    aula INTEGER, posicao INTEGER, registro TEXT, PRIMARY KEY (aula, posicao)
+                );
+                INSERT OR IGNORE INTO trilha (id, nome, proxima_chave) VALUES (1, NULL, 1);
+                """
+            )
+            self.__conexao.commit()
+
+    @property
+    def caminho(self):
+        return self.__caminho
+
+    # --- leitura ---
+
+    def ler_trilha(self):
+        with self.__trava:
+            nome = self.__conexao.execute("SELECT nome FROM trilha WHERE id = 1").fetchone()[0]
+            if nome is None:
+                return None
+            cursos = self.__conexao.execute(
+                """
+                SELECT c.chave, c.titulo, c.carga_horas, COUNT(a.chave), COALESCE(SUM(a.progresso), 0.0)
+                FROM cursos c LEFT JOIN aulas a ON a.curso = c.chave
+                GROUP BY c.chave ORDER BY c.posicao
+                """
+            ).fetchall()
+            return nome, cursos
+
+    def ler_aulas(self, chave_curso):
+        with self.__trava:
+            return self.__conexao.execute(
+                "SELECT chave, titulo, quantidade, progresso FROM aulas WHERE curso = ? ORDER BY posicao",
+                (chave_curso,),
+            ).fetchall()
+
+    def ler_tarefas(self, chave_aula):
+        with self.__trava:
+            linhas = self.__conexao.execute(
+                "SELECT registro FROM tarefas WHERE aula = ? ORDER BY posicao", (chave_aula,)
+            ).fetchall()
+        return [json.loads(registro) for (registro,) in linhas]
+
+    # --- gravação ---
+
+    def nova_chave(self):
+        with self.__trava:
+            chave = self.__conexao.execute("SELECT proxima_chave FROM trilha WHERE id = 1").fetchone()[0]
+            self.__conexao.execute("UPDATE trilha SET proxima_chave = ? WHERE id = 1", (chave + 1,))
+            return chave
+
+    def gravar_tarefas(self, chave_aula, registros, progresso):
+        linhas = [
+            (chave_aula, posicao, json.dumps(registro, ensure_ascii=False))
+            for posicao, registro in enumerate(registros)
+        ]
+        with self.__trava:
+            self.__conexao.execute("DELETE FROM tarefas WHERE aula = ?", (chave_aula,))
+            self.__conexao.executemany("INSERT INTO tarefas (aula, posicao, registro) VALUES (?, ?, ?)", linhas)
+            self.__conexao.execute(
+                "UPDATE aulas SET quantidade = ?, progresso = ? WHERE chave = ?",
+                (len(registros), progresso, chave_aula),
+            )
+
+    def gravar_estrutura(self, nome, cursos):
+        with self.__trava:
+            conexao = self.__conexao
+            conexao.execute("UPDATE trilha SET nome = ? WHERE id = 1", (nome,))
+
+            chaves_cursos = {chave for chave, _, _, _ in cursos}
+            listadas = {aula[0] for _, _, _, aulas in cursos if aulas is not None for aula in aulas}
+            # Cursos lidos: aulas que saíram (e não foram para outro curso) são apagadas.
+            lidos = [chave for chave, _, _, aulas in cursos if aulas is not None]
+            removidas = [
+                chave_aula
+                for chave_curso in lidos
+                for (chave_aula,) in conexao.execute("SELECT chave FROM aulas WHERE curso = ?", (chave_curso,))
+                if chave_aula not in listadas
+            ]
+            # Cursos que saíram da trilha levam as aulas junto.
+            for (chave_curso,) in conexao.execute("SELECT chave FROM cursos").fetchall():
+                if chave_curso not in chaves_cursos:
+                    removidas.extend(
+                        chave_aula
+                        for (chave_aula,) in conexao.execute("SELECT chave FROM aulas WHERE curso = ?", (chave_curso,))
+                        if chave_aula not in listadas
+                    )
+                    conexao.execute("DELETE FROM cursos WHERE chave = ?", (chave_curso,))
+            conexao.executemany("DELETE FROM tarefas WHERE aula = ?", [(chave,) for chave in removidas])
+            conexao.executemany("DELETE FROM aulas WHERE chave = ?", [(chave,) for chave in removidas])
+
+            for posicao, (chave, titulo, carga_horas, aulas) in enumerate(cursos):
+                conexao.execute(
+                    "INSERT OR REPLACE INTO cursos (chave, posicao, titulo, carga_horas) VALUES (?, ?, ?, ?)",
+                    (chave, posicao, titulo, carga_horas),
+                )
+                if aulas is not None:
+                    conexao.executemany(
+                        "INSERT OR REPLACE INTO aulas (chave, curso, posicao, titulo, quantidade, progresso) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (chave_aula, chave, posicao_aula, titulo_aula, quantidade, progresso)
+                            for posicao_aula, (chave_aula, titulo_aula, quantidade, progresso) in enumerate(aulas)
+                        ],
+                    )
+
+    def confirmar(self):
+        with self.__trava:
+            self.__conexao.commit()
+
+    def fechar(self):
+        with self.__trava:
+            self.__conexao.commit()
+            self.__conexao.close()
@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+
+
+class ArmazenamentoTrilha(ABC):
+    """
+    Onde o CarregadorTrilha guarda uma trilha para lê-la aos poucos.
+
+    O armazenamento conhece três níveis, identificados por chaves inteiras (nova_chave()):
+    - a trilha: nome e cursos em ordem (título e carga horária);
+    - as aulas de cada curso, com o resumo (quantidade de tarefas e progresso da aula);
+    - as tarefas de cada aula, como registros do SerializadorTrilha.
+
+    Com os resumos das aulas, o progresso de um curso sai sem ler nenhuma tarefa.
+    As gravações só ficam definitivas em confirmar().
+    """
+
+    # --- leitura ---
+
+    @abstractmethod
+    def ler_trilha(self):
+        """
+        Retorna (nome, cursos) ou None se o armazenamento está vazio. Cada curso é
+        (chave, título, carga_horas, quantidade de aulas, soma dos progressos das aulas).
+        """
+        pass
+
+    @abstractmethod
+    def ler_aulas(self, chave_curso):
+        """Retorna as aulas do curso, em ordem: (chave, título, quantidade de tarefas, progresso)."""
+        pass
+
+    @abstractmethod
+    def ler_tarefas(self, chave_aula):
+        """Retorna os registros das tarefas da aula, em ordem."""
+        pass
+
+    # --- gravação ---
+
+    @abstractmethod
+    def nova_chave(self):
+        """Retorna uma chave ainda não usada."""
+        pass
+
+    @abstractmethod
+    def gravar_tarefas(self, chave_aula, registros, progresso):
+        """Substitui as tarefas da aula e atualiza o resumo dela (quantidade e progresso)."""
+        pass
+
+    @abstractmethod
+    def gravar_estrutura(self, nome, cursos):
+        """
+        Substitui a estrutura da trilha. cursos é uma lista de
+        (chave, título, carga_horas, aulas), em que aulas é None (o curso não foi lido:
+        as aulas guardadas continuam as mesmas) ou a lista completa de
+        (chave, título, quantidade de tarefas, progresso).
+
+        Cursos e aulas que não aparecem mais são apagados com as suas tarefas.
+        """
+        pass
+
+    def confirmar(self):
+        """Torna definitivas as gravações feitas até aqui."""
+        pass
+
+    def fechar(self):
+        """Libera o arquivo/conexão."""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
+        return False
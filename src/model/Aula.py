@@ -1,8 +1,72 @@
+import math
+import weakref
+from contextlib import nullcontext
+from datetime import datetime
+from threading import RLock
+from .ConversorData import ConversorData
+from .TarefaComPrazo import TarefaComPrazo
+
+
 class Aula:
+    # Usado por "with aula.trava:" quando o modo concorrente está desligado.
+    _SEM_TRAVA = nullcontext()
+
     def __init__(self, titulo):
-# Chama o setter para aplicar as regras do título (strip, title e valor padrão).
+        # Tarefas da aula, na ordem de inclusão: id(tarefa) -> tarefa.
+        # O dicionário permite remover uma tarefa em O(1) sem perder a ordem das demais.
+        self.__tarefas = {}
+        # Tupla devolvida por "tarefas", montada na primeira leitura e reaproveitada até a
+        # próxima inclusão ou remoção (None = precisa montar de novo).
+        self.__tupla_tarefas = None
+
+        # Índice pela chave da tarefa (título, data de realização) -> tarefa,
+        # usado na busca e para rejeitar tarefas duplicadas.
+        self.__indice_chaves = {}
+        # Última chave conhecida de cada tarefa: id(tarefa) -> chave.
+        self.__chave_por_tarefa = {}
+
+        # Índices secundários por status e por tipo concreto de tarefa.
+        # Só são montados na primeira consulta (buscar_tarefas) e, a partir daí,
+        # mantidos a cada inclusão, remoção ou alteração de status.
+        # StatusTarefa -> {id(tarefa): tarefa} e classe -> {id(tarefa): tarefa}
+        self.__por_status = None
+        self.__por_tipo = None
+        # Último status conhecido de cada tarefa: id(tarefa) -> StatusTarefa.
+        self.__status_por_tarefa = None
+
+        # Cache do progresso: o último valor de cada tarefa e a soma deles.
+        # id(tarefa) -> último progresso
+        self.__progresso_por_tarefa = {}
+        # Soma refeita com math.fsum quando algo muda (None = refazer na próxima leitura):
+        # somar e subtrair diferenças acumularia erro de arredondamento a cada alteração.
+        self.__soma_progresso = 0.0
+        # Tarefas alteradas desde a última leitura do progresso (dirty flag por tarefa).
+        self.__tarefas_pendentes = {}
+        # Último progresso calculado (None = precisa recalcular). É um único atributo,
+        # então pode ser lido sem trava mesmo no modo concorrente.
+        self.__progresso_atual = None
+        # Objetos (ex.: Curso) avisados quando o progresso da aula pode ter mudado.
+        self.__observadores = []
+        # Funções que recebem os EventoAlteracao das tarefas da aula (criada no primeiro assinar).
+        self.__assinantes = None
+        # Trava do modo concorrente (None = desligado). Dentro de um Curso, é a trava do curso.
+        self.__trava = None
+
+        # Armazenamento (CarregadorTrilha) de onde as tarefas são lidas sob demanda.
+        # None = aula só em memória.
+        self.__carregador = None
+        self.__chave_armazenada = None
+        # (quantidade de tarefas, progresso) guardados enquanto as tarefas não estão em memória.
+        self.__resumo = None
+        # Houve alteração nas tarefas desde a última gravação no armazenamento.
+        self.__alterada = False
+        # Tarefas do último descarte que ainda existem fora da aula (alguém guardou a tarefa):
+        # posição gravada -> tarefa, por referência fraca. Voltam para a aula no lugar das
+        # lidas do armazenamento, para que não existam duas cópias da mesma tarefa.
+        self.__desligadas = None
+
+        # Chama o setter para aplicar as regras do título (strip, title e valor padrão).
         self.titulo = titulo
-        self.__tarefas = []
 
     # --- encapsulamento ---
 
@@ -13,24 +77,370 @@ class Aula:
     @titulo.setter
     def titulo(self, valor):
         self.__titulo = str(valor).strip().title() if valor else "Aula"
+        # O Curso indexa as aulas pelo título.
+        self.__notificar_observadores()
 
     @property
     def tarefas(self):
         """
-        Retorna a lista de tarefas associadas à aula.
-        A inclusão de novas tarefas deve ser feita pelo método adicionar_tarefa().
+        Retorna uma tupla (somente leitura) com as tarefas da aula, na ordem de inclusão.
+        A inclusão e a remoção devem ser feitas por adicionar_tarefa() e remover_tarefa().
+
+        A tupla é reaproveitada entre as leituras enquanto nenhuma tarefa entra ou sai,
+        então ler aula.tarefas várias vezes não copia as tarefas a cada vez.
+        Numa aula ligada a um armazenamento, as tarefas são lidas no primeiro acesso.
+        """
+        if self.__carregador is not None:
+            self.__acessar()
+        tarefas = self.__tupla_tarefas
+        if tarefas is None:
+            with self.trava:
+                tarefas = self.__tupla_tarefas = tuple(self.__tarefas.values())
+        return tarefas
+
+    @property
+    def quantidade_tarefas(self):
+        """Quantidade de tarefas da aula (sem ler as tarefas do armazenamento)."""
+        if self.__resumo is not None:
+            return self.__resumo[0]
+        return len(self.__tarefas)
+
+    # --- modo concorrente ---
+
+    def ativar_modo_concorrente(self, trava=None):
+        """
+        Protege a aula com uma trava (RLock) para uso por várias threads.
+
+        Leituras do progresso, buscas e a atualização dos caches/índices passam a
+        acontecer sob a trava. Alterações de tarefas feitas por outras threads devem
+        usar "with aula.trava:" para que ninguém leia uma tarefa alterada pela metade.
+
+        O Curso passa a própria trava para as suas aulas (uma trava por curso).
         """
-        return self.__tarefas
+        self.__trava = trava if trava is not None else RLock()
+
+    @property
+    def modo_concorrente(self):
+        return self.__trava is not None
+
+    @property
+    def trava(self):
+        """Trava da aula para usar com "with" (sem efeito se o modo concorrente estiver desligado)."""
+        return self.__trava if self.__trava is not None else Aula._SEM_TRAVA
 
     # --- operações de composição ---
 
-    def adicionar_tarefa(self, tarefa):
+    def adicionar_tarefa(self, tarefa, substituir=False, manter_duplicada=False):
         """
         Adiciona uma tarefa de estudo à aula.
         Espera um objeto de alguma subclasse de TarefaEstudo.
+
+        Uma tarefa duplicada (mesmo título e mesma data de realização de outra da aula)
+        gera ValueError. Com substituir=True, a tarefa existente é removida e a nova é
+        adicionada no lugar. Com manter_duplicada=True, as duas ficam na aula (a busca
+        continua encontrando a que já estava): é o estado de uma tarefa renomeada para
+        a chave de outra, e os leitores de arquivo usam para reconstruí-lo.
+
+        Retorna True se a tarefa foi adicionada e False se ela já estava na aula.
+        """
+        if tarefa is None:
+            return False
+        if self.__carregador is not None:
+            self.__acessar()
+
+        with self.trava:
+            if id(tarefa) in self.__tarefas:
+                return False
+
+            chave = tarefa.chave
+            existente = self.__indice_chaves.get(chave)
+            if existente is not None:
+                if substituir:
+                    self.remover_tarefa(existente)
+                elif not manter_duplicada:
+                    raise ValueError(
+                        f"A aula '{self.__titulo}' já tem a tarefa '{chave[0]}' com a mesma data "
+                        "de realização. Use substituir=True para trocá-la."
+                    )
+
+            progresso_tarefa = tarefa.progresso()
+            self.__tarefas[id(tarefa)] = tarefa
+            self.__tupla_tarefas = None
+            self.__indice_chaves.setdefault(chave, tarefa)
+            self.__chave_por_tarefa[id(tarefa)] = chave
+            self.__progresso_por_tarefa[id(tarefa)] = progresso_tarefa
+            self.__soma_progresso = None
+            self.__progresso_atual = None
+            self.__alterada = True
+            if self.__por_status is not None:
+                self.__indexar(tarefa)
+
+            # Passa a observar as alterações da tarefa (progresso e chave).
+            tarefa.registrar_observador(self)
+            self.__notificar_observadores()
+            return True
+
+    def remover_tarefa(self, tarefa):
+        """
+        Remove a tarefa da aula.
+        Aceita o próprio objeto ou uma tarefa igual (mesmo título e mesma data).
+
+        Retorna True se alguma tarefa foi removida.
+        """
+        if tarefa is None:
+            return False
+        if self.__carregador is not None:
+            self.__acessar()
+
+        with self.trava:
+            if id(tarefa) not in self.__tarefas:
+                tarefa = self.__indice_chaves.get(tarefa.chave)
+                if tarefa is None:
+                    return False
+
+            chave_tarefa = id(tarefa)
+            del self.__tarefas[chave_tarefa]
+            self.__tupla_tarefas = None
+            self.__tarefas_pendentes.pop(chave_tarefa, None)
+            del self.__progresso_por_tarefa[chave_tarefa]
+            self.__soma_progresso = None
+            self.__progresso_atual = None
+            self.__alterada = True
+
+            chave = self.__chave_por_tarefa.pop(chave_tarefa)
+            if self.__indice_chaves.get(chave) is tarefa:
+                del self.__indice_chaves[chave]
+                self.__reindexar_chave(chave)
+            if self.__por_status is not None:
+                self.__desindexar(tarefa)
+
+            tarefa.remover_observador(self)
+            self.__notificar_observadores()
+            return True
+
+    # --- busca ---
+
+    def buscar_tarefa(self, titulo, data_realizacao=None):
+        """
+        Retorna a tarefa com o título e a data de realização informados (ou None).
+        O título passa pelas mesmas regras do setter da tarefa; a data pode ser
+        um datetime ou uma string 'dd-mm-YYYY'.
+        """
+        titulo = str(titulo).strip().title() if titulo else "Tarefa"
+        if data_realizacao is not None and not isinstance(data_realizacao, datetime):
+            data_realizacao = ConversorData.converter_data(str(data_realizacao))
+        if self.__carregador is not None:
+            self.__acessar()
+
+        with self.trava:
+            return self.__indice_chaves.get((titulo, data_realizacao))
+
+    def tarefas_repetidas(self):
+        """
+        Tarefas com a mesma chave (título e data) de outra tarefa da aula, que a busca
+        não encontra (ex.: renomeadas para a chave de outra). Não lê as tarefas do
+        armazenamento; sem repetidas, custa O(1).
+        """
+        with self.trava:
+            if self.__resumo is not None or len(self.__tarefas) <= len(self.__indice_chaves):
+                return []
+            return [
+                tarefa for chave_tarefa, tarefa in self.__tarefas.items()
+                if self.__indice_chaves.get(self.__chave_por_tarefa[chave_tarefa]) is not tarefa
+            ]
+
+    def __contains__(self, tarefa):
+        """Permite usar 'tarefa in aula' (mesmo título e mesma data de realização)."""
+        if self.__carregador is not None:
+            self.__acessar()
+        return tarefa is not None and tarefa.chave in self.__indice_chaves
+
+    def buscar_tarefas(self, status=None, tipo=None):
+        """
+        Retorna a lista de tarefas com o status e/ou o tipo informados.
+
+        tipo é a classe concreta da tarefa (ex.: TarefaQuiz); uma TarefaComPrazo
+        é encontrada pelo tipo da tarefa que ela envolve.
+        Sem filtros, retorna todas as tarefas.
+
+        Na primeira chamada os índices são montados percorrendo as tarefas;
+        depois disso, o custo é proporcional ao tamanho do resultado.
         """
-        if tarefa is not None:
-            self.__tarefas.append(tarefa)
+        if status is None and tipo is None:
+            return list(self.tarefas)
+        if self.__carregador is not None:
+            self.__acessar()
+
+        with self.trava:
+            return self.__consultar_indices(status, tipo)
+
+    def __consultar_indices(self, status, tipo):
+        if self.__por_status is None:
+            self.__montar_indices_secundarios()
+
+        if tipo is None:
+            return list(self.__por_status.get(status, {}).values())
+        if status is None:
+            return list(self.__por_tipo.get(tipo, {}).values())
+
+        # Com os dois filtros, percorre o menor dos dois grupos.
+        grupo_status = self.__por_status.get(status, {})
+        grupo_tipo = self.__por_tipo.get(tipo, {})
+        if len(grupo_status) <= len(grupo_tipo):
+            return [tarefa for chave, tarefa in grupo_status.items() if chave in grupo_tipo]
+        return [tarefa for chave, tarefa in grupo_tipo.items() if chave in grupo_status]
+
+    # --- índices secundários (status e tipo) ---
+
+    @staticmethod
+    def tipo_da_tarefa(tarefa):
+        """Retorna a classe concreta da tarefa, desembrulhando TarefaComPrazo."""
+        while isinstance(tarefa, TarefaComPrazo):
+            tarefa = tarefa.tarefa_base
+        return type(tarefa)
+
+    def __montar_indices_secundarios(self):
+        self.__por_status = {}
+        self.__por_tipo = {}
+        self.__status_por_tarefa = {}
+        for tarefa in self.__tarefas.values():
+            self.__indexar(tarefa)
+
+    def __indexar(self, tarefa):
+        chave_tarefa = id(tarefa)
+        self.__por_status.setdefault(tarefa.status, {})[chave_tarefa] = tarefa
+        self.__por_tipo.setdefault(Aula.tipo_da_tarefa(tarefa), {})[chave_tarefa] = tarefa
+        self.__status_por_tarefa[chave_tarefa] = tarefa.status
+
+    def __desindexar(self, tarefa):
+        chave_tarefa = id(tarefa)
+        status = self.__status_por_tarefa.pop(chave_tarefa)
+        del self.__por_status[status][chave_tarefa]
+        del self.__por_tipo[Aula.tipo_da_tarefa(tarefa)][chave_tarefa]
+
+    def __atualizar_status(self, tarefa):
+        """Move a tarefa para o grupo do novo status, se ele mudou."""
+        chave_tarefa = id(tarefa)
+        status_antigo = self.__status_por_tarefa[chave_tarefa]
+        if tarefa.status is status_antigo:
+            return
+
+        del self.__por_status[status_antigo][chave_tarefa]
+        self.__por_status.setdefault(tarefa.status, {})[chave_tarefa] = tarefa
+        self.__status_por_tarefa[chave_tarefa] = tarefa.status
+
+    # --- cache de progresso ---
+
+    def tarefa_alterada(self, tarefa, evento=None):
+        """
+        Chamado por uma tarefa quando algum dado que influencia o progresso muda.
+        Apenas marca a tarefa como pendente; o recálculo acontece na próxima leitura.
+        O evento (se houver) é entregue aos assinantes e repassado ao Curso.
+        """
+        # Fora do modo concorrente não há custo extra além deste teste.
+        if self.__trava is None:
+            self.__registrar_alteracao(tarefa, evento)
+        else:
+            with self.__trava:
+                self.__registrar_alteracao(tarefa, evento)
+
+    def __registrar_alteracao(self, tarefa, evento):
+        chave_tarefa = id(tarefa)
+        if chave_tarefa not in self.__tarefas:
+            # Tarefa guardada antes do descarte e alterada depois: a aula volta para a
+            # memória com essa mesma tarefa e a alteração entra como qualquer outra.
+            if self.__resumo is None:
+                return
+            self.__carregar()
+            if chave_tarefa not in self.__tarefas:
+                return
+
+        self.__atualizar_indice(tarefa)
+        if self.__por_status is not None:
+            self.__atualizar_status(tarefa)
+        self.__tarefas_pendentes[chave_tarefa] = tarefa
+        self.__progresso_atual = None
+        self.__alterada = True
+
+        if evento is not None and self.__assinantes:
+            for assinante in self.__assinantes:
+                assinante(evento)
+        self.__notificar_observadores(evento)
+
+    def __atualizar_indice(self, tarefa):
+        """
+        Reposiciona a tarefa no índice de chaves se o título ou a data mudaram.
+        Se a nova chave já pertencer a outra tarefa, o índice continua apontando
+        para a tarefa que já estava lá (as duas ficam na aula).
+        """
+        chave_antiga = self.__chave_por_tarefa[id(tarefa)]
+        chave_nova = tarefa.chave
+        if chave_nova == chave_antiga:
+            return
+
+        self.__chave_por_tarefa[id(tarefa)] = chave_nova
+        self.__indice_chaves.setdefault(chave_nova, tarefa)
+        if self.__indice_chaves.get(chave_antiga) is tarefa:
+            del self.__indice_chaves[chave_antiga]
+            self.__reindexar_chave(chave_antiga)
+
+    def __reindexar_chave(self, chave):
+        """
+        Depois que a tarefa indexada por chave saiu (remoção ou nova chave), aponta o
+        índice para outra tarefa da aula com a mesma chave, se houver. Só percorre as
+        tarefas quando existem duplicadas (mais tarefas que chaves no índice).
+        """
+        if len(self.__tarefas) <= len(self.__indice_chaves):
+            return
+        for chave_tarefa, chave_atual in self.__chave_por_tarefa.items():
+            if chave_atual == chave:
+                self.__indice_chaves[chave] = self.__tarefas[chave_tarefa]
+                return
+
+    def __atualizar_pendentes(self):
+        """Recalcula somente as tarefas alteradas; a soma é refeita na leitura."""
+        for chave, tarefa in self.__tarefas_pendentes.items():
+            self.__progresso_por_tarefa[chave] = tarefa.progresso()
+
+        self.__tarefas_pendentes.clear()
+        self.__soma_progresso = None
+
+    def registrar_observador(self, observador):
+        """
+        Registra um objeto que deve ser avisado quando o progresso da aula puder mudar.
+        O observador precisa implementar o método aula_alterada(aula, evento=None).
+        """
+        if not any(registrado is observador for registrado in self.__observadores):
+            self.__observadores.append(observador)
+
+    def remover_observador(self, observador):
+        """Remove um observador registrado anteriormente (se existir)."""
+        self.__observadores = [
+            registrado for registrado in self.__observadores if registrado is not observador
+        ]
+
+    def __notificar_observadores(self, evento=None):
+        for observador in self.__observadores:
+            observador.aula_alterada(self, evento)
+
+    # --- eventos de alteração ---
+
+    def assinar(self, assinante):
+        """
+        Registra uma função chamada com cada EventoAlteracao das tarefas da aula
+        (ex.: um AgrupadorEventos).
+        """
+        if self.__assinantes is None:
+            self.__assinantes = []
+        if not any(registrado is assinante for registrado in self.__assinantes):
+            self.__assinantes.append(assinante)
+
+    def cancelar_assinatura(self, assinante):
+        """Remove uma função registrada com assinar() (se existir)."""
+        if self.__assinantes:
+            self.__assinantes = [
+                registrado for registrado in self.__assinantes if registrado is not assinante
+            ]
 
     # --- cálculo de progresso da aula ---
 
@@ -38,26 +448,206 @@ class Aula:
         """
         Calcula o progresso médio da aula com base nas tarefas.
         Se não houver tarefas, o progresso é 0.0.
+
+        O progresso de cada tarefa fica em cache e só as tarefas alteradas
+        desde a última chamada são recalculadas; a soma é refeita com math.fsum,
+        sem acumular erro de arredondamento. Sem alterações, o último valor é
+        devolvido direto (no modo concorrente, sem esperar a trava).
         """
+        valor = self.__progresso_atual
+        if valor is not None:
+            return valor
+
+        if self.__trava is None:
+            return self.__calcular_progresso()
+        with self.__trava:
+            return self.__calcular_progresso()
+
+    def __calcular_progresso(self):
         if not self.__tarefas:
-            return 0.0
+            valor = 0.0
+        else:
+            if self.__tarefas_pendentes:
+                self.__atualizar_pendentes()
+            if self.__soma_progresso is None:
+                self.__soma_progresso = math.fsum(self.__progresso_por_tarefa.values())
+            valor = self.__soma_progresso / len(self.__tarefas)
 
-        soma_progresso = 0.0
-        for tarefa in self.__tarefas:
-            # cada tarefa concreta sabe calcular o próprio progresso()
-            soma_progresso += tarefa.progresso()
+        self.__progresso_atual = valor
+        return valor
+
+    # --- armazenamento (tarefas lidas sob demanda) ---
+
+    def vincular_armazenamento(self, carregador, chave, resumo=None):
+        """
+        Liga a aula a um CarregadorTrilha (chamado pelo próprio carregador).
+
+        Com resumo=(quantidade de tarefas, progresso), a aula começa sem tarefas em memória:
+        progresso() responde pelo resumo e as tarefas só são lidas no primeiro acesso
+        (tarefas, buscas, inclusão ou remoção).
+        """
+        with self.trava:
+            self.__carregador = carregador
+            self.__chave_armazenada = chave
+            self.__alterada = False
+            if resumo is not None and not self.__tarefas:
+                quantidade, progresso = resumo
+                self.__resumo = (quantidade, progresso if quantidade else 0.0)
+                self.__progresso_atual = self.__resumo[1]
+
+    @property
+    def chave_armazenada(self):
+        """Chave da aula no armazenamento (None se a aula só existe em memória)."""
+        return self.__chave_armazenada
+
+    @property
+    def carregada(self):
+        """Indica se as tarefas estão em memória."""
+        return self.__resumo is None
+
+    @property
+    def alterada(self):
+        """Indica se há alterações nas tarefas ainda não gravadas no armazenamento."""
+        return self.__alterada
+
+    def marcar_gravada(self):
+        """Chamado pelo carregador depois de gravar as tarefas da aula."""
+        self.__alterada = False
+
+    def __acessar(self):
+        """Lê as tarefas, se preciso, e avisa o carregador do uso (para escolher quem descartar)."""
+        if self.__resumo is not None:
+            self.__carregar()
+        else:
+            self.__carregador.aula_usada(self)
+
+    def __carregar(self):
+        with self.trava:
+            if self.__resumo is None:
+                return
+            desligadas = self.__desligadas or {}
+            for posicao, lida in enumerate(self.__carregador.ler_tarefas(self)):
+                # Tarefa do descarte que alguém ainda usa: ela volta, e não a cópia lida.
+                tarefa = desligadas.get(posicao, lida)
+                chave_tarefa = id(tarefa)
+                chave = tarefa.chave
+                progresso_tarefa = tarefa.progresso()
+                self.__tarefas[chave_tarefa] = tarefa
+                self.__indice_chaves.setdefault(chave, tarefa)
+                self.__chave_por_tarefa[chave_tarefa] = chave
+                self.__progresso_por_tarefa[chave_tarefa] = progresso_tarefa
+                tarefa.registrar_observador(self)
+            self.__soma_progresso = None
+            self.__desligadas = None
+            self.__tupla_tarefas = None
+            # O progresso continua o do resumo: o Curso já o conhece. Se a leitura veio de
+            # uma tarefa desligada alterada, __registrar_alteracao avisa o Curso em seguida.
+            self.__resumo = None
+        # Fora da trava da aula: o carregador pode descartar outras aulas (limite de memória).
+        self.__carregador.aula_carregada(self)
+
+    def descarregar(self):
+        """
+        Tira as tarefas da memória e guarda só o resumo (quantidade e progresso).
+        Alterações ainda não gravadas vão para o armazenamento antes.
+
+        Retorna False (e não descarta) se a aula não está ligada a um armazenamento,
+        já está descarregada, está em uso por outra thread ou se alguma tarefa tem
+        outros observadores (ex.: HistoricoProgresso, IndicePrazos).
+
+        A aula continua observando as tarefas descartadas e guarda uma referência fraca
+        a elas: uma tarefa obtida antes do descarte (aula.tarefas[0]) e alterada depois
+        traz a aula de volta para a memória, com essa mesma tarefa, e a alteração é
+        gravada como as outras. Tarefas que ninguém guardou são liberadas normalmente.
+        """
+        if self.__carregador is None or self.__resumo is not None:
+            return False
+        trava = self.__trava
+        if trava is not None and not trava.acquire(blocking=False):
+            return False
+        try:
+            if self.__resumo is not None:
+                return False
+            tarefas = list(self.__tarefas.values())
+            for tarefa in tarefas:
+                tarefa.remover_observador(self)
+            outros_observadores = any(tarefa.possui_observadores for tarefa in tarefas)
+            for tarefa in tarefas:
+                tarefa.registrar_observador(self)
+            if outros_observadores:
+                return False
+
+            progresso = self.__calcular_progresso()
+            if self.__alterada:
+                self.__carregador.gravar_aula(self, tarefas, progresso)
+                self.__alterada = False
+
+            self.__tarefas = {}
+            self.__tupla_tarefas = None
+            self.__indice_chaves = {}
+            self.__chave_por_tarefa = {}
+            self.__progresso_por_tarefa = {}
+            self.__tarefas_pendentes = {}
+            self.__soma_progresso = 0.0
+            self.__por_status = None
+            self.__por_tipo = None
+            self.__status_por_tarefa = None
+            self.__desligadas = weakref.WeakValueDictionary(enumerate(tarefas))
+            self.__resumo = (len(tarefas), progresso)
+        finally:
+            if trava is not None:
+                trava.release()
+
+        self.__carregador.aula_descarregada(self)
+        return True
+
+    # --- serialização (pickle) ---
+
+    def __getstate__(self):
+        """
+        Assinantes de eventos não são copiados:
+        funções de painel/agrupadores não fazem parte dos dados.
+        A trava também fica de fora; a cópia começa com o modo concorrente desligado.
+        Uma aula ligada a um armazenamento lê as tarefas antes: a cópia fica só em memória.
+        """
+        if self.__carregador is not None:
+            self.__acessar()
+        estado = self.__dict__.copy()
+        estado["_Aula__assinantes"] = None
+        estado["_Aula__trava"] = None
+        estado["_Aula__carregador"] = None
+        estado["_Aula__chave_armazenada"] = None
+        estado["_Aula__alterada"] = False
+        estado["_Aula__desligadas"] = None
+        return estado
+
+    def __setstate__(self, estado):
+        """
+        Os dicionários internos usam id(tarefa) como chave, e os ids mudam na cópia:
+        refaz as chaves com os ids das tarefas recriadas.
+        """
+        self.__dict__.update(estado)
+        ids_novos = {chave: id(tarefa) for chave, tarefa in self.__tarefas.items()}
 
-        return soma_progresso / len(self.__tarefas)
+        self.__tarefas = {ids_novos[chave]: tarefa for chave, tarefa in self.__tarefas.items()}
+        self.__tupla_tarefas = None
+        self.__chave_por_tarefa = {ids_novos[c]: valor for c, valor in self.__chave_por_tarefa.items()}
+        self.__progresso_por_tarefa = {ids_novos[c]: valor for c, valor in self.__progresso_por_tarefa.items()}
+        self.__tarefas_pendentes = {ids_novos[c]: valor for c, valor in self.__tarefas_pendentes.items()}
+        # Os índices por status e tipo são montados de novo na próxima consulta.
+        self.__por_status = None
+        self.__por_tipo = None
+        self.__status_por_tarefa = None
 
     # --- apresentação ---
 
     def __str__(self):
-        return f"Aula: {self.__titulo} ({len(self.__tarefas)} tarefas)"
+        return f"Aula: {self.__titulo} ({self.quantidade_tarefas} tarefas)"
 
     def exibir_dados(self):
         linhas = [
             f"Aula: {self.__titulo}",
-            f"Quantidade de tarefas: {len(self.__tarefas)}",
+            f"Quantidade de tarefas: {self.quantidade_tarefas}",
             f"Progresso da aula: {self.progresso() * 100:.0f}%",
         ]
         return "\n".join(linhas)
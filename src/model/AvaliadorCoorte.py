@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor
+from .PlanoProgresso import PlanoProgresso
+
+
+class AvaliadorCoorte:
+    """
+    Calcula o progresso de muitas trilhas (uma por estudante) com várias estratégias de uma vez.
+
+    O resultado é uma tabela trilha × estratégia. As estratégias são compiladas em um
+    PlanoProgresso: as médias conhecidas e as EstrategiaPorNiveis são calculadas em uma
+    única passada por trilha, lendo o progresso de cada nó uma vez.
+    Outras estratégias são calculadas normalmente com estrategia.calcular(trilha).
+    """
+
+    def __init__(self, estrategias):
+        """
+        Parâmetros:
+            estrategias: lista de objetos EstrategiaProgresso (define as colunas da tabela).
+        """
+        self.__estrategias = list(estrategias)
+        # O plano também é enviado aos processos trabalhadores (pickle).
+        self.__plano = PlanoProgresso(self.__estrategias)
+
+    @property
+    def estrategias(self):
+        return list(self.__estrategias)
+
+    # --- avaliação ---
+
+    def avaliar(self, trilhas, max_trabalhadores=None):
+        """
+        Retorna uma lista com uma linha por trilha; cada linha tem um valor por estratégia,
+        na mesma ordem de self.estrategias.
+
+        Com max_trabalhadores > 1, as trilhas são divididas entre processos
+        (cada processo recebe uma parte da lista por pickle).
+        """
+        trilhas = list(trilhas)
+
+        if not max_trabalhadores or max_trabalhadores <= 1 or len(trilhas) < 2:
+            return AvaliadorCoorte.avaliar_parcial(trilhas, self.__plano)
+
+        quantidade_partes = min(max_trabalhadores, len(trilhas))
+        tamanho_parte = -(-len(trilhas) // quantidade_partes)  # divisão arredondando para cima
+        partes = [trilhas[inicio:inicio + tamanho_parte] for inicio in range(0, len(trilhas), tamanho_parte)]
+
+        resultados = []
+        with ProcessPoolExecutor(max_workers=quantidade_partes) as executor:
+            for linhas in executor.map(
+                AvaliadorCoorte.avaliar_parcial, partes, [self.__plano] * len(partes)
+            ):
+                resultados.extend(linhas)
+
+        return resultados
+
+    def tabela(self, trilhas, max_trabalhadores=None):
+        """
+        Mesmo cálculo de avaliar(), mas devolve uma lista de dicionários:
+        {"trilha": nome, "<NomeDaEstrategia>": valor, ...}.
+        """
+        trilhas = list(trilhas)
+        nomes = [estrategia.__class__.__name__ for estrategia in self.__estrategias]
+
+        tabela = []
+        for trilha, valores in zip(trilhas, self.avaliar(trilhas, max_trabalhadores)):
+            linha = {"trilha": trilha.nome}
+            linha.update(zip(nomes, valores))
+            tabela.append(linha)
+
+        return tabela
+
+    @staticmethod
+    def avaliar_parcial(trilhas, plano):
+        """
+        Calcula as linhas de um grupo de trilhas com o PlanoProgresso dado.
+        É a função executada por cada processo trabalhador.
+        """
+        return [plano.calcular(trilha) for trilha in trilhas]
+
@@ -0,0 +1,236 @@
+import threading
+from collections import OrderedDict
+from .Aula import Aula
+from .Curso import Curso
+from .Trilha import Trilha
+from .SerializadorTrilha import SerializadorTrilha
+
+
+class CarregadorTrilha:
+    """
+    Abre uma trilha guardada em um ArmazenamentoTrilha (ArmazenamentoArquivo ou
+    ArmazenamentoSQLite) lendo só o que é usado.
+
+    - Na abertura são lidos apenas os cursos, com o resumo das aulas de cada um:
+      Curso.progresso() (e as estratégias por curso) respondem sem ler aulas nem tarefas.
+    - curso.aulas lê os resumos das aulas do curso; aula.progresso() responde pelo resumo.
+    - As tarefas de uma aula são lidas no primeiro acesso (aula.tarefas, buscas, inclusão...).
+
+    Com limite_tarefas, as aulas menos usadas recentemente são descartadas da memória
+    (Aula.descarregar) sempre que as tarefas em memória passam do limite; as que têm
+    alterações são gravadas antes. salvar() grava as alterações e a estrutura.
+
+    Passando uma trilha já montada em memória, ela é gravada inteira no armazenamento
+    e passa a ser controlada pelo carregador (inclusive o limite de memória).
+    """
+
+    def __init__(self, armazenamento, trilha=None, limite_tarefas=None):
+        """
+        Parâmetros:
+            armazenamento: ArmazenamentoTrilha de onde a trilha é lida (e onde é gravada).
+            trilha: trilha em memória para gravar no armazenamento (None = abrir a guardada).
+            limite_tarefas: máximo aproximado de tarefas em memória (None = sem limite).
+        """
+        if limite_tarefas is not None and limite_tarefas < 0:
+            raise ValueError("limite_tarefas não pode ser negativo.")
+
+        self.__armazenamento = armazenamento
+        self.__limite_tarefas = limite_tarefas
+        self.__trava = threading.Lock()
+        # Aulas com tarefas em memória, da usada há mais tempo para a mais recente:
+        # id(aula) -> (aula, quantidade de tarefas lidas)
+        self.__carregadas = OrderedDict()
+        self.__tarefas_em_memoria = 0
+        self.__contadores = {"cursos_lidos": 0, "aulas_lidas": 0, "descartes": 0, "gravacoes": 0}
+
+        if trilha is None:
+            self.__trilha = self.__abrir()
+        else:
+            self.__trilha = trilha
+            self.salvar()
+
+    @property
+    def trilha(self):
+        return self.__trilha
+
+    @property
+    def armazenamento(self):
+        return self.__armazenamento
+
+    @property
+    def limite_tarefas(self):
+        return self.__limite_tarefas
+
+    @property
+    def estatisticas(self):
+        """Aulas e tarefas em memória e quantas leituras, descartes e gravações já ocorreram."""
+        with self.__trava:
+            estatisticas = {
+                "aulas_em_memoria": len(self.__carregadas),
+                "tarefas_em_memoria": self.__tarefas_em_memoria,
+            }
+            estatisticas.update(self.__contadores)
+        return estatisticas
+
+    # --- abertura ---
+
+    def __abrir(self):
+        lido = self.__armazenamento.ler_trilha()
+        if lido is None:
+            raise ValueError("O armazenamento não tem nenhuma trilha gravada.")
+
+        nome, cursos = lido
+        trilha = Trilha(nome)
+        for chave, titulo, carga_horas, quantidade_aulas, soma_progresso in cursos:
+            curso = Curso(titulo, carga_horas)
+            curso.vincular_armazenamento(self, chave, (quantidade_aulas, soma_progresso))
+            trilha.adicionar_curso(curso)
+        return trilha
+
+    # --- chamados por Curso e Aula ---
+
+    def ler_aulas(self, curso):
+        """Cria as aulas do curso a partir dos resumos guardados (sem tarefas em memória)."""
+        aulas = []
+        for chave, titulo, quantidade, progresso in self.__armazenamento.ler_aulas(curso.chave_armazenada):
+            aula = Aula(titulo)
+            aula.vincular_armazenamento(self, chave, (quantidade, progresso))
+            aulas.append(aula)
+        with self.__trava:
+            self.__contadores["cursos_lidos"] += 1
+        return aulas
+
+    def ler_tarefas(self, aula):
+        """Recria as tarefas guardadas da aula."""
+        return [
+            SerializadorTrilha.tarefa_de_registro(registro)
+            for registro in self.__armazenamento.ler_tarefas(aula.chave_armazenada)
+        ]
+
+    def aula_carregada(self, aula):
+        """Registra a aula como a mais recente e descarta as menos usadas, se passou do limite."""
+        with self.__trava:
+            quantidade = aula.quantidade_tarefas
+            self.__carregadas[id(aula)] = (aula, quantidade)
+            self.__tarefas_em_memoria += quantidade
+            self.__contadores["aulas_lidas"] += 1
+        self.__respeitar_limite(poupar=aula)
+
+    def aula_usada(self, aula):
+        """Marca a aula como usada agora (vai para o fim da fila de descarte)."""
+        with self.__trava:
+            if id(aula) in self.__carregadas:
+                self.__carregadas.move_to_end(id(aula))
+
+    def aula_descarregada(self, aula):
+        with self.__trava:
+            entrada = self.__carregadas.pop(id(aula), None)
+            if entrada is not None:
+                self.__tarefas_em_memoria -= entrada[1]
+            self.__contadores["descartes"] += 1
+
+    def gravar_aula(self, aula, tarefas, progresso):
+        """Grava as tarefas de uma aula alterada (chamado por Aula.descarregar)."""
+        self.__gravar_tarefas(aula.chave_armazenada, tarefas, progresso)
+        self.__armazenamento.confirmar()
+
+    def __gravar_tarefas(self, chave_aula, tarefas, progresso):
+        registros = [SerializadorTrilha.registro_tarefa(tarefa) for tarefa in tarefas]
+        self.__armazenamento.gravar_tarefas(chave_aula, registros, progresso)
+        with self.__trava:
+            self.__contadores["gravacoes"] += 1
+
+    # --- limite de memória ---
+
+    def __respeitar_limite(self, poupar=None):
+        limite = self.__limite_tarefas
+        if limite is None:
+            return
+
+        with self.__trava:
+            if self.__tarefas_em_memoria <= limite:
+                return
+            # Da usada há mais tempo para a mais recente.
+            candidatas = [aula for aula, _ in self.__carregadas.values()]
+
+        # Fora da trava do carregador: descarregar() usa a trava da aula (sem esperar por ela).
+        for aula in candidatas:
+            with self.__trava:
+                if self.__tarefas_em_memoria <= limite:
+                    return
+            if aula is not poupar:
+                aula.descarregar()
+
+    def descarregar_tudo(self):
+        """Descarta todas as aulas que puderem ser descartadas. Retorna quantas foram."""
+        with self.__trava:
+            candidatas = [aula for aula, _ in self.__carregadas.values()]
+        return sum(1 for aula in candidatas if aula.descarregar())
+
+    # --- gravação ---
+
+    def salvar(self):
+        """
+        Grava no armazenamento as tarefas das aulas alteradas, as aulas e cursos novos
+        e a estrutura da trilha (títulos, cargas, ordem, inclusões e remoções).
+        Cursos cujas aulas nunca foram lidas mantêm as aulas guardadas.
+        """
+        armazenamento = self.__armazenamento
+        cursos = []
+        novas_em_memoria = []
+
+        for curso in list(self.__trilha.cursos):
+            with curso.trava:
+                if curso.chave_armazenada is None:
+                    curso.vincular_armazenamento(self, armazenamento.nova_chave())
+
+                if not curso.aulas_carregadas:
+                    cursos.append((curso.chave_armazenada, curso.titulo, curso.carga_horas, None))
+                    continue
+
+                aulas = []
+                for aula in curso.aulas:
+                    nova = aula.chave_armazenada is None
+                    if nova:
+                        aula.vincular_armazenamento(self, armazenamento.nova_chave())
+                        novas_em_memoria.append(aula)
+                    if aula.carregada and (nova or aula.alterada):
+                        self.__gravar_tarefas(aula.chave_armazenada, aula.tarefas, aula.progresso())
+                        aula.marcar_gravada()
+                    aulas.append((aula.chave_armazenada, aula.titulo, aula.quantidade_tarefas, aula.progresso()))
+
+                cursos.append((curso.chave_armazenada, curso.titulo, curso.carga_horas, aulas))
+
+        armazenamento.gravar_estrutura(self.__trilha.nome, cursos)
+        armazenamento.confirmar()
+
+        # Aulas que vieram da memória entram no controle do limite a partir de agora.
+        if novas_em_memoria:
+            with self.__trava:
+                for aula in novas_em_memoria:
+                    quantidade = aula.quantidade_tarefas
+                    self.__carregadas[id(aula)] = (aula, quantidade)
+                    self.__tarefas_em_memoria += quantidade
+            self.__respeitar_limite()
+
+    def fechar(self):
+        """Fecha o armazenamento (sem gravar: chame salvar() antes, se preciso)."""
+        self.__armazenamento.fechar()
+
+    # --- uso com "with" ---
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        if tipo_erro is None:
+            self.salvar()
+        self.fechar()
+        return False
+
+    def __str__(self):
+        estatisticas = self.estatisticas
+        return (
+            f"CarregadorTrilha: {self.__trilha.nome} | {estatisticas['aulas_em_memoria']} aula(s) e "
+            f"{estatisticas['tarefas_em_memoria']} tarefa(s) em memória"
+        )
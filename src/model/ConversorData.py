@@ -0,0 +1,120 @@
+from datetime import datetime
+from functools import lru_cache
+
+
+class ConversorData:
+    """
+    Conversão rápida de textos de data usados pelas tarefas.
+
+    - 'dd-mm-YYYY'        → usado em TarefaEstudo.data_realizacao;
+    - 'dd-mm-YYYY HH:MM'  → usado em TarefaComPrazo.prazo.
+
+    Textos no formato exato (com zeros à esquerda) são convertidos
+    fatiando a string, sem passar por datetime.strptime. Qualquer outro texto
+    segue para o strptime, então o que é aceito ou rejeitado continua igual.
+    Os resultados ficam em um cache LRU, pois em importações em lote
+    as mesmas datas se repetem muito.
+
+    O caminho inverso (datetime → texto, usado em exibir_dados) também fica em cache:
+    em relatórios grandes a mesma data é formatada muitas vezes.
+    """
+
+    # Quantidade máxima de textos diferentes guardados em cada cache.
+    TAMANHO_CACHE = 4096
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def converter_data(texto):
+        """
+        Converte 'dd-mm-YYYY' em datetime.
+        Levanta ValueError (como o strptime) se o texto for inválido.
+        """
+        if (
+            len(texto) == 10
+            and texto[2] == "-"
+            and texto[5] == "-"
+            and texto[0:2].isdecimal()
+            and texto[3:5].isdecimal()
+            and texto[6:10].isdecimal()
+        ):
+            try:
+                return datetime(int(texto[6:10]), int(texto[3:5]), int(texto[0:2]))
+            except ValueError:
+                # Data impossível (ex.: 31-02-2025): deixa o strptime gerar a mesma mensagem de erro.
+                pass
+
+        return datetime.strptime(texto, "%d-%m-%Y")
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def converter_data_hora(texto):
+        """
+        Converte 'dd-mm-YYYY HH:MM' em datetime.
+        Levanta ValueError (como o strptime) se o texto for inválido.
+        """
+        if (
+            len(texto) == 16
+            and texto[2] == "-"
+            and texto[5] == "-"
+            and texto[10] == " "
+            and texto[13] == ":"
+            and texto[0:2].isdecimal()
+            and texto[3:5].isdecimal()
+            and texto[6:10].isdecimal()
+            and texto[11:13].isdecimal()
+            and texto[14:16].isdecimal()
+        ):
+            try:
+                return datetime(
+                    int(texto[6:10]),
+                    int(texto[3:5]),
+                    int(texto[0:2]),
+                    int(texto[11:13]),
+                    int(texto[14:16]),
+                )
+            except ValueError:
+                pass
+
+        return datetime.strptime(texto, "%d-%m-%Y %H:%M")
+
+    @staticmethod
+    def formatar_data(data):
+        """
+        Converte um datetime em 'dd-mm-YYYY'.
+
+        Só datetime sem fuso horário passa pelo cache, com a chave (ano, mês, dia):
+        datetimes com fuso são iguais (mesmo hash) quando representam o mesmo instante,
+        mesmo mostrando dias diferentes. Esses, as subclasses e outros objetos com
+        strftime são formatados direto, sem precisar ser hasheáveis.
+        """
+        if type(data) is datetime and data.tzinfo is None:
+            return ConversorData.__formatar_dia(data.year, data.month, data.day)
+        return data.strftime("%d-%m-%Y")
+
+    @staticmethod
+    def formatar_data_hora(data):
+        """
+        Converte um datetime em 'dd-mm-YYYY HH:MM'.
+        Mesmo cache de formatar_data, com a chave (ano, mês, dia, hora, minuto).
+        """
+        if type(data) is datetime and data.tzinfo is None:
+            return ConversorData.__formatar_minuto(data.year, data.month, data.day, data.hour, data.minute)
+        return data.strftime("%d-%m-%Y %H:%M")
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def __formatar_dia(ano, mes, dia):
+        return datetime(ano, mes, dia).strftime("%d-%m-%Y")
+
+    @staticmethod
+    @lru_cache(maxsize=TAMANHO_CACHE)
+    def __formatar_minuto(ano, mes, dia, hora, minuto):
+        return datetime(ano, mes, dia, hora, minuto).strftime("%d-%m-%Y %H:%M")
+
+    @staticmethod
+    def limpar_cache():
+        """Esvazia os caches de conversão (útil em testes e medições)."""
+        ConversorData.converter_data.cache_clear()
+        ConversorData.converter_data_hora.cache_clear()
+        ConversorData.__formatar_dia.cache_clear()
+        ConversorData.__formatar_minuto.cache_clear()
@@ -1,4 +1,12 @@
+import math
+from contextlib import nullcontext
+from threading import RLock
+
+
 class Curso:
+    # Usado por "with curso.trava:" quando o modo concorrente está desligado.
+    _SEM_TRAVA = nullcontext()
+
     def __init__(self, titulo, carga_horas=0):
         """
         Representa um curso dentro da trilha.
@@ -17,8 +25,40 @@ class Curso:
         # Usa o setter para validar a carga informada.
         self.carga_horas = carga_horas
 
-        # Lista de aulas pertencentes a este curso.
-        self.__aulas = []
+        # Aulas pertencentes a este curso, na ordem de inclusão: id(aula) -> aula.
+        self.__aulas = {}
+        # Tupla devolvida por "aulas", reaproveitada até a próxima inclusão ou remoção.
+        self.__tupla_aulas = None
+
+        # Índice pelo título da aula, usado na busca e em adicionar_aula(substituir=True).
+        # Aulas com o mesmo título são aceitas: título -> {id(aula): aula}, na ordem de inclusão.
+        self.__indice_titulos = {}
+        # Último título conhecido de cada aula: id(aula) -> título.
+        self.__titulo_por_aula = {}
+
+        # Cache do progresso, no mesmo formato usado em Aula:
+        # id(aula) -> último progresso
+        self.__progresso_por_aula = {}
+        # Refeita com math.fsum quando algo muda (None = refazer na próxima leitura).
+        self.__soma_progresso = 0.0
+        # Aulas alteradas desde a última leitura do progresso.
+        self.__aulas_pendentes = {}
+        # Último progresso calculado (None = precisa recalcular). É um único atributo,
+        # então pode ser lido sem trava mesmo no modo concorrente.
+        self.__progresso_atual = None
+
+        # Objetos (ex.: Trilha) avisados quando o progresso do curso pode ter mudado.
+        self.__observadores = []
+        # Funções que recebem os EventoAlteracao das tarefas do curso (criada no primeiro assinar).
+        self.__assinantes = None
+        # Trava do modo concorrente (None = desligado), compartilhada com as aulas do curso.
+        self.__trava = None
+
+        # Armazenamento (CarregadorTrilha) de onde as aulas são lidas sob demanda.
+        self.__carregador = None
+        self.__chave_armazenada = None
+        # (quantidade de aulas, soma dos progressos das aulas) enquanto as aulas não foram lidas.
+        self.__resumo = None
 
     # --- encapsulamento ---
 
@@ -66,22 +106,256 @@ class Curso:
     @property
     def aulas(self):
         """
-        Retorna a lista de aulas associadas ao curso.
+        Retorna uma tupla (somente leitura) com as aulas do curso, na ordem de inclusão.
 
-        A inclusão de novas aulas deve ser feita pelo método adicionar_aula().
+        A inclusão e a remoção devem ser feitas por adicionar_aula() e remover_aula().
+        A tupla é reaproveitada entre as leituras enquanto nenhuma aula entra ou sai.
+        Num curso ligado a um armazenamento, as aulas são lidas no primeiro acesso
+        (só os resumos; as tarefas de cada aula ficam para quando forem usadas).
         """
-        return self.__aulas
+        if self.__resumo is not None:
+            self.__carregar_aulas()
+        aulas = self.__tupla_aulas
+        if aulas is None:
+            with self.trava:
+                aulas = self.__tupla_aulas = tuple(self.__aulas.values())
+        return aulas
+
+    @property
+    def quantidade_aulas(self):
+        """Quantidade de aulas do curso (sem ler as aulas do armazenamento)."""
+        if self.__resumo is not None:
+            return self.__resumo[0]
+        return len(self.__aulas)
+
+    # --- modo concorrente ---
+
+    def ativar_modo_concorrente(self):
+        """
+        Protege o curso e as suas aulas com uma única trava (RLock).
+
+        Uma trava por curso (e não uma por aula) evita deadlock: quem altera uma tarefa
+        avisa aula -> curso, e quem lê o progresso consulta curso -> aula; com a mesma
+        trava, as duas ordens não se bloqueiam. Threads que trabalham em cursos
+        diferentes não disputam a mesma trava.
+        """
+        if self.__trava is None:
+            self.__trava = RLock()
+        with self.__trava:
+            for aula in self.__aulas.values():
+                aula.ativar_modo_concorrente(self.__trava)
+
+    @property
+    def modo_concorrente(self):
+        return self.__trava is not None
+
+    @property
+    def trava(self):
+        """Trava do curso para usar com "with" (sem efeito se o modo concorrente estiver desligado)."""
+        return self.__trava if self.__trava is not None else Curso._SEM_TRAVA
 
     # --- composição ---
 
-    def adicionar_aula(self, aula):
+    def adicionar_aula(self, aula, substituir=False):
         """
         Adiciona uma aula ao curso.
 
         Espera receber um objeto da classe Aula (ou compatível).
+        Aulas com o mesmo título de outra aula do curso são aceitas normalmente;
+        com substituir=True, as aulas com o mesmo título são removidas e a nova entra no lugar.
+
+        Retorna True se a aula foi adicionada e False caso contrário (None ou a mesma
+        aula já está no curso).
+        """
+        if aula is None:
+            return False
+        if self.__resumo is not None:
+            self.__carregar_aulas()
+
+        with self.trava:
+            return self.__incluir_aula(aula, substituir)
+
+    def __incluir_aula(self, aula, substituir):
+        if id(aula) in self.__aulas:
+            return False
+
+        if substituir:
+            for existente in list(self.__indice_titulos.get(aula.titulo, {}).values()):
+                self.__retirar_aula(existente)
+
+        progresso_aula = aula.progresso()
+        self.__aulas[id(aula)] = aula
+        self.__tupla_aulas = None
+        self.__indexar_titulo(aula, aula.titulo)
+        self.__progresso_por_aula[id(aula)] = progresso_aula
+        self.__soma_progresso = None
+        self.__progresso_atual = None
+
+        # Passa a observar as alterações da aula (progresso e título).
+        aula.registrar_observador(self)
+        if self.__trava is not None:
+            aula.ativar_modo_concorrente(self.__trava)
+        self.__notificar_observadores()
+        return True
+
+    def remover_aula(self, aula):
+        """
+        Remove a aula do curso.
+        Aceita o próprio objeto ou o título da aula.
+
+        Retorna True se alguma aula foi removida.
+        """
+        if self.__resumo is not None:
+            self.__carregar_aulas()
+        with self.trava:
+            return self.__retirar_aula(aula)
+
+    def __retirar_aula(self, aula):
+        if isinstance(aula, str):
+            aula = self.buscar_aula(aula)
+        if aula is None or id(aula) not in self.__aulas:
+            return False
+
+        chave_aula = id(aula)
+        del self.__aulas[chave_aula]
+        self.__tupla_aulas = None
+        self.__aulas_pendentes.pop(chave_aula, None)
+        del self.__progresso_por_aula[chave_aula]
+        self.__soma_progresso = None
+        self.__progresso_atual = None
+
+        self.__desindexar_titulo(chave_aula)
+
+        aula.remover_observador(self)
+        if self.__trava is not None:
+            # Fora do curso, a aula continua protegida, agora com uma trava só dela.
+            aula.ativar_modo_concorrente()
+        self.__notificar_observadores()
+        return True
+
+    # --- índice por título ---
+
+    def __indexar_titulo(self, aula, titulo):
+        self.__indice_titulos.setdefault(titulo, {})[id(aula)] = aula
+        self.__titulo_por_aula[id(aula)] = titulo
+
+    def __desindexar_titulo(self, chave_aula):
+        titulo = self.__titulo_por_aula.pop(chave_aula)
+        grupo = self.__indice_titulos[titulo]
+        del grupo[chave_aula]
+        if not grupo:
+            del self.__indice_titulos[titulo]
+
+    # --- busca ---
+
+    def buscar_aula(self, titulo):
+        """Retorna a aula com o título informado (ou None); com títulos repetidos, a primeira incluída."""
+        titulo = str(titulo).strip().title() if titulo else "Aula"
+        if self.__resumo is not None:
+            self.__carregar_aulas()
+        with self.trava:
+            grupo = self.__indice_titulos.get(titulo)
+            return next(iter(grupo.values())) if grupo else None
+
+    def buscar_tarefa(self, titulo, data_realizacao=None):
+        """
+        Procura a tarefa (título e data de realização) nas aulas do curso.
+        Cada aula responde pelo seu índice, então o custo é de uma consulta por aula.
+        Retorna a primeira tarefa encontrada ou None.
+        """
+        for aula in self.aulas:
+            tarefa = aula.buscar_tarefa(titulo, data_realizacao)
+            if tarefa is not None:
+                return tarefa
+        return None
+
+    def buscar_tarefas(self, status=None, tipo=None):
+        """
+        Retorna as tarefas do curso com o status e/ou o tipo informados
+        (veja Aula.buscar_tarefas), na ordem das aulas.
+        """
+        tarefas = []
+        for aula in self.aulas:
+            tarefas.extend(aula.buscar_tarefas(status, tipo))
+        return tarefas
+
+    # --- cache de progresso ---
+
+    def aula_alterada(self, aula, evento=None):
+        """
+        Chamado por uma aula quando alguma de suas tarefas (ou o título) muda.
+        Apenas marca a aula como pendente; o recálculo acontece na próxima leitura.
+        O evento (se houver) é entregue aos assinantes e repassado à Trilha.
         """
-        if aula is not None:
-            self.__aulas.append(aula)
+        if self.__trava is None:
+            self.__registrar_alteracao(aula, evento)
+        else:
+            with self.__trava:
+                self.__registrar_alteracao(aula, evento)
+
+    def __registrar_alteracao(self, aula, evento):
+        chave_aula = id(aula)
+        if chave_aula not in self.__aulas:
+            return
+
+        if aula.titulo != self.__titulo_por_aula[chave_aula]:
+            # Reposiciona a aula no índice de títulos.
+            self.__desindexar_titulo(chave_aula)
+            self.__indexar_titulo(aula, aula.titulo)
+
+        self.__aulas_pendentes[chave_aula] = aula
+        self.__progresso_atual = None
+
+        if evento is not None and self.__assinantes:
+            for assinante in self.__assinantes:
+                assinante(evento)
+        self.__notificar_observadores(evento)
+
+    def __atualizar_pendentes(self):
+        """Recalcula somente as aulas alteradas; a soma é refeita na leitura."""
+        for chave, aula in self.__aulas_pendentes.items():
+            self.__progresso_por_aula[chave] = aula.progresso()
+
+        self.__aulas_pendentes.clear()
+        self.__soma_progresso = None
+
+    def registrar_observador(self, observador):
+        """
+        Registra um objeto que deve ser avisado quando o progresso do curso puder mudar.
+        O observador precisa implementar o método curso_alterado(curso, evento=None).
+        """
+        if not any(registrado is observador for registrado in self.__observadores):
+            self.__observadores.append(observador)
+
+    def remover_observador(self, observador):
+        """Remove um observador registrado anteriormente (se existir)."""
+        self.__observadores = [
+            registrado for registrado in self.__observadores if registrado is not observador
+        ]
+
+    def __notificar_observadores(self, evento=None):
+        """Avisa os observadores; sem evento, a estrutura do curso mudou (aulas ou tarefas)."""
+        for observador in self.__observadores:
+            observador.curso_alterado(self, evento)
+
+    # --- eventos de alteração ---
+
+    def assinar(self, assinante):
+        """
+        Registra uma função chamada com cada EventoAlteracao das tarefas do curso
+        (ex.: um AgrupadorEventos).
+        """
+        if self.__assinantes is None:
+            self.__assinantes = []
+        if not any(registrado is assinante for registrado in self.__assinantes):
+            self.__assinantes.append(assinante)
+
+    def cancelar_assinatura(self, assinante):
+        """Remove uma função registrada com assinar() (se existir)."""
+        if self.__assinantes:
+            self.__assinantes = [
+                registrado for registrado in self.__assinantes if registrado is not assinante
+            ]
 
     # --- progresso do curso ---
 
@@ -91,21 +365,116 @@ class Curso:
 
         - Se não houver aulas cadastradas, o progresso é 0.0.
         - Caso existam aulas, faz a média dos progressos de cada aula.
+
+        O progresso de cada aula fica em cache: só as aulas com tarefas
+        alteradas desde a última chamada são recalculadas, a soma é refeita
+        com math.fsum e o último valor é reaproveitado enquanto nada muda.
         """
+        valor = self.__progresso_atual
+        if valor is not None:
+            return valor
+
+        if self.__trava is None:
+            return self.__calcular_progresso()
+        with self.__trava:
+            return self.__calcular_progresso()
+
+    def __calcular_progresso(self):
         if not self.__aulas:
-            return 0.0
+            valor = 0.0
+        else:
+            if self.__aulas_pendentes:
+                self.__atualizar_pendentes()
+            if self.__soma_progresso is None:
+                self.__soma_progresso = math.fsum(self.__progresso_por_aula.values())
+            valor = self.__soma_progresso / len(self.__aulas)
+
+        self.__progresso_atual = valor
+        return valor
+
+    # --- armazenamento (aulas lidas sob demanda) ---
+
+    def vincular_armazenamento(self, carregador, chave, resumo=None):
+        """
+        Liga o curso a um CarregadorTrilha (chamado pelo próprio carregador).
+
+        Com resumo=(quantidade de aulas, soma dos progressos das aulas), o curso começa sem
+        aulas em memória e progresso() responde pelo resumo, sem ler aulas nem tarefas.
+        """
+        with self.trava:
+            self.__carregador = carregador
+            self.__chave_armazenada = chave
+            if resumo is not None and not self.__aulas:
+                quantidade, soma = resumo
+                self.__resumo = (quantidade, soma)
+                self.__progresso_atual = soma / quantidade if quantidade else 0.0
+
+    @property
+    def chave_armazenada(self):
+        """Chave do curso no armazenamento (None se o curso só existe em memória)."""
+        return self.__chave_armazenada
+
+    @property
+    def aulas_carregadas(self):
+        """Indica se as aulas (ao menos os resumos) já estão em memória."""
+        return self.__resumo is None
+
+    def __carregar_aulas(self):
+        with self.trava:
+            if self.__resumo is None:
+                return
+            for aula in self.__carregador.ler_aulas(self):
+                chave_aula = id(aula)
+                progresso_aula = aula.progresso()
+                self.__aulas[chave_aula] = aula
+                self.__indexar_titulo(aula, aula.titulo)
+                self.__progresso_por_aula[chave_aula] = progresso_aula
+                aula.registrar_observador(self)
+                if self.__trava is not None:
+                    aula.ativar_modo_concorrente(self.__trava)
+            self.__soma_progresso = None
+            self.__tupla_aulas = None
+            # O progresso continua o do resumo (a média dos mesmos valores).
+            self.__resumo = None
+
+    # --- serialização (pickle) ---
+
+    def __getstate__(self):
+        """
+        Assinantes de eventos e observadores (a Trilha) não são copiados:
+        assim, enviar cursos para outro processo não leva a trilha inteira junto.
+        Travas não podem ser copiadas; a cópia começa com o modo concorrente desligado.
+        Um curso ligado a um armazenamento lê as aulas antes: a cópia fica só em memória.
+        """
+        if self.__resumo is not None:
+            self.__carregar_aulas()
+        estado = self.__dict__.copy()
+        estado["_Curso__observadores"] = []
+        estado["_Curso__assinantes"] = None
+        estado["_Curso__trava"] = None
+        estado["_Curso__carregador"] = None
+        estado["_Curso__chave_armazenada"] = None
+        return estado
 
-        soma_progresso = 0.0
-        for aula in self.__aulas:
-            soma_progresso += aula.progresso()
+    def __setstate__(self, estado):
+        """Refaz as chaves id(aula) dos dicionários internos (os ids mudam na cópia)."""
+        self.__dict__.update(estado)
+        ids_novos = {chave: id(aula) for chave, aula in self.__aulas.items()}
 
-        return soma_progresso / len(self.__aulas)
+        self.__aulas = {ids_novos[chave]: aula for chave, aula in self.__aulas.items()}
+        self.__tupla_aulas = None
+        self.__titulo_por_aula = {ids_novos[c]: valor for c, valor in self.__titulo_por_aula.items()}
+        self.__indice_titulos = {
+            titulo: {id(aula): aula for aula in grupo.values()} for titulo, grupo in self.__indice_titulos.items()
+        }
+        self.__progresso_por_aula = {ids_novos[c]: valor for c, valor in self.__progresso_por_aula.items()}
+        self.__aulas_pendentes = {ids_novos[c]: valor for c, valor in self.__aulas_pendentes.items()}
 
     # --- apresentação ---
 
     def __str__(self):
         """Retorna um resumo curto do curso."""
-        return f"Curso: {self.__titulo} ({len(self.__aulas)} aulas, {self.__carga_horas}h)"
+        return f"Curso: {self.__titulo} ({self.quantidade_aulas} aulas, {self.__carga_horas}h)"
 
     def exibir_dados(self):
         """
@@ -115,7 +484,7 @@ class Curso:
         linhas = [
             f"Curso: {self.__titulo}",
             f"Carga horária: {self.__carga_horas}h",
-            f"Quantidade de aulas: {len(self.__aulas)}",
+            f"Quantidade de aulas: {self.quantidade_aulas}",
             f"Progresso do curso: {self.progresso() * 100:.0f}%",
         ]
         return "\n".join(linhas)
@@ -0,0 +1,272 @@
+from functools import partial
+from .EstrategiaProgresso import EstrategiaProgresso
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaFactory import TarefaFactory
+
+
+class EstrategiaPorNiveis(EstrategiaProgresso):
+    """
+    Strategy descrita por níveis, em vez de um cálculo escrito à mão.
+
+    Em cada nível da trilha a estratégia informa:
+    - o peso de cada item: peso_curso(curso), peso_aula(aula), peso_tarefa(tarefa);
+    - como combinar os itens: combinar_cursos(pares), combinar_aulas(pares),
+      combinar_tarefas(pares), onde pares é uma lista de (progresso, peso).
+
+    Peso None vale 1 para todos os itens; combinar None é a média ponderada
+    (0.0 se não houver itens ou se os pesos somarem 0).
+
+    Níveis deixados no padrão não precisam ser percorridos: se nada for definido
+    abaixo do curso, o progresso de cada curso vem do cache (curso.progresso());
+    se nada for definido para as tarefas, o de cada aula vem de aula.progresso().
+
+    Como a estratégia é só uma descrição, várias delas podem ser calculadas em uma
+    única passada pela trilha (veja compilar/executar e PlanoProgresso).
+    """
+
+    # Até onde a passada precisa descer para esta estratégia.
+    NIVEL_CURSO = 1
+    NIVEL_AULA = 2
+    NIVEL_TAREFA = 3
+
+    def __init__(
+        self,
+        nome=None,
+        peso_curso=None,
+        peso_aula=None,
+        peso_tarefa=None,
+        combinar_cursos=None,
+        combinar_aulas=None,
+        combinar_tarefas=None,
+    ):
+        self.__nome = nome or self.__class__.__name__
+        self.__peso_curso = peso_curso
+        self.__peso_aula = peso_aula
+        self.__peso_tarefa = peso_tarefa
+        self.__combinar_cursos = combinar_cursos
+        self.__combinar_aulas = combinar_aulas
+        self.__combinar_tarefas = combinar_tarefas
+
+        if peso_tarefa is not None or combinar_tarefas is not None:
+            self.__profundidade = EstrategiaPorNiveis.NIVEL_TAREFA
+        elif peso_aula is not None or combinar_aulas is not None:
+            self.__profundidade = EstrategiaPorNiveis.NIVEL_AULA
+        else:
+            self.__profundidade = EstrategiaPorNiveis.NIVEL_CURSO
+
+        # Plano de uma estratégia só, montado no primeiro calcular().
+        self.__plano = None
+
+    @property
+    def nome(self):
+        return self.__nome
+
+    @property
+    def profundidade(self):
+        """NIVEL_CURSO, NIVEL_AULA ou NIVEL_TAREFA: o nível mais fundo que a estratégia lê."""
+        return self.__profundidade
+
+    # --- cálculo ---
+
+    def calcular(self, trilha):
+        if self.__plano is None:
+            self.__plano = EstrategiaPorNiveis.compilar([self])
+        return EstrategiaPorNiveis.executar(self.__plano, trilha)[0]
+
+    @staticmethod
+    def compilar(estrategias):
+        """
+        Monta o plano de uma passada única para várias EstrategiaPorNiveis. O plano é feito
+        uma vez e pode ser executado em quantas trilhas for preciso (veja executar).
+
+        Para cada nível há uma lista de passos (posição, peso, combinar) só com as
+        estratégias que combinam itens daquele nível a partir do nível de baixo.
+        """
+        estrategias = tuple(estrategias)
+        NIVEL_AULA = EstrategiaPorNiveis.NIVEL_AULA
+        NIVEL_TAREFA = EstrategiaPorNiveis.NIVEL_TAREFA
+
+        # Estratégias que param no curso/aula leem o progresso em cache daquele nível.
+        no_curso = tuple(i for i, e in enumerate(estrategias) if e.__profundidade < NIVEL_AULA)
+        no_aula = tuple(i for i, e in enumerate(estrategias) if e.__profundidade == NIVEL_AULA)
+
+        passos_tarefas = tuple(
+            (i, e.__peso_tarefa, e.__combinar_tarefas)
+            for i, e in enumerate(estrategias) if e.__profundidade == NIVEL_TAREFA
+        )
+        passos_aulas = tuple(
+            (i, e.__peso_aula, e.__combinar_aulas)
+            for i, e in enumerate(estrategias) if e.__profundidade >= NIVEL_AULA
+        )
+        passos_cursos = tuple((i, e.__peso_curso, e.__combinar_cursos) for i, e in enumerate(estrategias))
+        return len(estrategias), no_curso, no_aula, passos_tarefas, passos_aulas, passos_cursos
+
+    @staticmethod
+    def executar(plano, trilha):
+        """
+        Percorre a trilha uma vez e devolve o valor de cada estratégia do plano, na ordem
+        em que foram compiladas. O progresso de cada curso, aula ou tarefa é lido uma
+        única vez e alimenta todas as estratégias que usam aquele nível.
+        """
+        quantidade, no_curso, no_aula, passos_tarefas, passos_aulas, passos_cursos = plano
+        acumular = EstrategiaPorNiveis.__acumular
+        resultados = EstrategiaPorNiveis.__resultados
+
+        # Acumuladores de cada nível: soma ponderada, soma dos pesos e pares (combinar próprio).
+        somas_trilha, pesos_trilha, pares_trilha = EstrategiaPorNiveis.__acumuladores(quantidade, passos_cursos)
+
+        if not passos_aulas:
+            # Só o nível dos cursos (médias simples e ponderadas): laço direto, sem descer.
+            for curso in trilha.cursos:
+                progresso_curso = curso.progresso()
+                for i, peso, combinar in passos_cursos:
+                    valor_peso = peso(curso) if peso is not None else 1
+                    if combinar is None:
+                        somas_trilha[i] += progresso_curso * valor_peso
+                        pesos_trilha[i] += valor_peso
+                    else:
+                        pares_trilha[i].append((progresso_curso, valor_peso))
+        else:
+            valores_curso = [0.0] * quantidade
+            valores_aula = [0.0] * quantidade
+            for curso in trilha.cursos:
+                if no_curso:
+                    progresso_curso = curso.progresso()
+                    for i in no_curso:
+                        valores_curso[i] = progresso_curso
+
+                somas_curso, pesos_curso, pares_curso = EstrategiaPorNiveis.__acumuladores(
+                    quantidade, passos_aulas
+                )
+
+                for aula in curso.aulas:
+                    if no_aula:
+                        progresso_aula = aula.progresso()
+                        for i in no_aula:
+                            valores_aula[i] = progresso_aula
+
+                    if passos_tarefas:
+                        somas_aula, pesos_aula, pares_aula = EstrategiaPorNiveis.__acumuladores(
+                            quantidade, passos_tarefas
+                        )
+                        for tarefa in aula.tarefas:
+                            progresso_tarefa = tarefa.progresso()
+                            for i, peso, combinar in passos_tarefas:
+                                valor_peso = peso(tarefa) if peso is not None else 1
+                                if combinar is None:
+                                    somas_aula[i] += progresso_tarefa * valor_peso
+                                    pesos_aula[i] += valor_peso
+                                else:
+                                    pares_aula[i].append((progresso_tarefa, valor_peso))
+                        resultados(passos_tarefas, somas_aula, pesos_aula, pares_aula, valores_aula)
+
+                    acumular(passos_aulas, aula, valores_aula, somas_curso, pesos_curso, pares_curso)
+
+                resultados(passos_aulas, somas_curso, pesos_curso, pares_curso, valores_curso)
+
+                acumular(passos_cursos, curso, valores_curso, somas_trilha, pesos_trilha, pares_trilha)
+
+        resultados(passos_cursos, somas_trilha, pesos_trilha, pares_trilha, somas_trilha)
+        return somas_trilha
+
+    # --- acumuladores ---
+
+    @staticmethod
+    def __acumuladores(quantidade, passos):
+        pares = None
+        for i, _, combinar in passos:
+            if combinar is not None:
+                if pares is None:
+                    pares = [None] * quantidade
+                pares[i] = []
+        return [0.0] * quantidade, [0] * quantidade, pares
+
+    @staticmethod
+    def __acumular(passos, item, valores, somas, pesos, pares):
+        for i, peso, combinar in passos:
+            valor_peso = peso(item) if peso is not None else 1
+            if combinar is None:
+                somas[i] += valores[i] * valor_peso
+                pesos[i] += valor_peso
+            else:
+                pares[i].append((valores[i], valor_peso))
+
+    @staticmethod
+    def __resultados(passos, somas, pesos, pares, destino):
+        """
+        Fecha os acumuladores de um nó: média ponderada (0.0 sem peso) ou combinar(pares).
+        destino pode ser a própria lista de somas (cada posição é lida antes de ser trocada).
+        """
+        for i, _, combinar in passos:
+            if combinar is None:
+                destino[i] = somas[i] / pesos[i] if pesos[i] else 0.0
+            else:
+                destino[i] = combinar(pares[i])
+
+    # --- funções de combinação e de peso prontas ---
+
+    @staticmethod
+    def media_ponderada(pares):
+        """Média ponderada de pares (progresso, peso); 0.0 sem itens ou com pesos somando 0."""
+        soma = 0.0
+        pesos = 0
+        for valor, peso in pares:
+            soma += valor * peso
+            pesos += peso
+        return soma / pesos if pesos else 0.0
+
+    @staticmethod
+    def minimo(pares):
+        """Progresso do item mais atrasado (ignora os pesos); 0.0 sem itens."""
+        return min((valor for valor, _ in pares), default=0.0)
+
+    @staticmethod
+    def peso_carga_horaria(curso):
+        """Carga horária do curso (0 vale 1, como em MediaPonderadaPorCargaEstrategia)."""
+        return curso.carga_horas or 1
+
+    @staticmethod
+    def peso_quantidade_aulas(curso):
+        """Quantidade de aulas do curso (sem ler as aulas de um curso ainda não carregado)."""
+        return curso.quantidade_aulas
+
+    @staticmethod
+    def peso_por_tipo(pesos, tarefa):
+        """Peso pelo tipo da tarefa ("leitura", "quiz", ...), desembrulhando TarefaComPrazo; padrão 1."""
+        if isinstance(tarefa, TarefaComPrazo):
+            tarefa = tarefa.tarefa_concreta
+        return pesos.get(TarefaFactory.tipo_de(tarefa), 1)
+
+    @staticmethod
+    def peso_por_prazo(peso_com_prazo, tarefa):
+        """Tarefas com prazo (TarefaComPrazo) pesam peso_com_prazo; as demais pesam 1."""
+        return peso_com_prazo if isinstance(tarefa, TarefaComPrazo) else 1
+
+    # --- estratégias prontas ---
+
+    @staticmethod
+    def por_quantidade_aulas():
+        """Média dos cursos ponderada pela quantidade de aulas de cada um."""
+        return EstrategiaPorNiveis("por_aulas", peso_curso=EstrategiaPorNiveis.peso_quantidade_aulas)
+
+    @staticmethod
+    def por_tipo(pesos):
+        """
+        Média das tarefas de cada aula ponderada pelo tipo da tarefa.
+        Exemplo: EstrategiaPorNiveis.por_tipo({"projeto": 3, "pratica": 2})
+        """
+        return EstrategiaPorNiveis(
+            "por_tipo", peso_tarefa=partial(EstrategiaPorNiveis.peso_por_tipo, dict(pesos))
+        )
+
+    @staticmethod
+    def por_prazo(peso_com_prazo=2):
+        """Média das tarefas de cada aula em que as tarefas com prazo pesam mais."""
+        return EstrategiaPorNiveis(
+            "por_prazo", peso_tarefa=partial(EstrategiaPorNiveis.peso_por_prazo, peso_com_prazo)
+        )
+
+    # --- apresentação ---
+
+    def __str__(self):
+        return f"EstrategiaPorNiveis: {self.__nome}"
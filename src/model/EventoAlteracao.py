@@ -0,0 +1,55 @@
+from enum import Enum
+
+
+class EventoAlteracao:
+    """
+    Evento emitido por uma tarefa quando um campo muda.
+
+    Guarda a tarefa que mudou, o nome do campo (ex.: "status", "paginas_lidas", "prazo"),
+    o valor anterior e o valor novo. O evento sobe pela mesma cadeia de observadores
+    do cache de progresso: tarefa → (TarefaComPrazo) → Aula → Curso → Trilha.
+    """
+
+    __slots__ = ("__tarefa", "__campo", "__valor_anterior", "__valor_novo")
+
+    def __init__(self, tarefa, campo, valor_anterior, valor_novo):
+        self.__tarefa = tarefa
+        self.__campo = campo
+        self.__valor_anterior = valor_anterior
+        self.__valor_novo = valor_novo
+
+    @property
+    def tarefa(self):
+        """Tarefa em que o campo foi alterado (a tarefa concreta, mesmo dentro de um decorator)."""
+        return self.__tarefa
+
+    @property
+    def campo(self):
+        return self.__campo
+
+    @property
+    def valor_anterior(self):
+        return self.__valor_anterior
+
+    @property
+    def valor_novo(self):
+        return self.__valor_novo
+
+    def combinar(self, posterior):
+        """
+        Junta este evento com um evento posterior do mesmo campo da mesma tarefa:
+        mantém o valor anterior deste e o valor novo do posterior.
+        """
+        return EventoAlteracao(self.__tarefa, self.__campo, self.__valor_anterior, posterior.valor_novo)
+
+    @staticmethod
+    def __formatar(valor):
+        """Enums aparecem pelo nome (ex.: CONCLUIDA); os demais valores pelo repr."""
+        return valor.name if isinstance(valor, Enum) else repr(valor)
+
+    def __str__(self):
+        return (
+            f"{self.__tarefa.titulo}.{self.__campo}: "
+            f"{EventoAlteracao.__formatar(self.__valor_anterior)} -> "
+            f"{EventoAlteracao.__formatar(self.__valor_novo)}"
+        )
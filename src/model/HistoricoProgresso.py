@@ -0,0 +1,475 @@
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import nullcontext
+from datetime import datetime
+from .StatusTarefa import StatusTarefa
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from .MediaParalelaEstrategia import MediaParalelaEstrategia
+
+
+# Status gravados no log como um byte (-1 = tarefa fora da trilha naquele momento).
+_STATUS = tuple(StatusTarefa)
+_CODIGO_STATUS = {status: codigo for codigo, status in enumerate(_STATUS)}
+_AUSENTE = -1
+# Status gravado nos slots de aula e de curso enquanto estão na trilha.
+_NA_TRILHA = 0
+
+
+class HistoricoProgresso:
+    """
+    Histórico do progresso de uma trilha: permite perguntar "qual era o progresso em X?".
+
+    O histórico observa as tarefas da trilha (como IndicePrazos e RelatorioTrilha). A cada
+    alteração que muda o progresso ou o status de uma tarefa, um delta é acrescentado ao log:
+    (momento, tarefa, progresso, status). O log é colunar, em array.array de tipos fixos
+    (cerca de 21 bytes por delta), e só cresce.
+
+    A cada intervalo_checkpoint deltas é guardado um checkpoint: o progresso e o status de
+    todas as tarefas naquele ponto do log. Para reconstruir um momento, o histórico parte do
+    último checkpoint anterior a ele e reaplica só os deltas seguintes; o custo de uma consulta
+    fica limitado a intervalo_checkpoint deltas, por maior que seja o log. O intervalo padrão
+    é a quantidade de slots (mínimo 1000), então copiar o estado no checkpoint custa, em
+    média, uma posição por delta.
+
+    Aulas e cursos também ocupam um slot no log, com progresso 0.0 enquanto estão na trilha:
+    as médias de um momento contam as aulas e os cursos daquele momento, inclusive os vazios,
+    como Aula.progresso(), Curso.progresso() e as estratégias. Tarefas, aulas e cursos
+    incluídos ou removidos da trilha entram no log em sincronizar() ou checkpoint().
+    A média ponderada usa a carga horária atual de cada curso.
+    """
+
+    _SEM_TRAVA = nullcontext()
+
+    def __init__(self, trilha, intervalo_checkpoint=None, relogio=None):
+        """
+        Parâmetros:
+            trilha: trilha acompanhada (suas tarefas passam a ser observadas).
+            intervalo_checkpoint: quantidade de deltas entre dois checkpoints
+                                  (padrão: quantidade de slots, no mínimo 1000).
+            relogio: função sem argumentos que devolve o momento atual em segundos
+                     (padrão: time.time). Útil para simular datas nos testes.
+        """
+        if intervalo_checkpoint is not None and intervalo_checkpoint < 1:
+            raise ValueError("O intervalo entre checkpoints deve ser de pelo menos 1 delta.")
+
+        self.__trilha = trilha
+        self.__relogio = relogio or time.time
+        # Alterações podem chegar de threads de cursos diferentes no modo concorrente.
+        self.__trava = threading.Lock() if trilha.modo_concorrente else None
+
+        # Estrutura: slot -> tarefa e índice da aula (None e -1 nos slots de aula e de curso);
+        # aula -> curso e slot; curso -> slot. Os dicionários por id guardam só o que está
+        # na trilha agora; as listas guardam tudo o que já passou por ela.
+        self.__tarefas = []
+        self.__slot_por_id = {}
+        self.__aula_do_slot = array("i")
+        self.__aulas = []
+        self.__indice_aula = {}
+        self.__curso_da_aula = array("I")
+        self.__slot_da_aula = array("I")
+        self.__cursos = []
+        self.__indice_curso = {}
+        self.__slot_do_curso = array("I")
+
+        # Estado atual de cada slot (NaN / -1 = fora da trilha).
+        self.__progresso_atual = array("d")
+        self.__status_atual = array("b")
+
+        # Log de deltas, uma coluna por campo.
+        self.__momentos = array("d")
+        self.__slots = array("I")
+        self.__progressos = array("d")
+        self.__codigos_status = array("b")
+
+        # Checkpoints: (momento, posição no log, progressos, status) e os momentos para bisect.
+        self.__checkpoints = []
+        self.__momentos_checkpoint = []
+
+        self.__ultimo_momento = float("-inf")
+        self.__aplicar_estrutura(self.__ler_estrutura(), registrar=False)
+        self.__intervalo_checkpoint = int(intervalo_checkpoint or max(1000, len(self.__tarefas)))
+        self.__salvar_checkpoint(self.__agora())
+
+    @property
+    def trava(self):
+        return self.__trava if self.__trava is not None else HistoricoProgresso._SEM_TRAVA
+
+    @property
+    def inicio(self):
+        """Momento (datetime) a partir do qual o histórico pode ser consultado."""
+        return datetime.fromtimestamp(self.__momentos_checkpoint[0])
+
+    # --- registro ---
+
+    def __agora(self):
+        # O log precisa estar em ordem de momento para a busca binária: um relógio que
+        # volta (ajuste do sistema) não pode gravar um momento anterior ao último.
+        momento = float(self.__relogio())
+        if momento < self.__ultimo_momento:
+            momento = self.__ultimo_momento
+        self.__ultimo_momento = momento
+        return momento
+
+    def tarefa_alterada(self, tarefa, evento=None):
+        """Chamado pela tarefa quando algum dado muda: grava um delta se progresso ou status mudou."""
+        slot = self.__slot_por_id.get(id(tarefa))
+        if slot is None:
+            return
+
+        progresso = tarefa.progresso()
+        codigo = _CODIGO_STATUS[tarefa.status]
+
+        with self.trava:
+            if progresso == self.__progresso_atual[slot] and codigo == self.__status_atual[slot]:
+                return
+            momento = self.__gravar(slot, progresso, codigo)
+            # O checkpoint automático só copia o estado: ler a estrutura da trilha aqui
+            # (com a trava da aula de quem alterou) poderia travar no modo concorrente.
+            if len(self.__momentos) - self.__checkpoints[-1][1] >= self.__intervalo_checkpoint:
+                self.__salvar_checkpoint(momento)
+
+    def __gravar(self, slot, progresso, codigo):
+        momento = self.__agora()
+        self.__momentos.append(momento)
+        self.__slots.append(slot)
+        self.__progressos.append(progresso)
+        self.__codigos_status.append(codigo)
+        self.__progresso_atual[slot] = progresso
+        self.__status_atual[slot] = codigo
+        return momento
+
+    def __salvar_checkpoint(self, momento):
+        self.__checkpoints.append(
+            (momento, len(self.__momentos), array("d", self.__progresso_atual), array("b", self.__status_atual))
+        )
+        self.__momentos_checkpoint.append(momento)
+
+    def checkpoint(self):
+        """Sincroniza a estrutura e grava um checkpoint agora (além dos automáticos)."""
+        estrutura = self.__ler_estrutura()
+        with self.trava:
+            self.__aplicar_estrutura(estrutura, registrar=True)
+            self.__salvar_checkpoint(self.__agora())
+
+    def sincronizar(self):
+        """
+        Confere a estrutura da trilha: tarefas novas entram no log com o progresso atual e
+        tarefas que saíram são marcadas como ausentes. Retorna (incluídas, removidas).
+        """
+        estrutura = self.__ler_estrutura()
+        with self.trava:
+            return self.__aplicar_estrutura(estrutura, registrar=True)
+
+    def __ler_estrutura(self):
+        """(curso, [(aula, tarefas), ...]) de toda a trilha, lidos fora da trava do histórico."""
+        return [
+            (curso, [(aula, aula.tarefas) for aula in curso.aulas])
+            for curso in self.__trilha.cursos
+        ]
+
+    def __aplicar_estrutura(self, estrutura, registrar):
+        cursos_vistos = set()
+        aulas_vistas = set()
+        vistos = set()
+        incluidas = 0
+
+        for curso, aulas in estrutura:
+            indice_curso = self.__indice_curso.get(id(curso))
+            if indice_curso is None:
+                indice_curso = self.__incluir_curso(curso, registrar)
+            cursos_vistos.add(indice_curso)
+
+            for aula, tarefas in aulas:
+                indice_aula = self.__indice_aula.get(id(aula))
+                # Aula movida para outro curso ganha um índice novo (e suas tarefas, slots novos).
+                if indice_aula is not None and self.__curso_da_aula[indice_aula] != indice_curso:
+                    self.__retirar_aula(indice_aula, registrar)
+                    indice_aula = None
+                if indice_aula is None:
+                    indice_aula = self.__incluir_aula(aula, indice_curso, registrar)
+                aulas_vistas.add(indice_aula)
+
+                for tarefa in tarefas:
+                    slot = self.__slot_por_id.get(id(tarefa))
+                    # Tarefa movida para outra aula ganha um slot novo.
+                    if slot is not None and self.__aula_do_slot[slot] != indice_aula:
+                        self.__retirar(slot, registrar)
+                        slot = None
+                    if slot is None:
+                        slot = self.__incluir(tarefa, indice_aula, registrar)
+                        incluidas += 1
+                    vistos.add(slot)
+
+        removidas = 0
+        for slot in [slot for slot in self.__slot_por_id.values() if slot not in vistos]:
+            self.__retirar(slot, registrar)
+            removidas += 1
+        for indice in [indice for indice in self.__indice_aula.values() if indice not in aulas_vistas]:
+            self.__retirar_aula(indice, registrar)
+        for indice in [indice for indice in self.__indice_curso.values() if indice not in cursos_vistos]:
+            self.__retirar_curso(indice, registrar)
+
+        return incluidas, removidas
+
+    def __novo_slot(self, tarefa, indice_aula):
+        slot = len(self.__tarefas)
+        # A tarefa fica guardada mesmo depois de sair: o id não é reaproveitado por outro objeto.
+        self.__tarefas.append(tarefa)
+        self.__aula_do_slot.append(indice_aula)
+        self.__progresso_atual.append(math.nan)
+        self.__status_atual.append(_AUSENTE)
+        return slot
+
+    def __marcar(self, slot, progresso, codigo, registrar):
+        if registrar:
+            self.__gravar(slot, progresso, codigo)
+        else:
+            self.__progresso_atual[slot] = progresso
+            self.__status_atual[slot] = codigo
+
+    def __incluir_curso(self, curso, registrar):
+        indice_curso = self.__indice_curso[id(curso)] = len(self.__cursos)
+        self.__cursos.append(curso)
+        slot = self.__novo_slot(None, -1)
+        self.__slot_do_curso.append(slot)
+        self.__marcar(slot, 0.0, _NA_TRILHA, registrar)
+        return indice_curso
+
+    def __incluir_aula(self, aula, indice_curso, registrar):
+        indice_aula = self.__indice_aula[id(aula)] = len(self.__aulas)
+        self.__aulas.append(aula)
+        self.__curso_da_aula.append(indice_curso)
+        slot = self.__novo_slot(None, -1)
+        self.__slot_da_aula.append(slot)
+        self.__marcar(slot, 0.0, _NA_TRILHA, registrar)
+        return indice_aula
+
+    def __incluir(self, tarefa, indice_aula, registrar):
+        slot = self.__novo_slot(tarefa, indice_aula)
+        self.__slot_por_id[id(tarefa)] = slot
+        tarefa.registrar_observador(self)
+        self.__marcar(slot, tarefa.progresso(), _CODIGO_STATUS[tarefa.status], registrar)
+        return slot
+
+    def __retirar(self, slot, registrar):
+        tarefa = self.__tarefas[slot]
+        del self.__slot_por_id[id(tarefa)]
+        tarefa.remover_observador(self)
+        if registrar:
+            self.__gravar(slot, math.nan, _AUSENTE)
+
+    def __retirar_aula(self, indice_aula, registrar):
+        del self.__indice_aula[id(self.__aulas[indice_aula])]
+        if registrar:
+            self.__gravar(self.__slot_da_aula[indice_aula], math.nan, _AUSENTE)
+
+    def __retirar_curso(self, indice_curso, registrar):
+        del self.__indice_curso[id(self.__cursos[indice_curso])]
+        if registrar:
+            self.__gravar(self.__slot_do_curso[indice_curso], math.nan, _AUSENTE)
+
+    def fechar(self):
+        """Deixa de observar as tarefas (o histórico gravado continua consultável)."""
+        with self.trava:
+            for slot in self.__slot_por_id.values():
+                self.__tarefas[slot].remover_observador(self)
+            self.__slot_por_id.clear()
+
+    # --- reconstrução ---
+
+    @staticmethod
+    def __segundos(momento):
+        return momento.timestamp() if isinstance(momento, datetime) else float(momento)
+
+    def __estado_em(self, segundos):
+        """Progresso e status de cada slot no momento: último checkpoint + deltas até ele."""
+        indice = bisect_right(self.__momentos_checkpoint, segundos) - 1
+        if indice < 0:
+            raise ValueError(f"O histórico começa em {self.inicio:%d-%m-%Y %H:%M:%S}.")
+
+        _, posicao, progressos, codigos = self.__checkpoints[indice]
+        progressos = array("d", progressos)
+        codigos = array("b", codigos)
+        fim = bisect_right(self.__momentos, segundos, posicao)
+        self.__reaplicar(progressos, codigos, posicao, fim)
+        return progressos, codigos, fim
+
+    def __reaplicar(self, progressos, codigos, inicio, fim):
+        # Slots incluídos depois do checkpoint ainda não existiam nele.
+        faltando = len(self.__tarefas) - len(progressos)
+        if faltando > 0:
+            progressos.extend([math.nan] * faltando)
+            codigos.extend([_AUSENTE] * faltando)
+
+        slots = self.__slots
+        valores = self.__progressos
+        status = self.__codigos_status
+        for posicao in range(inicio, fim):
+            slot = slots[posicao]
+            progressos[slot] = valores[posicao]
+            codigos[slot] = status[posicao]
+
+    @staticmethod
+    def __ponderada(estrategia):
+        """Indica se a estratégia é a média ponderada por carga (None = média simples)."""
+        if estrategia is None:
+            return False
+        if type(estrategia) is MediaPonderadaPorCargaEstrategia:
+            return True
+        if type(estrategia) is MediaSimplesEstrategia:
+            return False
+        if type(estrategia) is MediaParalelaEstrategia:
+            return estrategia.ponderada_por_carga
+        raise ValueError(
+            "O histórico reconstrói a média simples e a média ponderada por carga horária."
+        )
+
+    def __medias_cursos(self, progressos):
+        """
+        Lista (curso, média das aulas) dos cursos na trilha no estado dado. Como em Aula
+        e Curso, aula sem tarefas vale 0.0 e curso sem aulas vale 0.0.
+        """
+        quantidade_aulas = len(self.__aulas)
+        somas_aula = [0.0] * quantidade_aulas
+        tarefas_aula = [0] * quantidade_aulas
+
+        aula_do_slot = self.__aula_do_slot
+        for slot, progresso in enumerate(progressos):
+            indice_aula = aula_do_slot[slot]
+            # -1: slot de aula ou curso; NaN: tarefa fora da trilha.
+            if indice_aula >= 0 and progresso == progresso:
+                somas_aula[indice_aula] += progresso
+                tarefas_aula[indice_aula] += 1
+
+        quantidade_cursos = len(self.__cursos)
+        somas_curso = [0.0] * quantidade_cursos
+        aulas_curso = [0] * quantidade_cursos
+        for indice_aula, slot in enumerate(self.__slot_da_aula):
+            if progressos[slot] == progressos[slot]:  # aula na trilha no momento
+                quantidade = tarefas_aula[indice_aula]
+                indice_curso = self.__curso_da_aula[indice_aula]
+                somas_curso[indice_curso] += somas_aula[indice_aula] / quantidade if quantidade else 0.0
+                aulas_curso[indice_curso] += 1
+
+        return [
+            (curso, somas_curso[indice] / aulas_curso[indice] if aulas_curso[indice] else 0.0)
+            for indice, curso in enumerate(self.__cursos)
+            if progressos[self.__slot_do_curso[indice]] == progressos[self.__slot_do_curso[indice]]
+        ]
+
+    def __progresso_trilha(self, progressos, ponderada):
+        medias = self.__medias_cursos(progressos)
+        if not medias:
+            return 0.0
+        if not ponderada:
+            return sum(media for _, media in medias) / len(medias)
+
+        soma = 0.0
+        pesos = 0
+        for curso, media in medias:
+            peso = curso.carga_horas or 1
+            soma += media * peso
+            pesos += peso
+        return soma / pesos
+
+    # --- consultas ---
+
+    def progresso_em(self, momento, estrategia=None):
+        """
+        Progresso da trilha no momento (datetime ou segundos), com a média simples
+        (padrão) ou a ponderada por carga (MediaPonderadaPorCargaEstrategia).
+        """
+        ponderada = HistoricoProgresso.__ponderada(estrategia)
+        with self.trava:
+            progressos, _, _ = self.__estado_em(HistoricoProgresso.__segundos(momento))
+        return self.__progresso_trilha(progressos, ponderada)
+
+    def progresso_cursos_em(self, momento):
+        """Dicionário título do curso -> progresso no momento (cursos na trilha naquele momento)."""
+        with self.trava:
+            progressos, _, _ = self.__estado_em(HistoricoProgresso.__segundos(momento))
+        return {curso.titulo: media for curso, media in self.__medias_cursos(progressos)}
+
+    def status_em(self, tarefa, momento):
+        """StatusTarefa da tarefa no momento (None se ela não estava na trilha ou não é acompanhada)."""
+        with self.trava:
+            slot = self.__slot_da_tarefa(tarefa)
+            if slot is None:
+                return None
+            _, codigos, _ = self.__estado_em(HistoricoProgresso.__segundos(momento))
+        codigo = codigos[slot]
+        return _STATUS[codigo] if codigo != _AUSENTE else None
+
+    def __slot_da_tarefa(self, tarefa):
+        slot = self.__slot_por_id.get(id(tarefa))
+        if slot is None:
+            # Tarefa que já saiu da trilha: procura entre as guardadas.
+            slot = next((indice for indice, guardada in enumerate(self.__tarefas) if guardada is tarefa), None)
+        return slot
+
+    def serie(self, momentos, estrategia=None):
+        """
+        Progresso da trilha em vários momentos (ex.: o fim de cada dia de um mês).
+        Os momentos são visitados em ordem: quando não há checkpoint entre dois deles,
+        o estado do anterior é avançado só com os deltas do intervalo.
+        Retorna os valores na ordem dos momentos recebidos.
+        """
+        ponderada = HistoricoProgresso.__ponderada(estrategia)
+        momentos = [HistoricoProgresso.__segundos(momento) for momento in momentos]
+        valores = [0.0] * len(momentos)
+
+        with self.trava:
+            progressos = codigos = None
+            checkpoint_atual = -1
+            posicao = 0
+            for indice in sorted(range(len(momentos)), key=momentos.__getitem__):
+                segundos = momentos[indice]
+                checkpoint = bisect_right(self.__momentos_checkpoint, segundos) - 1
+                if progressos is None or checkpoint != checkpoint_atual:
+                    progressos, codigos, posicao = self.__estado_em(segundos)
+                    checkpoint_atual = checkpoint
+                else:
+                    fim = bisect_right(self.__momentos, segundos, posicao)
+                    self.__reaplicar(progressos, codigos, posicao, fim)
+                    posicao = fim
+                valores[indice] = self.__progresso_trilha(progressos, ponderada)
+
+        return valores
+
+    # --- informações ---
+
+    def __len__(self):
+        """Quantidade de deltas no log."""
+        return len(self.__momentos)
+
+    @property
+    def estatisticas(self):
+        """Deltas, checkpoints, tarefas acompanhadas e bytes ocupados pelo log e pelos checkpoints."""
+        bytes_log = sum(
+            coluna.itemsize * len(coluna)
+            for coluna in (self.__momentos, self.__slots, self.__progressos, self.__codigos_status)
+        )
+        bytes_checkpoints = sum(
+            progressos.itemsize * len(progressos) + codigos.itemsize * len(codigos)
+            for _, _, progressos, codigos in self.__checkpoints
+        )
+        return {
+            "deltas": len(self.__momentos),
+            "checkpoints": len(self.__checkpoints),
+            "tarefas": len(self.__slot_por_id),
+            "bytes_log": bytes_log,
+            "bytes_checkpoints": bytes_checkpoints,
+        }
+
+    # --- contexto ---
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
+        return False
@@ -0,0 +1,321 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from itertools import count
+from .StatusTarefa import StatusTarefa
+from .TarefaComPrazo import TarefaComPrazo
+
+
+class IndicePrazos:
+    """
+    Índice ordenado pelos prazos das tarefas com prazo (TarefaComPrazo) ainda não concluídas.
+
+    Os prazos ficam em pares (prazo, sequência) ordenados, divididos em blocos de até
+    2 * TAMANHO_BLOCO pares (cada bloco é uma lista ordenada, mantida com bisect). Incluir
+    ou retirar um prazo mexe em um bloco só, em vez de deslocar a lista inteira.
+    Consultas por intervalo ("prazos nas próximas 24h") e "próximos N prazos" localizam o
+    início do resultado por busca binária e custam O(log n + tamanho do resultado).
+
+    O índice se registra como observador de cada TarefaComPrazo: quando o prazo muda ou a
+    tarefa é concluída, a posição da tarefa é atualizada (ou ela sai do índice).
+    Em decorators empilhados, cada camada com prazo entra no índice com o seu próprio prazo.
+
+    Criado a partir de uma trilha, o índice também observa os cursos e as aulas: tarefas
+    incluídas ou removidas depois (e aulas e cursos novos) entram ou saem sozinhas.
+    Os avisos de estrutura só marcam a aula (ou o curso) como pendente; a aula é conferida
+    uma vez, na próxima consulta. Sem trilha, as tarefas entram com adicionar().
+    """
+
+    # Tamanho de referência dos blocos: um bloco com o dobro disso é dividido ao meio.
+    TAMANHO_BLOCO = 512
+
+    def __init__(self, trilha=None):
+        """
+        Parâmetros:
+            trilha: se informada, as TarefaComPrazo da trilha entram no índice e o índice
+                    acompanha as tarefas, aulas e cursos incluídos ou removidos depois.
+        """
+        # Blocos de pares (prazo, sequência) ordenados; a sequência desempata prazos iguais.
+        # maximos[i] é o último par de blocos[i] (busca binária pelo bloco certo).
+        self.__blocos = []
+        self.__maximos = []
+        self.__quantidade = 0
+        # sequência -> tarefa
+        self.__tarefas = {}
+        # id(tarefa) -> par (prazo, sequência) atual, ou None se a tarefa está fora dos blocos
+        # (sem prazo ou concluída), mas continua sendo observada.
+        self.__chave_por_tarefa = {}
+        self.__sequencia = count()
+
+        self.__trilha = trilha
+        self.__cursos_observados = 0
+        # id(curso) -> {id(aula): aula} e id(aula) -> {id(tarefa): tarefa} (tarefas da aula
+        # que entraram no índice), para saber o que saiu quando a estrutura muda.
+        self.__aulas_por_curso = {}
+        self.__tarefas_por_aula = {}
+        # Em quantos cursos cada aula está e em quantas aulas cada tarefa está: uma aula ou
+        # tarefa movida continua no índice, em qualquer ordem que as mudanças sejam conferidas.
+        self.__cursos_com_aula = {}
+        self.__aulas_com_tarefa = {}
+        # Cursos e aulas avisados de mudança na estrutura, conferidos na próxima consulta.
+        self.__cursos_pendentes = {}
+        self.__aulas_pendentes = {}
+
+        if trilha is not None:
+            # Na montagem inicial os pares são acrescentados sem ordem e ordenados uma vez só.
+            self.__montando = []
+            self.__sincronizar()
+            self.__montar_blocos(sorted(self.__montando))
+            self.__montando = None
+        else:
+            self.__montando = None
+
+    # --- manutenção ---
+
+    def adicionar(self, tarefa):
+        """
+        Inclui a tarefa (e as camadas TarefaComPrazo que ela envolve) no índice.
+        Tarefas sem TarefaComPrazo são ignoradas.
+        """
+        self.__registrar(tarefa)
+
+    def __registrar(self, tarefa):
+        while isinstance(tarefa, TarefaComPrazo):
+            if id(tarefa) not in self.__chave_por_tarefa:
+                self.__chave_por_tarefa[id(tarefa)] = None
+                self.__posicionar(tarefa)
+                tarefa.registrar_observador(self)
+            tarefa = tarefa.tarefa_base
+
+    def remover(self, tarefa):
+        """Retira a tarefa (e suas camadas TarefaComPrazo) do índice e deixa de observá-la."""
+        while isinstance(tarefa, TarefaComPrazo):
+            if id(tarefa) in self.__chave_por_tarefa:
+                self.__retirar(tarefa)
+                del self.__chave_por_tarefa[id(tarefa)]
+                tarefa.remover_observador(self)
+            tarefa = tarefa.tarefa_base
+
+    def tarefa_alterada(self, tarefa, evento=None):
+        """Chamado pela TarefaComPrazo quando algo muda (prazo, status, data, ...)."""
+        if id(tarefa) in self.__chave_por_tarefa:
+            self.__posicionar(tarefa)
+
+    def aula_alterada(self, aula, evento=None):
+        """Chamado pela aula; sem evento, tarefas entraram ou saíram (conferida na próxima consulta)."""
+        if evento is None:
+            self.__aulas_pendentes[id(aula)] = aula
+
+    def curso_alterado(self, curso, evento=None):
+        """Chamado pelo curso; sem evento, aulas (ou tarefas) entraram ou saíram."""
+        if evento is None:
+            self.__cursos_pendentes[id(curso)] = curso
+
+    def __sincronizar(self):
+        """Confere os cursos novos da trilha e as aulas e cursos avisados desde a última consulta."""
+        if self.__trilha is None:
+            return
+
+        cursos = self.__trilha.cursos
+        for curso in cursos[self.__cursos_observados:]:
+            self.__aulas_por_curso[id(curso)] = {}
+            curso.registrar_observador(self)
+            self.__conferir_aulas(curso)
+        self.__cursos_observados = len(cursos)
+
+        # Na ordem dos avisos: prazos iguais ficam na ordem em que as tarefas entraram.
+        while self.__cursos_pendentes:
+            cursos, self.__cursos_pendentes = self.__cursos_pendentes, {}
+            for curso in cursos.values():
+                self.__conferir_aulas(curso)
+        while self.__aulas_pendentes:
+            aulas, self.__aulas_pendentes = self.__aulas_pendentes, {}
+            for aula in aulas.values():
+                self.__conferir_tarefas(aula)
+
+    def __conferir_aulas(self, curso):
+        """Passa a observar as aulas novas do curso e esquece as que saíram (O(aulas do curso))."""
+        conhecidas = self.__aulas_por_curso.get(id(curso))
+        if conhecidas is None:
+            return
+
+        atuais = {id(aula): aula for aula in curso.aulas}
+        for chave_aula in conhecidas.keys() - atuais.keys():
+            self.__sair_do_curso(conhecidas.pop(chave_aula))
+        for chave_aula in atuais.keys() - conhecidas.keys():
+            aula = conhecidas[chave_aula] = atuais[chave_aula]
+            cursos = self.__cursos_com_aula.get(chave_aula, 0)
+            self.__cursos_com_aula[chave_aula] = cursos + 1
+            if not cursos:
+                self.__tarefas_por_aula[chave_aula] = {}
+                aula.registrar_observador(self)
+                self.__aulas_pendentes[chave_aula] = aula
+
+    def __conferir_tarefas(self, aula):
+        """Inclui as tarefas novas da aula e retira as que saíram (O(tarefas da aula))."""
+        conhecidas = self.__tarefas_por_aula.get(id(aula))
+        if conhecidas is None:
+            return
+
+        atuais = {id(tarefa): tarefa for tarefa in aula.tarefas}
+        for chave_tarefa in conhecidas.keys() - atuais.keys():
+            self.__sair_da_aula(conhecidas.pop(chave_tarefa))
+        for chave_tarefa in atuais.keys() - conhecidas.keys():
+            tarefa = conhecidas[chave_tarefa] = atuais[chave_tarefa]
+            self.__aulas_com_tarefa[chave_tarefa] = self.__aulas_com_tarefa.get(chave_tarefa, 0) + 1
+            self.__registrar(tarefa)
+
+    def __sair_do_curso(self, aula):
+        restantes = self.__cursos_com_aula.pop(id(aula)) - 1
+        if restantes:
+            self.__cursos_com_aula[id(aula)] = restantes
+            return
+
+        aula.remover_observador(self)
+        self.__aulas_pendentes.pop(id(aula), None)
+        for tarefa in self.__tarefas_por_aula.pop(id(aula)).values():
+            self.__sair_da_aula(tarefa)
+
+    def __sair_da_aula(self, tarefa):
+        restantes = self.__aulas_com_tarefa.pop(id(tarefa)) - 1
+        if restantes:
+            self.__aulas_com_tarefa[id(tarefa)] = restantes
+        else:
+            self.remover(tarefa)
+
+    def __posicionar(self, tarefa):
+        """Coloca a tarefa na posição do prazo atual, ou a retira se não estiver pendente."""
+        chave_atual = self.__chave_por_tarefa[id(tarefa)]
+        pendente = tarefa.prazo is not None and tarefa.status != StatusTarefa.CONCLUIDA
+
+        if chave_atual is not None:
+            if pendente and chave_atual[0] == tarefa.prazo:
+                return
+            self.__retirar(tarefa)
+
+        if pendente:
+            chave = (tarefa.prazo, next(self.__sequencia))
+            if self.__montando is not None:
+                self.__montando.append(chave)
+            else:
+                self.__inserir(chave)
+            self.__tarefas[chave[1]] = tarefa
+            self.__chave_por_tarefa[id(tarefa)] = chave
+
+    def __retirar(self, tarefa):
+        chave = self.__chave_por_tarefa[id(tarefa)]
+        if chave is None:
+            return
+
+        if self.__montando is not None:
+            self.__montando.remove(chave)
+        else:
+            self.__apagar(chave)
+        del self.__tarefas[chave[1]]
+        self.__chave_por_tarefa[id(tarefa)] = None
+
+    # --- blocos ordenados ---
+
+    def __montar_blocos(self, chaves):
+        tamanho = IndicePrazos.TAMANHO_BLOCO
+        self.__blocos = [chaves[inicio:inicio + tamanho] for inicio in range(0, len(chaves), tamanho)]
+        self.__maximos = [bloco[-1] for bloco in self.__blocos]
+        self.__quantidade = len(chaves)
+
+    def __inserir(self, chave):
+        if not self.__blocos:
+            self.__blocos.append([chave])
+            self.__maximos.append(chave)
+            self.__quantidade = 1
+            return
+
+        # Primeiro bloco cujo último par é maior; depois do último par, vai para o último bloco.
+        posicao = min(bisect_left(self.__maximos, chave), len(self.__blocos) - 1)
+        bloco = self.__blocos[posicao]
+        insort(bloco, chave)
+        self.__maximos[posicao] = bloco[-1]
+        self.__quantidade += 1
+
+        tamanho = IndicePrazos.TAMANHO_BLOCO
+        if len(bloco) > 2 * tamanho:
+            metade = bloco[tamanho:]
+            del bloco[tamanho:]
+            self.__blocos.insert(posicao + 1, metade)
+            self.__maximos[posicao] = bloco[-1]
+            self.__maximos.insert(posicao + 1, metade[-1])
+
+    def __apagar(self, chave):
+        posicao = bisect_left(self.__maximos, chave)
+        bloco = self.__blocos[posicao]
+        del bloco[bisect_left(bloco, chave)]
+        self.__quantidade -= 1
+
+        if bloco:
+            self.__maximos[posicao] = bloco[-1]
+        else:
+            del self.__blocos[posicao]
+            del self.__maximos[posicao]
+
+    def __localizar(self, momento):
+        """(bloco, posição) do primeiro par com prazo >= momento (None: o primeiro par)."""
+        if momento is None:
+            return 0, 0
+        posicao = bisect_left(self.__maximos, (momento,))
+        if posicao == len(self.__blocos):
+            return posicao, 0
+        return posicao, bisect_left(self.__blocos[posicao], (momento,))
+
+    # --- consultas ---
+
+    def entre(self, inicio=None, fim=None):
+        """
+        Retorna as tarefas pendentes com inicio <= prazo < fim, em ordem de prazo.
+        inicio=None e fim=None deixam o intervalo aberto daquele lado.
+        """
+        self.__sincronizar()
+        posicao, primeira = self.__localizar(inicio)
+        resultado = []
+        for indice in range(posicao, len(self.__blocos)):
+            bloco = self.__blocos[indice]
+            if fim is not None and bloco[-1][0] >= fim:
+                ultima = bisect_left(bloco, (fim,))
+                resultado.extend(self.__tarefas[sequencia] for _, sequencia in bloco[primeira:ultima])
+                break
+            resultado.extend(self.__tarefas[sequencia] for _, sequencia in bloco[primeira:])
+            primeira = 0
+        return resultado
+
+    def proximos(self, quantidade, a_partir_de=None):
+        """Retorna os próximos prazos pendentes a partir de a_partir_de (padrão: agora)."""
+        if a_partir_de is None:
+            a_partir_de = datetime.now()
+
+        self.__sincronizar()
+        posicao, primeira = self.__localizar(a_partir_de)
+        resultado = []
+        for indice in range(posicao, len(self.__blocos)):
+            faltam = quantidade - len(resultado)
+            if faltam <= 0:
+                break
+            bloco = self.__blocos[indice]
+            resultado.extend(self.__tarefas[sequencia] for _, sequencia in bloco[primeira:primeira + faltam])
+            primeira = 0
+        return resultado
+
+    def vencidas(self, agora=None):
+        """Retorna as tarefas pendentes cujo prazo já passou."""
+        return self.entre(fim=agora or datetime.now())
+
+    def em_risco(self, janela=timedelta(hours=24), agora=None):
+        """Retorna as tarefas pendentes cujo prazo vence dentro da janela (padrão: 24h)."""
+        agora = agora or datetime.now()
+        return self.entre(agora, agora + janela)
+
+    def __len__(self):
+        """Quantidade de prazos pendentes no índice."""
+        self.__sincronizar()
+        return self.__quantidade
+
+    # --- apresentação ---
+
+    def __str__(self):
+        return f"IndicePrazos ({len(self)} prazos pendentes)"
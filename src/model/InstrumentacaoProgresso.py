@@ -0,0 +1,326 @@
+import json
+import marshal
+import pstats
+import threading
+import time
+from types import SimpleNamespace
+from .Aula import Aula
+from .Curso import Curso
+from .Trilha import Trilha
+from .TarefaEstudo import TarefaEstudo
+from .TarefaLeitura import TarefaLeitura
+from .TarefaQuiz import TarefaQuiz
+from .TarefaPratica import TarefaPratica
+from .TarefaProjeto import TarefaProjeto
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaFactory import TarefaFactory
+
+
+# Posições do registro de cada ponto medido (uma lista por ponto, por thread).
+_CHAMADAS, _PRIMITIVAS, _TEMPO_PROPRIO, _TEMPO_TOTAL, _CHAMADORES, _DETALHES = range(6)
+
+# Classes cujos progresso() e setters são medidos (as tarefas dão a divisão por tipo).
+_TAREFAS = (TarefaEstudo, TarefaLeitura, TarefaQuiz, TarefaPratica, TarefaProjeto, TarefaComPrazo)
+
+
+class InstrumentacaoProgresso:
+    """
+    Medição opcional dos pontos quentes do cálculo de progresso.
+
+    Enquanto está ativa, troca nas classes do modelo os métodos medidos por versões
+    que contam chamadas e tempo:
+    - Trilha.progresso (detalhado por trilha), Curso.progresso (por curso),
+      Aula.progresso (por aula) e o progresso() de cada tipo de tarefa;
+    - TarefaFactory.criar (detalhado pelo tipo pedido);
+    - os setters com validação (paginas_lidas, nota, status, prazo, carga_horas, ...),
+      detalhados pela classe da instância.
+
+    desativar() devolve os métodos originais às classes: desligada, a instrumentação
+    não deixa nenhum teste nem indireção no caminho do cálculo (custo zero).
+
+    Para cada ponto são guardados chamadas, tempo total (com os pontos chamados dentro
+    dele) e tempo próprio, quem chamou e o detalhamento. O resultado sai em JSON
+    (como_dicionario / salvar_json) ou no formato do cProfile (salvar_pstats / como_pstats),
+    que pode ser aberto com pstats.Stats ou ferramentas como snakeviz.
+
+    Só uma instrumentação pode estar ativa por vez. Cada thread acumula nos seus
+    próprios registros, que são somados na exportação.
+    """
+
+    _ativa = None
+    _trava_ativacao = threading.Lock()
+
+    def __init__(self):
+        self.__originais = []
+        self.__local = threading.local()
+        self.__registros_por_thread = []
+        self.__trava = threading.Lock()
+        # chave do ponto -> (arquivo, linha, nome da função), para o formato do cProfile.
+        self.__codigos = {}
+
+    @property
+    def ativa(self):
+        return InstrumentacaoProgresso._ativa is self
+
+    # --- ativação ---
+
+    def ativar(self):
+        """Passa a medir os pontos quentes. RuntimeError se outra instrumentação estiver ativa."""
+        with InstrumentacaoProgresso._trava_ativacao:
+            if InstrumentacaoProgresso._ativa is self:
+                return self
+            if InstrumentacaoProgresso._ativa is not None:
+                raise RuntimeError("Já existe uma instrumentação de progresso ativa.")
+
+            self.__instrumentar_metodo(Trilha, "progresso", InstrumentacaoProgresso.__detalhe_trilha)
+            self.__instrumentar_metodo(Curso, "progresso", InstrumentacaoProgresso.__detalhe_titulo)
+            self.__instrumentar_metodo(Aula, "progresso", InstrumentacaoProgresso.__detalhe_titulo)
+            for classe in _TAREFAS:
+                if "progresso" in vars(classe):
+                    self.__instrumentar_metodo(classe, "progresso", None)
+            self.__instrumentar_metodo(TarefaFactory, "criar", InstrumentacaoProgresso.__detalhe_tipo_pedido)
+
+            for classe in (Trilha, Curso, Aula) + _TAREFAS:
+                for nome, atributo in list(vars(classe).items()):
+                    if isinstance(atributo, property) and atributo.fset is not None:
+                        self.__instrumentar_setter(classe, nome, atributo)
+
+            InstrumentacaoProgresso._ativa = self
+        return self
+
+    def desativar(self):
+        """Devolve os métodos originais às classes (as medições continuam disponíveis)."""
+        with InstrumentacaoProgresso._trava_ativacao:
+            if InstrumentacaoProgresso._ativa is not self:
+                return
+            for classe, nome, original in reversed(self.__originais):
+                setattr(classe, nome, original)
+            self.__originais = []
+            InstrumentacaoProgresso._ativa = None
+
+    def limpar(self):
+        """Zera as medições."""
+        with self.__trava:
+            for registros in self.__registros_por_thread:
+                registros.clear()
+
+    def __instrumentar_metodo(self, classe, nome, detalhar):
+        original = vars(classe)[nome]
+        estatico = isinstance(original, staticmethod)
+        funcao = original.__func__ if estatico else original
+        chave = f"{classe.__name__}.{nome}"
+        medida = self.__medir(chave, funcao, detalhar)
+
+        self.__registrar_codigo(chave, funcao)
+        self.__originais.append((classe, nome, original))
+        setattr(classe, nome, staticmethod(medida) if estatico else medida)
+
+    def __instrumentar_setter(self, classe, nome, propriedade):
+        chave = f"{classe.__name__}.{nome}="
+        medida = self.__medir(chave, propriedade.fset, InstrumentacaoProgresso.__detalhe_classe)
+
+        self.__registrar_codigo(chave, propriedade.fset)
+        self.__originais.append((classe, nome, propriedade))
+        setattr(classe, nome, property(propriedade.fget, medida, propriedade.fdel, propriedade.__doc__))
+
+    def __registrar_codigo(self, chave, funcao):
+        codigo = funcao.__code__
+        self.__codigos[chave] = (codigo.co_filename, codigo.co_firstlineno, codigo.co_name)
+
+    # --- detalhamento de cada ponto ---
+
+    @staticmethod
+    def __detalhe_trilha(argumentos, nomeados):
+        return argumentos[0].nome
+
+    @staticmethod
+    def __detalhe_titulo(argumentos, nomeados):
+        return argumentos[0].titulo
+
+    @staticmethod
+    def __detalhe_classe(argumentos, nomeados):
+        return type(argumentos[0]).__name__
+
+    @staticmethod
+    def __detalhe_tipo_pedido(argumentos, nomeados):
+        tipo = argumentos[0] if argumentos else nomeados.get("tipo_tarefa")
+        return str(tipo).strip().lower() if tipo else None
+
+    # --- medição ---
+
+    def __dados_da_thread(self):
+        """
+        Pilha dos pontos em execução nesta thread (chaves e tempo gasto nos pontos chamados
+        dentro de cada um) e os registros da thread, criados na primeira medição.
+        """
+        local = self.__local
+        if not hasattr(local, "registros"):
+            local.chaves = []
+            local.tempos_filhos = []
+            local.registros = {}
+            with self.__trava:
+                self.__registros_por_thread.append(local.registros)
+        return local.chaves, local.tempos_filhos, local.registros
+
+    def __medir(self, chave, funcao, detalhar):
+        dados_da_thread = self.__dados_da_thread
+        relogio = time.perf_counter
+        acumular = InstrumentacaoProgresso.__acumular
+
+        def medida(*argumentos, **nomeados):
+            chaves, tempos_filhos, registros = dados_da_thread()
+            chaves.append(chave)
+            tempos_filhos.append(0.0)
+            inicio = relogio()
+            try:
+                return funcao(*argumentos, **nomeados)
+            finally:
+                total = relogio() - inicio
+                chaves.pop()
+                proprio = total - tempos_filhos.pop()
+                # Como no cProfile: numa chamada recursiva, o tempo total só conta na mais externa.
+                primitiva = chave not in chaves
+
+                registro = registros.get(chave)
+                if registro is None:
+                    registro = registros[chave] = [0, 0, 0.0, 0.0, {}, {}]
+                acumular(registro, primitiva, proprio, total)
+
+                if chaves:
+                    tempos_filhos[-1] += total
+                    chamador = chaves[-1]
+                    por_chamador = registro[_CHAMADORES].get(chamador)
+                    if por_chamador is None:
+                        por_chamador = registro[_CHAMADORES][chamador] = [0, 0, 0.0, 0.0]
+                    acumular(por_chamador, primitiva, proprio, total)
+
+                if detalhar is not None:
+                    detalhe = detalhar(argumentos, nomeados)
+                    por_detalhe = registro[_DETALHES].get(detalhe)
+                    if por_detalhe is None:
+                        por_detalhe = registro[_DETALHES][detalhe] = [0, 0.0]
+                    por_detalhe[0] += 1
+                    por_detalhe[1] += total
+
+        medida.__name__ = funcao.__name__
+        medida.__qualname__ = funcao.__qualname__
+        medida.__doc__ = funcao.__doc__
+        medida.__wrapped__ = funcao
+        return medida
+
+    @staticmethod
+    def __acumular(registro, primitiva, tempo_proprio, total):
+        registro[_CHAMADAS] += 1
+        registro[_TEMPO_PROPRIO] += tempo_proprio
+        if primitiva:
+            registro[_PRIMITIVAS] += 1
+            registro[_TEMPO_TOTAL] += total
+
+    def __somar_threads(self):
+        """Soma os registros de todas as threads: chave -> [chamadas, ..., chamadores, detalhes]."""
+        somados = {}
+        with self.__trava:
+            for registros in self.__registros_por_thread:
+                # Cópia: a thread dona pode continuar medindo durante a exportação.
+                for chave, registro in list(registros.items()):
+                    destino = somados.get(chave)
+                    if destino is None:
+                        destino = somados[chave] = [0, 0, 0.0, 0.0, {}, {}]
+                    for posicao in (_CHAMADAS, _PRIMITIVAS, _TEMPO_PROPRIO, _TEMPO_TOTAL):
+                        destino[posicao] += registro[posicao]
+                    for posicao in (_CHAMADORES, _DETALHES):
+                        for nome, valores in list(registro[posicao].items()):
+                            acumulado = destino[posicao].setdefault(nome, [0] * len(valores))
+                            for indice, valor in enumerate(valores):
+                                acumulado[indice] += valor
+        return somados
+
+    # --- exportação ---
+
+    def como_dicionario(self):
+        """
+        Medições em um dicionário pronto para JSON, com os pontos do mais caro
+        (tempo total) para o mais barato. Tempos em segundos.
+        """
+        somados = self.__somar_threads()
+        pontos = {}
+        for chave, registro in sorted(somados.items(), key=lambda item: -item[1][_TEMPO_TOTAL]):
+            chamadas = registro[_CHAMADAS]
+            pontos[chave] = {
+                "chamadas": chamadas,
+                "tempo_total": registro[_TEMPO_TOTAL],
+                "tempo_proprio": registro[_TEMPO_PROPRIO],
+                "tempo_medio": registro[_TEMPO_TOTAL] / chamadas if chamadas else 0.0,
+                "chamadores": {
+                    chamador: valores[_CHAMADAS] for chamador, valores in registro[_CHAMADORES].items()
+                },
+                "detalhes": {
+                    str(detalhe): {"chamadas": valores[0], "tempo_total": valores[1]}
+                    for detalhe, valores in sorted(registro[_DETALHES].items(), key=lambda item: -item[1][1])
+                },
+            }
+        return {"ativa": self.ativa, "pontos": pontos}
+
+    def salvar_json(self, destino):
+        """destino pode ser o caminho de um arquivo (str) ou um objeto com write()."""
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                self.salvar_json(arquivo)
+            return
+        json.dump(self.como_dicionario(), destino, ensure_ascii=False, indent=2)
+
+    def estatisticas_cprofile(self):
+        """
+        Medições no formato de cProfile.Profile().stats:
+        (arquivo, linha, função) -> (primitivas, chamadas, tempo próprio, tempo total, chamadores).
+        """
+        estatisticas = {}
+        for chave, registro in self.__somar_threads().items():
+            chamadores = {
+                self.__codigos[chamador]: tuple(valores)
+                for chamador, valores in registro[_CHAMADORES].items()
+            }
+            estatisticas[self.__codigos[chave]] = (
+                registro[_PRIMITIVAS],
+                registro[_CHAMADAS],
+                registro[_TEMPO_PROPRIO],
+                registro[_TEMPO_TOTAL],
+                chamadores,
+            )
+        return estatisticas
+
+    def salvar_pstats(self, destino):
+        """
+        Grava as medições no mesmo formato de cProfile.Profile().dump_stats():
+        o arquivo abre com pstats.Stats(caminho). destino: caminho (str) ou arquivo binário.
+        """
+        if isinstance(destino, str):
+            with open(destino, "wb") as arquivo:
+                self.salvar_pstats(arquivo)
+            return
+        marshal.dump(self.estatisticas_cprofile(), destino)
+
+    def como_pstats(self):
+        """Retorna um pstats.Stats com as medições (sort_stats, print_stats, print_callers, ...)."""
+        estatisticas = self.estatisticas_cprofile()
+        # pstats.Stats aceita qualquer objeto com create_stats() e o atributo stats.
+        return pstats.Stats(SimpleNamespace(create_stats=lambda: None, stats=estatisticas))
+
+    # --- uso com "with" ---
+
+    def __enter__(self):
+        return self.ativar()
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.desativar()
+        return False
+
+    def __str__(self):
+        pontos = self.como_dicionario()["pontos"]
+        linhas = [f"InstrumentacaoProgresso ({'ativa' if self.ativa else 'inativa'}): {len(pontos)} ponto(s)"]
+        for chave, dados in pontos.items():
+            linhas.append(
+                f"  {chave:<36} {dados['chamadas']:>8} chamadas | total {dados['tempo_total'] * 1000:9.3f} ms "
+                f"| próprio {dados['tempo_proprio'] * 1000:9.3f} ms"
+            )
+        return "\n".join(linhas)
@@ -0,0 +1,163 @@
+from .EventoAlteracao import EventoAlteracao
+from .TarefaComPrazo import TarefaComPrazo
+
+
+class LoteAlteracoes:
+    """
+    Transação de alterações em tarefas de uma trilha (criada por Trilha.lote()).
+
+    Dentro do bloco "with", os setters das tarefas funcionam normalmente, mas os eventos
+    que chegariam aos assinantes da trilha são guardados e combinados (um por campo de
+    cada tarefa). Na saída do bloco, o lote inteiro é validado (validar_lote):
+    - se o bloco terminou sem erro e o lote passou pela validação,
+      os assinantes da trilha recebem os eventos combinados de uma vez;
+    - se houve exceção no bloco ou a validação falhou (ValueError com todos os problemas,
+      ou qualquer outra exceção lançada por validar), todos os campos alterados voltam
+      ao valor que tinham antes do lote e a exceção é repassada.
+    Em todos os casos o lote é fechado na trilha, que volta a entregar os eventos.
+
+    Os assinantes de Aula e Curso (assinar()) recebem os eventos na hora, como fora do
+    lote; ao desfazer, recebem um evento por campo restaurado (valor do lote -> valor
+    original), então terminam vendo o mesmo estado das tarefas. Os assinantes da trilha
+    não recebem nada de um lote desfeito.
+
+    O progresso de aulas e cursos não é recalculado a cada alteração: o cache só marca
+    as tarefas como pendentes, e cada tarefa é recalculada uma vez na próxima leitura.
+
+    Uso:
+        with trilha.lote(validar=exigir_nota_minima):
+            for quiz, nota in notas:
+                quiz.nota = nota
+    """
+
+    # Campos que fazem parte da chave da tarefa (título e data de realização).
+    CAMPOS_CHAVE = ("titulo", "data_realizacao")
+
+    def __init__(self, trilha, validar=None):
+        """
+        Parâmetros:
+            trilha: trilha cujas tarefas serão alteradas.
+            validar: função chamada com cada EventoAlteracao combinado antes de confirmar;
+                     deve lançar ValueError para rejeitar o evento (opcional). Os erros de
+                     todos os eventos são reunidos; qualquer outra exceção desfaz o lote na hora.
+        """
+        self.__trilha = trilha
+        self.__validar = validar
+        # (id(tarefa), campo) -> evento combinado (primeiro valor anterior, último valor novo).
+        self.__eventos = {}
+        self.__desfazendo = False
+
+    # --- registro dos eventos ---
+
+    def registrar(self, evento):
+        """Recebe da trilha cada evento gerado dentro do bloco."""
+        if self.__desfazendo:
+            return
+
+        chave = (id(evento.tarefa), evento.campo)
+        anterior = self.__eventos.get(chave)
+        self.__eventos[chave] = evento if anterior is None else anterior.combinar(evento)
+
+    @property
+    def eventos(self):
+        """Eventos combinados até agora, sem os que voltaram ao valor original."""
+        return [
+            evento for evento in self.__eventos.values()
+            if evento.valor_novo != evento.valor_anterior
+        ]
+
+    # --- validação ---
+
+    def validar_lote(self, eventos):
+        """
+        Valida o lote inteiro e lança um único ValueError com todos os problemas encontrados:
+        - nenhuma tarefa alterada pode terminar com a chave (título e data) de outra tarefa
+          da mesma aula (a mesma regra de Aula.adicionar_tarefa);
+        - cada evento combinado passa pela função validar (se houver).
+        """
+        problemas = []
+
+        if any(evento.campo in LoteAlteracoes.CAMPOS_CHAVE for evento in eventos):
+            alteradas = {id(evento.tarefa) for evento in eventos}
+            for tarefa in self.__trilha.tarefas_repetidas():
+                if LoteAlteracoes.__alguma_camada_em(tarefa, alteradas):
+                    problemas.append(
+                        f"A tarefa '{tarefa.titulo}' ficou com a mesma chave de outra tarefa da aula"
+                    )
+
+        if self.__validar is not None:
+            for evento in eventos:
+                try:
+                    self.__validar(evento)
+                except ValueError as erro:
+                    problemas.append(str(erro))
+
+        if problemas:
+            raise ValueError(f"Lote rejeitado ({len(problemas)} problema(s)): " + "; ".join(problemas))
+
+    @staticmethod
+    def __alguma_camada_em(tarefa, ids_tarefas):
+        """Indica se a tarefa ou alguma tarefa envolvida por ela (TarefaComPrazo) está em ids_tarefas."""
+        while True:
+            if id(tarefa) in ids_tarefas:
+                return True
+            if not isinstance(tarefa, TarefaComPrazo):
+                return False
+            tarefa = tarefa.tarefa_base
+
+    # --- confirmação e desfazer ---
+
+    def desfazer(self):
+        """
+        Volta todos os campos alterados no lote para os valores anteriores e avisa os
+        observadores com um evento por campo que de fato muda (valor do lote -> valor anterior).
+        """
+        valores_por_tarefa = {}
+        for evento in self.__eventos.values():
+            tarefa, valores, desfeitos = valores_por_tarefa.setdefault(
+                id(evento.tarefa), (evento.tarefa, {}, [])
+            )
+            valores[evento.campo] = evento.valor_anterior
+            if evento.valor_novo != evento.valor_anterior:
+                desfeitos.append(
+                    EventoAlteracao(tarefa, evento.campo, evento.valor_novo, evento.valor_anterior)
+                )
+
+        self.__desfazendo = True
+        try:
+            for tarefa, valores, desfeitos in valores_por_tarefa.values():
+                tarefa.restaurar_campos(valores, desfeitos)
+        finally:
+            self.__desfazendo = False
+
+        self.__eventos.clear()
+
+    def __enter__(self):
+        self.__trilha.abrir_lote(self)
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        eventos = self.eventos
+
+        if erro is None:
+            try:
+                self.validar_lote(eventos)
+            except BaseException:
+                # Qualquer exceção da validação rejeita o lote (não só ValueError).
+                self.__cancelar()
+                raise
+
+        if erro is not None:
+            self.__cancelar()
+            return False
+
+        self.__eventos.clear()
+        self.__trilha.fechar_lote(eventos)
+        return False
+
+    def __cancelar(self):
+        """Desfaz as alterações e fecha o lote na trilha, mesmo se o desfazer falhar."""
+        try:
+            self.desfazer()
+        finally:
+            self.__trilha.fechar_lote([])
@@ -0,0 +1,226 @@
+import math
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .EstrategiaProgresso import EstrategiaProgresso
+from .SerializadorTrilha import SerializadorTrilha
+
+
+class MediaParalelaEstrategia(EstrategiaProgresso):
+    """
+    Strategy que divide os cursos da trilha entre vários trabalhadores.
+
+    Cada trabalhador devolve um par parcial (soma dos progressos ponderados, soma dos pesos)
+    e os pares são somados no final. Com ponderada_por_carga=False o peso de cada curso é 1
+    (mesmo resultado de MediaSimplesEstrategia); com True o peso é a carga horária
+    (mesmo resultado de MediaPonderadaPorCargaEstrategia). Como a soma é feita por partes,
+    o valor pode diferir do cálculo sequencial apenas no último dígito do float.
+
+    Abaixo de limite_serial cursos, o cálculo é feito no próprio processo.
+
+    Com threads (padrão em Python sem GIL, free-threaded), cada trabalhador recebe os
+    próprios cursos e calcula o progresso deles. Com processos, cada trabalhador recebe a
+    sua parte dos cursos já serializada (peso do curso e, por aula, os registros das tarefas
+    do SerializadorTrilha), recria as tarefas e calcula o progresso de tarefas, aulas e
+    cursos no próprio processo; o processo principal só serializa e soma os pares.
+    Enviar os objetos Curso inteiros por pickle custava bem mais (cerca de 767 ms no
+    teste_paralelo).
+
+    Sem limite_serial informado, o pool é usado a partir de LIMITE_SERIAL_THREADS cursos
+    com threads e de LIMITE_SERIAL_PROCESSOS cursos com processos.
+
+    A cada cálculo, trabalhadores_utilizados guarda quem calculou cada parte
+    ((pid, thread) de cada trabalhador; vazio quando o cálculo foi sequencial).
+    """
+
+    LIMITE_SERIAL_THREADS = 64
+    LIMITE_SERIAL_PROCESSOS = 256
+
+    def __init__(
+        self,
+        ponderada_por_carga=False,
+        limite_serial=None,
+        max_trabalhadores=None,
+        usar_threads=None,
+    ):
+        """
+        Parâmetros:
+            ponderada_por_carga: usa a carga horária como peso de cada curso.
+            limite_serial: quantidade mínima de cursos para usar o pool
+                           (None: LIMITE_SERIAL_THREADS com threads,
+                           LIMITE_SERIAL_PROCESSOS com processos).
+            max_trabalhadores: tamanho do pool (padrão: quantidade de CPUs).
+            usar_threads: True usa threads; False usa processos;
+                          None escolhe threads apenas em Python sem GIL (free-threaded).
+        """
+        self.__ponderada_por_carga = bool(ponderada_por_carga)
+        self.__max_trabalhadores = max_trabalhadores or os.cpu_count() or 1
+
+        if usar_threads is None:
+            verificar_gil = getattr(sys, "_is_gil_enabled", None)
+            usar_threads = verificar_gil is not None and not verificar_gil()
+        self.__usar_threads = usar_threads
+
+        if limite_serial is not None:
+            self.__limite_serial = max(1, int(limite_serial))
+        elif usar_threads:
+            self.__limite_serial = MediaParalelaEstrategia.LIMITE_SERIAL_THREADS
+        else:
+            self.__limite_serial = MediaParalelaEstrategia.LIMITE_SERIAL_PROCESSOS
+
+        self.__executor = None
+        self.__trabalhadores_utilizados = ()
+
+    @property
+    def ponderada_por_carga(self):
+        return self.__ponderada_por_carga
+
+    @property
+    def trabalhadores_utilizados(self):
+        """
+        Identificadores (pid, thread) dos trabalhadores que calcularam cada parte
+        no último cálculo, na ordem das partes. Vazio se o cálculo foi sequencial.
+        """
+        return self.__trabalhadores_utilizados
+
+    # --- cálculo ---
+
+    def calcular(self, trilha):
+        """
+        Calcula o progresso da trilha, em paralelo quando houver cursos suficientes.
+        Retorna um número entre 0.0 e 1.0 (0.0 para trilha sem cursos).
+        """
+        cursos = trilha.cursos
+        if not cursos:
+            return 0.0
+
+        if len(cursos) < self.__limite_serial or self.__max_trabalhadores == 1:
+            self.__trabalhadores_utilizados = ()
+            soma_ponderada, soma_pesos, _ = MediaParalelaEstrategia.calcular_parcial(
+                cursos, self.__ponderada_por_carga
+            )
+        else:
+            soma_ponderada = 0.0
+            soma_pesos = 0
+            trabalhadores = []
+            for parcial_ponderada, parcial_pesos, trabalhador in self.__calcular_em_paralelo(cursos):
+                soma_ponderada += parcial_ponderada
+                soma_pesos += parcial_pesos
+                trabalhadores.append(trabalhador)
+            self.__trabalhadores_utilizados = tuple(trabalhadores)
+
+        if soma_pesos == 0:
+            return 0.0
+
+        return soma_ponderada / soma_pesos
+
+    @staticmethod
+    def calcular_parcial(cursos, ponderada_por_carga):
+        """
+        Calcula (soma dos progressos ponderados, soma dos pesos, trabalhador) de um grupo
+        de cursos. É a função executada por cada thread do pool.
+        """
+        soma_ponderada = 0.0
+        soma_pesos = 0
+
+        for curso in cursos:
+            # Se carga_horas for 0, considera peso 1 para não descartar o curso.
+            peso_curso = (curso.carga_horas or 1) if ponderada_por_carga else 1
+            soma_ponderada += curso.progresso() * peso_curso
+            soma_pesos += peso_curso
+
+        return soma_ponderada, soma_pesos, MediaParalelaEstrategia.__identificar_trabalhador()
+
+    @staticmethod
+    def serializar_curso(curso, ponderada_por_carga):
+        """
+        Monta o que um processo precisa para calcular o curso sozinho:
+        (peso, [registros das tarefas de cada aula]), com os registros do SerializadorTrilha.
+        """
+        peso_curso = (curso.carga_horas or 1) if ponderada_por_carga else 1
+        aulas = [
+            [SerializadorTrilha.registro_tarefa(tarefa) for tarefa in aula.tarefas]
+            for aula in curso.aulas
+        ]
+        return peso_curso, aulas
+
+    @staticmethod
+    def calcular_parcial_serializada(cursos):
+        """
+        Recebe cursos montados por serializar_curso, recria as tarefas e devolve
+        (soma dos progressos ponderados, soma dos pesos, trabalhador).
+        É a função executada por cada processo do pool.
+
+        As médias seguem as regras de Aula e Curso (math.fsum; aula sem tarefas e
+        curso sem aulas valem 0.0).
+        """
+        soma_ponderada = 0.0
+        soma_pesos = 0
+
+        for peso_curso, aulas in cursos:
+            progressos_aulas = []
+            for registros in aulas:
+                if registros:
+                    soma_tarefas = math.fsum(
+                        SerializadorTrilha.tarefa_de_registro(registro).progresso()
+                        for registro in registros
+                    )
+                    progressos_aulas.append(soma_tarefas / len(registros))
+                else:
+                    progressos_aulas.append(0.0)
+
+            progresso_curso = math.fsum(progressos_aulas) / len(aulas) if aulas else 0.0
+            soma_ponderada += progresso_curso * peso_curso
+            soma_pesos += peso_curso
+
+        return soma_ponderada, soma_pesos, MediaParalelaEstrategia.__identificar_trabalhador()
+
+    @staticmethod
+    def __identificar_trabalhador():
+        return os.getpid(), threading.get_ident()
+
+    def __calcular_em_paralelo(self, cursos):
+        """Divide os cursos em partes contíguas e devolve os resultados parciais na ordem."""
+        quantidade_partes = min(self.__max_trabalhadores, len(cursos))
+        tamanho_parte = -(-len(cursos) // quantidade_partes)  # divisão arredondando para cima
+        partes = [cursos[inicio:inicio + tamanho_parte] for inicio in range(0, len(cursos), tamanho_parte)]
+        executor = self.__obter_executor()
+
+        if not self.__usar_threads:
+            # Processos: cada parte vai serializada e é calculada inteira no trabalhador.
+            ponderada = self.__ponderada_por_carga
+            partes = [
+                [MediaParalelaEstrategia.serializar_curso(curso, ponderada) for curso in parte]
+                for parte in partes
+            ]
+            return executor.map(MediaParalelaEstrategia.calcular_parcial_serializada, partes)
+
+        return executor.map(
+            MediaParalelaEstrategia.calcular_parcial,
+            partes,
+            [self.__ponderada_por_carga] * len(partes),
+        )
+
+    # --- pool de trabalhadores ---
+
+    def __obter_executor(self):
+        """Cria o pool na primeira utilização e o reaproveita nas chamadas seguintes."""
+        if self.__executor is None:
+            if self.__usar_threads:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__max_trabalhadores)
+            else:
+                self.__executor = ProcessPoolExecutor(max_workers=self.__max_trabalhadores)
+        return self.__executor
+
+    def fechar(self):
+        """Encerra o pool de trabalhadores (se tiver sido criado)."""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
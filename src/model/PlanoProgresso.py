@@ -0,0 +1,104 @@
+from .EstrategiaPorNiveis import EstrategiaPorNiveis
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from .MediaParalelaEstrategia import MediaParalelaEstrategia
+
+
+class PlanoProgresso:
+    """
+    Plano de cálculo de várias estratégias de progresso em uma única passada pela trilha.
+
+    Na criação, cada estratégia é traduzida para a forma por níveis (EstrategiaPorNiveis):
+    - EstrategiaPorNiveis entram como estão;
+    - as médias conhecidas (simples, ponderada por carga e a versão paralela delas) viram
+      a descrição equivalente, com o mesmo resultado;
+    - qualquer outra estratégia (inclusive subclasses das conhecidas, que podem redefinir
+      calcular) fica de fora da passada e é calculada com calcular(trilha).
+
+    As estratégias traduzidas são compiladas uma vez; calcular(trilha) percorre cursos,
+    aulas e tarefas só até o nível mais fundo que alguma delas precisa, lendo o progresso
+    de cada nó uma única vez. Assim, N estratégias custam uma passada, e não N.
+    """
+
+    def __init__(self, estrategias):
+        """
+        Parâmetros:
+            estrategias: lista de objetos EstrategiaProgresso (define a ordem dos resultados).
+        """
+        self.__estrategias = list(estrategias)
+        if not self.__estrategias:
+            raise ValueError("Informe ao menos uma estratégia.")
+
+        fundidas = []
+        self.__posicoes_fundidas = []
+        self.__avulsas = []
+        for posicao, estrategia in enumerate(self.__estrategias):
+            traduzida = PlanoProgresso.__traduzir(estrategia)
+            if traduzida is None:
+                self.__avulsas.append((posicao, estrategia))
+            else:
+                fundidas.append(traduzida)
+                self.__posicoes_fundidas.append(posicao)
+
+        self.__compilado = EstrategiaPorNiveis.compilar(fundidas) if fundidas else None
+        self.__profundidade = max((estrategia.profundidade for estrategia in fundidas), default=0)
+
+    @staticmethod
+    def __traduzir(estrategia):
+        """Forma por níveis equivalente à estratégia (ou None, se ela não for conhecida)."""
+        # Tipo exato: uma subclasse pode redefinir calcular e não ser mais a mesma média.
+        if type(estrategia) is EstrategiaPorNiveis:
+            return estrategia
+        if type(estrategia) is MediaPonderadaPorCargaEstrategia:
+            ponderada = True
+        elif type(estrategia) is MediaSimplesEstrategia:
+            ponderada = False
+        elif type(estrategia) is MediaParalelaEstrategia:
+            ponderada = estrategia.ponderada_por_carga
+        else:
+            return None
+
+        if ponderada:
+            return EstrategiaPorNiveis("ponderada", peso_curso=EstrategiaPorNiveis.peso_carga_horaria)
+        return EstrategiaPorNiveis("simples")
+
+    @property
+    def estrategias(self):
+        return list(self.__estrategias)
+
+    @property
+    def fundidas(self):
+        """Quantidade de estratégias calculadas na passada única."""
+        return len(self.__posicoes_fundidas)
+
+    @property
+    def profundidade(self):
+        """Nível mais fundo percorrido (EstrategiaPorNiveis.NIVEL_*; 0 se nenhuma foi fundida)."""
+        return self.__profundidade
+
+    # --- cálculo ---
+
+    def calcular(self, trilha):
+        """Retorna uma lista com o progresso da trilha em cada estratégia, na ordem do plano."""
+        if not self.__avulsas:
+            # Todas na passada única, na ordem do plano.
+            return EstrategiaPorNiveis.executar(self.__compilado, trilha)
+
+        valores = [0.0] * len(self.__estrategias)
+
+        if self.__compilado is not None:
+            for posicao, valor in zip(
+                self.__posicoes_fundidas, EstrategiaPorNiveis.executar(self.__compilado, trilha)
+            ):
+                valores[posicao] = valor
+
+        for posicao, estrategia in self.__avulsas:
+            valores[posicao] = estrategia.calcular(trilha)
+
+        return valores
+
+    def __str__(self):
+        return (
+            f"PlanoProgresso: {len(self.__estrategias)} estratégia(s), "
+            f"{self.fundidas} na passada única"
+        )
@@ -0,0 +1,70 @@
+from .EstrategiaProgresso import EstrategiaProgresso
+from .EstrategiaPorNiveis import EstrategiaPorNiveis
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from .PlanoProgresso import PlanoProgresso
+
+
+# Estratégias disponíveis por nome (o registro é compartilhado por todo o programa).
+_ESTRATEGIAS = {
+    "simples": MediaSimplesEstrategia(),
+    "ponderada": MediaPonderadaPorCargaEstrategia(),
+    "por_aulas": EstrategiaPorNiveis.por_quantidade_aulas(),
+    "por_tipo": EstrategiaPorNiveis.por_tipo({"projeto": 3, "pratica": 2, "quiz": 1, "leitura": 1}),
+    "por_prazo": EstrategiaPorNiveis.por_prazo(2),
+}
+
+
+class RegistroEstrategias:
+    """
+    Registro de estratégias de progresso por nome ("simples", "ponderada", ...).
+
+    Novas formas de ponderar entram com registrar(), sem mexer nas estratégias existentes;
+    plano() devolve um PlanoProgresso que calcula as estratégias escolhidas em uma passada.
+    """
+
+    @staticmethod
+    def __normalizar(nome):
+        nome_normalizado = str(nome or "").strip().lower()
+        if not nome_normalizado:
+            raise ValueError("Nome da estratégia não informado.")
+        return nome_normalizado
+
+    @staticmethod
+    def registrar(nome, estrategia, substituir=False):
+        """Registra a estratégia com o nome dado. Nome repetido só com substituir=True."""
+        nome = RegistroEstrategias.__normalizar(nome)
+        if not isinstance(estrategia, EstrategiaProgresso):
+            raise ValueError(f"'{nome}': a estratégia deve ser uma EstrategiaProgresso.")
+        if nome in _ESTRATEGIAS and not substituir:
+            raise ValueError(f"Já existe uma estratégia registrada como '{nome}'.")
+        _ESTRATEGIAS[nome] = estrategia
+
+    @staticmethod
+    def remover(nome):
+        """Remove a estratégia do registro (retorna True se ela existia)."""
+        return _ESTRATEGIAS.pop(RegistroEstrategias.__normalizar(nome), None) is not None
+
+    @staticmethod
+    def obter(nome):
+        nome = RegistroEstrategias.__normalizar(nome)
+        if nome not in _ESTRATEGIAS:
+            raise ValueError(
+                f"Estratégia desconhecida: '{nome}'. Registradas: {', '.join(sorted(_ESTRATEGIAS))}."
+            )
+        return _ESTRATEGIAS[nome]
+
+    @staticmethod
+    def nomes():
+        return list(_ESTRATEGIAS)
+
+    @staticmethod
+    def todas():
+        """Cópia do registro: dicionário nome -> estratégia."""
+        return dict(_ESTRATEGIAS)
+
+    @staticmethod
+    def plano(*nomes):
+        """PlanoProgresso com as estratégias nomeadas (todas as registradas, se nenhuma for dada)."""
+        nomes = nomes or tuple(_ESTRATEGIAS)
+        return PlanoProgresso([RegistroEstrategias.obter(nome) for nome in nomes])
@@ -0,0 +1,179 @@
+import csv
+import json
+from .Trilha import Trilha
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaFactory import TarefaFactory
+from .ConversorData import ConversorData
+
+
+class RelatorioLinhas:
+    """
+    Relatório tabular de uma ou várias trilhas (coorte), gerado linha a linha.
+
+    linhas() é um gerador: cada tarefa vira uma linha no momento em que é lida, então
+    a memória usada não depende do tamanho da coorte. Na mesma passada, as médias de
+    cada aula, curso e trilha são acumuladas e saem como linhas de resumo logo depois
+    das linhas que resumem (aula depois das suas tarefas, curso depois das suas aulas).
+    As médias seguem a média simples (MediaSimplesEstrategia).
+
+    Cada linha é uma tupla na ordem de COLUNAS:
+        caminho     "Trilha/Curso/Aula/Tarefa"
+        nivel       "tarefa", "aula", "curso" ou "trilha"
+        tipo        tipo da tarefa ("leitura", "quiz", ...); vazio nos resumos
+        status      StatusTarefa (None nos resumos)
+        progresso   0.0 a 1.0
+        prazo       datetime da camada de prazo mais externa (ou None)
+        penalidade  penalidade dessa camada (ou None)
+    """
+
+    COLUNAS = ("caminho", "nivel", "tipo", "status", "progresso", "prazo", "penalidade")
+
+    # --- geração das linhas ---
+
+    @staticmethod
+    def linhas(trilhas):
+        """Gera as linhas de uma Trilha ou de um iterável de trilhas (pode ser um gerador)."""
+        if isinstance(trilhas, Trilha):
+            trilhas = (trilhas,)
+
+        for trilha in trilhas:
+            caminho_trilha = trilha.nome
+            soma_cursos = 0.0
+            quantidade_cursos = 0
+
+            for curso in trilha.cursos:
+                caminho_curso = f"{caminho_trilha}/{curso.titulo}"
+                soma_aulas = 0.0
+                quantidade_aulas = 0
+
+                for aula in curso.aulas:
+                    caminho_aula = f"{caminho_curso}/{aula.titulo}"
+                    soma_tarefas = 0.0
+                    quantidade_tarefas = 0
+
+                    for tarefa in aula.tarefas:
+                        progresso = tarefa.progresso()
+                        soma_tarefas += progresso
+                        quantidade_tarefas += 1
+
+                        if isinstance(tarefa, TarefaComPrazo):
+                            prazo, penalidade = tarefa.prazo, tarefa.penalidade
+                            concreta = tarefa.tarefa_concreta
+                        else:
+                            prazo = penalidade = None
+                            concreta = tarefa
+
+                        yield (
+                            f"{caminho_aula}/{tarefa.titulo}",
+                            "tarefa",
+                            TarefaFactory.tipo_de(concreta) or type(concreta).__name__,
+                            tarefa.status,
+                            progresso,
+                            prazo,
+                            penalidade,
+                        )
+
+                    media_aula = soma_tarefas / quantidade_tarefas if quantidade_tarefas else 0.0
+                    soma_aulas += media_aula
+                    quantidade_aulas += 1
+                    yield (caminho_aula, "aula", "", None, media_aula, None, None)
+
+                media_curso = soma_aulas / quantidade_aulas if quantidade_aulas else 0.0
+                soma_cursos += media_curso
+                quantidade_cursos += 1
+                yield (caminho_curso, "curso", "", None, media_curso, None, None)
+
+            media_trilha = soma_cursos / quantidade_cursos if quantidade_cursos else 0.0
+            yield (caminho_trilha, "trilha", "", None, media_trilha, None, None)
+
+    # --- formatos de saída ---
+
+    @staticmethod
+    def escrever_csv(trilhas, destino):
+        """
+        Escreve as linhas em CSV (com cabeçalho). Datas em ISO 8601, status pelo nome do enum.
+        destino pode ser o caminho de um arquivo (str) ou um objeto com write().
+        Retorna a quantidade de linhas escritas (sem o cabeçalho).
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8", newline="") as arquivo:
+                return RelatorioLinhas.escrever_csv(trilhas, arquivo)
+
+        escritor = csv.writer(destino)
+        escritor.writerow(RelatorioLinhas.COLUNAS)
+        quantidade = 0
+        for linha in RelatorioLinhas.linhas(trilhas):
+            escritor.writerow(RelatorioLinhas.__valores_csv(linha))
+            quantidade += 1
+        return quantidade
+
+    @staticmethod
+    def escrever_json(trilhas, destino):
+        """
+        Escreve as linhas como um array JSON de objetos, um objeto por linha do arquivo.
+        O array é escrito aos poucos, sem montar a lista inteira em memória.
+        Retorna a quantidade de linhas escritas.
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                return RelatorioLinhas.escrever_json(trilhas, arquivo)
+
+        quantidade = 0
+        destino.write("[")
+        for caminho, nivel, tipo, status, progresso, prazo, penalidade in RelatorioLinhas.linhas(trilhas):
+            objeto = {
+                "caminho": caminho,
+                "nivel": nivel,
+                "tipo": tipo or None,
+                "status": status.name if status is not None else None,
+                "progresso": progresso,
+                "prazo": prazo.isoformat() if prazo is not None else None,
+                "penalidade": penalidade,
+            }
+            destino.write(",\n" if quantidade else "\n")
+            destino.write(json.dumps(objeto, ensure_ascii=False))
+            quantidade += 1
+        destino.write("\n]\n")
+        return quantidade
+
+    @staticmethod
+    def escrever_markdown(trilhas, destino):
+        """
+        Escreve as linhas como uma tabela Markdown (progresso em %, datas 'dd-mm-YYYY HH:MM').
+        Retorna a quantidade de linhas escritas (sem o cabeçalho).
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                return RelatorioLinhas.escrever_markdown(trilhas, arquivo)
+
+        destino.write("| " + " | ".join(RelatorioLinhas.COLUNAS) + " |\n")
+        destino.write("|" + "---|" * len(RelatorioLinhas.COLUNAS) + "\n")
+        quantidade = 0
+        for caminho, nivel, tipo, status, progresso, prazo, penalidade in RelatorioLinhas.linhas(trilhas):
+            celulas = (
+                caminho.replace("|", "\\|"),
+                nivel,
+                tipo,
+                status.value if status is not None else "",
+                f"{progresso * 100:.1f}%",
+                ConversorData.formatar_data_hora(prazo) if prazo is not None else "",
+                f"{penalidade * 100:.0f}%" if penalidade is not None else "",
+            )
+            destino.write("| " + " | ".join(celulas) + " |\n")
+            quantidade += 1
+        return quantidade
+
+    # --- auxiliares ---
+
+    @staticmethod
+    def __valores_csv(linha):
+        caminho, nivel, tipo, status, progresso, prazo, penalidade = linha
+        return (
+            caminho,
+            nivel,
+            tipo,
+            status.name if status is not None else "",
+            progresso,
+            prazo.isoformat() if prazo is not None else "",
+            penalidade if penalidade is not None else "",
+        )
@@ -0,0 +1,132 @@
+import io
+
+
+class RelatorioTrilha:
+    """
+    Relatório em texto da trilha inteira (trilha, cursos, aulas e tarefas), escrito
+    direto em um arquivo ou em qualquer objeto com write().
+
+    - A árvore é percorrida uma vez por relatório e cada bloco é escrito assim que fica
+      pronto, sem montar um texto gigante com join.
+    - O texto de cada tarefa (exibir_dados, já recuado) fica guardado entre um relatório e
+      outro. O relatório observa as tarefas: quando uma tarefa muda, só o texto dela é
+      refeito no próximo relatório.
+    - Cursos e aulas usam o próprio exibir_dados(), que lê o progresso do cache;
+      o progresso da trilha é calculado uma vez pela estratégia.
+
+    O texto de cada bloco é o mesmo de exibir_dados(), recuado conforme o nível.
+    """
+
+    def __init__(self, trilha, estrategia=None, recuo="  "):
+        """
+        Parâmetros:
+            trilha: trilha do relatório.
+            estrategia: estratégia usada na linha de progresso da trilha (opcional).
+            recuo: texto colocado antes das linhas a cada nível da hierarquia.
+        """
+        self.__trilha = trilha
+        self.__estrategia = estrategia
+        self.__recuo = recuo
+
+        # id(tarefa) -> [tarefa, texto recuado ou None se precisa refazer]
+        # Guardar a própria tarefa impede que o id seja reaproveitado por outro objeto.
+        self.__fragmentos = {}
+        self.__reaproveitados = 0
+        self.__refeitos = 0
+
+    # --- escrita ---
+
+    def escrever(self, destino):
+        """
+        Escreve o relatório em destino: caminho de arquivo (str) ou objeto com write()
+        (arquivo aberto, io.StringIO, sys.stdout, ...).
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                self.escrever(arquivo)
+            return
+
+        escrever = destino.write
+        recuo_curso = self.__recuo
+        recuo_aula = recuo_curso * 2
+        recuo_tarefa = recuo_curso * 3
+        fragmentos = self.__fragmentos
+        vistas = set()
+
+        escrever(self.__trilha.exibir_dados(self.__estrategia))
+        escrever("\n")
+
+        for curso in self.__trilha.cursos:
+            escrever("\n")
+            escrever(RelatorioTrilha.__recuar(curso.exibir_dados(), recuo_curso))
+            escrever("\n")
+
+            for aula in curso.aulas:
+                escrever("\n")
+                escrever(RelatorioTrilha.__recuar(aula.exibir_dados(), recuo_aula))
+                escrever("\n")
+
+                for tarefa in aula.tarefas:
+                    chave = id(tarefa)
+                    vistas.add(chave)
+                    entrada = fragmentos.get(chave)
+
+                    if entrada is None:
+                        entrada = [tarefa, None]
+                        fragmentos[chave] = entrada
+                        tarefa.registrar_observador(self)
+
+                    texto = entrada[1]
+                    if texto is None:
+                        texto = RelatorioTrilha.__recuar(tarefa.exibir_dados(), recuo_tarefa)
+                        entrada[1] = texto
+                        self.__refeitos += 1
+                    else:
+                        self.__reaproveitados += 1
+
+                    escrever("\n")
+                    escrever(texto)
+                    escrever("\n")
+
+        # Tarefas que saíram da trilha deixam de ser observadas.
+        if len(vistas) != len(fragmentos):
+            for chave in [chave for chave in fragmentos if chave not in vistas]:
+                fragmentos.pop(chave)[0].remover_observador(self)
+
+    def texto(self):
+        """Retorna o relatório como uma string (para relatórios pequenos)."""
+        destino = io.StringIO()
+        self.escrever(destino)
+        return destino.getvalue()
+
+    @staticmethod
+    def __recuar(texto, recuo):
+        return recuo + texto.replace("\n", "\n" + recuo)
+
+    # --- cache dos textos das tarefas ---
+
+    def tarefa_alterada(self, tarefa, evento=None):
+        """Chamado pela tarefa quando algum dado muda: o texto dela será refeito."""
+        entrada = self.__fragmentos.get(id(tarefa))
+        if entrada is not None:
+            entrada[1] = None
+
+    def fechar(self):
+        """Deixa de observar as tarefas e descarta os textos guardados."""
+        for tarefa, _ in self.__fragmentos.values():
+            tarefa.remover_observador(self)
+        self.__fragmentos.clear()
+
+    @property
+    def estatisticas(self):
+        """Textos de tarefas reaproveitados e refeitos desde a criação do relatório."""
+        return {"reaproveitados": self.__reaproveitados, "refeitos": self.__refeitos}
+
+    # --- contexto ---
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
+        return False
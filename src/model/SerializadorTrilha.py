@@ -0,0 +1,191 @@
+import json
+from datetime import datetime
+from .Aula import Aula
+from .Curso import Curso
+from .Trilha import Trilha
+from .StatusTarefa import StatusTarefa
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaFactory import TarefaFactory
+
+
+class SerializadorTrilha:
+    """
+    Salva e carrega uma Trilha em JSON Lines (um objeto JSON por linha).
+
+    Ordem dos registros no arquivo:
+        {"registro": "trilha", ...}
+        {"registro": "curso", ...}     # cursos em ordem
+        {"registro": "aula", ...}      # aulas do último curso lido
+        {"registro": "tarefa", ...}    # tarefas da última aula lida
+
+    Tanto a escrita quanto a leitura trabalham linha a linha,
+    sem montar o arquivo inteiro em memória.
+    """
+
+    # --- escrita ---
+
+    @staticmethod
+    def salvar(trilha, destino):
+        """
+        Escreve a trilha em JSON Lines.
+
+        destino pode ser o caminho de um arquivo (str) ou um objeto com write()
+        (arquivo aberto, io.StringIO, ...).
+        """
+        if isinstance(destino, str):
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                SerializadorTrilha.salvar(trilha, arquivo)
+            return
+
+        for registro in SerializadorTrilha.registros(trilha):
+            destino.write(json.dumps(registro, ensure_ascii=False))
+            destino.write("\n")
+
+    @staticmethod
+    def registros(trilha):
+        """Gera, um a um, os dicionários que representam a trilha (na ordem do arquivo)."""
+        yield {"registro": "trilha", "nome": trilha.nome}
+
+        for curso in trilha.cursos:
+            yield {"registro": "curso", "titulo": curso.titulo, "carga_horas": curso.carga_horas}
+
+            for aula in curso.aulas:
+                yield {"registro": "aula", "titulo": aula.titulo}
+
+                for tarefa in aula.tarefas:
+                    yield SerializadorTrilha.registro_tarefa(tarefa)
+
+    @staticmethod
+    def registro_tarefa(tarefa):
+        """
+        Monta o registro de uma tarefa.
+
+        Decorators TarefaComPrazo viram a lista "prazos" (do mais interno para o mais externo),
+        com o prazo, a penalidade e o estado próprio de cada camada.
+        """
+        camadas = []
+        while isinstance(tarefa, TarefaComPrazo):
+            camadas.append(
+                {
+                    "prazo": SerializadorTrilha.__data_para_texto(tarefa.prazo),
+                    "penalidade": tarefa.penalidade,
+                    "titulo": tarefa.titulo,
+                    "descricao": tarefa.descricao,
+                    "data_realizacao": SerializadorTrilha.__data_para_texto(tarefa.data_realizacao),
+                    "status": tarefa.status.name,
+                }
+            )
+            tarefa = tarefa.tarefa_base
+
+        registro = {"registro": "tarefa"}
+        registro.update(TarefaFactory.argumentos_de(tarefa))
+        registro["data_realizacao"] = SerializadorTrilha.__data_para_texto(tarefa.data_realizacao)
+        registro["status"] = tarefa.status.name
+
+        if camadas:
+            camadas.reverse()
+            registro["prazos"] = camadas
+
+        return registro
+
+    # --- leitura ---
+
+    @staticmethod
+    def carregar(origem):
+        """
+        Reconstrói uma Trilha a partir de JSON Lines.
+
+        origem pode ser o caminho de um arquivo (str) ou qualquer iterável de linhas
+        (arquivo aberto, io.StringIO, lista de strings, ...).
+        As tarefas são recriadas pela TarefaFactory.
+        """
+        if isinstance(origem, str):
+            with open(origem, "r", encoding="utf-8") as arquivo:
+                return SerializadorTrilha.carregar(arquivo)
+
+        trilha = None
+        curso_atual = None
+        aula_atual = None
+
+        for numero_linha, linha in enumerate(origem, start=1):
+            linha = linha.strip()
+            if not linha:
+                continue
+
+            registro = json.loads(linha)
+            tipo_registro = registro.get("registro")
+
+            if tipo_registro == "trilha":
+                trilha = Trilha(registro.get("nome"))
+            elif tipo_registro == "curso":
+                curso_atual = Curso(registro.get("titulo"), registro.get("carga_horas", 0))
+                aula_atual = None
+                SerializadorTrilha.__exigir(trilha, "trilha", numero_linha).adicionar_curso(curso_atual)
+            elif tipo_registro == "aula":
+                aula_atual = Aula(registro.get("titulo"))
+                SerializadorTrilha.__exigir(curso_atual, "curso", numero_linha).adicionar_aula(aula_atual)
+            elif tipo_registro == "tarefa":
+                tarefa = SerializadorTrilha.tarefa_de_registro(registro)
+                aula = SerializadorTrilha.__exigir(aula_atual, "aula", numero_linha)
+                # Tarefas com a mesma chave (ex.: uma renomeada) foram salvas juntas e voltam juntas.
+                aula.adicionar_tarefa(tarefa, manter_duplicada=True)
+            else:
+                raise ValueError(f"Linha {numero_linha}: registro desconhecido: {tipo_registro!r}.")
+
+        if trilha is None:
+            raise ValueError("Arquivo sem registro de trilha.")
+
+        return trilha
+
+    @staticmethod
+    def tarefa_de_registro(registro):
+        """Recria uma tarefa (e seus decorators de prazo) a partir de um registro."""
+        argumentos = {
+            chave: valor
+            for chave, valor in registro.items()
+            if chave not in ("registro", "status", "prazos")
+        }
+        argumentos["data_realizacao"] = SerializadorTrilha.__texto_para_data(
+            argumentos.get("data_realizacao")
+        )
+
+        tarefa = TarefaFactory.criar(**argumentos)
+        tarefa.status = SerializadorTrilha.__texto_para_status(registro.get("status"))
+
+        for camada in registro.get("prazos", ()):
+            tarefa = TarefaComPrazo(
+                tarefa,
+                prazo=SerializadorTrilha.__texto_para_data(camada.get("prazo")),
+                penalidade=camada.get("penalidade", 0.0),
+            )
+            tarefa.titulo = camada.get("titulo")
+            tarefa.descricao = camada.get("descricao")
+            tarefa.data_realizacao = SerializadorTrilha.__texto_para_data(
+                camada.get("data_realizacao")
+            )
+            tarefa.status = SerializadorTrilha.__texto_para_status(camada.get("status"))
+
+        return tarefa
+
+    # --- auxiliares ---
+
+    @staticmethod
+    def __exigir(objeto, nome, numero_linha):
+        if objeto is None:
+            raise ValueError(f"Linha {numero_linha}: registro fora de um(a) {nome}.")
+        return objeto
+
+    @staticmethod
+    def __data_para_texto(data):
+        # ISO 8601 preserva hora, minuto e segundo (necessário para comparar com o prazo).
+        return data.isoformat() if data is not None else None
+
+    @staticmethod
+    def __texto_para_data(texto):
+        return datetime.fromisoformat(texto) if texto else None
+
+    @staticmethod
+    def __texto_para_status(nome):
+        if nome in StatusTarefa.__members__:
+            return StatusTarefa[nome]
+        return StatusTarefa.A_FAZER
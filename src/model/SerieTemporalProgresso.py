@@ -0,0 +1,345 @@
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from .MediaParalelaEstrategia import MediaParalelaEstrategia
+
+
+class SerieTemporalProgresso:
+    """
+    Progresso por hora e por dia da trilha e de cada curso, mantido enquanto as tarefas mudam
+    (para gráficos de painel, sem reconstruir estados passados).
+
+    A série observa os cursos da trilha. Quando um curso avisa uma alteração, o progresso dele
+    é lido do cache (curso.progresso()) e as médias da trilha são ajustadas pela diferença:
+    - média simples: soma dos progressos dos cursos / quantidade de cursos;
+    - média ponderada: soma de progresso × carga / soma das cargas (carga 0 vale 1),
+      como em MediaPonderadaPorCargaEstrategia.
+    O progresso de um curso não depende da estratégia, então cada curso tem uma série só.
+
+    Cada período (hora ou dia, no horário local) guarda, para cada série, o progresso na
+    abertura, no fechamento, o mínimo e o máximo, em colunas array.array. Só o período atual
+    é atualizado; consultar um intervalo custa uma busca binária e O(1) por período.
+    Períodos sem alteração repetem o fechamento do anterior.
+
+    Tarefas alteradas, incluídas ou removidas nas aulas e aulas incluídas/removidas nos cursos
+    entram sozinhas (o curso avisa). Cursos incluídos na trilha e mudanças de carga horária
+    não geram aviso e entram nas séries em sincronizar().
+    """
+
+    HORA = "hora"
+    DIA = "dia"
+
+    # Séries fixas; o curso de índice i usa a série _PRIMEIRO_CURSO + i.
+    _SIMPLES = 0
+    _PONDERADA = 1
+    _PRIMEIRO_CURSO = 2
+
+    _SEM_TRAVA = nullcontext()
+
+    def __init__(self, trilha, relogio=None):
+        """
+        Parâmetros:
+            trilha: trilha acompanhada (seus cursos passam a ser observados).
+            relogio: função sem argumentos que devolve o momento atual em segundos
+                     (padrão: time.time).
+        """
+        self.__trilha = trilha
+        self.__relogio = relogio or time.time
+        self.__trava = threading.Lock() if trilha.modo_concorrente else None
+
+        self.__cursos = []
+        self.__indice_curso = {}
+        self.__pesos = []
+        # Valor atual de cada série e as somas usadas nas médias da trilha.
+        self.__valores = array("d", [0.0, 0.0])
+        self.__soma_progresso = 0.0
+        self.__soma_ponderada = 0.0
+        self.__soma_pesos = 0
+
+        # Por granularidade: chaves dos períodos (em ordem), limites do período atual e,
+        # para cada série, as colunas (abertura, fechamento, mínimo, máximo).
+        self.__periodos = {
+            granularidade: {"chaves": array("q"), "inicio": math.inf, "fim": -math.inf, "colunas": []}
+            for granularidade in (SerieTemporalProgresso.HORA, SerieTemporalProgresso.DIA)
+        }
+        for _ in range(SerieTemporalProgresso._PRIMEIRO_CURSO):
+            self.__nova_serie()
+
+        self.__ultimo_momento = -math.inf
+        self.__sincronizar(inicial=True)
+
+    @property
+    def trava(self):
+        return self.__trava if self.__trava is not None else SerieTemporalProgresso._SEM_TRAVA
+
+    # --- manutenção ---
+
+    def __agora(self):
+        # Os períodos são abertos em ordem: um relógio que volta não reabre um período antigo.
+        momento = float(self.__relogio())
+        if momento < self.__ultimo_momento:
+            momento = self.__ultimo_momento
+        self.__ultimo_momento = momento
+        return momento
+
+    def curso_alterado(self, curso, evento=None):
+        """Chamado pelo curso quando alguma aula/tarefa muda: atualiza o período atual."""
+        indice = self.__indice_curso.get(id(curso))
+        if indice is None:
+            return
+
+        progresso = curso.progresso()
+
+        # Fora do modo concorrente não há custo extra além deste teste.
+        if self.__trava is None:
+            self.__atualizar_curso(indice, progresso)
+        else:
+            with self.__trava:
+                self.__atualizar_curso(indice, progresso)
+
+    def __atualizar_curso(self, indice, progresso):
+        serie = SerieTemporalProgresso._PRIMEIRO_CURSO + indice
+        anterior = self.__valores[serie]
+        if progresso == anterior:
+            return
+
+        self.__abrir_periodos(self.__agora())
+        self.__soma_progresso += progresso - anterior
+        self.__soma_ponderada += (progresso - anterior) * self.__pesos[indice]
+        self.__valores[serie] = progresso
+        self.__atualizar_medias()
+        self.__registrar((SerieTemporalProgresso._SIMPLES, SerieTemporalProgresso._PONDERADA, serie))
+
+    def sincronizar(self):
+        """
+        Relê os cursos da trilha: inclui cursos novos e recalcula os progressos e as cargas
+        (depois de incluir cursos ou mudar carga_horas). Retorna os cursos incluídos.
+        """
+        return self.__sincronizar(inicial=False)
+
+    def __sincronizar(self, inicial):
+        incluidos = 0
+        for curso in self.__trilha.cursos:
+            # Mesma ordem de travas de quem altera tarefas (curso, depois série): o valor lido
+            # não pode ser sobrescrito por uma alteração do curso no meio da sincronização.
+            with curso.trava:
+                progresso = curso.progresso()
+                with self.trava:
+                    incluidos += self.__aplicar_curso(curso, progresso, inicial)
+
+        with self.trava:
+            # Somas refeitas do zero: também descartam o erro de arredondamento acumulado.
+            valores_cursos = self.__valores[SerieTemporalProgresso._PRIMEIRO_CURSO:]
+            self.__soma_progresso = sum(valores_cursos)
+            self.__soma_ponderada = sum(valor * peso for valor, peso in zip(valores_cursos, self.__pesos))
+            self.__soma_pesos = sum(self.__pesos)
+            self.__atualizar_medias()
+            # Na criação, os períodos abrem só agora, já com os valores de todos os cursos.
+            self.__abrir_periodos(self.__agora())
+            self.__registrar(range(len(self.__valores)))
+        return incluidos
+
+    def __aplicar_curso(self, curso, progresso, inicial):
+        """Inclui o curso (se for novo) e grava o progresso e o peso atuais. Retorna 1 se incluiu."""
+        if not inicial:
+            self.__abrir_periodos(self.__agora())
+
+        indice = self.__indice_curso.get(id(curso))
+        incluido = indice is None
+        if incluido:
+            indice = self.__indice_curso[id(curso)] = len(self.__cursos)
+            self.__cursos.append(curso)
+            self.__pesos.append(0)
+            self.__valores.append(progresso)
+            self.__nova_serie(progresso)
+            curso.registrar_observador(self)
+
+        self.__pesos[indice] = curso.carga_horas or 1
+        self.__valores[SerieTemporalProgresso._PRIMEIRO_CURSO + indice] = progresso
+        if not inicial:
+            self.__registrar((SerieTemporalProgresso._PRIMEIRO_CURSO + indice,))
+        return int(incluido)
+
+    def __atualizar_medias(self):
+        quantidade = len(self.__cursos)
+        self.__valores[SerieTemporalProgresso._SIMPLES] = self.__soma_progresso / quantidade if quantidade else 0.0
+        self.__valores[SerieTemporalProgresso._PONDERADA] = (
+            self.__soma_ponderada / self.__soma_pesos if self.__soma_pesos else 0.0
+        )
+
+    def fechar(self):
+        """Deixa de observar os cursos (as séries gravadas continuam consultáveis)."""
+        with self.trava:
+            for curso in self.__cursos:
+                curso.remover_observador(self)
+
+    # --- períodos ---
+
+    def __nova_serie(self, valor=math.nan):
+        """Colunas de uma série nova: NaN nos períodos anteriores, o valor no período atual."""
+        for periodo in self.__periodos.values():
+            quantidade = len(periodo["chaves"])
+            colunas = tuple(array("d", [math.nan]) * quantidade for _ in range(4))
+            if quantidade:
+                for coluna in colunas:
+                    coluna[-1] = valor
+            periodo["colunas"].append(colunas)
+
+    def __abrir_periodos(self, momento):
+        """Abre um período novo (hora/dia) se o momento passou do atual, partindo dos valores atuais."""
+        for granularidade, periodo in self.__periodos.items():
+            if periodo["inicio"] <= momento < periodo["fim"]:
+                continue
+            chave, inicio, fim = SerieTemporalProgresso.__limites(granularidade, momento)
+            periodo["inicio"], periodo["fim"] = inicio, fim
+            periodo["chaves"].append(chave)
+            for valor, colunas in zip(self.__valores, periodo["colunas"]):
+                for coluna in colunas:
+                    coluna.append(valor)
+
+    def __registrar(self, series):
+        """Atualiza fechamento, mínimo e máximo das séries no período atual."""
+        valores = self.__valores
+        for periodo in self.__periodos.values():
+            todas_colunas = periodo["colunas"]
+            for serie in series:
+                valor = valores[serie]
+                _, fechamento, minimo, maximo = todas_colunas[serie]
+                fechamento[-1] = valor
+                # Séries de cursos novos começam com NaN; qualquer comparação com NaN é falsa.
+                if not valor >= minimo[-1]:
+                    minimo[-1] = valor
+                if not valor <= maximo[-1]:
+                    maximo[-1] = valor
+
+    @staticmethod
+    def __limites(granularidade, momento):
+        """(chave, início, fim) do período que contém o momento (segundos), no horário local."""
+        data = datetime.fromtimestamp(momento)
+        if granularidade == SerieTemporalProgresso.DIA:
+            inicio = datetime(data.year, data.month, data.day)
+            fim = inicio + timedelta(days=1)
+            chave = inicio.toordinal()
+        else:
+            inicio = data.replace(minute=0, second=0, microsecond=0)
+            fim = inicio + timedelta(hours=1)
+            chave = inicio.toordinal() * 24 + inicio.hour
+        return chave, inicio.timestamp(), fim.timestamp()
+
+    @staticmethod
+    def __chave(granularidade, momento):
+        if isinstance(momento, datetime):
+            momento = momento.timestamp()
+        elif isinstance(momento, date):
+            momento = datetime(momento.year, momento.month, momento.day).timestamp()
+        return SerieTemporalProgresso.__limites(granularidade, float(momento))[0]
+
+    @staticmethod
+    def __inicio_periodo(granularidade, chave):
+        if granularidade == SerieTemporalProgresso.DIA:
+            return datetime.fromordinal(chave)
+        return datetime.fromordinal(chave // 24) + timedelta(hours=chave % 24)
+
+    # --- consultas ---
+
+    def __serie(self, curso, estrategia):
+        if curso is not None:
+            for indice, registrado in enumerate(self.__cursos):
+                if registrado is curso or (isinstance(curso, str) and registrado.titulo == curso.strip().title()):
+                    return SerieTemporalProgresso._PRIMEIRO_CURSO + indice
+            raise ValueError(f"Curso não acompanhado pela série: {curso}")
+
+        if estrategia is None:
+            return SerieTemporalProgresso._SIMPLES
+        if type(estrategia) is MediaPonderadaPorCargaEstrategia:
+            return SerieTemporalProgresso._PONDERADA
+        if type(estrategia) is MediaSimplesEstrategia:
+            return SerieTemporalProgresso._SIMPLES
+        if type(estrategia) is MediaParalelaEstrategia:
+            if estrategia.ponderada_por_carga:
+                return SerieTemporalProgresso._PONDERADA
+            return SerieTemporalProgresso._SIMPLES
+        raise ValueError("A série temporal mantém a média simples e a média ponderada por carga horária.")
+
+    def periodos(self, granularidade, inicio=None, fim=None, curso=None, estrategia=None):
+        """
+        Períodos (hora ou dia) de inicio até fim (date, datetime ou segundos; padrão: tudo até agora),
+        como tuplas (início do período, abertura, fechamento, mínimo, máximo).
+
+        curso: Curso ou título (série do curso); sem curso, a trilha na estratégia
+        informada (média simples por padrão, ou MediaPonderadaPorCargaEstrategia).
+        """
+        if granularidade not in self.__periodos:
+            raise ValueError(f"Granularidade desconhecida: {granularidade}. Use 'hora' ou 'dia'.")
+
+        with self.trava:
+            serie = self.__serie(curso, estrategia)
+            periodo = self.__periodos[granularidade]
+            chaves = periodo["chaves"]
+            if not chaves:
+                return []
+            abertura, fechamento, minimo, maximo = periodo["colunas"][serie]
+
+            primeira = chaves[0] if inicio is None else max(chaves[0], self.__chave(granularidade, inicio))
+            # Até o período de agora: dias sem alteração depois da última também aparecem.
+            ultima = max(chaves[-1], self.__chave(granularidade, self.__agora()))
+            if fim is not None:
+                ultima = min(ultima, self.__chave(granularidade, fim))
+
+            resultado = []
+            posicao = bisect_right(chaves, primeira) - 1
+            for chave in range(primeira, ultima + 1):
+                while posicao + 1 < len(chaves) and chaves[posicao + 1] <= chave:
+                    posicao += 1
+                if chaves[posicao] == chave:
+                    linha = (abertura[posicao], fechamento[posicao], minimo[posicao], maximo[posicao])
+                else:
+                    valor = fechamento[posicao]
+                    linha = (valor, valor, valor, valor)
+                if linha[1] == linha[1]:  # NaN: o curso ainda não estava na série
+                    resultado.append((SerieTemporalProgresso.__inicio_periodo(granularidade, chave),) + linha)
+            return resultado
+
+    def por_dia(self, inicio=None, fim=None, curso=None, estrategia=None):
+        """Atalho para periodos("dia", ...)."""
+        return self.periodos(SerieTemporalProgresso.DIA, inicio, fim, curso, estrategia)
+
+    def por_hora(self, inicio=None, fim=None, curso=None, estrategia=None):
+        """Atalho para periodos("hora", ...)."""
+        return self.periodos(SerieTemporalProgresso.HORA, inicio, fim, curso, estrategia)
+
+    def progresso_atual(self, curso=None, estrategia=None):
+        """Último valor da série (o mesmo que trilha.progresso / curso.progresso, sem recalcular)."""
+        with self.trava:
+            return self.__valores[self.__serie(curso, estrategia)]
+
+    @property
+    def estatisticas(self):
+        """Séries, períodos guardados e bytes ocupados pelas colunas."""
+        bytes_colunas = sum(
+            coluna.itemsize * len(coluna)
+            for periodo in self.__periodos.values()
+            for colunas in periodo["colunas"]
+            for coluna in colunas
+        )
+        return {
+            "series": len(self.__valores),
+            "horas": len(self.__periodos[SerieTemporalProgresso.HORA]["chaves"]),
+            "dias": len(self.__periodos[SerieTemporalProgresso.DIA]["chaves"]),
+            "bytes": bytes_colunas,
+        }
+
+    # --- contexto ---
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
+        return False
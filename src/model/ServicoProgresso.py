@@ -0,0 +1,277 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+from .RegistroEstrategias import RegistroEstrategias
+
+# Erros inesperados no atendimento HTTP (o cliente recebe 500 e o erro fica no log).
+_log = logging.getLogger(__name__)
+
+
+class ServicoProgresso:
+    """
+    Fachada asyncio para consultar o progresso de trilhas sem bloquear o event loop.
+
+    - Todo acesso ao modelo (cálculo de progresso e alterações feitas por alterar()) roda em
+      uma única thread de trabalho. O event loop continua livre para atender outras conexões,
+      e leituras e escritas nunca acontecem ao mesmo tempo (o modelo não é thread-safe).
+    - Pedidos simultâneos do progresso da mesma trilha com a mesma estratégia são agrupados:
+      um único cálculo é feito e todos os pedidos recebem o mesmo resultado.
+    - servir() abre um endpoint HTTP/JSON local:
+        GET /trilhas                                  → nomes das trilhas
+        GET /trilhas/<nome>/progresso?estrategia=...  → progresso da trilha
+        GET /trilhas/<nome>/cursos                    → progresso de cada curso
+        GET /estatisticas                             → pedidos recebidos x cálculos feitos
+      Trilha ou estratégia desconhecida → 404; erro durante o cálculo → 500 (registrado no log).
+    """
+
+    ESTRATEGIA_PADRAO = "simples"
+    # Trecho lido por vez ao descartar o corpo de um pedido (Content-Length).
+    TAMANHO_BLOCO_CORPO = 64 * 1024
+
+    def __init__(self, trilhas=(), estrategias=None):
+        """
+        Parâmetros:
+            trilhas: trilhas atendidas pelo serviço (identificadas pelo nome).
+            estrategias: dicionário nome -> EstrategiaProgresso. Com None (padrão), cada
+                         pedido procura a estratégia no RegistroEstrategias, então as
+                         registradas depois da criação do serviço também são atendidas.
+                         Um dicionário vazio não atende nenhuma estratégia.
+        """
+        self.__trilhas = {}
+        for trilha in trilhas:
+            self.adicionar_trilha(trilha)
+
+        self.__estrategias = None if estrategias is None else dict(estrategias)
+
+        # Uma única thread: os cálculos e as alterações do modelo ficam em sequência.
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modelo")
+        # (nome da trilha, estratégia) -> future do cálculo em andamento.
+        self.__em_andamento = {}
+        self.__pedidos = 0
+        self.__calculos = 0
+
+    def adicionar_trilha(self, trilha):
+        """Passa a atender a trilha pelo seu nome (substitui outra com o mesmo nome)."""
+        self.__trilhas[trilha.nome] = trilha
+
+    @property
+    def nomes_trilhas(self):
+        return list(self.__trilhas)
+
+    @property
+    def estatisticas(self):
+        """Pedidos de progresso recebidos e cálculos realmente executados."""
+        return {"pedidos": self.__pedidos, "calculos": self.__calculos}
+
+    # --- consultas assíncronas ---
+
+    async def progresso(self, nome_trilha, estrategia=None):
+        """
+        Retorna o progresso da trilha (0.0 a 1.0) calculado na thread do modelo.
+        Lança KeyError se a trilha ou a estratégia não existirem.
+        """
+        trilha = self.__trilhas[nome_trilha]
+        nome_estrategia = estrategia or ServicoProgresso.ESTRATEGIA_PADRAO
+        objeto_estrategia = self.obter_estrategia(nome_estrategia)
+        self.__pedidos += 1
+
+        chave = (nome_trilha, nome_estrategia)
+        calculo = self.__em_andamento.get(chave)
+        if calculo is None:
+            self.__calculos += 1
+            calculo = asyncio.get_running_loop().run_in_executor(
+                self.__executor, trilha.progresso, objeto_estrategia
+            )
+            self.__em_andamento[chave] = calculo
+            calculo.add_done_callback(lambda _: self.__em_andamento.pop(chave, None))
+
+        # shield: se um dos pedidos for cancelado, o cálculo continua para os demais.
+        return await asyncio.shield(calculo)
+
+    def obter_estrategia(self, nome):
+        """
+        Retorna a estratégia com o nome dado, procurada a cada pedido
+        (no dicionário do serviço ou, sem ele, no RegistroEstrategias).
+        Lança KeyError se ela não existir.
+        """
+        if self.__estrategias is not None:
+            return self.__estrategias[nome]
+        try:
+            return RegistroEstrategias.obter(nome)
+        except ValueError:
+            raise KeyError(nome) from None
+
+    async def progresso_cursos(self, nome_trilha):
+        """Retorna [(título do curso, progresso), ...] calculado na thread do modelo."""
+        trilha = self.__trilhas[nome_trilha]
+        return await self.executar(
+            lambda: [(curso.titulo, curso.progresso()) for curso in trilha.cursos]
+        )
+
+    async def alterar(self, nome_trilha, funcao):
+        """
+        Executa funcao(trilha) na thread do modelo e retorna o resultado.
+        É a forma segura de alterar tarefas enquanto o serviço atende consultas.
+        """
+        trilha = self.__trilhas[nome_trilha]
+        return await self.executar(lambda: funcao(trilha))
+
+    async def executar(self, funcao):
+        """Executa funcao() na thread do modelo sem bloquear o event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, funcao)
+
+    def fechar(self):
+        """Encerra a thread do modelo."""
+        self.__executor.shutdown()
+
+    # --- endpoint HTTP/JSON ---
+
+    async def servir(self, host="127.0.0.1", porta=8080):
+        """
+        Abre o servidor HTTP e retorna o objeto asyncio.Server
+        (use "async with servidor:" e "await servidor.serve_forever()").
+        """
+        return await asyncio.start_server(self.__atender_conexao, host, porta)
+
+    async def __atender_conexao(self, leitor, escritor):
+        """Atende uma conexão HTTP/1.1 (com keep-alive) até o cliente fechar."""
+        try:
+            while True:
+                try:
+                    linha_pedido = await leitor.readline()
+                    if not linha_pedido:
+                        break
+
+                    cabecalhos = {}
+                    while True:
+                        linha = await leitor.readline()
+                        if linha in (b"\r\n", b"\n", b""):
+                            break
+                        nome, _, valor = linha.decode("latin-1").partition(":")
+                        cabecalhos[nome.strip().lower()] = valor.strip()
+                except (asyncio.LimitOverrunError, ValueError):
+                    # Linha maior que o limite do StreamReader: o resto do pedido não é confiável.
+                    await self.__responder(escritor, 400, {"erro": "Linha do pedido muito longa."}, False)
+                    break
+
+                partes = linha_pedido.decode("latin-1").split()
+                if len(partes) != 3:
+                    await self.__responder(escritor, 400, {"erro": "Pedido HTTP inválido."}, False)
+                    break
+
+                # O corpo (se houver) é lido e descartado; sem isso, ele seria lido
+                # como o próximo pedido da conexão keep-alive.
+                erro_corpo = await self.__descartar_corpo(leitor, cabecalhos)
+                if erro_corpo is not None:
+                    await self.__responder(escritor, erro_corpo[0], {"erro": erro_corpo[1]}, False)
+                    break
+
+                metodo, alvo, versao = partes
+                manter_conexao = (
+                    versao == "HTTP/1.1" and cabecalhos.get("connection", "").lower() != "close"
+                )
+                codigo, corpo = await self.__rotear(metodo, alvo)
+                await self.__responder(escritor, codigo, corpo, manter_conexao)
+
+                if not manter_conexao:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+    @staticmethod
+    async def __descartar_corpo(leitor, cabecalhos):
+        """
+        Lê e descarta o corpo do pedido indicado por Content-Length.
+        Retorna None, ou (código HTTP, mensagem) se o corpo não puder ser lido
+        (nesse caso a conexão é fechada depois da resposta).
+        """
+        if "transfer-encoding" in cabecalhos:
+            return 501, "Transfer-Encoding não suportado; use Content-Length."
+
+        texto = cabecalhos.get("content-length")
+        if texto is None:
+            return None
+        if not texto.isdecimal():
+            return 400, "Content-Length inválido."
+
+        restante = int(texto)
+        while restante:
+            bloco = min(restante, ServicoProgresso.TAMANHO_BLOCO_CORPO)
+            await leitor.readexactly(bloco)
+            restante -= bloco
+        return None
+
+    async def __rotear(self, metodo, alvo):
+        """Retorna (código HTTP, corpo JSON) para o pedido."""
+        if metodo != "GET":
+            return 405, {"erro": "Use GET."}
+
+        endereco = urlsplit(alvo)
+        partes = [unquote(parte) for parte in endereco.path.strip("/").split("/") if parte]
+        parametros = parse_qs(endereco.query)
+
+        if partes == ["trilhas"]:
+            return 200, {"trilhas": self.nomes_trilhas}
+
+        if partes == ["estatisticas"]:
+            return 200, self.estatisticas
+
+        if len(partes) != 3 or partes[0] != "trilhas" or partes[2] not in ("progresso", "cursos"):
+            return 404, {"erro": "Caminho desconhecido."}
+
+        # Trilha e estratégia são procuradas antes do cálculo: um KeyError dentro de uma
+        # estratégia ou do modelo é erro interno (500), não "não encontrado".
+        nome_trilha = partes[1]
+        if nome_trilha not in self.__trilhas:
+            return 404, {"erro": f"Trilha não encontrada: {nome_trilha}"}
+
+        estrategia = parametros.get("estrategia", [ServicoProgresso.ESTRATEGIA_PADRAO])[0]
+        if partes[2] == "progresso":
+            try:
+                self.obter_estrategia(estrategia)
+            except KeyError:
+                return 404, {"erro": f"Estratégia não encontrada: {estrategia}"}
+
+        try:
+            if partes[2] == "progresso":
+                valor = await self.progresso(nome_trilha, estrategia)
+                return 200, {"trilha": nome_trilha, "estrategia": estrategia, "progresso": valor}
+
+            cursos = await self.progresso_cursos(nome_trilha)
+            return 200, {
+                "trilha": nome_trilha,
+                "cursos": [{"titulo": titulo, "progresso": valor} for titulo, valor in cursos],
+            }
+        except Exception:
+            # Erro numa estratégia ou no modelo: a conexão continua e o cliente recebe 500.
+            _log.exception("Erro ao atender %s %s", metodo, alvo)
+            return 500, {"erro": "Erro interno ao calcular o progresso."}
+
+    @staticmethod
+    async def __responder(escritor, codigo, corpo, manter_conexao):
+        textos = {
+            200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            500: "Internal Server Error", 501: "Not Implemented",
+        }
+        conteudo = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+        cabecalho = (
+            f"HTTP/1.1 {codigo} {textos.get(codigo, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(conteudo)}\r\n"
+            f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n"
+            "\r\n"
+        )
+        escritor.write(cabecalho.encode("latin-1") + conteudo)
+        await escritor.drain()
+
+    # --- contexto ---
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
@@ -0,0 +1,463 @@
+import mmap
+import struct
+from datetime import datetime, timedelta, timezone
+from .Aula import Aula
+from .Curso import Curso
+from .Trilha import Trilha
+from .StatusTarefa import StatusTarefa
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaFactory import TarefaFactory
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+
+
+class SnapshotTrilha:
+    """
+    Snapshot binário (versionado) de uma Trilha, lido com mmap.
+
+    Layout do arquivo (little-endian):
+        cabeçalho
+        cursos   → registros fixos (título, carga, primeira aula, quantidade de aulas)
+        aulas    → registros fixos (título, primeira tarefa, quantidade de tarefas)
+        tarefas  → registros fixos (tipo, status, título, descrição, numerador,
+                   denominador, data, primeira camada de prazo, quantidade de camadas)
+        camadas  → um registro por TarefaComPrazo (prazo, penalidade, data, status, ...)
+        textos   → tabela de strings (offsets + bytes UTF-8), sem repetição
+
+    Datas são gravadas como microssegundos desde 01-01-1970 (sem fuso),
+    o que preserva exatamente o datetime original. Datas com fuso (tzinfo) são
+    convertidas para UTC antes de gravar e voltam sem fuso, já em UTC.
+
+    O progresso é calculado direto dos registros, sem criar objetos TarefaEstudo;
+    tarefas individuais só são criadas quando acessadas por tarefa(indice).
+    """
+
+    MAGICO = b"TRLH"
+    VERSAO = 1
+
+    # magico, versão, reservado, título da trilha, qtd. de cursos, aulas, tarefas,
+    # camadas e textos, offsets de cursos, aulas, tarefas, camadas e textos.
+    CABECALHO = struct.Struct("<4sHHIIIIIIQQQQQ")
+    CURSO = struct.Struct("<IIII")
+    AULA = struct.Struct("<III")
+    TAREFA = struct.Struct("<BBHIIddqII")
+    CAMADA = struct.Struct("<qdqB3xII")
+    OFFSET_TEXTO = struct.Struct("<Q")
+
+    # Posição na tupla = código gravado no arquivo.
+    TIPOS = ("leitura", "pratica", "quiz", "projeto")
+    STATUS = (StatusTarefa.A_FAZER, StatusTarefa.EM_ANDAMENTO, StatusTarefa.CONCLUIDA)
+    # tipo -> (campo numerador, campo denominador)
+    CAMPOS = {
+        "leitura": ("paginas_lidas", "total_paginas"),
+        "pratica": ("etapas_concluidas", "total_etapas"),
+        "quiz": ("nota", "nota_max"),
+        "projeto": ("entregas_aprovadas", "total_entregas"),
+    }
+
+    SEM_TEXTO = 0xFFFFFFFF
+    SEM_DATA = -(2 ** 63)
+    EPOCA = datetime(1970, 1, 1)
+
+    def __init__(self, arquivo, mapa):
+        """
+        Use SnapshotTrilha.abrir(caminho) em vez de chamar o construtor diretamente.
+        """
+        self.__arquivo = arquivo
+        self.__mapa = mapa
+        self.__tarefas_criadas = {}
+        # Trilha materializada para as estratégias sem cálculo direto dos registros (progresso).
+        self.__trilha_materializada = None
+
+        (
+            magico,
+            versao,
+            _,
+            self.__nome,
+            self.__quantidade_cursos,
+            self.__quantidade_aulas,
+            self.__quantidade_tarefas,
+            self.__quantidade_camadas,
+            self.__quantidade_textos,
+            self.__offset_cursos,
+            self.__offset_aulas,
+            self.__offset_tarefas,
+            self.__offset_camadas,
+            self.__offset_textos,
+        ) = self.CABECALHO.unpack_from(mapa, 0)
+
+        if magico != self.MAGICO:
+            raise ValueError("Arquivo não é um snapshot de trilha.")
+        if versao != self.VERSAO:
+            raise ValueError(f"Versão de snapshot não suportada: {versao}.")
+
+    # --- escrita ---
+
+    @classmethod
+    def salvar(cls, trilha, caminho):
+        """Grava o snapshot binário da trilha no caminho informado."""
+        textos = {}
+
+        def indice_texto(texto):
+            if texto is None:
+                return cls.SEM_TEXTO
+            return textos.setdefault(texto, len(textos))
+
+        cursos = bytearray()
+        aulas = bytearray()
+        tarefas = bytearray()
+        camadas = bytearray()
+        quantidade_aulas = 0
+        quantidade_tarefas = 0
+        quantidade_camadas = 0
+
+        for curso in trilha.cursos:
+            cursos += cls.CURSO.pack(
+                indice_texto(curso.titulo), curso.carga_horas, quantidade_aulas, len(curso.aulas)
+            )
+
+            for aula in curso.aulas:
+                aulas += cls.AULA.pack(indice_texto(aula.titulo), quantidade_tarefas, len(aula.tarefas))
+                quantidade_aulas += 1
+
+                for tarefa in aula.tarefas:
+                    # Camadas de prazo, da mais externa para a mais interna.
+                    camadas_tarefa = []
+                    while isinstance(tarefa, TarefaComPrazo):
+                        camadas_tarefa.append(tarefa)
+                        tarefa = tarefa.tarefa_base
+
+                    primeira_camada = quantidade_camadas
+                    for camada in reversed(camadas_tarefa):
+                        camadas += cls.CAMADA.pack(
+                            cls.__data_para_inteiro(camada.prazo),
+                            camada.penalidade,
+                            cls.__data_para_inteiro(camada.data_realizacao),
+                            cls.STATUS.index(camada.status),
+                            indice_texto(camada.titulo),
+                            indice_texto(camada.descricao),
+                        )
+                        quantidade_camadas += 1
+
+                    argumentos = TarefaFactory.argumentos_de(tarefa)
+                    tipo = argumentos["tipo_tarefa"]
+                    campo_numerador, campo_denominador = cls.CAMPOS[tipo]
+                    tarefas += cls.TAREFA.pack(
+                        cls.TIPOS.index(tipo),
+                        cls.STATUS.index(tarefa.status),
+                        0,
+                        indice_texto(tarefa.titulo),
+                        indice_texto(tarefa.descricao),
+                        argumentos[campo_numerador],
+                        argumentos[campo_denominador],
+                        cls.__data_para_inteiro(tarefa.data_realizacao),
+                        primeira_camada,
+                        len(camadas_tarefa),
+                    )
+                    quantidade_tarefas += 1
+
+        indice_nome = indice_texto(trilha.nome)
+
+        # Tabela de textos: offsets (um a mais que a quantidade) seguidos dos bytes UTF-8.
+        dados_textos = bytearray()
+        offsets_textos = bytearray()
+        for texto in textos:
+            offsets_textos += cls.OFFSET_TEXTO.pack(len(dados_textos))
+            dados_textos += texto.encode("utf-8")
+        offsets_textos += cls.OFFSET_TEXTO.pack(len(dados_textos))
+
+        offset_cursos = cls.CABECALHO.size
+        offset_aulas = offset_cursos + len(cursos)
+        offset_tarefas = offset_aulas + len(aulas)
+        offset_camadas = offset_tarefas + len(tarefas)
+        offset_textos = offset_camadas + len(camadas)
+
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(
+                cls.CABECALHO.pack(
+                    cls.MAGICO,
+                    cls.VERSAO,
+                    0,
+                    indice_nome,
+                    len(trilha.cursos),
+                    quantidade_aulas,
+                    quantidade_tarefas,
+                    quantidade_camadas,
+                    len(textos),
+                    offset_cursos,
+                    offset_aulas,
+                    offset_tarefas,
+                    offset_camadas,
+                    offset_textos,
+                )
+            )
+            for secao in (cursos, aulas, tarefas, camadas, offsets_textos, dados_textos):
+                arquivo.write(secao)
+
+    # --- abertura / fechamento ---
+
+    @classmethod
+    def abrir(cls, caminho):
+        """Abre o snapshot com mmap (somente leitura)."""
+        arquivo = open(caminho, "rb")
+        try:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            arquivo.close()
+            raise
+        return cls(arquivo, mapa)
+
+    def fechar(self):
+        self.__tarefas_criadas.clear()
+        self.__trilha_materializada = None
+        self.__mapa.close()
+        self.__arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_erro, erro, rastreamento):
+        self.fechar()
+
+    # --- consultas básicas ---
+
+    @property
+    def nome(self):
+        return self.__texto(self.__nome)
+
+    @property
+    def quantidade_cursos(self):
+        return self.__quantidade_cursos
+
+    @property
+    def quantidade_aulas(self):
+        return self.__quantidade_aulas
+
+    @property
+    def quantidade_tarefas(self):
+        return self.__quantidade_tarefas
+
+    def curso(self, indice):
+        """Retorna (titulo, carga_horas, primeira_aula, quantidade_aulas) do curso."""
+        titulo, carga, primeira_aula, quantidade = self.CURSO.unpack_from(
+            self.__mapa, self.__offset_cursos + indice * self.CURSO.size
+        )
+        return self.__texto(titulo), carga, primeira_aula, quantidade
+
+    def aula(self, indice):
+        """Retorna (titulo, primeira_tarefa, quantidade_tarefas) da aula."""
+        titulo, primeira_tarefa, quantidade = self.AULA.unpack_from(
+            self.__mapa, self.__offset_aulas + indice * self.AULA.size
+        )
+        return self.__texto(titulo), primeira_tarefa, quantidade
+
+    # --- progresso sem criar objetos ---
+
+    def progresso_tarefa(self, indice):
+        """Mesmo valor de tarefa.progresso(), lido direto do registro."""
+        registro = self.TAREFA.unpack_from(
+            self.__mapa, self.__offset_tarefas + indice * self.TAREFA.size
+        )
+        return self.__progresso_registro(registro)
+
+    def progresso_aula(self, indice):
+        """Mesmo valor de Aula.progresso()."""
+        _, primeira_tarefa, quantidade = self.AULA.unpack_from(
+            self.__mapa, self.__offset_aulas + indice * self.AULA.size
+        )
+        if quantidade == 0:
+            return 0.0
+
+        inicio = self.__offset_tarefas + primeira_tarefa * self.TAREFA.size
+        fim = inicio + quantidade * self.TAREFA.size
+        soma_progresso = 0.0
+        for registro in self.TAREFA.iter_unpack(self.__mapa[inicio:fim]):
+            soma_progresso += self.__progresso_registro(registro)
+
+        return soma_progresso / quantidade
+
+    def progresso_curso(self, indice):
+        """Mesmo valor de Curso.progresso()."""
+        _, _, primeira_aula, quantidade = self.CURSO.unpack_from(
+            self.__mapa, self.__offset_cursos + indice * self.CURSO.size
+        )
+        if quantidade == 0:
+            return 0.0
+
+        soma_progresso = 0.0
+        for indice_aula in range(primeira_aula, primeira_aula + quantidade):
+            soma_progresso += self.progresso_aula(indice_aula)
+
+        return soma_progresso / quantidade
+
+    def progresso(self, estrategia):
+        """
+        Progresso da trilha com a estratégia informada (como Trilha.progresso),
+        calculado a partir dos registros.
+
+        Só MediaSimplesEstrategia e MediaPonderadaPorCargaEstrategia (tipo exato: uma
+        subclasse pode redefinir calcular) são calculadas direto dos registros; as demais
+        recebem a trilha materializada em estrategia.calcular (materializada uma vez
+        e reaproveitada: o snapshot não muda).
+        """
+        if estrategia is None:
+            return 0.0
+
+        if type(estrategia) not in (MediaPonderadaPorCargaEstrategia, MediaSimplesEstrategia):
+            if self.__trilha_materializada is None:
+                self.__trilha_materializada = self.materializar()
+            return estrategia.calcular(self.__trilha_materializada)
+
+        if self.__quantidade_cursos == 0:
+            return 0.0
+
+        if type(estrategia) is MediaPonderadaPorCargaEstrategia:
+            soma_progresso_ponderado = 0.0
+            soma_pesos = 0
+            for indice in range(self.__quantidade_cursos):
+                # Se carga_horas for 0, considera peso 1 para não descartar o curso.
+                peso_curso = self.curso(indice)[1] or 1
+                soma_progresso_ponderado += self.progresso_curso(indice) * peso_curso
+                soma_pesos += peso_curso
+            return soma_progresso_ponderado / soma_pesos
+
+        soma_progresso = 0.0
+        for indice in range(self.__quantidade_cursos):
+            soma_progresso += self.progresso_curso(indice)
+        return soma_progresso / self.__quantidade_cursos
+
+    # --- criação sob demanda ---
+
+    def tarefa(self, indice):
+        """
+        Cria (na primeira vez) e devolve a TarefaEstudo gravada na posição indicada,
+        incluindo seus decorators TarefaComPrazo.
+        """
+        tarefa = self.__tarefas_criadas.get(indice)
+        if tarefa is not None:
+            return tarefa
+
+        (
+            codigo_tipo,
+            codigo_status,
+            _,
+            titulo,
+            descricao,
+            numerador,
+            denominador,
+            data,
+            primeira_camada,
+            quantidade_camadas,
+        ) = self.TAREFA.unpack_from(self.__mapa, self.__offset_tarefas + indice * self.TAREFA.size)
+
+        tipo = self.TIPOS[codigo_tipo]
+        campo_numerador, campo_denominador = self.CAMPOS[tipo]
+        if tipo != "quiz":
+            numerador = int(numerador)
+            denominador = int(denominador)
+
+        tarefa = TarefaFactory.criar(
+            tipo,
+            titulo=self.__texto(titulo),
+            descricao=self.__texto(descricao),
+            data_realizacao=self.__inteiro_para_data(data),
+            **{campo_numerador: numerador, campo_denominador: denominador},
+        )
+        tarefa.status = self.STATUS[codigo_status]
+
+        for indice_camada in range(primeira_camada, primeira_camada + quantidade_camadas):
+            prazo, penalidade, data_camada, status_camada, titulo_camada, descricao_camada = (
+                self.CAMADA.unpack_from(
+                    self.__mapa, self.__offset_camadas + indice_camada * self.CAMADA.size
+                )
+            )
+            tarefa = TarefaComPrazo(
+                tarefa, prazo=self.__inteiro_para_data(prazo), penalidade=penalidade
+            )
+            tarefa.titulo = self.__texto(titulo_camada)
+            tarefa.descricao = self.__texto(descricao_camada)
+            tarefa.data_realizacao = self.__inteiro_para_data(data_camada)
+            tarefa.status = self.STATUS[status_camada]
+
+        self.__tarefas_criadas[indice] = tarefa
+        return tarefa
+
+    def materializar(self):
+        """Reconstrói a Trilha completa (cria todos os objetos)."""
+        trilha = Trilha(self.nome)
+        for indice_curso in range(self.__quantidade_cursos):
+            titulo, carga, primeira_aula, quantidade_aulas = self.curso(indice_curso)
+            curso = Curso(titulo, carga)
+
+            for indice_aula in range(primeira_aula, primeira_aula + quantidade_aulas):
+                titulo_aula, primeira_tarefa, quantidade_tarefas = self.aula(indice_aula)
+                aula = Aula(titulo_aula)
+                # Tarefas com a mesma chave (ex.: uma renomeada) foram salvas juntas e voltam juntas.
+                for indice_tarefa in range(primeira_tarefa, primeira_tarefa + quantidade_tarefas):
+                    aula.adicionar_tarefa(self.tarefa(indice_tarefa), manter_duplicada=True)
+                curso.adicionar_aula(aula)
+
+            trilha.adicionar_curso(curso)
+
+        return trilha
+
+    # --- auxiliares ---
+
+    def __progresso_registro(self, registro):
+        numerador = registro[5]
+        denominador = registro[6]
+        progresso = numerador / denominador
+
+        primeira_camada = registro[8]
+        for indice_camada in range(primeira_camada, primeira_camada + registro[9]):
+            prazo, penalidade, data, status, _, _ = self.CAMADA.unpack_from(
+                self.__mapa, self.__offset_camadas + indice_camada * self.CAMADA.size
+            )
+            # Mesma regra de TarefaComPrazo.atrasada / fator_penalidade().
+            if (
+                prazo != self.SEM_DATA
+                and self.STATUS[status] == StatusTarefa.CONCLUIDA
+                and data != self.SEM_DATA
+                and data > prazo
+            ):
+                fator = 1.0 - penalidade
+                if fator < 0.0:
+                    fator = 0.0
+                progresso *= fator
+
+            if progresso < 0.0:
+                progresso = 0.0
+            if progresso > 1.0:
+                progresso = 1.0
+
+        return progresso
+
+    def __texto(self, indice):
+        if indice == self.SEM_TEXTO:
+            return None
+        posicao = self.__offset_textos + indice * self.OFFSET_TEXTO.size
+        inicio = self.OFFSET_TEXTO.unpack_from(self.__mapa, posicao)[0]
+        fim = self.OFFSET_TEXTO.unpack_from(self.__mapa, posicao + self.OFFSET_TEXTO.size)[0]
+        base = self.__offset_textos + (self.__quantidade_textos + 1) * self.OFFSET_TEXTO.size
+        return self.__mapa[base + inicio:base + fim].decode("utf-8")
+
+    @classmethod
+    def __data_para_inteiro(cls, data):
+        if data is None:
+            return cls.SEM_DATA
+        if data.tzinfo is not None:
+            # A época não tem fuso: subtrair uma data com fuso lançaria TypeError.
+            data = data.astimezone(timezone.utc).replace(tzinfo=None)
+        return (data - cls.EPOCA) // timedelta(microseconds=1)
+
+    @classmethod
+    def __inteiro_para_data(cls, valor):
+        if valor == cls.SEM_DATA:
+            return None
+        return cls.EPOCA + timedelta(microseconds=valor)
+
+    def __str__(self):
+        return (
+            f"SnapshotTrilha: {self.nome} ({self.__quantidade_cursos} cursos, "
+            f"{self.__quantidade_aulas} aulas, {self.__quantidade_tarefas} tarefas)"
+        )
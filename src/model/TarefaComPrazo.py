@@ -1,6 +1,7 @@
 from datetime import datetime
 from .TarefaEstudo import TarefaEstudo
 from .StatusTarefa import StatusTarefa
+from .ConversorData import ConversorData
 
 
 class TarefaComPrazo(TarefaEstudo):
@@ -10,6 +11,8 @@ class TarefaComPrazo(TarefaEstudo):
     caso ela seja concluída após o prazo definido.
     """
 
+    __slots__ = ("__tarefa_base", "__prazo", "__penalidade", "__tarefa_concreta", "__camadas", "__fatores")
+
     def __init__(self, tarefa_base, prazo=None, penalidade=0.0):
         """
         Parâmetros:
@@ -34,6 +37,19 @@ class TarefaComPrazo(TarefaEstudo):
         )
 
         self.__tarefa_base = tarefa_base
+        # Alterações na tarefa base mudam o progresso do decorator também.
+        tarefa_base.registrar_observador(self)
+
+        # Decorators empilhados são avaliados de uma vez: a cadeia não muda depois de criada,
+        # então guardamos a tarefa concreta e as camadas (da mais interna para a mais externa).
+        if isinstance(tarefa_base, TarefaComPrazo):
+            self.__tarefa_concreta = tarefa_base.__tarefa_concreta
+            self.__camadas = tarefa_base.__camadas + (self,)
+        else:
+            self.__tarefa_concreta = tarefa_base
+            self.__camadas = (self,)
+        # Fatores de penalidade que se aplicam hoje (None = recalcular na próxima leitura).
+        self.__fatores = None
 
         self.__prazo = None
         self.prazo = prazo  # usa o setter
@@ -43,6 +59,21 @@ class TarefaComPrazo(TarefaEstudo):
 
     # --- campos adicionais ---
 
+    @property
+    def tarefa_base(self):
+        """Retorna a tarefa envolvida pelo decorator (somente leitura)."""
+        return self.__tarefa_base
+
+    @property
+    def tarefa_concreta(self):
+        """Retorna a tarefa concreta no fim da cadeia de decorators."""
+        return self.__tarefa_concreta
+
+    @property
+    def camadas(self):
+        """Retorna as camadas TarefaComPrazo da cadeia, da mais interna até esta."""
+        return self.__camadas
+
     @property
     def prazo(self):
         """Retorna o prazo limite da tarefa (datetime ou None)."""
@@ -60,23 +91,30 @@ class TarefaComPrazo(TarefaEstudo):
 
         Em formato inválido, mantém None e exibe uma mensagem.
         """
-        self.__prazo = None
+        anterior = self.__prazo if self.possui_observadores else None
+
+        self.__prazo = TarefaComPrazo.__converter_prazo(valor)
+        # Avisa depois de gravar: o progresso e o índice de prazos dependem do valor novo.
+        self.notificar_alteracao("prazo", anterior, self.__prazo)
 
+    @staticmethod
+    def __converter_prazo(valor):
+        """Converte o valor recebido pelo setter de prazo (None se for inválido)."""
         if valor is None:
-            return
+            return None
 
         if isinstance(valor, datetime):
-            self.__prazo = valor
-            return
+            return valor
 
         if isinstance(valor, str):
             try:
-                self.__prazo = datetime.strptime(valor, "%d-%m-%Y %H:%M")
+                return ConversorData.converter_data_hora(valor)
             except ValueError as erro:
                 print(f"Prazo em formato inválido: {erro}")
-            return
+            return None
 
         print("Prazo inválido. Use datetime ou string 'dd-mm-YYYY HH:MM'.")
+        return None
 
     @property
     def penalidade(self):
@@ -92,6 +130,8 @@ class TarefaComPrazo(TarefaEstudo):
         - menor que 0 → 0.0;
         - maior que 1 → 1.0.
         """
+        anterior = self.__penalidade if self.possui_observadores else None
+
         try:
             valor_convertido = float(valor)
         except (TypeError, ValueError):
@@ -103,9 +143,69 @@ class TarefaComPrazo(TarefaEstudo):
             valor_convertido = 1.0
 
         self.__penalidade = valor_convertido
+        self.notificar_alteracao("penalidade", anterior, self.__penalidade)
+
+    # --- cache de progresso ---
+
+    def tarefa_alterada(self, tarefa, evento=None):
+        """Repassa aos observadores do decorator as alterações (e o evento) da tarefa base."""
+        self.notificar_alteracao(evento=evento)
+
+    def notificar_alteracao(self, campo=None, valor_anterior=None, valor_novo=None, evento=None):
+        """Descarta os fatores em cache e avisa os observadores."""
+        self.__fatores = None
+        super().notificar_alteracao(campo, valor_anterior, valor_novo, evento)
+
+    # --- desfazer alterações ---
+
+    def restaurar_campos(self, valores, eventos=None):
+        """Restaura prazo e penalidade do decorator (a tarefa base é restaurada à parte)."""
+        if "prazo" in valores:
+            self.__prazo = valores["prazo"]
+        if "penalidade" in valores:
+            self.__penalidade = valores["penalidade"]
+        super().restaurar_campos(valores, eventos)
 
     # --- comportamento ---
 
+    @property
+    def atrasada(self):
+        """
+        Indica se a tarefa foi concluída depois do prazo.
+
+        Retorna True apenas quando há prazo, a tarefa está CONCLUIDA
+        e a data de realização é posterior ao prazo.
+        """
+        return (
+            self.__prazo is not None
+            and self.status == StatusTarefa.CONCLUIDA
+            and self.data_realizacao is not None
+            and self.data_realizacao > self.__prazo
+        )
+
+    def fator_penalidade(self):
+        """
+        Retorna o fator multiplicado ao progresso da tarefa base
+        quando ela está atrasada (1.0 - penalidade, nunca negativo).
+        """
+        fator = 1.0 - self.__penalidade
+        if fator < 0.0:
+            fator = 0.0
+        return fator
+
+    def fatores_aplicados(self):
+        """
+        Retorna os fatores de penalidade das camadas atrasadas da cadeia,
+        da camada mais interna para a mais externa.
+
+        O resultado fica em cache até alguma camada (ou a tarefa concreta) avisar uma alteração.
+        """
+        if self.__fatores is None:
+            self.__fatores = tuple(
+                camada.fator_penalidade() for camada in self.__camadas if camada.atrasada
+            )
+        return self.__fatores
+
     def progresso(self):
         """
         Calcula o progresso considerando o prazo.
@@ -113,19 +213,20 @@ class TarefaComPrazo(TarefaEstudo):
         - se houver prazo e a tarefa estiver concluída depois dele,
           aplica a penalidade;
         - o resultado final é mantido entre 0.0 e 1.0.
+
+        Com decorators empilhados, a cadeia é avaliada em uma única passada:
+        lê o progresso da tarefa concreta e aplica, em ordem, os fatores das camadas
+        atrasadas (mesmo resultado de delegar camada por camada).
         """
-        progresso_base = self.__tarefa_base.progresso()
+        progresso_base = self.__tarefa_concreta.progresso()
 
-        if (
-            self.__prazo is not None
-            and self.status == StatusTarefa.CONCLUIDA
-            and self.data_realizacao is not None
-            and self.data_realizacao > self.__prazo
-        ):
-            fator = 1.0 - self.__penalidade
-            if fator < 0.0:
-                fator = 0.0
+        for fator in self.fatores_aplicados():
             progresso_base *= fator
+            # Mesma limitação que cada camada aplicaria ao seu próprio resultado.
+            if progresso_base < 0.0:
+                progresso_base = 0.0
+            if progresso_base > 1.0:
+                progresso_base = 1.0
 
         if progresso_base < 0.0:
             progresso_base = 0.0
@@ -154,7 +255,7 @@ class TarefaComPrazo(TarefaEstudo):
         """
         texto_base = self.__tarefa_base.exibir_dados()
         prazo_formatado = (
-            self.__prazo.strftime("%d-%m-%Y %H:%M") if self.__prazo else "Sem prazo"
+            ConversorData.formatar_data_hora(self.__prazo) if self.__prazo else "Sem prazo"
         )
 
         linhas = [
@@ -1,14 +1,25 @@
 from datetime import datetime
 from abc import ABC, abstractmethod
 from .StatusTarefa import StatusTarefa
+from .ConversorData import ConversorData
+from .EventoAlteracao import EventoAlteracao
 
 
 class TarefaEstudo(ABC):
+    # __slots__ evita um __dict__ por instância (economia de memória com muitas tarefas).
+    # Os nomes com "__" passam pelo mesmo name mangling dos atributos privados.
+    # __weakref__: a Aula descarregada guarda referências fracas às suas tarefas (Aula.descarregar).
+    __slots__ = ("__observadores", "__titulo", "__descricao", "__data_realizacao", "__status", "__weakref__")
+
     def __init__(self, titulo, descricao=None, data_realizacao=None, status=StatusTarefa.A_FAZER):
         """
         Classe base abstrata para representar uma tarefa de estudo.
         Define atributos e comportamentos comuns a todos os tipos de tarefa.
         """
+        # Objetos (Aula, TarefaComPrazo, ...) avisados quando o progresso pode ter mudado.
+        # A lista só é criada no primeiro registro, para não ocupar memória à toa.
+        self.__observadores = None
+
         self.__titulo = str(titulo).strip().title() if titulo else "Tarefa"
         self.__descricao = descricao
         self.__data_realizacao = None
@@ -20,6 +31,27 @@ class TarefaEstudo(ABC):
         # Define o status inicial, validando contra o Enum StatusTarefa.
         self.status = status
 
+    @classmethod
+    def instancia_validada(cls, titulo, descricao=None, data_realizacao=None):
+        """
+        Cria a tarefa sem chamar __init__ nem os setters, com status A_FAZER.
+        Os valores precisam chegar prontos: título já normalizado (normalizar_titulo)
+        e data como datetime ou None. Usado por de_valores_validados das tarefas
+        concretas, na criação em lote da TarefaFactory (que valida o lote antes).
+        """
+        tarefa = cls.__new__(cls)
+        tarefa.__observadores = None
+        tarefa.__titulo = titulo
+        tarefa.__descricao = descricao
+        tarefa.__data_realizacao = data_realizacao
+        tarefa.__status = StatusTarefa.A_FAZER
+        return tarefa
+
+    @staticmethod
+    def normalizar_titulo(valor):
+        """Regra do título: strip e title, com "Tarefa" quando vier vazio."""
+        return str(valor).strip().title() if valor else "Tarefa"
+
     # --- Encapsulamento: título, descrição e data de realização ---
 
     @property
@@ -33,7 +65,10 @@ class TarefaEstudo(ABC):
         Define o título da tarefa.
         Aplica strip e title, e utiliza um valor padrão caso o título seja vazio.
         """
-        self.__titulo = str(valor).strip().title() if valor else "Tarefa"
+        anterior = self.__titulo
+        self.__titulo = TarefaEstudo.normalizar_titulo(valor)
+        # O título faz parte da chave da tarefa (os índices da Aula precisam saber).
+        self.notificar_alteracao("titulo", anterior, self.__titulo)
 
     @property
     def descricao(self):
@@ -43,7 +78,10 @@ class TarefaEstudo(ABC):
     @descricao.setter
     def descricao(self, valor):
         """Define a descrição da tarefa."""
+        anterior = self.__descricao
         self.__descricao = valor
+        # Não muda o progresso, mas gera o evento (assinantes e desfazer de lotes).
+        self.notificar_alteracao("descricao", anterior, self.__descricao)
 
     @property
     def data_realizacao(self):
@@ -61,24 +99,35 @@ class TarefaEstudo(ABC):
 
         Em caso de formato inválido, mantém None e exibe uma mensagem.
         """
-        self.__data_realizacao = None
-
+        anterior = self.__data_realizacao
+        self.__data_realizacao = TarefaEstudo.__converter_data(data)
+        # A data pode alterar o progresso (ex.: TarefaComPrazo compara com o prazo)
+        # e faz parte da chave da tarefa.
+        self.notificar_alteracao("data_realizacao", anterior, self.__data_realizacao)
+
+    @staticmethod
+    def __converter_data(data):
+        """Converte o valor recebido pelo setter de data_realizacao (None se for inválido)."""
         if data is None:
-            return
+            return None
+
+        # datetime já está no formato final (seu str() nunca está no formato 'dd-mm-YYYY').
+        if isinstance(data, datetime):
+            return data
 
-        # Tenta converter a partir de uma string no formato 'dd-mm-YYYY'
+        # Tenta converter a partir de uma string no formato 'dd-mm-YYYY' (com cache).
         try:
-            self.__data_realizacao = datetime.strptime(str(data), "%d-%m-%Y")
-            return
+            return ConversorData.converter_data(str(data))
         except Exception:
             pass
 
         # Tenta utilizar diretamente um objeto com .strftime (ex.: datetime)
         try:
             _ = data.strftime("%d-%m-%Y")
-            self.__data_realizacao = data
+            return data
         except Exception:
             print("Data em formato inválido. Use 'dd-mm-YYYY' ou um objeto datetime.")
+            return None
 
     # --- Encapsulamento: status da tarefa ---
 
@@ -93,11 +142,88 @@ class TarefaEstudo(ABC):
         Define o status da tarefa, garantindo que seja um valor válido do Enum StatusTarefa.
         Caso contrário, utiliza o status padrão A_FAZER.
         """
+        anterior = self.__status if self.possui_observadores else None
+
         if novo_status in (StatusTarefa.A_FAZER, StatusTarefa.EM_ANDAMENTO, StatusTarefa.CONCLUIDA):
             self.__status = novo_status
         else:
             self.__status = StatusTarefa.A_FAZER
 
+        self.notificar_alteracao("status", anterior, self.__status)
+
+    # --- Notificação de alterações (usada pelo cache de progresso) ---
+
+    def registrar_observador(self, observador):
+        """
+        Registra um objeto que deve ser avisado quando o progresso da tarefa puder mudar.
+        O observador precisa implementar o método tarefa_alterada(tarefa, evento=None).
+        """
+        if self.__observadores is None:
+            self.__observadores = []
+
+        # Compara por identidade: TarefaEstudo.__eq__ compara título e data.
+        if not any(registrado is observador for registrado in self.__observadores):
+            self.__observadores.append(observador)
+
+    def remover_observador(self, observador):
+        """Remove um observador registrado anteriormente (se existir)."""
+        if self.__observadores:
+            self.__observadores = [
+                registrado for registrado in self.__observadores if registrado is not observador
+            ]
+
+    @property
+    def possui_observadores(self):
+        """
+        Indica se há observadores registrados.
+        Os setters usam para só guardar o valor anterior quando alguém vai receber o evento.
+        """
+        return bool(self.__observadores)
+
+    def notificar_alteracao(self, campo=None, valor_anterior=None, valor_novo=None, evento=None):
+        """
+        Avisa os observadores (ex.: a Aula que contém a tarefa) de que
+        algum dado que influencia o progresso (ou a chave da tarefa) foi alterado.
+
+        Quando o campo é informado, os observadores recebem também um EventoAlteracao
+        (tarefa, campo, valor anterior e valor novo). O evento só é criado se houver observadores.
+        Um evento já pronto (ex.: vindo da tarefa envolvida por um decorator) pode ser repassado.
+        """
+        if self.__observadores:
+            if evento is None and campo is not None:
+                evento = EventoAlteracao(self, campo, valor_anterior, valor_novo)
+            for observador in self.__observadores:
+                observador.tarefa_alterada(self, evento)
+
+    def restaurar_campos(self, valores, eventos=None):
+        """
+        Grava diretamente (sem passar pelos setters) os campos presentes em valores
+        (ex.: {"status": StatusTarefa.A_FAZER, "nota": 7.0}) e avisa os observadores.
+
+        Usado para desfazer alterações (LoteAlteracoes): os valores são os que a tarefa
+        já tinha antes, então não precisam ser validados de novo, e a ordem não importa
+        (ex.: restaurar total_paginas e paginas_lidas sem que um limite o outro).
+        Cada subclasse grava os seus campos e chama super().restaurar_campos(valores, eventos).
+
+        Sem eventos, os observadores recebem um único aviso sem evento. Com eventos
+        (os EventoAlteracao que desfazem cada campo), cada um é repassado aos observadores,
+        e os assinantes de Aula e Curso ficam sabendo do valor restaurado.
+        """
+        if "titulo" in valores:
+            self.__titulo = valores["titulo"]
+        if "descricao" in valores:
+            self.__descricao = valores["descricao"]
+        if "data_realizacao" in valores:
+            self.__data_realizacao = valores["data_realizacao"]
+        if "status" in valores:
+            self.__status = valores["status"]
+
+        if eventos is None:
+            self.notificar_alteracao()
+        else:
+            for evento in eventos:
+                self.notificar_alteracao(evento=evento)
+
     # --- Propriedade derivada do status ---
 
     @property
@@ -131,15 +257,32 @@ class TarefaEstudo(ABC):
         """Retorna uma representação textual simples da tarefa, incluindo o status."""
         return f"{self.__class__.__name__}: {self.__titulo} [{self.status.value}]"
 
+    # --- Identidade (igualdade e hash) ---
+
+    @property
+    def chave(self):
+        """
+        Retorna a chave que identifica a tarefa: (título, data de realização).
+        É a mesma informação usada por __eq__ e __hash__, e muda se o título ou a data mudarem.
+        """
+        return (self.__titulo, self.__data_realizacao)
+
     def __eq__(self, outro):
         """
         Compara duas tarefas pelo título e pela data de realização.
-        Retorna False caso o objeto comparado não tenha os mesmos atributos.
+        Objetos que não são tarefas não são considerados iguais.
         """
-        try:
-            return (self.titulo == outro.titulo) and (self.data_realizacao == outro.data_realizacao)
-        except Exception:
-            return False
+        if not isinstance(outro, TarefaEstudo):
+            return NotImplemented
+        return self.chave == outro.chave
+
+    def __hash__(self):
+        """
+        Hash coerente com __eq__ (tarefas iguais têm o mesmo hash).
+        Como a chave é mutável, não altere o título ou a data de uma tarefa guardada em set/dict;
+        Aula e Curso mantêm seus próprios índices atualizados.
+        """
+        return hash(self.chave)
 
     # --- Contrato das subclasses (abstração e polimorfismo) ---
 
@@ -180,7 +323,7 @@ class TarefaEstudo(ABC):
         linhas.append(f"Status: {self.status.value}")
 
         data = (
-            self.data_realizacao.strftime("%d-%m-%Y")
+            ConversorData.formatar_data(self.data_realizacao)
             if self.data_realizacao
             else "Sem data definida"
         )
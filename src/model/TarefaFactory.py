@@ -1,9 +1,34 @@
+from datetime import datetime
+from .ConversorData import ConversorData
+from .TarefaEstudo import TarefaEstudo
 from .TarefaLeitura import TarefaLeitura
 from .TarefaQuiz import TarefaQuiz
 from .TarefaPratica import TarefaPratica
 from .TarefaProjeto import TarefaProjeto
 
 
+# Tabela de despacho usada pela fábrica:
+# tipo -> (classe, campo obrigatório, campo opcional, valor padrão do opcional, título padrão)
+_ESPECIFICACOES = {
+    "leitura": (TarefaLeitura, "total_paginas", "paginas_lidas", 0, "Leitura"),
+    "quiz": (TarefaQuiz, "nota", "nota_max", 10, "Quiz"),
+    "pratica": (TarefaPratica, "total_etapas", "etapas_concluidas", 0, "Prática"),
+    "projeto": (TarefaProjeto, "total_entregas", "entregas_aprovadas", 0, "Projeto"),
+}
+
+# Regras dos contadores usadas na validação em lote (as mesmas faixas dos setters):
+# tipo -> (conversão, campo do total, campo do que já foi feito); 1 <= total e 0 <= feito <= total.
+_CONTADORES = {
+    "leitura": (int, "total_paginas", "paginas_lidas"),
+    "quiz": (float, "nota_max", "nota"),
+    "pratica": (int, "total_etapas", "etapas_concluidas"),
+    "projeto": (int, "total_entregas", "entregas_aprovadas"),
+}
+
+# classe -> tipo, para descobrir o tipo de uma tarefa sem percorrer a tabela.
+_TIPO_POR_CLASSE = {especificacao[0]: tipo for tipo, especificacao in _ESPECIFICACOES.items()}
+
+
 class TarefaFactory:
     @staticmethod
     def criar(tipo_tarefa: str, **args):
@@ -27,77 +52,257 @@ class TarefaFactory:
             raise ValueError("Tipo de tarefa não informado.")
 
         tipo_normalizado = str(tipo_tarefa).strip().lower()
+        classe, obrigatorio, opcional, valor_padrao, titulo_padrao = (
+            TarefaFactory.__especificacao(tipo_normalizado)
+        )
 
-        # --- LEITURA ---
-        if tipo_normalizado == "leitura":
-            total_paginas = args.get("total_paginas")
-            if total_paginas is None:
-                raise ValueError("Para 'leitura', informe 'total_paginas'.")
-
-            titulo = args.get("titulo", "Leitura")
-            paginas_lidas = args.get("paginas_lidas", 0)
-
-            return TarefaLeitura(
-                titulo=titulo,
-                total_paginas=total_paginas,
-                paginas_lidas=paginas_lidas,
-                descricao=args.get("descricao"),
-                data_realizacao=args.get("data_realizacao"),
-            )
+        valor_obrigatorio = args.get(obrigatorio)
+        if valor_obrigatorio is None:
+            raise ValueError(f"Para '{tipo_normalizado}', informe '{obrigatorio}'.")
+
+        # Os construtores das quatro tarefas seguem a mesma ordem de parâmetros:
+        # (titulo, obrigatório, opcional, descricao, data_realizacao).
+        return classe(
+            args.get("titulo", titulo_padrao),
+            valor_obrigatorio,
+            args.get(opcional, valor_padrao),
+            args.get("descricao"),
+            args.get("data_realizacao"),
+        )
+
+    # --- criação em lote ---
+
+    @staticmethod
+    def criar_lote(registros, tamanho_bloco=None):
+        """
+        Cria várias tarefas a partir de um iterável de dicionários.
+
+        Cada dicionário tem os mesmos argumentos de criar(), incluindo 'tipo_tarefa'.
+        O lote inteiro é validado antes de a primeira tarefa ser criada: tipo, campo
+        obrigatório, contadores (número e faixa) e data. Um registro inválido levanta
+        ValueError com a posição dele, e nenhuma tarefa é criada. Ao contrário de criar(),
+        valores fora da faixa são recusados, e não corrigidos pelos setters.
+
+        Depois da validação, as tarefas são montadas direto com os valores validados
+        (de_valores_validados), sem rodar os setters de novo, e devolvidas uma a uma
+        (gerador).
+
+        tamanho_bloco: para entradas grandes lidas de arquivo, valida e cria em blocos
+        desse tamanho, com memória constante (None = o lote inteiro de uma vez). Um erro
+        num bloco só aparece depois das tarefas dos blocos anteriores.
+        """
+        # Normaliza cada texto de tipo uma única vez por lote.
+        tipos_normalizados = {}
+
+        def validar(indice, registro):
+            tipo_tarefa = registro.get("tipo_tarefa")
+            tipo_normalizado = tipos_normalizados.get(tipo_tarefa)
+            if tipo_normalizado is None:
+                if not tipo_tarefa:
+                    raise ValueError(f"Registro {indice}: Tipo de tarefa não informado.")
+                tipo_normalizado = str(tipo_tarefa).strip().lower()
+                tipos_normalizados[tipo_tarefa] = tipo_normalizado
 
-        # --- QUIZ ---
-        if tipo_normalizado == "quiz":
-            nota = args.get("nota")
-            if nota is None:
-                raise ValueError("Para 'quiz', informe 'nota'.")
-
-            titulo = args.get("titulo", "Quiz")
-            nota_max = args.get("nota_max", 10)
-
-            return TarefaQuiz(
-                titulo=titulo,
-                nota=nota,
-                nota_max=nota_max,
-                descricao=args.get("descricao"),
-                data_realizacao=args.get("data_realizacao"),
+            try:
+                especificacao = TarefaFactory.__especificacao(tipo_normalizado)
+            except ValueError as erro:
+                raise ValueError(f"Registro {indice}: {erro}") from None
+
+            return TarefaFactory.__validar_dicionario(tipo_normalizado, especificacao, registro, indice)
+
+        return TarefaFactory.__validar_e_montar(registros, validar, tamanho_bloco)
+
+    @staticmethod
+    def criar_muitos(tipo_tarefa, registros, tamanho_bloco=None):
+        """
+        Cria várias tarefas de um mesmo tipo (gerador), com a mesma validação do lote
+        inteiro de criar_lote() antes de criar a primeira tarefa.
+
+        Cada registro pode ser:
+            - um dicionário com os argumentos de criar() (sem 'tipo_tarefa');
+            - uma tupla na ordem (titulo, obrigatório, opcional, descricao, data_realizacao),
+              em que só os dois primeiros são necessários. Exemplo para leitura:
+              ("Cap. 1", 50)  ou  ("Cap. 1", 50, 20, "Resumo", "10-03-2025").
+        """
+        if not tipo_tarefa:
+            raise ValueError("Tipo de tarefa não informado.")
+
+        tipo_normalizado = str(tipo_tarefa).strip().lower()
+        especificacao = TarefaFactory.__especificacao(tipo_normalizado)
+        obrigatorio = especificacao[1]
+        valor_padrao = especificacao[3]
+        titulo_padrao = especificacao[4]
+
+        def validar(indice, registro):
+            if isinstance(registro, dict):
+                return TarefaFactory.__validar_dicionario(tipo_normalizado, especificacao, registro, indice)
+
+            quantidade = len(registro)
+            if quantidade < 2 or registro[1] is None:
+                raise ValueError(
+                    f"Registro {indice}: Para '{tipo_normalizado}', informe '{obrigatorio}'."
+                )
+            if quantidade > 5:
+                raise ValueError(
+                    f"Registro {indice}: use no máximo 5 campos "
+                    "(titulo, obrigatório, opcional, descricao, data_realizacao)."
+                )
+
+            return TarefaFactory.__validar_valores(
+                tipo_normalizado,
+                especificacao,
+                indice,
+                registro[0] if registro[0] is not None else titulo_padrao,
+                registro[1],
+                registro[2] if quantidade > 2 else valor_padrao,
+                registro[3] if quantidade > 3 else None,
+                registro[4] if quantidade > 4 else None,
             )
 
-        # --- PRÁTICA ---
-        if tipo_normalizado == "pratica":
-            total_etapas = args.get("total_etapas")
-            if total_etapas is None:
-                raise ValueError("Para 'pratica', informe 'total_etapas'.")
-
-            titulo = args.get("titulo", "Prática")
-            etapas_concluidas = args.get("etapas_concluidas", 0)
-
-            return TarefaPratica(
-                titulo=titulo,
-                total_etapas=total_etapas,
-                etapas_concluidas=etapas_concluidas,
-                descricao=args.get("descricao"),
-                data_realizacao=args.get("data_realizacao"),
+        return TarefaFactory.__validar_e_montar(registros, validar, tamanho_bloco)
+
+    # --- caminho inverso: tarefa -> argumentos de criar() ---
+
+    @staticmethod
+    def argumentos_de(tarefa):
+        """
+        Devolve um dicionário com os argumentos que recriam a tarefa via criar():
+        tipo_tarefa, titulo, campo obrigatório, campo opcional, descricao e data_realizacao.
+
+        O status não faz parte de criar() e deve ser copiado à parte.
+        Funciona apenas com as tarefas concretas (não com TarefaComPrazo).
+        """
+        for tipo, (classe, obrigatorio, opcional, _, _) in _ESPECIFICACOES.items():
+            if isinstance(tarefa, classe):
+                return {
+                    "tipo_tarefa": tipo,
+                    "titulo": tarefa.titulo,
+                    obrigatorio: getattr(tarefa, obrigatorio),
+                    opcional: getattr(tarefa, opcional),
+                    "descricao": tarefa.descricao,
+                    "data_realizacao": tarefa.data_realizacao,
+                }
+
+        raise ValueError(
+            f"A fábrica não sabe descrever tarefas do tipo {tarefa.__class__.__name__}."
+        )
+
+    @staticmethod
+    def tipo_de(tarefa):
+        """
+        Retorna o nome do tipo usado em criar() ("leitura", "quiz", "pratica" ou "projeto"),
+        ou None se a tarefa não for de nenhum tipo conhecido pela fábrica.
+        """
+        tipo = _TIPO_POR_CLASSE.get(type(tarefa))
+        if tipo is not None:
+            return tipo
+
+        for tipo, especificacao in _ESPECIFICACOES.items():
+            if isinstance(tarefa, especificacao[0]):
+                return tipo
+        return None
+
+    # --- auxiliares ---
+
+    @staticmethod
+    def __especificacao(tipo_normalizado):
+        """Busca na tabela de tipos; levanta ValueError para tipos desconhecidos."""
+        especificacao = _ESPECIFICACOES.get(tipo_normalizado)
+        if especificacao is None:
+            raise ValueError(
+                "Tipo de tarefa inválido. Use: 'leitura', 'quiz', 'pratica' ou 'projeto'."
             )
+        return especificacao
+
+    @staticmethod
+    def __validar_e_montar(registros, validar, tamanho_bloco):
+        """
+        Valida os registros (o lote inteiro ou cada bloco) antes de montar as tarefas.
+        A validação acontece no primeiro next() do gerador devolvido.
+        """
+        if tamanho_bloco is not None and tamanho_bloco < 1:
+            raise ValueError("tamanho_bloco deve ser pelo menos 1.")
+
+        validados = []
+        for indice, registro in enumerate(registros):
+            validados.append(validar(indice, registro))
+            if tamanho_bloco is not None and len(validados) >= tamanho_bloco:
+                for classe, *valores in validados:
+                    yield classe.de_valores_validados(*valores)
+                validados = []
+
+        for classe, *valores in validados:
+            yield classe.de_valores_validados(*valores)
+
+    @staticmethod
+    def __validar_dicionario(tipo_normalizado, especificacao, registro, indice):
+        """Lê os campos de um dicionário de criar() e valida (mensagens com a posição do registro)."""
+        _, obrigatorio, opcional, valor_padrao, titulo_padrao = especificacao
 
-        # --- PROJETO ---
-        if tipo_normalizado == "projeto":
-            total_entregas = args.get("total_entregas")
-            if total_entregas is None:
-                raise ValueError("Para 'projeto', informe 'total_entregas'.")
-
-            titulo = args.get("titulo", "Projeto")
-            entregas_aprovadas = args.get("entregas_aprovadas", 0)
-
-            return TarefaProjeto(
-                titulo=titulo,
-                total_entregas=total_entregas,
-                entregas_aprovadas=entregas_aprovadas,
-                descricao=args.get("descricao"),
-                data_realizacao=args.get("data_realizacao"),
+        valor_obrigatorio = registro.get(obrigatorio)
+        if valor_obrigatorio is None:
+            raise ValueError(
+                f"Registro {indice}: Para '{tipo_normalizado}', informe '{obrigatorio}'."
             )
 
-        # --- tipo inválido ---
-        raise ValueError(
-            "Tipo de tarefa inválido. Use: 'leitura', 'quiz', 'pratica' ou 'projeto'."
+        return TarefaFactory.__validar_valores(
+            tipo_normalizado,
+            especificacao,
+            indice,
+            registro.get("titulo", titulo_padrao),
+            valor_obrigatorio,
+            registro.get(opcional, valor_padrao),
+            registro.get("descricao"),
+            registro.get("data_realizacao"),
         )
 
+    @staticmethod
+    def __validar_valores(tipo_normalizado, especificacao, indice, titulo, valor_obrigatorio,
+                          valor_opcional, descricao, data_realizacao):
+        """
+        Valida e normaliza um registro. Retorna (classe, titulo, obrigatório, opcional,
+        descricao, data), na ordem dos construtores e de de_valores_validados.
+        """
+        classe, obrigatorio, _, _, _ = especificacao
+        conversao, campo_total, campo_feito = _CONTADORES[tipo_normalizado]
+
+        try:
+            valor_obrigatorio = conversao(valor_obrigatorio)
+            valor_opcional = conversao(valor_opcional)
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Registro {indice}: '{campo_total}' e '{campo_feito}' devem ser números."
+            ) from None
+
+        if campo_total == obrigatorio:
+            total, feito = valor_obrigatorio, valor_opcional
+        else:
+            total, feito = valor_opcional, valor_obrigatorio
+        if not total >= 1:
+            raise ValueError(f"Registro {indice}: '{campo_total}' deve ser pelo menos 1.")
+        if not 0 <= feito <= total:
+            raise ValueError(f"Registro {indice}: '{campo_feito}' deve estar entre 0 e '{campo_total}'.")
+
+        return (
+            classe,
+            TarefaEstudo.normalizar_titulo(titulo),
+            valor_obrigatorio,
+            valor_opcional,
+            descricao,
+            TarefaFactory.__validar_data(data_realizacao, indice),
+        )
+
+    @staticmethod
+    def __validar_data(data, indice):
+        """Mesma conversão do setter data_realizacao, mas com erro em vez de None para datas inválidas."""
+        if data is None or isinstance(data, datetime):
+            return data
+        try:
+            return ConversorData.converter_data(str(data))
+        except ValueError:
+            pass
+        if hasattr(data, "strftime"):
+            return data
+        raise ValueError(
+            f"Registro {indice}: data_realizacao inválida ({data!r}). Use 'dd-mm-YYYY' ou um objeto datetime."
+        )
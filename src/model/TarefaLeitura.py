@@ -4,6 +4,8 @@ from .StatusTarefa import StatusTarefa
 
 
 class TarefaLeitura(TarefaEstudo):
+    __slots__ = ("__total_paginas", "__paginas_lidas")
+
     def __init__(
         self,
         titulo,
@@ -29,6 +31,17 @@ class TarefaLeitura(TarefaEstudo):
         self.total_paginas = total_paginas
         self.paginas_lidas = paginas_lidas
 
+    @classmethod
+    def de_valores_validados(cls, titulo, total_paginas, paginas_lidas, descricao=None, data_realizacao=None):
+        """
+        Cria a leitura sem passar pelos setters, com valores já validados e normalizados
+        (1 <= total_paginas e 0 <= paginas_lidas <= total_paginas). Usado pela criação em lote da TarefaFactory.
+        """
+        tarefa = cls.instancia_validada(titulo, descricao, data_realizacao)
+        tarefa.__total_paginas = total_paginas
+        tarefa.__paginas_lidas = paginas_lidas
+        return tarefa
+
     # --- dados específicos de leitura ---
 
     @property
@@ -45,6 +58,8 @@ class TarefaLeitura(TarefaEstudo):
         - Se der erro ou vier um valor menor que 1, usa 1 como padrão.
         - Se páginas_lidas já existir, garante que ela não fique maior que o novo total.
         """
+        anterior = self.__total_paginas if self.possui_observadores else None
+
         try:
             valor_temporario = int(valor)
         except (TypeError, ValueError):
@@ -58,11 +73,15 @@ class TarefaLeitura(TarefaEstudo):
         # Se paginas_lidas já foi definido antes, ajusta caso tenha passado do novo limite.
         try:
             if self.__paginas_lidas > self.__total_paginas:
+                lidas_anterior = self.__paginas_lidas
                 self.__paginas_lidas = self.__total_paginas
+                self.notificar_alteracao("paginas_lidas", lidas_anterior, self.__paginas_lidas)
         except AttributeError:
             # Ainda não temos paginas_lidas definido, então não há nada para ajustar aqui.
             pass
 
+        self.notificar_alteracao("total_paginas", anterior, self.__total_paginas)
+
     @property
     def paginas_lidas(self):
         """Quantidade de páginas já lidas até agora."""
@@ -78,6 +97,8 @@ class TarefaLeitura(TarefaEstudo):
         - Nunca deixa ficar menor que 0.
         - Também não deixa passar do total de páginas.
         """
+        anterior = self.__paginas_lidas if self.possui_observadores else None
+
         try:
             valor_temporario = int(valor)
         except (TypeError, ValueError):
@@ -91,6 +112,17 @@ class TarefaLeitura(TarefaEstudo):
             valor_temporario = self.__total_paginas
 
         self.__paginas_lidas = valor_temporario
+        self.notificar_alteracao("paginas_lidas", anterior, self.__paginas_lidas)
+
+    # --- desfazer alterações ---
+
+    def restaurar_campos(self, valores, eventos=None):
+        """Restaura total_paginas/paginas_lidas (veja TarefaEstudo.restaurar_campos)."""
+        if "total_paginas" in valores:
+            self.__total_paginas = valores["total_paginas"]
+        if "paginas_lidas" in valores:
+            self.__paginas_lidas = valores["paginas_lidas"]
+        super().restaurar_campos(valores, eventos)
 
     # --- regra de progresso ---
 
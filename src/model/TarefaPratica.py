@@ -4,6 +4,8 @@ from .StatusTarefa import StatusTarefa
 
 
 class TarefaPratica(TarefaEstudo):
+    __slots__ = ("__total_etapas", "__etapas_concluidas")
+
     def __init__(
         self,
         titulo,
@@ -29,6 +31,17 @@ class TarefaPratica(TarefaEstudo):
         self.total_etapas = total_etapas
         self.etapas_concluidas = etapas_concluidas
 
+    @classmethod
+    def de_valores_validados(cls, titulo, total_etapas, etapas_concluidas, descricao=None, data_realizacao=None):
+        """
+        Cria a tarefa prática sem passar pelos setters, com valores já validados e normalizados
+        (1 <= total_etapas e 0 <= etapas_concluidas <= total_etapas). Usado pela criação em lote da TarefaFactory.
+        """
+        tarefa = cls.instancia_validada(titulo, descricao, data_realizacao)
+        tarefa.__total_etapas = total_etapas
+        tarefa.__etapas_concluidas = etapas_concluidas
+        return tarefa
+
     # --- Atributos específicos da tarefa prática ---
 
     @property
@@ -42,6 +55,8 @@ class TarefaPratica(TarefaEstudo):
         Define o total de etapas da tarefa prática como um inteiro maior ou igual a 1.
         Em caso de valor inválido, assume 1 como padrão.
         """
+        anterior = self.__total_etapas if self.possui_observadores else None
+
         try:
             valor_temporario = int(valor)
         except (TypeError, ValueError):
@@ -55,11 +70,15 @@ class TarefaPratica(TarefaEstudo):
         # Se etapas_concluidas já foi definido, garante que não ultrapasse o novo total de etapas.
         try:
             if self.__etapas_concluidas > self.__total_etapas:
+                concluidas_anterior = self.__etapas_concluidas
                 self.__etapas_concluidas = self.__total_etapas
+                self.notificar_alteracao("etapas_concluidas", concluidas_anterior, self.__etapas_concluidas)
         except AttributeError:
             # Caso etapas_concluidas ainda não tenha sido definido, não há ajuste a fazer.
             pass
 
+        self.notificar_alteracao("total_etapas", anterior, self.__total_etapas)
+
     @property
     def etapas_concluidas(self):
         """Retorna a quantidade de etapas já concluídas na tarefa prática."""
@@ -71,6 +90,8 @@ class TarefaPratica(TarefaEstudo):
         Define a quantidade de etapas concluídas como um inteiro entre 0 e total_etapas.
         Em caso de valor inválido, assume 0 como padrão.
         """
+        anterior = self.__etapas_concluidas if self.possui_observadores else None
+
         try:
             valor_temporario = int(valor)
         except (TypeError, ValueError):
@@ -84,6 +105,17 @@ class TarefaPratica(TarefaEstudo):
             valor_temporario = self.__total_etapas
 
         self.__etapas_concluidas = valor_temporario
+        self.notificar_alteracao("etapas_concluidas", anterior, self.__etapas_concluidas)
+
+    # --- Desfazer alterações ---
+
+    def restaurar_campos(self, valores, eventos=None):
+        """Restaura total_etapas/etapas_concluidas (veja TarefaEstudo.restaurar_campos)."""
+        if "total_etapas" in valores:
+            self.__total_etapas = valores["total_etapas"]
+        if "etapas_concluidas" in valores:
+            self.__etapas_concluidas = valores["etapas_concluidas"]
+        super().restaurar_campos(valores, eventos)
 
     # --- Regra de progresso ---
 
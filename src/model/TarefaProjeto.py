@@ -4,6 +4,8 @@ from .StatusTarefa import StatusTarefa
 
 
 class TarefaProjeto(TarefaEstudo):
+    __slots__ = ("__total_entregas", "__entregas_aprovadas")
+
     def __init__(
         self,
         titulo,
@@ -37,6 +39,17 @@ class TarefaProjeto(TarefaEstudo):
         self.total_entregas = total_entregas
         self.entregas_aprovadas = entregas_aprovadas
 
+    @classmethod
+    def de_valores_validados(cls, titulo, total_entregas, entregas_aprovadas, descricao=None, data_realizacao=None):
+        """
+        Cria o projeto sem passar pelos setters, com valores já validados e normalizados
+        (1 <= total_entregas e 0 <= entregas_aprovadas <= total_entregas). Usado pela criação em lote da TarefaFactory.
+        """
+        tarefa = cls.instancia_validada(titulo, descricao, data_realizacao)
+        tarefa.__total_entregas = total_entregas
+        tarefa.__entregas_aprovadas = entregas_aprovadas
+        return tarefa
+
     # --- Atributos específicos do projeto ---
 
     @property
@@ -54,6 +67,8 @@ class TarefaProjeto(TarefaEstudo):
         - Se o valor for inválido, assume 1.
         - Se já existirem entregas aprovadas, ajusta para não ultrapassar o novo total.
         """
+        anterior = self.__total_entregas if self.possui_observadores else None
+
         try:
             valor_inteiro = int(valor)
         except (TypeError, ValueError):
@@ -66,7 +81,11 @@ class TarefaProjeto(TarefaEstudo):
 
         # Garante que entregas_aprovadas fique dentro do limite [0, total_entregas]
         if self.__entregas_aprovadas > self.__total_entregas:
+            aprovadas_anterior = self.__entregas_aprovadas
             self.__entregas_aprovadas = self.__total_entregas
+            self.notificar_alteracao("entregas_aprovadas", aprovadas_anterior, self.__entregas_aprovadas)
+
+        self.notificar_alteracao("total_entregas", anterior, self.__total_entregas)
 
     @property
     def entregas_aprovadas(self):
@@ -83,6 +102,8 @@ class TarefaProjeto(TarefaEstudo):
         - Garante que não ultrapasse o total de entregas.
         - Se o valor for inválido, assume 0.
         """
+        anterior = self.__entregas_aprovadas if self.possui_observadores else None
+
         try:
             valor_inteiro = int(valor)
         except (TypeError, ValueError):
@@ -95,6 +116,17 @@ class TarefaProjeto(TarefaEstudo):
             valor_inteiro = self.__total_entregas
 
         self.__entregas_aprovadas = valor_inteiro
+        self.notificar_alteracao("entregas_aprovadas", anterior, self.__entregas_aprovadas)
+
+    # --- Desfazer alterações ---
+
+    def restaurar_campos(self, valores, eventos=None):
+        """Restaura total_entregas/entregas_aprovadas (veja TarefaEstudo.restaurar_campos)."""
+        if "total_entregas" in valores:
+            self.__total_entregas = valores["total_entregas"]
+        if "entregas_aprovadas" in valores:
+            self.__entregas_aprovadas = valores["entregas_aprovadas"]
+        super().restaurar_campos(valores, eventos)
 
     # --- Regra de progresso ---
 
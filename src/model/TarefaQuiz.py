@@ -4,6 +4,8 @@ from .StatusTarefa import StatusTarefa
 
 
 class TarefaQuiz(TarefaEstudo):
+    __slots__ = ("__nota", "__nota_max")
+
     def __init__(
         self,
         titulo,
@@ -37,6 +39,17 @@ class TarefaQuiz(TarefaEstudo):
         self.nota_max = nota_max
         self.nota = nota
 
+    @classmethod
+    def de_valores_validados(cls, titulo, nota, nota_max, descricao=None, data_realizacao=None):
+        """
+        Cria o quiz sem passar pelos setters, com valores já validados e normalizados
+        (1.0 <= nota_max e 0.0 <= nota <= nota_max). Usado pela criação em lote da TarefaFactory.
+        """
+        tarefa = cls.instancia_validada(titulo, descricao, data_realizacao)
+        tarefa.__nota = nota
+        tarefa.__nota_max = nota_max
+        return tarefa
+
     # --- Atributos específicos do quiz ---
 
     @property
@@ -55,6 +68,8 @@ class TarefaQuiz(TarefaEstudo):
         - Após definir a nota máxima, ajusta a nota atual
           para não ultrapassar esse limite.
         """
+        anterior = self.__nota_max if self.possui_observadores else None
+
         try:
             valor_float = float(valor)
         except (TypeError, ValueError):
@@ -66,10 +81,15 @@ class TarefaQuiz(TarefaEstudo):
         self.__nota_max = valor_float
 
         # Garante que a nota fique dentro do intervalo [0, nota_max]
+        nota_anterior = self.__nota
         if self.__nota < 0.0:
             self.__nota = 0.0
         if self.__nota > self.__nota_max:
             self.__nota = self.__nota_max
+        if self.__nota != nota_anterior:
+            self.notificar_alteracao("nota", nota_anterior, self.__nota)
+
+        self.notificar_alteracao("nota_max", anterior, self.__nota_max)
 
     @property
     def nota(self):
@@ -86,6 +106,8 @@ class TarefaQuiz(TarefaEstudo):
         - Garante que não seja negativa.
         - Garante que não ultrapasse a nota máxima configurada.
         """
+        anterior = self.__nota if self.possui_observadores else None
+
         try:
             valor_float = float(valor)
         except (TypeError, ValueError):
@@ -98,6 +120,17 @@ class TarefaQuiz(TarefaEstudo):
             valor_float = self.__nota_max
 
         self.__nota = valor_float
+        self.notificar_alteracao("nota", anterior, self.__nota)
+
+    # --- Desfazer alterações ---
+
+    def restaurar_campos(self, valores, eventos=None):
+        """Restaura nota_max/nota (veja TarefaEstudo.restaurar_campos)."""
+        if "nota_max" in valores:
+            self.__nota_max = valores["nota_max"]
+        if "nota" in valores:
+            self.__nota = valores["nota"]
+        super().restaurar_campos(valores, eventos)
 
     # --- Regra de progresso ---
 
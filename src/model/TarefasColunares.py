@@ -0,0 +1,292 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional: só é necessário para o armazenamento colunar.
+    np = None
+
+from .StatusTarefa import StatusTarefa
+from .TarefaComPrazo import TarefaComPrazo
+from .TarefaLeitura import TarefaLeitura
+from .TarefaPratica import TarefaPratica
+from .TarefaQuiz import TarefaQuiz
+from .TarefaProjeto import TarefaProjeto
+from .MediaSimplesEstrategia import MediaSimplesEstrategia
+from .MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+
+
+class TarefasColunares:
+    """
+    Armazenamento colunar (NumPy) das tarefas de uma trilha.
+
+    Em vez de um objeto por tarefa, guarda um array por campo:
+    numerador, denominador, fator de penalidade, tipo, status,
+    aula e curso de cada tarefa. O progresso de cada tarefa é calculado de forma
+    vetorizada; as somas por aula e por curso usam math.fsum, como Aula e Curso,
+    devolvendo os mesmos valores do modelo de objetos.
+    """
+
+    # Códigos usados no array de tipos (a posição na tupla é o código).
+    TIPOS = ("leitura", "pratica", "quiz", "projeto")
+    # Códigos usados no array de status.
+    STATUS = (StatusTarefa.A_FAZER, StatusTarefa.EM_ANDAMENTO, StatusTarefa.CONCLUIDA)
+
+    def __init__(
+        self,
+        numerador,
+        denominador,
+        fator,
+        tipo,
+        status,
+        aula_id,
+        curso_da_aula,
+        carga_cursos,
+        trilha=None,
+    ):
+        """
+        Parâmetros (todos sequências/arrays):
+            numerador, denominador, fator, tipo, status, aula_id:
+                um valor por tarefa; aula_id é o índice da aula da tarefa.
+            curso_da_aula:
+                um valor por aula, com o índice do curso ao qual ela pertence.
+            carga_cursos:
+                um valor por curso, com a carga horária (peso da média ponderada).
+            trilha: trilha de origem das colunas (opcional), usada pelas estratégias
+                    que não têm cálculo colunar (veja progresso).
+
+        Normalmente é criado com TarefasColunares.de_trilha(trilha).
+        """
+        if np is None:
+            raise ImportError("TarefasColunares precisa do pacote numpy (pip install numpy).")
+
+        self.__numerador = np.asarray(numerador, dtype=np.float64)
+        self.__denominador = np.asarray(denominador, dtype=np.float64)
+        self.__fator = np.asarray(fator, dtype=np.float64)
+        self.__tipo = np.asarray(tipo, dtype=np.int8)
+        self.__status = np.asarray(status, dtype=np.int8)
+        self.__aula_id = np.asarray(aula_id, dtype=np.int64)
+        self.__curso_da_aula = np.asarray(curso_da_aula, dtype=np.int64)
+        self.__carga_cursos = np.asarray(carga_cursos, dtype=np.int64)
+        self.__trilha = trilha
+
+        quantidade = len(self.__numerador)
+        for coluna in (self.__denominador, self.__fator, self.__tipo, self.__status, self.__aula_id):
+            if len(coluna) != quantidade:
+                raise ValueError("Todas as colunas de tarefas devem ter o mesmo tamanho.")
+
+    # --- construção a partir do modelo de objetos ---
+
+    @classmethod
+    def de_trilha(cls, trilha):
+        """
+        Percorre a trilha uma única vez e monta as colunas.
+
+        TarefaComPrazo é "desembrulhada": a coluna de numerador/denominador
+        vem da tarefa base e a penalidade (se a tarefa estiver atrasada)
+        vai para a coluna fator.
+        """
+        numerador = []
+        denominador = []
+        fator = []
+        tipo = []
+        status = []
+        aula_id = []
+        curso_da_aula = []
+        carga_cursos = []
+
+        indice_aula = 0
+        for indice_curso, curso in enumerate(trilha.cursos):
+            carga_cursos.append(curso.carga_horas)
+
+            for aula in curso.aulas:
+                curso_da_aula.append(indice_curso)
+
+                for tarefa in aula.tarefas:
+                    fator_tarefa = 1.0
+                    status_tarefa = tarefa.status
+
+                    # Decorators empilhados: acumula os fatores até chegar na tarefa concreta.
+                    while isinstance(tarefa, TarefaComPrazo):
+                        if tarefa.atrasada:
+                            fator_tarefa *= tarefa.fator_penalidade()
+                        tarefa = tarefa.tarefa_base
+
+                    codigo_tipo, valor, total = cls.__extrair_contadores(tarefa)
+
+                    numerador.append(valor)
+                    denominador.append(total)
+                    fator.append(fator_tarefa)
+                    tipo.append(codigo_tipo)
+                    status.append(cls.STATUS.index(status_tarefa))
+                    aula_id.append(indice_aula)
+
+                indice_aula += 1
+
+        return cls(
+            numerador,
+            denominador,
+            fator,
+            tipo,
+            status,
+            aula_id,
+            curso_da_aula,
+            carga_cursos,
+            trilha,
+        )
+
+    @classmethod
+    def __extrair_contadores(cls, tarefa):
+        """Retorna (código do tipo, numerador, denominador) de uma tarefa concreta."""
+        if isinstance(tarefa, TarefaLeitura):
+            return 0, tarefa.paginas_lidas, tarefa.total_paginas
+        if isinstance(tarefa, TarefaPratica):
+            return 1, tarefa.etapas_concluidas, tarefa.total_etapas
+        if isinstance(tarefa, TarefaQuiz):
+            return 2, tarefa.nota, tarefa.nota_max
+        if isinstance(tarefa, TarefaProjeto):
+            return 3, tarefa.entregas_aprovadas, tarefa.total_entregas
+
+        raise TypeError(
+            f"Tipo de tarefa não suportado no armazenamento colunar: {tarefa.__class__.__name__}"
+        )
+
+    # --- colunas (somente leitura) ---
+
+    @property
+    def numerador(self):
+        return self.__numerador
+
+    @property
+    def denominador(self):
+        return self.__denominador
+
+    @property
+    def fator(self):
+        return self.__fator
+
+    @property
+    def tipo(self):
+        return self.__tipo
+
+    @property
+    def status(self):
+        return self.__status
+
+    @property
+    def aula_id(self):
+        return self.__aula_id
+
+    @property
+    def curso_id(self):
+        """Índice do curso de cada tarefa (derivado de aula_id)."""
+        return self.__curso_da_aula[self.__aula_id]
+
+    @property
+    def curso_da_aula(self):
+        return self.__curso_da_aula
+
+    @property
+    def carga_cursos(self):
+        return self.__carga_cursos
+
+    def __len__(self):
+        return len(self.__numerador)
+
+    # --- cálculo de progresso vetorizado ---
+
+    def progresso_tarefas(self):
+        """Progresso de cada tarefa, entre 0.0 e 1.0."""
+        progresso = self.__numerador / self.__denominador * self.__fator
+        return np.clip(progresso, 0.0, 1.0)
+
+    @staticmethod
+    def __somas_por_grupo(grupos, valores, quantidade_grupos):
+        """
+        Soma dos valores de cada grupo com math.fsum (arredondamento correto), como
+        Aula e Curso somam o cache: np.bincount somaria em ordem e poderia diferir
+        no último dígito. Retorna (somas, quantidades).
+        """
+        ordem = np.argsort(grupos, kind="stable")
+        ordenados = valores[ordem].tolist()
+        limites = np.searchsorted(grupos[ordem], np.arange(quantidade_grupos + 1)).tolist()
+        somas = np.array(
+            [math.fsum(ordenados[limites[grupo]:limites[grupo + 1]]) for grupo in range(quantidade_grupos)],
+            dtype=np.float64,
+        )
+        return somas, np.diff(limites)
+
+    def progresso_aulas(self):
+        """
+        Progresso médio de cada aula (mesma regra de Aula.progresso()).
+        Aulas sem tarefas ficam com 0.0.
+        """
+        quantidade_aulas = len(self.__curso_da_aula)
+        soma, quantidade = TarefasColunares.__somas_por_grupo(
+            self.__aula_id, self.progresso_tarefas(), quantidade_aulas
+        )
+        return np.divide(soma, quantidade, out=np.zeros(quantidade_aulas), where=quantidade > 0)
+
+    def progresso_cursos(self):
+        """
+        Progresso médio de cada curso (mesma regra de Curso.progresso()).
+        Cursos sem aulas ficam com 0.0.
+        """
+        quantidade_cursos = len(self.__carga_cursos)
+        soma, quantidade = TarefasColunares.__somas_por_grupo(
+            self.__curso_da_aula, self.progresso_aulas(), quantidade_cursos
+        )
+        return np.divide(soma, quantidade, out=np.zeros(quantidade_cursos), where=quantidade > 0)
+
+    def media_simples(self):
+        """Mesmo resultado de MediaSimplesEstrategia.calcular(trilha)."""
+        progresso_cursos = self.progresso_cursos()
+        if len(progresso_cursos) == 0:
+            return 0.0
+
+        # cumsum soma na mesma ordem do laço em Python (np.sum usa soma em pares).
+        return float(np.cumsum(progresso_cursos)[-1] / len(progresso_cursos))
+
+    def media_ponderada_por_carga(self):
+        """Mesmo resultado de MediaPonderadaPorCargaEstrategia.calcular(trilha)."""
+        progresso_cursos = self.progresso_cursos()
+        if len(progresso_cursos) == 0:
+            return 0.0
+
+        # Se carga_horas for 0, considera peso 1 para não descartar o curso.
+        pesos = np.where(self.__carga_cursos > 0, self.__carga_cursos, 1)
+        soma_pesos = int(pesos.sum())
+        if soma_pesos == 0:
+            return 0.0
+
+        soma_progresso_ponderado = np.cumsum(progresso_cursos * pesos)[-1]
+        return float(soma_progresso_ponderado / soma_pesos)
+
+    def progresso(self, estrategia):
+        """
+        Calcula o progresso da trilha com a estratégia informada,
+        como Trilha.progresso(estrategia), mas sobre as colunas.
+
+        Só MediaSimplesEstrategia e MediaPonderadaPorCargaEstrategia (tipo exato: uma
+        subclasse pode redefinir calcular) têm cálculo colunar. As demais estratégias
+        usam estrategia.calcular com a trilha de origem (estado atual dos objetos);
+        sem trilha de origem, geram TypeError.
+        """
+        if estrategia is None:
+            return 0.0
+
+        if type(estrategia) is MediaPonderadaPorCargaEstrategia:
+            return self.media_ponderada_por_carga()
+        if type(estrategia) is MediaSimplesEstrategia:
+            return self.media_simples()
+
+        if self.__trilha is None:
+            raise TypeError(
+                f"Estratégia sem cálculo colunar e sem trilha de origem: {estrategia.__class__.__name__}"
+            )
+        return estrategia.calcular(self.__trilha)
+
+    def __str__(self):
+        return (
+            f"TarefasColunares ({len(self)} tarefas, "
+            f"{len(self.__curso_da_aula)} aulas, {len(self.__carga_cursos)} cursos)"
+        )
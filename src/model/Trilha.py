@@ -1,3 +1,9 @@
+import threading
+from .Aula import Aula
+from .LoteAlteracoes import LoteAlteracoes
+from .TarefaComPrazo import TarefaComPrazo
+
+
 class Trilha:
     def __init__(self, nome):
         """
@@ -12,6 +18,26 @@ class Trilha:
         # Lista de cursos que fazem parte desta trilha.
         self.__cursos = []
 
+        # Funções que recebem os EventoAlteracao das tarefas da trilha (criada no primeiro assinar).
+        self.__assinantes = None
+        # Lote de alterações aberto (with trilha.lote()), que guarda os eventos até o fim do bloco.
+        self.__lote = None
+        # Com o modo concorrente ligado, cada curso (novo ou existente) ganha a sua trava.
+        self.__modo_concorrente = False
+
+        # Índices das tarefas da trilha por status e por tipo (montados na primeira consulta
+        # com filtro e mantidos pelos eventos de status que sobem dos cursos):
+        # StatusTarefa -> {id(tarefa): tarefa} e classe -> {id(tarefa): tarefa}
+        self.__por_status = None
+        self.__por_tipo = None
+        # id de cada objeto da cadeia (TarefaComPrazo e tarefa concreta) -> tarefa que está na aula,
+        # para achar no índice a tarefa de um EventoAlteracao.
+        self.__tarefa_da_aula = None
+        # Contador de alterações: uma consulta que montou os índices enquanto a trilha mudava
+        # não os guarda. Trava dos índices só no modo concorrente.
+        self.__versao = 0
+        self.__trava_indices = None
+
     # --- encapsulamento ---
 
     @property
@@ -49,6 +75,234 @@ class Trilha:
         """
         if curso is not None:
             self.__cursos.append(curso)
+            # Os eventos das tarefas chegam à trilha pelo curso.
+            curso.registrar_observador(self)
+            if self.__modo_concorrente:
+                curso.ativar_modo_concorrente()
+            self.curso_alterado(curso)
+
+    # --- modo concorrente ---
+
+    def ativar_modo_concorrente(self):
+        """
+        Liga o modo concorrente em todos os cursos (uma trava por curso, veja
+        Curso.ativar_modo_concorrente), inclusive nos que forem adicionados depois.
+
+        Várias threads podem então ler o progresso enquanto outras alteram tarefas.
+        Alterações com mais de um passo devem ficar dentro de "with aula.trava:".
+        O progresso da trilha lê um curso de cada vez: cada curso é consistente,
+        mas cursos diferentes podem refletir momentos diferentes.
+        """
+        if self.__trava_indices is None:
+            self.__trava_indices = threading.Lock()
+        self.__modo_concorrente = True
+        for curso in self.__cursos:
+            curso.ativar_modo_concorrente()
+
+    @property
+    def modo_concorrente(self):
+        return self.__modo_concorrente
+
+    # --- eventos de alteração ---
+
+    def curso_alterado(self, curso, evento=None):
+        """
+        Chamado por um curso quando alguma de suas tarefas muda; atualiza os índices de
+        buscar_tarefas e repassa o evento aos assinantes. Sem evento, a estrutura mudou
+        (tarefas ou aulas incluídas/removidas).
+        """
+        # Fora do modo concorrente não há custo extra além deste teste.
+        if self.__trava_indices is None:
+            self.__atualizar_indices(evento)
+        else:
+            with self.__trava_indices:
+                self.__atualizar_indices(evento)
+
+        if evento is None:
+            return
+
+        if self.__lote is not None:
+            self.__lote.registrar(evento)
+        elif self.__assinantes:
+            for assinante in self.__assinantes:
+                assinante(evento)
+
+    def assinar(self, assinante):
+        """
+        Registra uma função chamada com cada EventoAlteracao das tarefas da trilha.
+
+        Exemplo (painel atualizado em lote):
+            agrupador = AgrupadorEventos(atualizar_painel)
+            trilha.assinar(agrupador)
+        """
+        if self.__assinantes is None:
+            self.__assinantes = []
+        if not any(registrado is assinante for registrado in self.__assinantes):
+            self.__assinantes.append(assinante)
+
+    def cancelar_assinatura(self, assinante):
+        """Remove uma função registrada com assinar() (se existir)."""
+        if self.__assinantes:
+            self.__assinantes = [
+                registrado for registrado in self.__assinantes if registrado is not assinante
+            ]
+
+    # --- lote de alterações ---
+
+    def lote(self, validar=None):
+        """
+        Retorna um LoteAlteracoes para ser usado com "with": as alterações feitas
+        nas tarefas dentro do bloco são confirmadas juntas no final ou todas desfeitas
+        (exceção no bloco ou ValueError lançado por validar).
+        """
+        return LoteAlteracoes(self, validar)
+
+    def tarefas_repetidas(self):
+        """
+        Tarefas com a mesma chave de outra tarefa da mesma aula (veja Aula.tarefas_repetidas),
+        procuradas só nos cursos e aulas que já estão em memória.
+        """
+        repetidas = []
+        for curso in self.__cursos:
+            if curso.aulas_carregadas:
+                for aula in curso.aulas:
+                    repetidas.extend(aula.tarefas_repetidas())
+        return repetidas
+
+    def abrir_lote(self, lote):
+        """Chamado pelo LoteAlteracoes ao entrar no bloco "with"."""
+        if self.__lote is not None:
+            raise RuntimeError("Já existe um lote de alterações aberto nesta trilha.")
+        self.__lote = lote
+
+    def fechar_lote(self, eventos):
+        """Chamado pelo LoteAlteracoes ao sair do bloco; entrega os eventos confirmados."""
+        self.__lote = None
+        if self.__assinantes:
+            for evento in eventos:
+                for assinante in self.__assinantes:
+                    assinante(evento)
+
+    # --- consultas ---
+
+    def buscar_tarefas(self, status=None, tipo=None):
+        """
+        Retorna as tarefas da trilha com o status e/ou o tipo informados
+        (uma TarefaComPrazo conta pelo tipo da tarefa que ela envolve).
+
+        Exemplo: trilha.buscar_tarefas(StatusTarefa.EM_ANDAMENTO)
+                 trilha.buscar_tarefas(tipo=TarefaQuiz)
+
+        A primeira consulta com filtro monta os índices da trilha percorrendo as tarefas
+        (na ordem de cursos e aulas). Depois, mudanças de status só movem a tarefa de grupo
+        (ela passa para o fim do grupo novo) e a consulta custa proporcional ao resultado.
+        Incluir ou remover tarefas, aulas ou cursos (ou desfazer um lote) descarta os índices,
+        que são montados de novo na consulta seguinte.
+
+        Numa trilha lida sob demanda (CarregadorTrilha), os índices não são guardados, para
+        não prender todas as tarefas em memória: cada consulta usa os índices das aulas.
+        Sem filtros, retorna todas as tarefas na ordem de cursos e aulas.
+        """
+        if status is None and tipo is None:
+            tarefas = []
+            for curso in self.__cursos:
+                tarefas.extend(curso.buscar_tarefas())
+            return tarefas
+
+        if self.__trava_indices is None:
+            if self.__por_status is None:
+                self.__montar_indices()
+            if self.__por_status is not None:
+                return self.__consultar_indices(status, tipo)
+        else:
+            with self.__trava_indices:
+                if self.__por_status is not None:
+                    return self.__consultar_indices(status, tipo)
+            # Montagem fora da trava dos índices: ela lê cada curso sob a trava do curso,
+            # e os eventos chegam na ordem contrária (curso, depois trilha).
+            self.__montar_indices()
+            with self.__trava_indices:
+                if self.__por_status is not None:
+                    return self.__consultar_indices(status, tipo)
+
+        # Trilha lida sob demanda (ou alterada durante a montagem): cada aula responde.
+        tarefas = []
+        for curso in self.__cursos:
+            tarefas.extend(curso.buscar_tarefas(status, tipo))
+        return tarefas
+
+    def __consultar_indices(self, status, tipo):
+        if tipo is None:
+            return list(self.__por_status.get(status, {}).values())
+        if status is None:
+            return list(self.__por_tipo.get(tipo, {}).values())
+
+        # Com os dois filtros, percorre o menor dos dois grupos.
+        grupo_status = self.__por_status.get(status, {})
+        grupo_tipo = self.__por_tipo.get(tipo, {})
+        if len(grupo_status) <= len(grupo_tipo):
+            return [tarefa for chave, tarefa in grupo_status.items() if chave in grupo_tipo]
+        return [tarefa for chave, tarefa in grupo_tipo.items() if chave in grupo_status]
+
+    # --- índices por status e tipo ---
+
+    def __montar_indices(self):
+        """Percorre as tarefas da trilha e guarda os índices, se nada mudou durante a montagem."""
+        versao = self.__versao
+        cursos = list(self.__cursos)
+        if any(curso.chave_armazenada is not None for curso in cursos):
+            return
+
+        por_status = {}
+        por_tipo = {}
+        tarefa_da_aula = {}
+        for curso in cursos:
+            with curso.trava:
+                for aula in curso.aulas:
+                    for tarefa in aula.tarefas:
+                        chave_tarefa = id(tarefa)
+                        por_status.setdefault(tarefa.status, {})[chave_tarefa] = tarefa
+                        por_tipo.setdefault(Aula.tipo_da_tarefa(tarefa), {})[chave_tarefa] = tarefa
+                        tarefa_da_aula[chave_tarefa] = tarefa
+                        if isinstance(tarefa, TarefaComPrazo):
+                            for objeto in tarefa.camadas + (tarefa.tarefa_concreta,):
+                                tarefa_da_aula[id(objeto)] = tarefa
+
+        if self.__trava_indices is None:
+            self.__guardar_indices(versao, por_status, por_tipo, tarefa_da_aula)
+        else:
+            with self.__trava_indices:
+                self.__guardar_indices(versao, por_status, por_tipo, tarefa_da_aula)
+
+    def __guardar_indices(self, versao, por_status, por_tipo, tarefa_da_aula):
+        if self.__versao == versao:
+            self.__por_status = por_status
+            self.__por_tipo = por_tipo
+            self.__tarefa_da_aula = tarefa_da_aula
+
+    def __atualizar_indices(self, evento):
+        self.__versao += 1
+        if self.__por_status is None:
+            return
+        if evento is None:
+            self.__descartar_indices()
+        elif evento.campo == "status":
+            tarefa = self.__tarefa_da_aula.get(id(evento.tarefa))
+            if tarefa is None:
+                self.__descartar_indices()
+                return
+            chave_tarefa = id(tarefa)
+            for status, grupo in self.__por_status.items():
+                if chave_tarefa in grupo:
+                    if status is not tarefa.status:
+                        del grupo[chave_tarefa]
+                        self.__por_status.setdefault(tarefa.status, {})[chave_tarefa] = tarefa
+                    return
+
+    def __descartar_indices(self):
+        self.__por_status = None
+        self.__por_tipo = None
+        self.__tarefa_da_aula = None
 
     # --- cálculo de progresso com Strategy ---
 
@@ -69,6 +323,35 @@ class Trilha:
 
         return estrategia.calcular(self)
 
+    # --- serialização (pickle) ---
+
+    def __getstate__(self):
+        """
+        Assinantes de eventos não são copiados:
+        funções de painel/agrupadores não fazem parte dos dados.
+        """
+        estado = self.__dict__.copy()
+        estado["_Trilha__assinantes"] = None
+        estado["_Trilha__lote"] = None
+        estado["_Trilha__por_status"] = None
+        estado["_Trilha__por_tipo"] = None
+        estado["_Trilha__tarefa_da_aula"] = None
+        estado["_Trilha__trava_indices"] = None
+        return estado
+
+    def __setstate__(self, estado):
+        """
+        Os cursos não guardam a trilha nem a trava ao serem copiados:
+        registra a trilha de novo e religa o modo concorrente, se estava ligado.
+        """
+        self.__dict__.update(estado)
+        if self.__modo_concorrente:
+            self.__trava_indices = threading.Lock()
+        for curso in self.__cursos:
+            curso.registrar_observador(self)
+            if self.__modo_concorrente:
+                curso.ativar_modo_concorrente()
+
     # --- apresentação ---
 
     def __str__(self):
@@ -0,0 +1,210 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+import tracemalloc
+from datetime import datetime
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaComPrazo import TarefaComPrazo
+from model.TarefaFactory import TarefaFactory
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+
+
+# --- geração de trilhas sintéticas ---
+
+def gerar_registros_tarefas(gerador, quantidade):
+    """Gera dicionários aceitos por TarefaFactory.criar, com os quatro tipos de tarefa misturados."""
+    for numero in range(quantidade):
+        tipo = gerador.randrange(4)
+        titulo = f"Tarefa {numero}"
+        if tipo == 0:
+            yield {"tipo_tarefa": "leitura", "titulo": titulo, "total_paginas": 60,
+                   "paginas_lidas": gerador.randint(0, 60)}
+        elif tipo == 1:
+            yield {"tipo_tarefa": "pratica", "titulo": titulo, "total_etapas": 8,
+                   "etapas_concluidas": gerador.randint(0, 8)}
+        elif tipo == 2:
+            yield {"tipo_tarefa": "quiz", "titulo": titulo, "nota": round(gerador.uniform(0, 10), 1)}
+        else:
+            yield {"tipo_tarefa": "projeto", "titulo": titulo, "total_entregas": 4,
+                   "entregas_aprovadas": gerador.randint(0, 4)}
+
+
+def gerar_trilha(cursos, aulas, tarefas, fracao_prazo=0.2, semente=2024):
+    """
+    Monta uma trilha sintética pela TarefaFactory.
+
+    fracao_prazo é a fração das tarefas envolvidas por TarefaComPrazo
+    (metade delas concluída depois do prazo).
+    """
+    gerador = random.Random(semente)
+    prazo_vencido = datetime(2024, 1, 1, 12, 0)
+    trilha = Trilha("Trilha Benchmark")
+
+    for numero_curso in range(cursos):
+        curso = Curso(f"Curso {numero_curso}", carga_horas=gerador.choice([0, 20, 40, 60]))
+
+        for numero_aula in range(aulas):
+            aula = Aula(f"Aula {numero_aula}")
+
+            for tarefa in TarefaFactory.criar_lote(gerar_registros_tarefas(gerador, tarefas)):
+                if gerador.random() < fracao_prazo:
+                    tarefa = TarefaComPrazo(tarefa, prazo=prazo_vencido, penalidade=0.3)
+                    if gerador.random() < 0.5:
+                        tarefa.concluir()
+                aula.adicionar_tarefa(tarefa)
+
+            curso.adicionar_aula(aula)
+
+        trilha.adicionar_curso(curso)
+
+    return trilha
+
+
+# --- medições ---
+
+def medir(funcao, repeticoes):
+    """Executa a função várias vezes e devolve o menor tempo e a mediana (em ms)."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return {"min_ms": round(min(tempos), 4), "mediana_ms": round(statistics.median(tempos), 4)}
+
+
+def medir_memoria_por_tarefa(configuracao):
+    """Bytes alocados por tarefa durante a construção da trilha (tracemalloc)."""
+    tracemalloc.start()
+    trilha = gerar_trilha(**configuracao)
+    memoria_usada = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    quantidade_tarefas = sum(len(aula.tarefas) for curso in trilha.cursos for aula in curso.aulas)
+    return round(memoria_usada / max(quantidade_tarefas, 1), 1)
+
+
+def executar(configuracao, repeticoes):
+    """Roda todas as medições e devolve o dicionário de resultados."""
+    trilha = gerar_trilha(**configuracao)
+    cursos = trilha.cursos
+    aulas = [aula for curso in cursos for aula in curso.aulas]
+    tarefas = [tarefa for aula in aulas for tarefa in aula.tarefas]
+    simples = MediaSimplesEstrategia()
+    ponderada = MediaPonderadaPorCargaEstrategia()
+
+    def alterar_uma_tarefa_por_aula():
+        # Invalida o cache de todas as aulas antes de ler o progresso.
+        for aula in aulas:
+            tarefa = aula.tarefas[0]
+            while isinstance(tarefa, TarefaComPrazo):
+                tarefa = tarefa.tarefa_base
+            tarefa.status = tarefa.status
+        return trilha.progresso(simples)
+
+    def recalcular_sem_cache():
+        for aula in aulas:
+            sum(tarefa.progresso() for tarefa in aula.tarefas)
+
+    resultados = {
+        "construcao_factory": medir(lambda: gerar_trilha(**configuracao), max(1, repeticoes // 5)),
+        "tarefa_progresso": medir(lambda: [tarefa.progresso() for tarefa in tarefas], repeticoes),
+        "aula_progresso": medir(lambda: [aula.progresso() for aula in aulas], repeticoes),
+        "curso_progresso": medir(lambda: [curso.progresso() for curso in cursos], repeticoes),
+        "trilha_media_simples": medir(lambda: trilha.progresso(simples), repeticoes),
+        "trilha_media_ponderada": medir(lambda: trilha.progresso(ponderada), repeticoes),
+        "trilha_apos_alteracoes": medir(alterar_uma_tarefa_por_aula, repeticoes),
+        "recalculo_sem_cache": medir(recalcular_sem_cache, repeticoes),
+        "exibir_dados_tarefas": medir(lambda: [tarefa.exibir_dados() for tarefa in tarefas], repeticoes),
+        "exibir_dados_cursos": medir(lambda: [curso.exibir_dados() for curso in cursos], repeticoes),
+    }
+
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "configuracao": configuracao,
+        "quantidade_tarefas": len(tarefas),
+        "repeticoes": repeticoes,
+        "memoria_bytes_por_tarefa": medir_memoria_por_tarefa(configuracao),
+        "resultados": resultados,
+    }
+
+
+# --- relatório ---
+
+def imprimir(relatorio, anterior=None):
+    configuracao = relatorio["configuracao"]
+    print("\n=== BENCHMARK DO MODELO ===")
+    print(
+        f"{configuracao['cursos']} cursos x {configuracao['aulas']} aulas x "
+        f"{configuracao['tarefas']} tarefas ({relatorio['quantidade_tarefas']} tarefas, "
+        f"{configuracao['fracao_prazo']:.0%} com prazo) | Python {relatorio['python']}"
+    )
+    print(f"Memória por tarefa: {relatorio['memoria_bytes_por_tarefa']} bytes")
+
+    print(f"\n{'medição':<26}{'mín (ms)':>12}{'mediana (ms)':>14}", end="")
+    print(f"{'anterior':>12}{'variação':>10}" if anterior else "")
+
+    for nome, valores in relatorio["resultados"].items():
+        linha = f"{nome:<26}{valores['min_ms']:>12.3f}{valores['mediana_ms']:>14.3f}"
+        if anterior:
+            valor_anterior = anterior["resultados"].get(nome, {}).get("min_ms")
+            if valor_anterior:
+                variacao = (valores["min_ms"] - valor_anterior) / valor_anterior
+                linha += f"{valor_anterior:>12.3f}{variacao:>+10.0%}"
+        print(linha)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos caminhos principais do modelo.")
+    parser.add_argument("--cursos", type=int, default=20)
+    parser.add_argument("--aulas", type=int, default=10)
+    parser.add_argument("--tarefas", type=int, default=25, help="tarefas por aula")
+    parser.add_argument("--fracao-prazo", type=float, default=0.2, help="fração com TarefaComPrazo")
+    parser.add_argument("--semente", type=int, default=2024)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    parser.add_argument("--saida", help="arquivo JSON onde salvar os resultados")
+    parser.add_argument("--comparar", help="arquivo JSON de uma execução anterior")
+    opcoes = parser.parse_args(argumentos)
+
+    configuracao = {
+        "cursos": opcoes.cursos,
+        "aulas": opcoes.aulas,
+        "tarefas": opcoes.tarefas,
+        "fracao_prazo": opcoes.fracao_prazo,
+        "semente": opcoes.semente,
+    }
+    relatorio = executar(configuracao, opcoes.repeticoes)
+
+    anterior = None
+    if opcoes.comparar:
+        with open(opcoes.comparar, "r", encoding="utf-8") as arquivo:
+            anterior = json.load(arquivo)
+
+    imprimir(relatorio, anterior)
+
+    if opcoes.saida:
+        with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+        print(f"\nResultados salvos em {opcoes.saida}")
+
+
+if __name__ == "__main__":
+    main()
+
+"""
+Benchmark reproduzível (mesma semente = mesma trilha) dos caminhos principais:
+- construção de tarefas pela TarefaFactory;
+- progresso de tarefas, aulas, cursos e trilha (as duas estratégias);
+- progresso depois de alterar tarefas (cache) e recálculo completo sem cache;
+- exibir_dados() e memória por tarefa.
+
+Exemplos (dentro de src):
+    python -m testes.benchmark_modelo --cursos 50 --aulas 10 --tarefas 40 --saida antes.json
+    python -m testes.benchmark_modelo --cursos 50 --aulas 10 --tarefas 40 --comparar antes.json
+"""
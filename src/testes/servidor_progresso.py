@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+from model.SerializadorTrilha import SerializadorTrilha
+from model.ServicoProgresso import ServicoProgresso
+from testes.benchmark_modelo import gerar_trilha
+
+
+async def servir(trilhas, host, porta):
+    async with ServicoProgresso(trilhas) as servico:
+        servidor = await servico.servir(host, porta)
+        async with servidor:
+            print(f"Servindo {servico.nomes_trilhas} em http://{host}:{porta}/trilhas (Ctrl+C para sair)")
+            await servidor.serve_forever()
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Endpoint HTTP/JSON local de progresso das trilhas.")
+    parser.add_argument("arquivos", nargs="*", help="trilhas salvas em JSON Lines (SerializadorTrilha)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    parser.add_argument("--cursos", type=int, default=20, help="trilha sintética, se nenhum arquivo for informado")
+    parser.add_argument("--aulas", type=int, default=10)
+    parser.add_argument("--tarefas", type=int, default=25, help="tarefas por aula")
+    opcoes = parser.parse_args(argumentos)
+
+    if opcoes.arquivos:
+        trilhas = [SerializadorTrilha.carregar(arquivo) for arquivo in opcoes.arquivos]
+    else:
+        trilhas = [gerar_trilha(opcoes.cursos, opcoes.aulas, opcoes.tarefas)]
+
+    try:
+        asyncio.run(servir(trilhas, opcoes.host, opcoes.porta))
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
+
+"""
+Sobe o ServicoProgresso para testes de carga em uma máquina só.
+
+Exemplos (dentro de src):
+    python -m testes.servidor_progresso --cursos 50 --aulas 10 --tarefas 40
+    python -m testes.servidor_progresso minha_trilha.jsonl --porta 9000
+
+    curl http://127.0.0.1:8080/trilhas
+    curl "http://127.0.0.1:8080/trilhas/Trilha%20Benchmark/progresso?estrategia=ponderada"
+"""
@@ -1,9 +1,14 @@
+import math
+import random
+import time
 from model.Aula import Aula
 from model.Curso import Curso
 from model.Trilha import Trilha
 from model.TarefaLeitura import TarefaLeitura
 from model.TarefaPratica import TarefaPratica
 from model.TarefaQuiz import TarefaQuiz
+from model.TarefaComPrazo import TarefaComPrazo
+from model.StatusTarefa import StatusTarefa
 from model.MediaSimplesEstrategia import MediaSimplesEstrategia
 from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
 
@@ -79,13 +84,157 @@ def testar_strategies():
     print(f"(Strategy: Média ponderada)-> {progresso_ponderado:.4f}")
 
 
+def progresso_sem_cache(curso):
+    """Recalcula o progresso do curso percorrendo todas as tarefas (sem usar o cache)."""
+    progressos_aulas = []
+    for aula in curso.aulas:
+        if aula.tarefas:
+            soma = math.fsum(tarefa.progresso() for tarefa in aula.tarefas)
+            progressos_aulas.append(soma / len(aula.tarefas))
+        else:
+            progressos_aulas.append(0.0)
+    return math.fsum(progressos_aulas) / len(progressos_aulas) if progressos_aulas else 0.0
+
+
+def testar_cache_sem_erro_acumulado():
+    print("\n=== CACHE APÓS 5.000 ALTERAÇÕES (sem erro de arredondamento acumulado) ===")
+    gerador = random.Random(5)
+    curso = Curso("Curso de Cálculo", carga_horas=40)
+    quizzes = []
+    for numero_aula in range(4):
+        aula = Aula(f"Aula {numero_aula}")
+        for numero_quiz in range(25):
+            quiz = TarefaQuiz(f"Quiz {numero_quiz}", nota=gerador.uniform(0, 10), nota_max=10)
+            aula.adicionar_tarefa(quiz)
+            quizzes.append(quiz)
+        curso.adicionar_aula(aula)
+
+    for _ in range(5000):
+        gerador.choice(quizzes).nota = gerador.uniform(0, 10)
+        curso.progresso()
+
+    print(f"Cache: {curso.progresso()!r} | recalculado: {progresso_sem_cache(curso)!r} | "
+          f"iguais: {curso.progresso() == progresso_sem_cache(curso)}")
+
+
+def testar_cache_progresso():
+    print("\n=== CACHE DE PROGRESSO (AULA / CURSO) ===")
+    trilha = montar_trilha_exemplo()
+    curso_poo = trilha.cursos[0]
+    aula_poo_1 = curso_poo.aulas[0]
+    leitura = aula_poo_1.tarefas[0]
+
+    print(f"Progresso inicial do curso: {curso_poo.progresso():.4f}")
+
+    # Alterar uma tarefa invalida apenas a aula e o curso a que ela pertence.
+    leitura.paginas_lidas = 40
+    print(f"Após ler todas as páginas:  {curso_poo.progresso():.4f}")
+    print(f"Recalculado sem cache:      {progresso_sem_cache(curso_poo):.4f}")
+
+    quiz = aula_poo_1.tarefas[1]
+    quiz.nota = 10
+    aula_poo_1.adicionar_tarefa(
+        TarefaQuiz("Quiz extra", nota=5, nota_max=10)
+    )
+    print(f"Após nota 10 e novo quiz:   {curso_poo.progresso():.4f}")
+    print(f"Recalculado sem cache:      {progresso_sem_cache(curso_poo):.4f}")
+
+
+def testar_indices():
+    print("\n=== ÍNDICES (BUSCA, DUPLICATAS E REMOÇÃO) ===")
+    trilha = montar_trilha_exemplo()
+    curso_poo = trilha.cursos[0]
+    aula_poo_1 = curso_poo.aulas[0]
+
+    # Tarefas iguais (mesmo título e data) têm o mesmo hash e podem ir para um set.
+    copia = TarefaQuiz("quiz poo básico", nota=3, nota_max=10)
+    print(f"Cópia está na aula: {copia in aula_poo_1}")
+    print(f"Tarefas distintas no set: {len({*aula_poo_1.tarefas, copia})}")
+
+    try:
+        aula_poo_1.adicionar_tarefa(copia)
+    except ValueError as erro:
+        print(f"Duplicata rejeitada: {erro}")
+    print(f"Busca no curso: {curso_poo.buscar_tarefa('Quiz POO básico')}")
+    # Aulas com o mesmo título são aceitas; substituir=True troca as de mesmo título.
+    quantidade_aulas = len(curso_poo.aulas)
+    print(f"Aula com título repetido aceita: {curso_poo.adicionar_aula(Aula('Padrões de projeto'))} "
+          f"({quantidade_aulas} -> {len(curso_poo.aulas)} aulas)")
+    curso_poo.adicionar_aula(Aula("Padrões de projeto"), substituir=True)
+    print(f"Após substituir a aula: {len(curso_poo.aulas)} aulas | "
+          f"{curso_poo.progresso():.4f} | sem cache: {progresso_sem_cache(curso_poo):.4f}")
+
+    # substituir=True troca a tarefa existente (upsert).
+    aula_poo_1.adicionar_tarefa(copia, substituir=True)
+    print(f"Após substituir: {curso_poo.progresso():.4f} | sem cache: {progresso_sem_cache(curso_poo):.4f}")
+
+    # Concluir muda a data de realização: o índice acompanha a nova chave.
+    leitura = aula_poo_1.buscar_tarefa("Apostila POO")
+    leitura.concluir()
+    print(f"Busca pela data de hoje: {aula_poo_1.buscar_tarefa('Apostila POO', leitura.data_realizacao)}")
+
+    # Renomear para a chave de outra tarefa: as duas ficam na aula; removida a que a busca
+    # encontra, a outra passa a ser encontrada.
+    quiz = aula_poo_1.buscar_tarefa("Quiz POO básico")
+    aula_poo_1.adicionar_tarefa(TarefaQuiz("Quiz revisão", nota=4))
+    aula_poo_1.buscar_tarefa("Quiz revisão").titulo = "Quiz POO básico"
+    aula_poo_1.remover_tarefa(quiz)
+    print(f"Após renomear e remover: {len(aula_poo_1.tarefas)} tarefas | "
+          f"busca encontra a renomeada (nota {aula_poo_1.buscar_tarefa('Quiz POO básico').nota})")
+
+    aula_poo_1.remover_tarefa(leitura)
+    curso_poo.remover_aula("Padrões de Projeto")
+    print(f"Após remoções: {curso_poo.progresso():.4f} | sem cache: {progresso_sem_cache(curso_poo):.4f}")
+    print(curso_poo)
+
+    # Sincronização de muitas tarefas: cada inclusão/remoção é O(1).
+    aula = Aula("Sincronização")
+    inicio = time.perf_counter()
+    for rodada in range(2):
+        for numero in range(20_000):
+            aula.adicionar_tarefa(TarefaQuiz(f"Quiz {numero}", nota=rodada * 5), substituir=True)
+    for numero in range(0, 20_000, 2):
+        aula.remover_tarefa(aula.buscar_tarefa(f"Quiz {numero}"))
+    print(f"40.000 upserts e 10.000 remoções em {time.perf_counter() - inicio:.2f}s -> {aula}")
+
+
+def testar_consultas_status_tipo():
+    print("\n=== CONSULTAS POR STATUS E TIPO ===")
+    trilha = montar_trilha_exemplo()
+    aula_poo_1 = trilha.cursos[0].aulas[0]
+    quiz_com_prazo = TarefaComPrazo(TarefaQuiz("Quiz com prazo", nota=6), prazo="01-01-2024 12:00")
+    aula_poo_1.adicionar_tarefa(quiz_com_prazo)
+
+    print(f"Quizzes: {[tarefa.titulo for tarefa in trilha.buscar_tarefas(tipo=TarefaQuiz)]}")
+    print(f"A fazer: {len(trilha.buscar_tarefas(StatusTarefa.A_FAZER))}")
+
+    # Os índices acompanham as mudanças de status feitas depois da primeira consulta.
+    trilha.cursos[1].aulas[0].tarefas[0].iniciar_estudo()
+    quiz_com_prazo.concluir()
+    print(f"Em andamento: {[str(tarefa) for tarefa in trilha.buscar_tarefas(StatusTarefa.EM_ANDAMENTO)]}")
+    quizzes_atrasados = [
+        tarefa for tarefa in trilha.buscar_tarefas(StatusTarefa.CONCLUIDA, TarefaQuiz)
+        if isinstance(tarefa, TarefaComPrazo) and tarefa.atrasada
+    ]
+    print(f"Quizzes concluídos com atraso: {[tarefa.titulo for tarefa in quizzes_atrasados]}")
+
+    aula_poo_1.remover_tarefa(quiz_com_prazo)
+    print(f"Concluídas após remover o quiz: {len(trilha.buscar_tarefas(StatusTarefa.CONCLUIDA))}")
+
+
 if __name__ == "__main__":
     testar_strategies()
+    testar_cache_progresso()
+    testar_cache_sem_erro_acumulado()
+    testar_indices()
+    testar_consultas_status_tipo()
 
 """
 Mostra:
 - composição Aula -> Tarefas
 - composição Curso -> Aulas
 - composição Trilha -> Cursos
-- uso das estratégias MediaSimplesEstrategia e MediaPonderadaPorCargaEstrategia.
+- uso das estratégias MediaSimplesEstrategia e MediaPonderadaPorCargaEstrategia
+- busca, duplicatas (ValueError, substituir=True ou renomeação) e remoção de tarefas e aulas pelos índices
+- consultas por status e por tipo de tarefa, mantidas a cada mudança de status.
 """
@@ -0,0 +1,199 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from model.ArmazenamentoArquivo import ArmazenamentoArquivo
+from model.ArmazenamentoSQLite import ArmazenamentoSQLite
+from model.CarregadorTrilha import CarregadorTrilha
+from model.SerializadorTrilha import SerializadorTrilha
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.EstrategiaPorNiveis import EstrategiaPorNiveis
+from model.TarefaLeitura import TarefaLeitura
+from testes.benchmark_modelo import gerar_trilha
+from testes.teste_historico import estudar
+
+
+def armazenamentos(pasta):
+    """Os dois armazenamentos, cada um em seu lugar dentro da pasta."""
+    return (
+        ("arquivos", lambda: ArmazenamentoArquivo(os.path.join(pasta, "arquivos"))),
+        ("SQLite", lambda: ArmazenamentoSQLite(os.path.join(pasta, "trilha.db"))),
+    )
+
+
+def medir(funcao):
+    """Roda a função duas vezes: uma cronometrada e outra com tracemalloc (memória alocada)."""
+    inicio = time.perf_counter()
+    funcao()
+    tempo = time.perf_counter() - inicio
+    tracemalloc.start()
+    resultado = funcao()
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, tempo, memoria
+
+
+def estudar_ao_acaso(trilha, alteracoes, semente=9):
+    """Escolhe curso, aula e tarefa por posição (as mesmas em trilhas iguais) e avança a tarefa."""
+    gerador = random.Random(semente)
+    for _ in range(alteracoes):
+        curso = trilha.cursos[gerador.randrange(len(trilha.cursos))]
+        aulas = curso.aulas
+        tarefas = aulas[gerador.randrange(len(aulas))].tarefas
+        estudar(tarefas[gerador.randrange(len(tarefas))], gerador)
+
+
+def testar_resumo_sem_ler_tarefas():
+    print("\n=== ABRIR A TRILHA E VER O PROGRESSO SEM LER AS TAREFAS (20 mil tarefas) ===")
+    pasta = tempfile.mkdtemp()
+    trilha = gerar_trilha(40, 20, 25)
+    simples = trilha.progresso(MediaSimplesEstrategia())
+    ponderada = trilha.progresso(MediaPonderadaPorCargaEstrategia())
+
+    caminho_jsonl = os.path.join(pasta, "trilha.jsonl")
+    SerializadorTrilha.salvar(trilha, caminho_jsonl)
+    _, tempo, memoria = medir(
+        lambda: SerializadorTrilha.carregar(caminho_jsonl).progresso(MediaSimplesEstrategia())
+    )
+    print(f"{'JSON Lines (tudo em memória)':<30} {tempo * 1000:8.1f} ms | {memoria / 1024:8.0f} KiB")
+
+    for nome, criar in armazenamentos(pasta):
+        CarregadorTrilha(criar(), trilha=trilha).fechar()
+
+        def abrir():
+            carregador = CarregadorTrilha(criar())
+            progressos = (
+                carregador.trilha.progresso(MediaSimplesEstrategia()),
+                carregador.trilha.progresso(MediaPonderadaPorCargaEstrategia()),
+            )
+            carregador.fechar()
+            return progressos, carregador.estatisticas["tarefas_em_memoria"]
+
+        ((progresso_simples, progresso_ponderada), lidas), tempo, memoria = medir(abrir)
+
+        iguais = abs(progresso_simples - simples) < 1e-12 and abs(progresso_ponderada - ponderada) < 1e-12
+        print(f"{'Carregador (' + nome + ')':<30} {tempo * 1000:8.1f} ms | {memoria / 1024:8.0f} KiB | "
+              f"mesmo progresso: {iguais} | {lidas} tarefas lidas")
+
+
+def testar_abrir_um_curso():
+    print("\n=== RESUMO DE UM CURSO E USO DE UMA AULA ===")
+    pasta = tempfile.mkdtemp()
+    for nome, criar in armazenamentos(pasta):
+        CarregadorTrilha(criar(), trilha=gerar_trilha(10, 12, 30)).fechar()
+
+        with CarregadorTrilha(criar()) as carregador:
+            curso = carregador.trilha.cursos[3]
+            print(f"[{nome}] {curso} | progresso {curso.progresso() * 100:.1f}% | "
+                  f"aulas lidas: {curso.aulas_carregadas}")
+
+            # Peso pela quantidade de aulas: vem do resumo, sem ler as aulas dos cursos.
+            carregador.trilha.progresso(EstrategiaPorNiveis.por_quantidade_aulas())
+            print(f"[{nome}] Depois da estratégia por_aulas: aulas lidas em algum curso: "
+                  f"{any(c.aulas_carregadas for c in carregador.trilha.cursos)}")
+
+            aula = curso.aulas[5]
+            print(f"[{nome}] Depois de curso.aulas: {len(curso.aulas)} resumos, "
+                  f"tarefas em memória: {carregador.estatisticas['tarefas_em_memoria']} | "
+                  f"{aula} carregada: {aula.carregada}")
+
+            concluidas = [tarefa.titulo for tarefa in aula.tarefas if tarefa.progresso() == 1.0]
+            print(f"[{nome}] Ao usar aula.tarefas: {carregador.estatisticas} | concluídas: {len(concluidas)}")
+
+
+def testar_limite_de_memoria():
+    print("\n=== LIMITE DE MEMÓRIA: AULAS POUCO USADAS SAEM DA MEMÓRIA ===")
+    pasta = tempfile.mkdtemp()
+    for nome, criar in armazenamentos(pasta):
+        CarregadorTrilha(criar(), trilha=gerar_trilha(8, 10, 20)).fechar()
+        # Mesmas alterações numa trilha toda em memória, para comparar.
+        em_memoria = gerar_trilha(8, 10, 20)
+        estudar_ao_acaso(em_memoria, 3000)
+
+        carregador = CarregadorTrilha(criar(), limite_tarefas=300)
+        estudar_ao_acaso(carregador.trilha, 3000)
+        estatisticas = carregador.estatisticas
+        print(f"[{nome}] {estatisticas}")
+
+        mesmo_progresso = all(
+            abs(carregador.trilha.progresso(estrategia) - em_memoria.progresso(estrategia)) < 1e-12
+            for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia())
+        )
+        print(f"[{nome}] Tarefas em memória dentro do limite: {estatisticas['tarefas_em_memoria'] <= 300} | "
+              f"progresso igual à trilha em memória: {mesmo_progresso}")
+
+        # Tarefa observada por outro objeto: a aula não sai da memória.
+        aula = carregador.trilha.cursos[0].aulas[0]
+        tarefa = aula.tarefas[0]
+        painel = type("Painel", (), {"tarefa_alterada": lambda self, tarefa, evento=None: None})()
+        tarefa.registrar_observador(painel)
+        print(f"[{nome}] Descartar aula com tarefa observada: {aula.descarregar()}")
+        tarefa.remover_observador(painel)
+
+        # Estrutura nova + alterações gravadas; reabrir traz tudo de volta.
+        aula.adicionar_tarefa(TarefaLeitura("Leitura complementar", total_paginas=20, paginas_lidas=20))
+        carregador.trilha.cursos[1].remover_aula(carregador.trilha.cursos[1].aulas[0])
+        esperado = carregador.trilha.progresso(MediaPonderadaPorCargaEstrategia())
+        carregador.salvar()
+        carregador.fechar()
+
+        with CarregadorTrilha(criar()) as reaberto:
+            trilha = reaberto.trilha
+            print(f"[{nome}] Reaberto: progresso igual: "
+                  f"{abs(trilha.progresso(MediaPonderadaPorCargaEstrategia()) - esperado) < 1e-12} | "
+                  f"aulas do curso 1: {trilha.cursos[1].quantidade_aulas} | "
+                  f"tarefa nova: {trilha.cursos[0].aulas[0].buscar_tarefa('Leitura complementar') is not None}")
+
+
+def testar_tarefa_guardada_apos_descarte():
+    print("\n=== TAREFA GUARDADA E ALTERADA DEPOIS QUE A AULA SAIU DA MEMÓRIA ===")
+    pasta = tempfile.mkdtemp()
+    for nome, criar in armazenamentos(pasta):
+        CarregadorTrilha(criar(), trilha=gerar_trilha(2, 4, 10)).fechar()
+
+        carregador = CarregadorTrilha(criar(), limite_tarefas=10)
+        aulas = carregador.trilha.cursos[0].aulas
+        tarefas = aulas[0].tarefas
+        aulas[1].tarefas  # passa do limite: a aula 0 sai da memória
+        print(f"[{nome}] Aula 0 em memória depois de ler a aula 1: {aulas[0].carregada}")
+
+        posicao = next(indice for indice, tarefa in enumerate(tarefas) if tarefa.progresso() < 1.0)
+        tarefas[posicao].concluir()
+        esperado = carregador.trilha.progresso(MediaSimplesEstrategia())
+        print(f"[{nome}] Depois de alterar a tarefa guardada: aula 0 em memória: {aulas[0].carregada} | "
+              f"mesma tarefa na aula: {aulas[0].tarefas[posicao] is tarefas[posicao]} | "
+              f"progresso da aula: {aulas[0].progresso() * 100:.1f}%")
+
+        # Descartada de novo sem alteração: a tarefa guardada volta (não uma cópia).
+        descartada = aulas[0].descarregar()
+        print(f"[{nome}] Descartada de novo: {descartada} | relida, mesma tarefa: "
+              f"{aulas[0].tarefas[posicao] is tarefas[posicao]}")
+
+        carregador.salvar()
+        carregador.fechar()
+        with CarregadorTrilha(criar()) as reaberto:
+            relida = reaberto.trilha.cursos[0].aulas[0].tarefas[posicao]
+            print(f"[{nome}] Reaberto: status {relida.status.name} | progresso da trilha igual: "
+                  f"{abs(reaberto.trilha.progresso(MediaSimplesEstrategia()) - esperado) < 1e-12}")
+
+
+if __name__ == "__main__":
+    testar_resumo_sem_ler_tarefas()
+    testar_abrir_um_curso()
+    testar_limite_de_memoria()
+    testar_tarefa_guardada_apos_descarte()
+
+"""
+Mostra:
+- CarregadorTrilha abrindo uma trilha guardada em arquivos (ArmazenamentoArquivo) ou em SQLite
+  (ArmazenamentoSQLite) e calculando o progresso só com os resumos das aulas, sem ler tarefas,
+  comparado a carregar o JSON Lines inteiro;
+- curso.aulas lendo só os resumos, e as tarefas de uma aula lidas no primeiro acesso;
+- limite_tarefas descartando as aulas menos usadas (gravando as alteradas) com o mesmo progresso
+  de uma trilha toda em memória; tarefas observadas impedem o descarte;
+- tarefa guardada antes do descarte e alterada depois trazendo a aula de volta, com a
+  mesma tarefa, sem perder a alteração;
+- salvar() gravando tarefas e estrutura novas, e a trilha reaberta igual.
+"""
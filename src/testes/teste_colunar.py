@@ -0,0 +1,137 @@
+import random
+import time
+from datetime import datetime, timedelta
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaLeitura import TarefaLeitura
+from model.TarefaPratica import TarefaPratica
+from model.TarefaQuiz import TarefaQuiz
+from model.TarefaProjeto import TarefaProjeto
+from model.TarefaComPrazo import TarefaComPrazo
+from model.TarefasColunares import TarefasColunares
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from testes.teste_historico import estudar
+
+
+def montar_trilha_aleatoria(cursos=20, aulas=10, tarefas=25, semente=42):
+    """
+    Monta uma trilha sintética com todos os tipos de tarefa
+    (inclusive algumas envolvidas por TarefaComPrazo).
+    """
+    gerador = random.Random(semente)
+    trilha = Trilha("Trilha Sintética")
+
+    for numero_curso in range(cursos):
+        curso = Curso(f"Curso {numero_curso}", carga_horas=gerador.choice([0, 20, 40, 60]))
+
+        for numero_aula in range(aulas):
+            aula = Aula(f"Aula {numero_aula}")
+
+            for numero_tarefa in range(tarefas):
+                tipo = gerador.randrange(4)
+                titulo = f"Tarefa {numero_tarefa}"
+                if tipo == 0:
+                    tarefa = TarefaLeitura(titulo, total_paginas=50, paginas_lidas=gerador.randint(0, 50))
+                elif tipo == 1:
+                    tarefa = TarefaPratica(titulo, total_etapas=7, etapas_concluidas=gerador.randint(0, 7))
+                elif tipo == 2:
+                    tarefa = TarefaQuiz(titulo, nota=gerador.uniform(0, 10), nota_max=10)
+                else:
+                    tarefa = TarefaProjeto(titulo, total_entregas=3, entregas_aprovadas=gerador.randint(0, 3))
+
+                if gerador.random() < 0.2:
+                    tarefa = TarefaComPrazo(
+                        tarefa,
+                        prazo=datetime.now() - timedelta(days=1),
+                        penalidade=gerador.choice([0.1, 0.3, 0.5]),
+                    )
+                    if gerador.random() < 0.5:
+                        tarefa.concluir()
+
+                aula.adicionar_tarefa(tarefa)
+
+            curso.adicionar_aula(aula)
+
+        trilha.adicionar_curso(curso)
+
+    return trilha
+
+
+def testar_mesmos_resultados():
+    print("\n=== ARMAZENAMENTO COLUNAR x MODELO DE OBJETOS ===")
+    trilha = montar_trilha_aleatoria()
+    colunas = TarefasColunares.de_trilha(trilha)
+    print(colunas)
+
+    for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia()):
+        valor_objetos = trilha.progresso(estrategia)
+        valor_colunas = colunas.progresso(estrategia)
+        print(f"\n{estrategia.__class__.__name__}")
+        print(f"Modelo de objetos: {valor_objetos:.10f}")
+        print(f"Colunar (NumPy):   {valor_colunas:.10f}")
+        print(f"Mesmo resultado: {valor_objetos == valor_colunas}")
+
+    progresso_cursos = colunas.progresso_cursos()
+    iguais = all(
+        curso.progresso() == progresso_cursos[indice]
+        for indice, curso in enumerate(trilha.cursos)
+    )
+    print(f"\nProgresso por curso igual ao modelo de objetos: {iguais}")
+
+    # Uma subclasse pode redefinir calcular: não é tratada como a média simples.
+    class MediaSimplesDobrada(MediaSimplesEstrategia):
+        def calcular(self, trilha):
+            return min(1.0, 2 * super().calcular(trilha))
+
+    dobrada = MediaSimplesDobrada()
+    print(f"Subclasse com calcular próprio: {trilha.progresso(dobrada):.10f} | "
+          f"colunar {colunas.progresso(dobrada):.10f}")
+
+    # Depois de muitas alterações, o cache de Aula e Curso continua igual às colunas.
+    gerador = random.Random(1)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+    for _ in range(5000):
+        estudar(gerador.choice(tarefas), gerador)
+        trilha.progresso(MediaSimplesEstrategia())
+    colunas = TarefasColunares.de_trilha(trilha)
+    iguais = all(
+        trilha.progresso(estrategia) == colunas.progresso(estrategia)
+        for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia())
+    )
+    print(f"Após 5.000 alterações, mesmo resultado nas duas médias: {iguais}")
+
+
+def testar_desempenho():
+    print("\n=== DESEMPENHO (100 cursos x 20 aulas x 50 tarefas) ===")
+    trilha = montar_trilha_aleatoria(cursos=100, aulas=20, tarefas=50)
+    colunas = TarefasColunares.de_trilha(trilha)
+    estrategia = MediaSimplesEstrategia()
+
+    # Recalcula tudo percorrendo as tarefas, sem o cache das aulas.
+    inicio = time.perf_counter()
+    for curso in trilha.cursos:
+        for aula in curso.aulas:
+            sum(tarefa.progresso() for tarefa in aula.tarefas)
+    tempo_objetos = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    colunas.progresso(estrategia)
+    tempo_colunas = time.perf_counter() - inicio
+
+    print(f"Tarefas: {len(colunas)}")
+    print(f"Percorrendo objetos: {tempo_objetos * 1000:.1f} ms")
+    print(f"Colunar (NumPy):     {tempo_colunas * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    testar_mesmos_resultados()
+    testar_desempenho()
+
+"""
+Mostra:
+- montagem do armazenamento colunar a partir de uma Trilha;
+- mesmos resultados das duas estratégias no modelo de objetos e no colunar;
+- diferença de tempo ao recalcular o progresso de todas as tarefas.
+"""
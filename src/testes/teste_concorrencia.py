@@ -0,0 +1,149 @@
+import sys
+import threading
+import time
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaLeitura import TarefaLeitura
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+
+
+def montar_trilha(cursos=8, aulas=5, tarefas=20):
+    trilha = Trilha("Trilha concorrente")
+    for numero_curso in range(cursos):
+        curso = Curso(f"Curso {numero_curso}")
+        for numero_aula in range(aulas):
+            aula = Aula(f"Aula {numero_aula}")
+            for numero_tarefa in range(tarefas):
+                aula.adicionar_tarefa(TarefaLeitura(f"Leitura {numero_tarefa}", total_paginas=100_000))
+            curso.adicionar_aula(aula)
+        trilha.adicionar_curso(curso)
+    return trilha
+
+
+def progresso_sem_cache(trilha):
+    """Média das médias calculada direto das tarefas, para conferir o cache."""
+    medias_cursos = []
+    for curso in trilha.cursos:
+        medias_aulas = [
+            sum(tarefa.progresso() for tarefa in aula.tarefas) / len(aula.tarefas)
+            for aula in curso.aulas
+        ]
+        medias_cursos.append(sum(medias_aulas) / len(medias_aulas))
+    return sum(medias_cursos) / len(medias_cursos)
+
+
+def executar_carga(trilha, escritores, leitores, voltas):
+    """
+    Cada escritor soma 1 página em todas as tarefas, "voltas" vezes; os leitores calculam o
+    progresso da trilha sem parar até os escritores terminarem.
+    Retorna (leituras feitas, leituras inválidas, erros nos leitores, tempo).
+    """
+    estrategia = MediaSimplesEstrategia()
+    pares = [(aula, tarefa) for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+    terminou = threading.Event()
+    leituras = [0] * leitores
+    invalidas = [0] * leitores
+    erros = []
+
+    def escrever():
+        for _ in range(voltas):
+            for aula, tarefa in pares:
+                # "+=" lê e grava: sem a trava, duas threads podem gravar o mesmo valor.
+                with aula.trava:
+                    tarefa.paginas_lidas += 1
+
+    def ler(numero):
+        anterior = 0.0
+        try:
+            while not terminou.is_set():
+                valor = trilha.progresso(estrategia)
+                # Só há incrementos: o progresso nunca pode diminuir nem passar de 100%.
+                if valor < anterior - 1e-9 or valor > 1.0:
+                    invalidas[numero] += 1
+                anterior = valor
+                leituras[numero] += 1
+        except Exception as erro:
+            erros.append(repr(erro))
+
+    threads_leitura = [threading.Thread(target=ler, args=(numero,)) for numero in range(leitores)]
+    threads_escrita = [threading.Thread(target=escrever) for _ in range(escritores)]
+
+    inicio = time.perf_counter()
+    for thread in threads_leitura + threads_escrita:
+        thread.start()
+    for thread in threads_escrita:
+        thread.join()
+    terminou.set()
+    for thread in threads_leitura:
+        thread.join()
+
+    return sum(leituras), sum(invalidas), erros, time.perf_counter() - inicio
+
+
+def conferir(trilha, escritores, voltas):
+    """Retorna (incrementos perdidos, cache igual ao cálculo direto)."""
+    esperado = escritores * voltas
+    perdidos = sum(
+        esperado - tarefa.paginas_lidas
+        for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas
+    )
+    cache_correto = abs(trilha.progresso(MediaSimplesEstrategia()) - progresso_sem_cache(trilha)) < 1e-9
+    return perdidos, cache_correto
+
+
+def testar_sem_atualizacoes_perdidas():
+    print("\n=== 4 ESCRITORES x 4 LEITORES (800 tarefas, 30 voltas) ===")
+    # Trocas de thread bem mais frequentes que o padrão (5 ms) para provocar disputas.
+    intervalo_original = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        for ligado in (False, True):
+            trilha = montar_trilha()
+            if ligado:
+                trilha.ativar_modo_concorrente()
+
+            leituras, invalidas, erros, tempo = executar_carga(trilha, escritores=4, leitores=4, voltas=30)
+            perdidos, cache_correto = conferir(trilha, escritores=4, voltas=30)
+
+            print(f"\nModo concorrente {'ligado' if ligado else 'desligado'} ({tempo:.2f}s):")
+            print(f"  Incrementos perdidos: {perdidos}")
+            print(f"  Cache igual ao cálculo direto: {cache_correto}")
+            print(f"  Leituras: {leituras} | inválidas: {invalidas} | erros nos leitores: {len(erros)}")
+            if erros:
+                print(f"  Primeiro erro: {erros[0]}")
+    finally:
+        sys.setswitchinterval(intervalo_original)
+
+
+def testar_vazao_leitores():
+    print("\n=== VAZÃO DE LEITURA COM 1 ESCRITOR (modo concorrente ligado) ===")
+    for leitores in (1, 2, 4, 8):
+        trilha = montar_trilha()
+        trilha.ativar_modo_concorrente()
+        leituras, invalidas, erros, tempo = executar_carga(trilha, escritores=1, leitores=leitores, voltas=40)
+        perdidos, cache_correto = conferir(trilha, escritores=1, voltas=40)
+        print(
+            f"{leitores} leitor(es): {leituras / tempo:8.0f} leituras/s | escrita em {tempo:.2f}s | "
+            f"perdidos: {perdidos} | cache correto: {cache_correto} | inválidas: {invalidas + len(erros)}"
+        )
+
+
+if __name__ == "__main__":
+    testar_sem_atualizacoes_perdidas()
+    testar_vazao_leitores()
+
+"""
+Mostra:
+- Trilha.ativar_modo_concorrente(): uma trava por curso, compartilhada pelas aulas;
+- escritores usando "with aula.trava:" sem perder incrementos, enquanto leitores calculam o
+  progresso (sempre crescente, nunca acima de 100%) e o cache termina igual ao cálculo direto;
+- o mesmo teste com o modo desligado, para comparação;
+- leituras por segundo com 1, 2, 4 e 8 threads leitoras.
+
+Observação: no CPython com GIL as threads não executam Python em paralelo. Leituras sem
+alterações pendentes não esperam a trava (devolvem o último progresso em cache), por isso
+a vazão de leitura cresce com mais leitores, enquanto o escritor divide o mesmo núcleo
+com eles. As travas por curso garantem a correção; threads em cursos diferentes não
+disputam a mesma trava.
+"""
@@ -0,0 +1,159 @@
+import time
+from model.AvaliadorCoorte import AvaliadorCoorte
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.EstrategiaPorNiveis import EstrategiaPorNiveis
+from model.PlanoProgresso import PlanoProgresso
+from model.RegistroEstrategias import RegistroEstrategias
+from model.TarefaComPrazo import TarefaComPrazo
+from model.TarefaFactory import TarefaFactory
+from testes.benchmark_modelo import gerar_trilha
+from testes.teste_colunar import montar_trilha_aleatoria
+
+
+def montar_coorte(quantidade_estudantes=200):
+    """Uma trilha por estudante, com progresso diferente em cada uma."""
+    return [
+        montar_trilha_aleatoria(cursos=5, aulas=4, tarefas=5, semente=estudante)
+        for estudante in range(quantidade_estudantes)
+    ]
+
+
+def testar_avaliador_coorte():
+    print("\n=== AVALIAÇÃO DE UMA COORTE (200 trilhas x 2 estratégias) ===")
+    trilhas = montar_coorte()
+    estrategias = [MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia()]
+    avaliador = AvaliadorCoorte(estrategias)
+
+    inicio = time.perf_counter()
+    esperado = [[trilha.progresso(estrategia) for estrategia in estrategias] for trilha in trilhas]
+    tempo_laco = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resultados = avaliador.avaliar(trilhas)
+    tempo_lote = time.perf_counter() - inicio
+
+    print(f"Laço com trilha.progresso(): {tempo_laco * 1000:.1f} ms")
+    print(f"AvaliadorCoorte.avaliar():   {tempo_lote * 1000:.1f} ms")
+    print(f"Mesmos resultados: {resultados == esperado}")
+
+    resultados_processos = avaliador.avaliar(trilhas, max_trabalhadores=2)
+    print(f"Mesmos resultados com 2 processos: {resultados_processos == esperado}")
+
+    print("\nPrimeiras linhas da tabela:")
+    for linha in avaliador.tabela(trilhas[:3]):
+        print(linha)
+
+
+def media_por_tarefas(trilha, peso_tarefa):
+    """Média das médias ponderadas de tarefas, escrita à mão (uma passada por estratégia)."""
+    medias_cursos = []
+    for curso in trilha.cursos:
+        medias_aulas = []
+        for aula in curso.aulas:
+            pares = [(tarefa.progresso(), peso_tarefa(tarefa)) for tarefa in aula.tarefas]
+            soma_pesos = sum(peso for _, peso in pares)
+            medias_aulas.append(sum(valor * peso for valor, peso in pares) / soma_pesos if soma_pesos else 0.0)
+        medias_cursos.append(sum(medias_aulas) / len(medias_aulas) if medias_aulas else 0.0)
+    return sum(medias_cursos) / len(medias_cursos) if medias_cursos else 0.0
+
+
+def testar_estrategias_por_niveis():
+    print("\n=== ESTRATÉGIAS POR NÍVEIS E REGISTRO ===")
+    trilha = gerar_trilha(4, 3, 6, fracao_prazo=0.4)
+    trilha.cursos[0].remover_aula(trilha.cursos[0].aulas[0])
+    print(f"Registradas: {RegistroEstrategias.nomes()}")
+
+    # Uma estratégia nova: a aula mais atrasada define o progresso de cada curso.
+    RegistroEstrategias.registrar(
+        "gargalo", EstrategiaPorNiveis("gargalo", combinar_aulas=EstrategiaPorNiveis.minimo)
+    )
+    try:
+        RegistroEstrategias.registrar("gargalo", MediaSimplesEstrategia())
+    except ValueError as erro:
+        print(f"Erro esperado: {erro}")
+
+    plano = RegistroEstrategias.plano()
+    print(plano)
+    valores = dict(zip(RegistroEstrategias.nomes(), plano.calcular(trilha)))
+    for nome, valor in valores.items():
+        print(f"  {nome:<10} {valor * 100:6.2f}%")
+
+    pesos_tipo = {"projeto": 3, "pratica": 2, "quiz": 1, "leitura": 1}
+
+    def peso_tipo(tarefa):
+        concreta = tarefa.tarefa_concreta if isinstance(tarefa, TarefaComPrazo) else tarefa
+        return pesos_tipo[TarefaFactory.tipo_de(concreta)]
+
+    def peso_prazo(tarefa):
+        return 2 if isinstance(tarefa, TarefaComPrazo) else 1
+
+    quantidade_aulas = sum(len(curso.aulas) for curso in trilha.cursos)
+    esperado = {
+        "simples": trilha.progresso(MediaSimplesEstrategia()),
+        "ponderada": trilha.progresso(MediaPonderadaPorCargaEstrategia()),
+        "por_aulas": sum(curso.progresso() * len(curso.aulas) for curso in trilha.cursos) / quantidade_aulas,
+        "por_tipo": media_por_tarefas(trilha, peso_tipo),
+        "por_prazo": media_por_tarefas(trilha, peso_prazo),
+        "gargalo": sum(min(aula.progresso() for aula in curso.aulas) for curso in trilha.cursos) / len(trilha.cursos),
+    }
+    print(f"Simples e ponderada idênticas às estratégias originais: "
+          f"{valores['simples'] == esperado['simples'] and valores['ponderada'] == esperado['ponderada']}")
+    print(f"Todas iguais ao cálculo direto: {all(abs(valores[nome] - esperado[nome]) < 1e-12 for nome in esperado)}")
+    print(f"Cada estratégia sozinha dá o mesmo valor: "
+          f"{all(RegistroEstrategias.obter(nome).calcular(trilha) == valores[nome] for nome in valores)}")
+    RegistroEstrategias.remover("gargalo")
+
+
+def testar_passada_unica():
+    print("\n=== N ESTRATÉGIAS EM UMA PASSADA (20 cursos x 10 aulas x 25 tarefas) ===")
+    trilha = gerar_trilha(20, 10, 25, fracao_prazo=0.3)
+    # Estratégias que descem até as tarefas: cada uma sozinha percorre as 5000 tarefas.
+    estrategias = [
+        EstrategiaPorNiveis.por_tipo({"projeto": peso, "pratica": 2}) for peso in (1, 2, 3, 4)
+    ] + [EstrategiaPorNiveis.por_prazo(peso) for peso in (2, 3)] + [
+        MediaSimplesEstrategia(),
+        MediaPonderadaPorCargaEstrategia(),
+    ]
+    plano = PlanoProgresso(estrategias)
+
+    inicio = time.perf_counter()
+    separadas = [trilha.progresso(estrategia) for estrategia in estrategias]
+    tempo_separadas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    fundidas = plano.calcular(trilha)
+    tempo_fundidas = time.perf_counter() - inicio
+
+    print(f"{len(estrategias)} estratégias, uma de cada vez: {tempo_separadas * 1000:7.1f} ms")
+    print(f"{len(estrategias)} estratégias, passada única:   {tempo_fundidas * 1000:7.1f} ms")
+    print(f"Mesmos resultados: {separadas == fundidas}")
+
+    # Subclasse que redefine calcular: não é a média conhecida, fica fora da passada.
+    class MetadeDaMedia(MediaSimplesEstrategia):
+        def calcular(self, trilha):
+            return super().calcular(trilha) / 2
+
+    plano = PlanoProgresso([MediaSimplesEstrategia(), MetadeDaMedia()])
+    simples, metade = plano.calcular(trilha)
+    print(f"Subclasse com calcular próprio: fundidas {plano.fundidas} de 2 | "
+          f"valor igual ao calcular dela: {metade == MetadeDaMedia().calcular(trilha) == simples / 2}")
+
+
+if __name__ == "__main__":
+    testar_avaliador_coorte()
+    testar_estrategias_por_niveis()
+    testar_passada_unica()
+
+"""
+Mostra:
+- cálculo de várias estratégias para várias trilhas em uma única passada por trilha;
+- distribuição opcional das trilhas entre processos;
+- resultado em formato de tabela (trilha x estratégia);
+- EstrategiaPorNiveis: estratégias novas (por quantidade de aulas, por tipo de tarefa,
+  por prazo, pela aula mais atrasada) descritas por peso e combinação em cada nível;
+- RegistroEstrategias: estratégias por nome, com registro de novas;
+- PlanoProgresso: várias estratégias calculadas em uma única passada pela trilha,
+  com os mesmos valores de calcular cada uma separadamente (subclasses que redefinem
+  calcular ficam fora da passada).
+"""
@@ -0,0 +1,102 @@
+import time
+from datetime import datetime, timedelta, timezone
+from model.ConversorData import ConversorData
+
+
+def mesmo_resultado(converter, texto, formato):
+    """Compara o ConversorData com o datetime.strptime para um texto (valor ou erro)."""
+    try:
+        esperado = datetime.strptime(texto, formato)
+    except ValueError:
+        esperado = "erro"
+
+    try:
+        obtido = converter(texto)
+    except ValueError:
+        obtido = "erro"
+
+    return esperado == obtido
+
+
+def testar_equivalencia():
+    print("\n=== CONVERSOR DE DATAS x STRPTIME ===")
+
+    datas = [
+        "10-03-2025", "01-01-2000", "29-02-2024", "29-02-2023", "31-04-2025",
+        "1-3-2025", "00-01-2025", "10-13-2025", "10/03/2025", "10-03-25",
+        " 1-03-2025", "10-03-2025 ", "", "abcdefghij",
+    ]
+    datas_hora = [
+        "10-03-2025 14:30", "10-03-2025 23:59", "10-03-2025 24:00", "10-03-2025 9:05",
+        "10-03-2025 14:60", "31-02-2025 10:00", "10-03-2025", "10-03-2025  14:30",
+    ]
+
+    iguais = all(mesmo_resultado(ConversorData.converter_data, texto, "%d-%m-%Y") for texto in datas)
+    print(f"'dd-mm-YYYY' igual ao strptime: {iguais}")
+
+    iguais = all(
+        mesmo_resultado(ConversorData.converter_data_hora, texto, "%d-%m-%Y %H:%M")
+        for texto in datas_hora
+    )
+    print(f"'dd-mm-YYYY HH:MM' igual ao strptime: {iguais}")
+
+
+def testar_formatacao():
+    print("\n=== FORMATAÇÃO COM CACHE (datetime com fuso e outros objetos) ===")
+    # O mesmo instante em dois fusos: datetimes iguais (mesmo hash), dias diferentes.
+    utc = datetime(2025, 3, 10, 23, 30, tzinfo=timezone.utc)
+    sao_paulo = utc.astimezone(timezone(timedelta(hours=-3)))
+    toquio = utc.astimezone(timezone(timedelta(hours=9)))
+    print(f"Instantes iguais: {sao_paulo == toquio} | "
+          f"{ConversorData.formatar_data_hora(sao_paulo)} e {ConversorData.formatar_data_hora(toquio)}")
+    print(f"Iguais ao strftime: {ConversorData.formatar_data(toquio) == toquio.strftime('%d-%m-%Y')}")
+
+    class DataSemHash:
+        """Objeto com strftime que não pode ir para um cache (não é hasheável)."""
+        __hash__ = None
+
+        def strftime(self, formato):
+            return datetime(2025, 3, 10).strftime(formato)
+
+    print(f"Objeto não hasheável: {ConversorData.formatar_data(DataSemHash())}")
+
+
+def testar_desempenho():
+    print("\n=== DESEMPENHO (100.010 conversões com datas repetidas) ===")
+    textos = [f"{(n % 28) + 1:02d}-{(n % 12) + 1:02d}-2025" for n in range(365)] * 274
+
+    inicio = time.perf_counter()
+    for texto in textos:
+        datetime.strptime(texto, "%d-%m-%Y")
+    tempo_strptime = time.perf_counter() - inicio
+
+    ConversorData.limpar_cache()
+    inicio = time.perf_counter()
+    for texto in textos:
+        ConversorData.converter_data(texto)
+    tempo_conversor = time.perf_counter() - inicio
+
+    # Sem o cache: mede só o caminho rápido (fatiar a string).
+    converter_sem_cache = ConversorData.converter_data.__wrapped__
+    inicio = time.perf_counter()
+    for texto in textos:
+        converter_sem_cache(texto)
+    tempo_sem_cache = time.perf_counter() - inicio
+
+    print(f"datetime.strptime:          {tempo_strptime * 1000:.1f} ms")
+    print(f"ConversorData (sem cache):  {tempo_sem_cache * 1000:.1f} ms")
+    print(f"ConversorData (com cache):  {tempo_conversor * 1000:.1f} ms")
+    print(ConversorData.converter_data.cache_info())
+
+
+if __name__ == "__main__":
+    testar_equivalencia()
+    testar_formatacao()
+    testar_desempenho()
+
+"""
+Mostra:
+- que o ConversorData aceita e rejeita os mesmos textos que o datetime.strptime;
+- a formatação com cache correta para datetimes com fuso e objetos não hasheáveis;
+- o ganho de tempo do caminho rápido e do cache LRU em conversões repetidas.
+"""
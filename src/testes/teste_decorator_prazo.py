@@ -1,6 +1,14 @@
+import random
+import time
 from datetime import datetime, timedelta
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
 from model.TarefaLeitura import TarefaLeitura
+from model.TarefaQuiz import TarefaQuiz
 from model.TarefaComPrazo import TarefaComPrazo
+from model.IndicePrazos import IndicePrazos
+from model.StatusTarefa import StatusTarefa
 
 
 def testar_sem_atraso():
@@ -50,12 +58,107 @@ def testar_com_atraso():
     print(f"Progresso (com atraso): {tarefa_com_prazo.progresso():.2f}")
 
 
+def testar_prazos_empilhados():
+    print("\n=== DECORATORS EMPILHADOS (DOIS NÍVEIS DE PRAZO) ===")
+
+    tarefa_base = TarefaQuiz("Quiz final", nota=9, nota_max=10)
+    prazo_ideal = TarefaComPrazo(tarefa_base, prazo=datetime.now() - timedelta(days=3), penalidade=0.1)
+    prazo_final = TarefaComPrazo(prazo_ideal, prazo=datetime.now() - timedelta(days=1), penalidade=0.2)
+    prazo_final.concluir()
+
+    # As duas camadas são avaliadas em uma passada: 0.9 * 0.9 * 0.8.
+    print(f"Camadas: {len(prazo_final.camadas)} | tarefa concreta: {prazo_final.tarefa_concreta}")
+    print(f"Fatores aplicados: {prazo_final.fatores_aplicados()}")
+    print(f"Progresso: {prazo_final.progresso():.3f}")
+
+    prazo_final.prazo = datetime.now() + timedelta(days=1)
+    print(f"Após adiar o prazo final: {prazo_final.fatores_aplicados()} -> {prazo_final.progresso():.3f}")
+
+
+def montar_trilha_com_prazos(cursos, aulas, tarefas, agora, semente=7):
+    """Trilha em que todas as tarefas têm prazo entre 10 dias atrás e 10 dias à frente."""
+    gerador = random.Random(semente)
+    trilha = Trilha("Trilha com prazos")
+    for numero_curso in range(cursos):
+        curso = Curso(f"Curso {numero_curso}")
+        for numero_aula in range(aulas):
+            aula = Aula(f"Aula {numero_aula}")
+            for numero_tarefa in range(tarefas):
+                prazo = agora + timedelta(minutes=gerador.randint(-14_400, 14_400))
+                aula.adicionar_tarefa(TarefaComPrazo(TarefaQuiz(f"Quiz {numero_tarefa}", nota=7), prazo=prazo))
+            curso.adicionar_aula(aula)
+        trilha.adicionar_curso(curso)
+    return trilha
+
+
+def testar_indice_prazos():
+    print("\n=== ÍNDICE DE PRAZOS (200 cursos x 10 aulas x 50 tarefas) ===")
+    agora = datetime(2024, 6, 1, 12, 0)
+    trilha = montar_trilha_com_prazos(200, 10, 50, agora)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+
+    inicio = time.perf_counter()
+    indice = IndicePrazos(trilha)
+    print(f"{indice} montado em {time.perf_counter() - inicio:.2f}s")
+
+    # Conclusões e mudanças de prazo depois da montagem atualizam o índice.
+    for tarefa in tarefas[::3]:
+        tarefa.concluir()
+    for tarefa in tarefas[1::7]:
+        tarefa.prazo = tarefa.prazo + timedelta(hours=6)
+
+    def varredura_todas():
+        tarefas_atuais = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+        return [tarefa for tarefa in tarefas_atuais if tarefa.status != StatusTarefa.CONCLUIDA]
+
+    def varredura():
+        return [
+            tarefa for tarefa in tarefas
+            if tarefa.status != StatusTarefa.CONCLUIDA and agora <= tarefa.prazo < agora + timedelta(hours=24)
+        ]
+
+    inicio = time.perf_counter()
+    em_risco = indice.em_risco(timedelta(hours=24), agora)
+    tempo_indice = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    esperado = varredura()
+    tempo_varredura = time.perf_counter() - inicio
+
+    print(f"Vencem nas próximas 24h: {len(em_risco)} | igual à varredura: {set(map(id, em_risco)) == set(map(id, esperado))}")
+    print(f"Índice: {tempo_indice * 1000:.2f} ms | varredura completa: {tempo_varredura * 1000:.2f} ms")
+    print(f"Vencidas e pendentes: {len(indice.vencidas(agora))}")
+    print("Próximos 3 prazos:")
+    for tarefa in indice.proximos(3, agora):
+        print(f"  {tarefa.prazo:%d-%m-%Y %H:%M} {tarefa.titulo}")
+
+    # Tarefas, aulas e cursos incluídos ou removidos depois da montagem entram e saem sozinhos.
+    aula = trilha.cursos[0].aulas[0]
+    nova = TarefaComPrazo(TarefaQuiz("Quiz extra", nota=7), prazo=agora + timedelta(hours=1))
+    aula.adicionar_tarefa(nova)
+    print(f"Tarefa incluída na aula aparece: {nova in indice.em_risco(timedelta(hours=24), agora)}")
+    aula.remover_tarefa(nova)
+    print(f"Tarefa removida da aula some: {nova not in indice.em_risco(timedelta(hours=24), agora)}")
+
+    curso = Curso("Curso novo")
+    aula_nova = Aula("Aula nova")
+    aula_nova.adicionar_tarefa(TarefaComPrazo(TarefaQuiz("Quiz do curso novo", nota=7), prazo=agora + timedelta(hours=2)))
+    curso.adicionar_aula(aula_nova)
+    trilha.adicionar_curso(curso)
+    print(f"Curso incluído na trilha: {[t.titulo for t in indice.entre(agora + timedelta(hours=2), agora + timedelta(hours=2, minutes=1))]}")
+    curso.remover_aula(aula_nova)
+    print(f"Depois de remover a aula: {len(indice)} prazos | igual à varredura: {len(indice) == len(varredura_todas())}")
+
+
 if __name__ == "__main__":
     testar_sem_atraso()
     testar_com_atraso()
+    testar_prazos_empilhados()
+    testar_indice_prazos()
 
 """
-Mostra dois cenários:
+Mostra:
 - tarefa concluída ANTES do prazo (sem penalidade);
-- tarefa concluída DEPOIS do prazo (com penalidade aplicada).
+- tarefa concluída DEPOIS do prazo (com penalidade aplicada);
+- dois decorators de prazo empilhados, avaliados em uma única passada;
+- IndicePrazos: prazos pendentes em ordem, consultas por janela e próximos N prazos.
 """
@@ -0,0 +1,208 @@
+import time
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaQuiz import TarefaQuiz
+from model.AgrupadorEventos import AgrupadorEventos
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from testes.teste_aula_curso_trilha import montar_trilha_exemplo
+from testes.teste_colunar import montar_trilha_aleatoria
+
+
+def testar_eventos_na_trilha():
+    print("\n=== EVENTOS DE ALTERAÇÃO (TAREFA -> AULA -> CURSO -> TRILHA) ===")
+    trilha = montar_trilha_exemplo()
+    trilha.assinar(lambda evento: print(f"[trilha] {evento}"))
+
+    aula = trilha.cursos[0].aulas[0]
+    aula.assinar(lambda evento: print(f"[aula]   {evento.campo} mudou em {evento.tarefa.titulo}"))
+
+    leitura = aula.tarefas[0]
+    leitura.iniciar_estudo()
+    leitura.paginas_lidas = 35
+
+
+def testar_agrupador():
+    print("\n=== AGRUPADOR DE EVENTOS (LOTE COMBINADO) ===")
+    trilha = montar_trilha_exemplo()
+    estrategia = MediaSimplesEstrategia()
+
+    def atualizar_painel(eventos):
+        print(f"Painel recebeu {len(eventos)} eventos:")
+        for evento in eventos:
+            print(f"  {evento}")
+        print(f"  progresso da trilha: {trilha.progresso(estrategia):.4f}")
+
+    agrupador = AgrupadorEventos(atualizar_painel)
+    trilha.assinar(agrupador)
+
+    quiz = trilha.cursos[0].aulas[0].tarefas[1]
+    pratica = trilha.cursos[1].aulas[0].tarefas[0]
+    with agrupador:
+        # Várias alterações no mesmo campo viram um único evento (primeiro anterior, último novo).
+        for nota in (5, 6, 9):
+            quiz.nota = nota
+        # Alteração desfeita dentro do lote não gera evento.
+        pratica.etapas_concluidas = 8
+        pratica.etapas_concluidas = 4
+
+
+def testar_custo_eventos():
+    print("\n=== CUSTO DOS EVENTOS (20.000 alterações de status) ===")
+    trilha = montar_trilha_aleatoria(cursos=20, aulas=10, tarefas=100)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas][:20_000]
+
+    def alterar_todas():
+        inicio = time.perf_counter()
+        for tarefa in tarefas:
+            tarefa.status = tarefa.status
+        return time.perf_counter() - inicio
+
+    sem_assinantes = alterar_todas()
+    agrupador = AgrupadorEventos()
+    trilha.assinar(agrupador)
+    com_agrupador = alterar_todas()
+
+    print(f"Sem assinantes: {sem_assinantes * 1000:.1f} ms | com agrupador: {com_agrupador * 1000:.1f} ms")
+    print(f"Eventos combinados pendentes: {agrupador.quantidade_pendente}")
+    print(f"Eventos com mudança real: {len(agrupador.descarregar())}")
+
+
+def exigir_nota_maxima_10(evento):
+    """Validação usada nos lotes: nenhuma nota acima de 10."""
+    if evento.campo == "nota" and evento.valor_novo > 10:
+        raise ValueError(f"Nota inválida em {evento.tarefa.titulo}: {evento.valor_novo}")
+
+
+def testar_lote():
+    print("\n=== LOTE DE ALTERAÇÕES (CONFIRMAR E DESFAZER) ===")
+    trilha = montar_trilha_exemplo()
+    estrategia = MediaSimplesEstrategia()
+    trilha.assinar(lambda evento: print(f"[trilha] {evento}"))
+
+    leitura = trilha.cursos[0].aulas[0].tarefas[0]
+    quiz = trilha.cursos[0].aulas[0].tarefas[1]
+    print(f"Progresso antes: {trilha.progresso(estrategia):.4f}")
+
+    with trilha.lote(validar=exigir_nota_maxima_10):
+        quiz.nota = 9
+        quiz.nota = 10
+        leitura.iniciar_estudo()
+    print(f"Confirmado: {trilha.progresso(estrategia):.4f}")
+
+    try:
+        with trilha.lote(validar=exigir_nota_maxima_10):
+            leitura.total_paginas = 10  # também limita paginas_lidas (20 -> 10)
+            quiz.nota_max = 20
+            quiz.nota = 15
+    except ValueError as erro:
+        print(f"Lote desfeito: {erro}")
+    print(f"Após desfazer: {trilha.progresso(estrategia):.4f} | {leitura.paginas_lidas}/{leitura.total_paginas} páginas, "
+          f"nota {quiz.nota}/{quiz.nota_max}")
+
+    try:
+        with trilha.lote():
+            quiz.concluir()
+            raise RuntimeError("falha no meio do lote")
+    except RuntimeError as erro:
+        print(f"Exceção no bloco ({erro}): status do quiz = {quiz.status.value}, data = {quiz.data_realizacao}")
+
+    # Um erro inesperado dentro de validar (aqui, KeyError) também desfaz e fecha o lote.
+    def validar_com_erro(evento):
+        raise KeyError(evento.campo)
+
+    try:
+        with trilha.lote(validar=validar_com_erro):
+            quiz.nota = 3
+    except KeyError as erro:
+        print(f"Erro na validação ({erro!r}): nota do quiz = {quiz.nota}")
+    with trilha.lote():
+        leitura.paginas_lidas = 5
+    print(f"Novo lote abre e entrega os eventos normalmente: {trilha.progresso(estrategia):.4f}")
+
+
+def testar_lote_assinantes_e_validacao():
+    print("\n=== LOTE: ASSINANTES DE AULA/CURSO E VALIDAÇÃO DO LOTE INTEIRO ===")
+    trilha = montar_trilha_exemplo()
+    curso = trilha.cursos[0]
+    aula = curso.aulas[0]
+    leitura, quiz = aula.tarefas
+    aula.assinar(lambda evento: print(f"[aula]  {evento}"))
+    curso.assinar(lambda evento: print(f"[curso] {evento}"))
+    trilha.assinar(lambda evento: print(f"[trilha] {evento}"))
+
+    # Aula e curso recebem os eventos na hora e, no desfazer, um evento por campo restaurado.
+    try:
+        with trilha.lote(validar=exigir_nota_maxima_10):
+            quiz.nota_max = 20
+            quiz.nota = 15
+            leitura.paginas_lidas = 35
+            quiz.nota = 18
+    except ValueError as erro:
+        print(f"Lote desfeito: {erro}")
+
+    # Todos os problemas do lote aparecem juntos, incluindo a regra do modelo:
+    # a renomeação não pode deixar duas tarefas da aula com a mesma chave.
+    try:
+        with trilha.lote(validar=exigir_nota_maxima_10):
+            quiz.nota_max = 20
+            quiz.nota = 12
+            leitura.titulo = "Quiz POO básico"
+    except ValueError as erro:
+        print(f"Lote desfeito: {erro}")
+    print(f"Após desfazer: {[tarefa.titulo for tarefa in aula.tarefas]} | nota {quiz.nota}/{quiz.nota_max} | "
+          f"repetidas: {len(trilha.tarefas_repetidas())}")
+
+
+def testar_lote_notas():
+    print("\n=== LOTE COM 50.000 NOTAS DE QUIZ ===")
+    trilha = Trilha("Trilha de Quizzes")
+    for numero_curso in range(50):
+        curso = Curso(f"Curso {numero_curso}", carga_horas=20)
+        for numero_aula in range(10):
+            aula = Aula(f"Aula {numero_aula}")
+            for numero_quiz in range(100):
+                aula.adicionar_tarefa(TarefaQuiz(f"Quiz {numero_quiz}", nota=5))
+            curso.adicionar_aula(aula)
+        trilha.adicionar_curso(curso)
+
+    quizzes = trilha.buscar_tarefas(tipo=TarefaQuiz)
+    estrategia = MediaSimplesEstrategia()
+    agrupador = AgrupadorEventos(lambda eventos: print(f"Painel recebeu {len(eventos)} eventos de uma vez"))
+    trilha.assinar(agrupador)
+
+    inicio = time.perf_counter()
+    with trilha.lote(validar=exigir_nota_maxima_10):
+        for posicao, quiz in enumerate(quizzes):
+            quiz.nota = posicao % 11
+    agrupador.descarregar()
+    print(f"Lote confirmado em {time.perf_counter() - inicio:.2f}s -> progresso {trilha.progresso(estrategia):.4f}")
+
+    inicio = time.perf_counter()
+    try:
+        with trilha.lote(validar=exigir_nota_maxima_10):
+            for posicao, quiz in enumerate(quizzes):
+                quiz.nota_max = 20
+                quiz.nota = 10 + posicao % 5
+    except ValueError:
+        pass
+    print(f"Lote desfeito em {time.perf_counter() - inicio:.2f}s -> progresso {trilha.progresso(estrategia):.4f}")
+    print(f"Eventos entregues ao painel após desfazer: {agrupador.quantidade_pendente}")
+
+
+if __name__ == "__main__":
+    testar_eventos_na_trilha()
+    testar_agrupador()
+    testar_custo_eventos()
+    testar_lote()
+    testar_lote_assinantes_e_validacao()
+    testar_lote_notas()
+
+"""
+Mostra:
+- eventos tipados (tarefa, campo, valor anterior, valor novo) subindo até Aula e Trilha;
+- AgrupadorEventos combinando várias alterações em um lote para um painel;
+- custo das alterações com e sem assinantes;
+- lotes de alterações (with trilha.lote()): confirmação com validação do lote inteiro e desfazer
+  completo, com eventos de desfazer para os assinantes de Aula e Curso.
+"""
@@ -55,13 +55,63 @@ def testar_factory_pratica_projeto():
     print(tarefa_projeto.exibir_dados())
 
 
+def testar_factory_lote():
+    print("\n=== FACTORY EM LOTE (criar_lote e criar_muitos) ===")
+
+    registros = [
+        {"tipo_tarefa": "leitura", "titulo": "Cap. 3", "total_paginas": 40, "paginas_lidas": 10},
+        {"tipo_tarefa": "quiz", "titulo": "Quiz Cap. 3", "nota": 6},
+        {"tipo_tarefa": "projeto", "titulo": "Entrega parcial", "total_entregas": 2},
+    ]
+
+    # criar_lote devolve um gerador: as tarefas são criadas à medida que são consumidas.
+    for tarefa in TarefaFactory.criar_lote(registros):
+        print(f"{tarefa} -> progresso {tarefa.progresso():.2f}")
+
+    # Registros agrupados por tipo podem ser tuplas:
+    # (titulo, obrigatório, opcional, descricao, data_realizacao)
+    praticas = [
+        ("Exercício 1", 4, 4),
+        ("Exercício 2", 4, 1, "Lista de fixação"),
+        ("Exercício 3", 5),
+    ]
+    for tarefa in TarefaFactory.criar_muitos("pratica", praticas):
+        print(f"{tarefa} -> progresso {tarefa.progresso():.2f}")
+
+    try:
+        list(TarefaFactory.criar_lote([{"tipo_tarefa": "leitura", "titulo": "Sem total"}]))
+    except ValueError as erro:
+        print(f"Erro esperado: {erro}")
+
+    # O lote é validado inteiro antes da primeira tarefa: valores fora da faixa são recusados.
+    criadas = []
+    try:
+        for tarefa in TarefaFactory.criar_lote([
+            {"tipo_tarefa": "leitura", "titulo": "Cap. 4", "total_paginas": 30},
+            {"tipo_tarefa": "leitura", "titulo": "Cap. 5", "total_paginas": 30, "paginas_lidas": 45},
+        ]):
+            criadas.append(tarefa)
+    except ValueError as erro:
+        print(f"Erro esperado: {erro} | tarefas criadas antes do erro: {len(criadas)}")
+
+    # Montadas sem os setters, mas com os mesmos valores de criar().
+    registro = {"titulo": "  cap. 6 ", "total_paginas": "40", "paginas_lidas": 12.0, "data_realizacao": "10-03-2025"}
+    pelo_lote = next(TarefaFactory.criar_lote([dict(registro, tipo_tarefa="leitura")]))
+    por_criar = TarefaFactory.criar("leitura", **registro)
+    print(f"Lote igual a criar(): "
+          f"{TarefaFactory.argumentos_de(pelo_lote) == TarefaFactory.argumentos_de(por_criar)}")
+
+
 if __name__ == "__main__":
     testar_factory_leitura_quiz()
     testar_factory_pratica_projeto()
+    testar_factory_lote()
 
 """
 Mostra:
 - criação de tarefas usando a TarefaFactory a partir de strings:
   "leitura", "quiz", "pratica", "projeto".
 - cada tipo concreto aplica sua própria regra de progresso().
+- criação em lote com criar_lote (dicionários) e criar_muitos (tuplas agrupadas por tipo),
+  com o lote validado inteiro antes de criar as tarefas.
 """
@@ -0,0 +1,235 @@
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from model.Aula import Aula
+from model.Curso import Curso
+from model.HistoricoProgresso import HistoricoProgresso
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.StatusTarefa import StatusTarefa
+from model.TarefaComPrazo import TarefaComPrazo
+from model.TarefaLeitura import TarefaLeitura
+from testes.benchmark_modelo import gerar_trilha
+
+
+class Relogio:
+    """Relógio simulado: o teste decide que horas são."""
+
+    def __init__(self, inicio):
+        self.agora = inicio
+
+    def __call__(self):
+        return self.agora.timestamp()
+
+
+# Contador que mede o avanço de cada tipo de tarefa e o total correspondente.
+CONTADORES = (
+    ("paginas_lidas", "total_paginas"),
+    ("etapas_concluidas", "total_etapas"),
+    ("entregas_aprovadas", "total_entregas"),
+    ("nota", "nota_max"),
+)
+
+
+def estudar(tarefa, gerador):
+    """Avança um pouco o contador da tarefa (e às vezes a conclui)."""
+    concreta = tarefa.tarefa_concreta if isinstance(tarefa, TarefaComPrazo) else tarefa
+    if gerador.random() < 0.1:
+        tarefa.concluir()
+        return
+    for contador, total in CONTADORES:
+        if hasattr(concreta, contador):
+            atual = getattr(concreta, contador) or 0
+            setattr(concreta, contador, min(getattr(concreta, total), atual + 1))
+            if tarefa.status == StatusTarefa.A_FAZER:
+                tarefa.iniciar_estudo()
+            return
+
+
+def simular_mes(trilha, historico, relogio, inicio, dias=30, alteracoes_por_dia=300, semente=7):
+    """Estuda durante "dias" dias e devolve [(fim do dia, simples, ponderada), ...] medidos ao vivo."""
+    gerador = random.Random(semente)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+    medidos = []
+    for dia in range(dias):
+        for alteracao in range(alteracoes_por_dia):
+            relogio.agora = inicio + timedelta(days=dia, hours=8, seconds=alteracao * 30)
+            estudar(gerador.choice(tarefas), gerador)
+        fim_do_dia = inicio + timedelta(days=dia, hours=23)
+        medidos.append((
+            fim_do_dia,
+            trilha.progresso(MediaSimplesEstrategia()),
+            trilha.progresso(MediaPonderadaPorCargaEstrategia()),
+        ))
+    return medidos
+
+
+def testar_progresso_em_cada_dia():
+    print("\n=== PROGRESSO EM CADA DIA DE UM MÊS (reconstruído pelo histórico) ===")
+    inicio = datetime(2025, 3, 1)
+    relogio = Relogio(inicio)
+    trilha = gerar_trilha(8, 5, 10, fracao_prazo=0.3)
+    historico = HistoricoProgresso(trilha, relogio=relogio)
+
+    medidos = simular_mes(trilha, historico, relogio, inicio)
+
+    for momento, simples, ponderada in medidos[::7]:
+        reconstruido = historico.progresso_em(momento)
+        print(f"{momento:%d-%m-%Y}: ao vivo {simples * 100:6.2f}% | histórico {reconstruido * 100:6.2f}%")
+
+    iguais = all(
+        abs(historico.progresso_em(momento) - simples) < 1e-9
+        and abs(historico.progresso_em(momento, MediaPonderadaPorCargaEstrategia()) - ponderada) < 1e-9
+        for momento, simples, ponderada in medidos
+    )
+    print(f"Todos os dias iguais ao valor medido na época (simples e ponderada): {iguais}")
+
+    serie = historico.serie([momento for momento, _, _ in medidos])
+    print(f"serie() igual às consultas uma a uma: {serie == [historico.progresso_em(m) for m, _, _ in medidos]}")
+    print(f"Antes de qualquer estudo: {historico.progresso_em(inicio) * 100:.2f}%")
+
+    try:
+        historico.progresso_em(inicio - timedelta(days=1))
+    except ValueError as erro:
+        print(f"Erro esperado: {erro}")
+
+    print(f"Estatísticas: {historico.estatisticas}")
+    historico.fechar()
+
+
+def testar_inclusao_e_remocao():
+    print("\n=== TAREFAS INCLUÍDAS E REMOVIDAS ===")
+    inicio = datetime(2025, 3, 1)
+    relogio = Relogio(inicio)
+    trilha = gerar_trilha(1, 1, 2, fracao_prazo=0.0)
+    aula = trilha.cursos[0].aulas[0]
+    historico = HistoricoProgresso(trilha, relogio=relogio)
+
+    relogio.agora = inicio + timedelta(days=1)
+    nova = TarefaLeitura("Capítulo extra", total_paginas=10, paginas_lidas=10)
+    nova.concluir()
+    aula.adicionar_tarefa(nova)
+    print(f"sincronizar() após incluir: (incluídas, removidas) = {historico.sincronizar()}")
+    depois_da_inclusao = trilha.progresso(MediaSimplesEstrategia())
+
+    relogio.agora = inicio + timedelta(days=2)
+    aula.remover_tarefa(nova)
+    print(f"sincronizar() após remover: (incluídas, removidas) = {historico.sincronizar()}")
+
+    for dias in (0, 1, 2):
+        momento = inicio + timedelta(days=dias, hours=1)
+        print(
+            f"Dia {dias}: {historico.progresso_em(momento) * 100:6.2f}% | "
+            f"status da tarefa extra: {historico.status_em(nova, momento)}"
+        )
+    print(f"Dia 1 igual ao progresso medido logo após incluir: "
+          f"{abs(historico.progresso_em(inicio + timedelta(days=1, hours=1)) - depois_da_inclusao) < 1e-9}")
+    print(f"Tarefa removida ainda tem observadores: {nova.possui_observadores}")
+    historico.fechar()
+
+
+def testar_aulas_e_cursos_vazios():
+    print("\n=== AULAS E CURSOS VAZIOS CONTAM NAS MÉDIAS (como Aula e Curso) ===")
+    inicio = datetime(2025, 3, 1)
+    relogio = Relogio(inicio)
+    trilha = gerar_trilha(2, 2, 4, fracao_prazo=0.3)
+    trilha.cursos[0].adicionar_aula(Aula("Aula sem tarefas"))
+    trilha.adicionar_curso(Curso("Curso sem aulas", 30))
+    historico = HistoricoProgresso(trilha, relogio=relogio)
+    gerador = random.Random(3)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+
+    def conferir(dia):
+        # Valor ao vivo agora x valor reconstruído para este mesmo momento.
+        ao_vivo = [trilha.progresso(estrategia) for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia())]
+        reconstruido = [
+            historico.progresso_em(relogio.agora),
+            historico.progresso_em(relogio.agora, MediaPonderadaPorCargaEstrategia()),
+        ]
+        iguais = all(abs(a - b) < 1e-12 for a, b in zip(ao_vivo, reconstruido))
+        print(f"Dia {dia}: ao vivo {ao_vivo[0] * 100:6.2f}% / {ao_vivo[1] * 100:6.2f}% | "
+              f"histórico {reconstruido[0] * 100:6.2f}% / {reconstruido[1] * 100:6.2f}% | iguais: {iguais}")
+        return ao_vivo
+
+    for alteracao in range(20):
+        relogio.agora = inicio + timedelta(seconds=alteracao)
+        estudar(gerador.choice(tarefas), gerador)
+    dia_0 = conferir(0)
+
+    relogio.agora = inicio + timedelta(days=1)
+    trilha.cursos[1].adicionar_aula(Aula("Outra aula sem tarefas"))
+    trilha.adicionar_curso(Curso("Mais um curso sem aulas", 10))
+    historico.sincronizar()
+    conferir(1)
+
+    relogio.agora = inicio + timedelta(days=2)
+    trilha.cursos[0].remover_aula(trilha.cursos[0].buscar_aula("Aula sem tarefas"))
+    historico.sincronizar()
+    conferir(2)
+
+    print(f"Dia 0 consultado depois das mudanças igual ao medido na época: "
+          f"{abs(historico.progresso_em(inicio + timedelta(hours=1)) - dia_0[0]) < 1e-12}")
+    print(f"Cursos no dia 1: {sorted(historico.progresso_cursos_em(inicio + timedelta(days=1, hours=1)))}")
+    historico.fechar()
+
+
+def testar_custo_das_consultas():
+    print("\n=== CUSTO DAS CONSULTAS COM E SEM CHECKPOINTS (200 mil deltas) ===")
+    inicio = datetime(2025, 1, 1)
+    gerador = random.Random(3)
+
+    for intervalo, descricao in ((None, "checkpoints automáticos"), (10**9, "sem checkpoints")):
+        relogio = Relogio(inicio)
+        trilha = gerar_trilha(20, 10, 25, fracao_prazo=0.0)
+        tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+        leituras = [tarefa for tarefa in tarefas if isinstance(tarefa, TarefaLeitura)]
+        historico = HistoricoProgresso(trilha, intervalo_checkpoint=intervalo, relogio=relogio)
+
+        inicio_escrita = time.perf_counter()
+        for numero in range(200_000):
+            relogio.agora = inicio + timedelta(minutes=numero)
+            tarefa = gerador.choice(leituras)
+            tarefa.paginas_lidas = gerador.randint(0, tarefa.total_paginas)
+        tempo_escrita = time.perf_counter() - inicio_escrita
+
+        momentos = [inicio + timedelta(minutes=gerador.randint(0, 200_000)) for _ in range(50)]
+        inicio_consulta = time.perf_counter()
+        for momento in momentos:
+            historico.progresso_em(momento)
+        tempo_consulta = (time.perf_counter() - inicio_consulta) / len(momentos)
+
+        estatisticas = historico.estatisticas
+        print(
+            f"{descricao:<24} {estatisticas['checkpoints']:4d} checkpoints | "
+            f"escrita {tempo_escrita / 200_000 * 1e6:5.2f} µs/delta | consulta {tempo_consulta * 1000:7.2f} ms | "
+            f"log {estatisticas['bytes_log'] / len(historico):.0f} bytes/delta, "
+            f"checkpoints {estatisticas['bytes_checkpoints'] // 1024} KiB"
+        )
+        historico.fechar()
+
+    # Mesmo log guardado como lista de tuplas, para comparar a memória.
+    tracemalloc.start()
+    tuplas = [(float(numero), numero % 5000, numero / 200_000, 1) for numero in range(200_000)]
+    memoria_tuplas, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Lista de tuplas com os mesmos deltas: {memoria_tuplas / len(tuplas):.0f} bytes/delta")
+
+
+if __name__ == "__main__":
+    testar_progresso_em_cada_dia()
+    testar_inclusao_e_remocao()
+    testar_aulas_e_cursos_vazios()
+    testar_custo_das_consultas()
+
+"""
+Mostra:
+- HistoricoProgresso reconstruindo o progresso da trilha (média simples e ponderada)
+  no fim de cada dia de um mês simulado, igual ao valor medido na época;
+- serie() para vários momentos de uma vez e o erro para momentos anteriores ao histórico;
+- tarefas incluídas e removidas entrando no log com sincronizar(), e status_em();
+- aulas e cursos vazios (e incluídos ou removidos depois) contando nas médias como em
+  Aula, Curso e nas estratégias: progresso_em(agora) igual a trilha.progresso(...);
+- o custo de uma consulta limitado pelos checkpoints, comparado a reaplicar o log inteiro;
+- o tamanho do log colunar (array.array) por delta, comparado a uma lista de tuplas.
+"""
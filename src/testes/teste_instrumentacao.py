@@ -0,0 +1,171 @@
+import io
+import json
+import os
+import pstats
+import random
+import tempfile
+import threading
+import time
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaComPrazo import TarefaComPrazo
+from model.TarefaFactory import TarefaFactory
+from model.InstrumentacaoProgresso import InstrumentacaoProgresso
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from testes.benchmark_modelo import gerar_registros_tarefas, gerar_trilha
+from testes.teste_historico import estudar
+
+
+def montar_trilha(nome, cursos, aulas, tarefas, semente):
+    """Trilha criada tarefa a tarefa por TarefaFactory.criar (o ponto medido da fábrica)."""
+    gerador = random.Random(semente)
+    trilha = Trilha(nome)
+    for numero_curso in range(cursos):
+        curso = Curso(f"Curso {numero_curso}", carga_horas=gerador.choice([20, 40, 60]))
+        for numero_aula in range(aulas):
+            aula = Aula(f"Aula {numero_aula}")
+            for registro in gerar_registros_tarefas(gerador, tarefas):
+                tarefa = TarefaFactory.criar(**registro)
+                if gerador.random() < 0.2:
+                    tarefa = TarefaComPrazo(tarefa, prazo="01-01-2024 12:00", penalidade=0.3)
+                aula.adicionar_tarefa(tarefa)
+            curso.adicionar_aula(aula)
+        trilha.adicionar_curso(curso)
+    return trilha
+
+
+def rodada_de_estudo(trilhas, alteracoes, semente=5):
+    """Altera tarefas ao acaso e recalcula o progresso das trilhas depois de cada alteração."""
+    gerador = random.Random(semente)
+    tarefas = [
+        (trilha, tarefa)
+        for trilha in trilhas for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas
+    ]
+    simples = MediaSimplesEstrategia()
+    ponderada = MediaPonderadaPorCargaEstrategia()
+    for _ in range(alteracoes):
+        trilha, tarefa = gerador.choice(tarefas)
+        estudar(tarefa, gerador)
+        trilha.progresso(simples)
+        trilha.progresso(ponderada)
+
+
+def testar_pontos_quentes():
+    print("\n=== ONDE O TEMPO É GASTO (instrumentação ligada) ===")
+    with InstrumentacaoProgresso() as instrumentacao:
+        pequena = montar_trilha("Trilha Pequena", 2, 3, 5, semente=1)
+        grande = montar_trilha("Trilha Grande", 10, 8, 20, semente=2)
+        rodada_de_estudo([pequena, grande], alteracoes=3000)
+
+    print(instrumentacao)
+
+    dados = instrumentacao.como_dicionario()["pontos"]
+    print("\nTrilha.progresso por trilha:")
+    for trilha, valores in dados["Trilha.progresso"]["detalhes"].items():
+        print(f"  {trilha:<16} {valores['chamadas']:>6} chamadas | {valores['tempo_total'] * 1000:8.2f} ms")
+
+    print("TarefaFactory.criar por tipo:")
+    for tipo, valores in dados["TarefaFactory.criar"]["detalhes"].items():
+        print(f"  {tipo:<16} {valores['chamadas']:>6} chamadas | {valores['tempo_total'] * 1000:8.2f} ms")
+
+    print("Setter de status por tipo de tarefa:")
+    for tipo, valores in dados["TarefaEstudo.status="]["detalhes"].items():
+        print(f"  {tipo:<16} {valores['chamadas']:>6} chamadas | {valores['tempo_total'] * 1000:8.2f} ms")
+
+    print(f"Quem chama TarefaLeitura.progresso: {dados['TarefaLeitura.progresso']['chamadores']}")
+
+
+def testar_exportacao():
+    print("\n=== EXPORTAÇÃO EM JSON E NO FORMATO DO cPROFILE ===")
+    trilha = gerar_trilha(5, 5, 10)
+    with InstrumentacaoProgresso() as instrumentacao:
+        rodada_de_estudo([trilha], alteracoes=500)
+
+    destino = io.StringIO()
+    instrumentacao.salvar_json(destino)
+    lido = json.loads(destino.getvalue())
+    print(f"JSON: {len(destino.getvalue())} caracteres, pontos: {list(lido['pontos'])[:4]} ...")
+
+    caminho = os.path.join(tempfile.mkdtemp(), "progresso.pstats")
+    instrumentacao.salvar_pstats(caminho)
+    estatisticas = pstats.Stats(caminho, stream=io.StringIO())
+    print(f"pstats.Stats lê o arquivo: {len(estatisticas.stats)} funções, "
+          f"{estatisticas.total_calls} chamadas no total")
+
+    saida = io.StringIO()
+    estatisticas = instrumentacao.como_pstats()
+    estatisticas.stream = saida
+    estatisticas.sort_stats("cumulative").print_stats(4)
+    print("\n".join(linha for linha in saida.getvalue().splitlines() if "(progresso)" in linha or "ncalls" in linha))
+
+
+def testar_varias_threads():
+    print("\n=== MEDIÇÃO COM VÁRIAS THREADS ===")
+    trilhas = [gerar_trilha(3, 4, 10, semente=semente) for semente in range(4)]
+    for trilha in trilhas:
+        trilha.ativar_modo_concorrente()
+
+    with InstrumentacaoProgresso() as instrumentacao:
+        threads = [
+            threading.Thread(target=rodada_de_estudo, args=([trilha], 1000, numero))
+            for numero, trilha in enumerate(trilhas)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    chamadas = instrumentacao.como_dicionario()["pontos"]["Trilha.progresso"]["chamadas"]
+    print(f"Trilha.progresso somado entre as 4 threads: {chamadas} chamadas (esperado {4 * 1000 * 2})")
+
+
+def testar_custo_desligada():
+    print("\n=== CUSTO COM A INSTRUMENTAÇÃO DESLIGADA ===")
+    originais = {classe: dict(vars(classe)) for classe in (Trilha, Curso, Aula, TarefaFactory)}
+
+    trilha = gerar_trilha(10, 8, 20)
+    medicoes = {}
+    for fase in ("antes", "ligada", "depois"):
+        instrumentacao = InstrumentacaoProgresso()
+        if fase == "ligada":
+            instrumentacao.ativar()
+        tempos = []
+        for _ in range(3):
+            inicio = time.perf_counter()
+            rodada_de_estudo([trilha], alteracoes=5000)
+            tempos.append(time.perf_counter() - inicio)
+        medicoes[fase] = min(tempos)
+        instrumentacao.desativar()
+
+    for fase, tempo in medicoes.items():
+        print(f"5000 alterações + progresso, {fase:<7}: {tempo * 1000:7.1f} ms (melhor de 3)")
+
+    restaurados = all(
+        vars(classe)[nome] is atributo for classe, atributos in originais.items() for nome, atributo in atributos.items()
+    )
+    print(f"Depois de desativar, as classes têm de novo os métodos originais: {restaurados}")
+
+    try:
+        with InstrumentacaoProgresso():
+            InstrumentacaoProgresso().ativar()
+    except RuntimeError as erro:
+        print(f"Erro esperado: {erro}")
+
+
+if __name__ == "__main__":
+    testar_pontos_quentes()
+    testar_exportacao()
+    testar_varias_threads()
+    testar_custo_desligada()
+
+"""
+Mostra:
+- InstrumentacaoProgresso medindo chamadas, tempo total e tempo próprio de Trilha/Curso/Aula.progresso,
+  do progresso() de cada tipo de tarefa, de TarefaFactory.criar e dos setters com validação;
+- o detalhamento por trilha, por tipo pedido à fábrica e por tipo de tarefa, e quem chama cada ponto;
+- a exportação em JSON e no formato do cProfile, lida de volta com pstats.Stats;
+- medições somadas entre várias threads;
+- desligada, as classes voltam a ter os métodos originais (sem custo no cálculo).
+"""
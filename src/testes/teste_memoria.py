@@ -0,0 +1,97 @@
+import os
+import re
+import sys
+import tracemalloc
+import types
+import model
+from model.TarefaLeitura import TarefaLeitura
+from model.TarefaPratica import TarefaPratica
+from model.TarefaQuiz import TarefaQuiz
+from model.TarefaProjeto import TarefaProjeto
+from model.TarefaComPrazo import TarefaComPrazo
+
+# Módulos da hierarquia de tarefas, na ordem em que um depende do outro.
+MODULOS_TAREFAS = ("TarefaEstudo", "TarefaLeitura", "TarefaPratica", "TarefaQuiz", "TarefaProjeto", "TarefaComPrazo")
+
+
+def carregar_tarefas_sem_slots():
+    """
+    Recria a hierarquia de tarefas a partir do mesmo código-fonte, só que sem as linhas
+    de __slots__ (como era antes), num pacote à parte chamado "model_sem_slots".
+    Os demais módulos (StatusTarefa, ConversorData, ...) são os do pacote model.
+    Retorna um dicionário nome da classe -> classe sem __slots__.
+    """
+    pacote = types.ModuleType("model_sem_slots")
+    pacote.__path__ = []
+    sys.modules["model_sem_slots"] = pacote
+    for nome in ("StatusTarefa", "ConversorData", "EventoAlteracao"):
+        sys.modules[f"model_sem_slots.{nome}"] = sys.modules[f"model.{nome}"]
+
+    pasta = os.path.dirname(model.__file__)
+    classes = {}
+    for nome in MODULOS_TAREFAS:
+        caminho = os.path.join(pasta, f"{nome}.py")
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            fonte = re.sub(r"^\s*__slots__ = .*$", "", arquivo.read(), flags=re.MULTILINE)
+
+        modulo = types.ModuleType(f"model_sem_slots.{nome}")
+        modulo.__package__ = "model_sem_slots"
+        modulo.__file__ = caminho
+        sys.modules[modulo.__name__] = modulo
+        exec(compile(fonte, caminho, "exec"), modulo.__dict__)
+        classes[nome] = getattr(modulo, nome)
+    return classes
+
+
+def bytes_por_objeto(criar, quantidade=20000):
+    """Mede, com tracemalloc, quantos bytes cada objeto criado ocupa em média."""
+    tracemalloc.start()
+    objetos = [criar(numero) for numero in range(quantidade)]
+    memoria_usada = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objetos
+    return memoria_usada / quantidade
+
+
+def casos(leitura, pratica, quiz, projeto, com_prazo):
+    """Os mesmos objetos medidos, criados com as classes recebidas."""
+    return [
+        ("TarefaLeitura", lambda n: leitura("Cap", total_paginas=10, paginas_lidas=n % 10)),
+        ("TarefaPratica", lambda n: pratica("Lista", total_etapas=5, etapas_concluidas=n % 5)),
+        ("TarefaQuiz", lambda n: quiz("Quiz", nota=n % 10)),
+        ("TarefaProjeto", lambda n: projeto("Projeto", total_entregas=3)),
+        ("TarefaComPrazo", lambda n: com_prazo(quiz("Quiz", nota=5), prazo=None, penalidade=0.2)),
+    ]
+
+
+def testar_memoria_por_tarefa():
+    print("\n=== MEMÓRIA POR TAREFA (bytes, média de 20.000 objetos) ===")
+
+    sem_slots = carregar_tarefas_sem_slots()
+    antes = casos(
+        sem_slots["TarefaLeitura"], sem_slots["TarefaPratica"], sem_slots["TarefaQuiz"],
+        sem_slots["TarefaProjeto"], sem_slots["TarefaComPrazo"],
+    )
+    depois = casos(TarefaLeitura, TarefaPratica, TarefaQuiz, TarefaProjeto, TarefaComPrazo)
+
+    print(f"{'Tarefa':<16} {'sem __slots__':>14} {'com __slots__':>14} {'economia':>9}")
+    for (nome, criar_antes), (_, criar_depois) in zip(antes, depois):
+        bytes_antes = bytes_por_objeto(criar_antes)
+        bytes_depois = bytes_por_objeto(criar_depois)
+        economia = (1 - bytes_depois / bytes_antes) * 100
+        print(f"{nome:<16} {bytes_antes:14.1f} {bytes_depois:14.1f} {economia:8.1f}%")
+
+    tarefa = TarefaLeitura("Cap", total_paginas=10)
+    print(f"\nTarefa possui __dict__? {hasattr(tarefa, '__dict__')} "
+          f"(sem __slots__: {hasattr(sem_slots['TarefaLeitura']('Cap', total_paginas=10), '__dict__')})")
+
+
+if __name__ == "__main__":
+    testar_memoria_por_tarefa()
+
+"""
+Mostra:
+- quantos bytes cada tipo de tarefa ocupa com __slots__ (sem __dict__) e, como linha de base,
+  com as mesmas classes recriadas do código-fonte sem as linhas de __slots__;
+- a economia de memória de cada tipo de tarefa.
+"""
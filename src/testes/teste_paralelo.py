@@ -0,0 +1,71 @@
+import os
+import time
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.MediaParalelaEstrategia import MediaParalelaEstrategia
+from testes.teste_colunar import montar_trilha_aleatoria
+
+
+def testar_estrategia_paralela():
+    print("\n=== STRATEGY PARALELA (200 cursos x 10 aulas x 20 tarefas) ===")
+    trilha = montar_trilha_aleatoria(cursos=200, aulas=10, tarefas=20)
+
+    comparacoes = [
+        (MediaSimplesEstrategia(), MediaParalelaEstrategia(limite_serial=1, max_trabalhadores=2)),
+        (MediaPonderadaPorCargaEstrategia(), MediaParalelaEstrategia(ponderada_por_carga=True, limite_serial=1, max_trabalhadores=2)),
+    ]
+
+    for sequencial, paralela in comparacoes:
+        with paralela:
+            inicio = time.perf_counter()
+            valor_paralelo = trilha.progresso(paralela)
+            tempo_paralelo = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        valor_sequencial = trilha.progresso(sequencial)
+        tempo_sequencial = time.perf_counter() - inicio
+
+        print(f"\n{sequencial.__class__.__name__}")
+        print(f"Sequencial: {valor_sequencial:.10f} ({tempo_sequencial * 1000:.1f} ms)")
+        print(f"Paralela:   {valor_paralelo:.10f} ({tempo_paralelo * 1000:.1f} ms)")
+        print(f"Diferença:  {abs(valor_paralelo - valor_sequencial):.1e}")
+
+        # Os cursos são calculados nos processos do pool, não no processo principal.
+        processos = {pid for pid, _ in paralela.trabalhadores_utilizados}
+        print(f"Partes calculadas: {len(paralela.trabalhadores_utilizados)} | "
+              f"todas fora do processo principal: {bool(processos) and os.getpid() not in processos}")
+
+
+def testar_limite_serial():
+    print("\n=== LIMITE PADRÃO (sem limite_serial) ===")
+    trilha = montar_trilha_aleatoria(cursos=3, aulas=2, tarefas=5)
+
+    # Sem limite_serial, trilhas com poucos cursos são calculadas no próprio processo:
+    # o pool nem é criado.
+    paralela = MediaParalelaEstrategia()
+    print(f"Paralela:   {trilha.progresso(paralela):.10f}")
+    print(f"Sequencial: {trilha.progresso(MediaSimplesEstrategia()):.10f}")
+    print(f"Partes calculadas no pool: {len(paralela.trabalhadores_utilizados)}")
+    paralela.fechar()
+
+    # Com processos, a partir de LIMITE_SERIAL_PROCESSOS cursos o pool é usado sem limite_serial.
+    trilha = montar_trilha_aleatoria(cursos=MediaParalelaEstrategia.LIMITE_SERIAL_PROCESSOS, aulas=2, tarefas=5)
+    with MediaParalelaEstrategia(max_trabalhadores=2, usar_threads=False) as paralela:
+        print(f"\n{MediaParalelaEstrategia.LIMITE_SERIAL_PROCESSOS} cursos, processos")
+        print(f"Paralela:   {trilha.progresso(paralela):.10f}")
+        print(f"Sequencial: {trilha.progresso(MediaSimplesEstrategia()):.10f}")
+        print(f"Partes calculadas no pool: {len(paralela.trabalhadores_utilizados)}")
+
+
+if __name__ == "__main__":
+    testar_estrategia_paralela()
+    testar_limite_serial()
+
+"""
+Mostra:
+- MediaParalelaEstrategia usada como qualquer outra EstrategiaProgresso (trilha.progresso);
+- mesmo resultado das estratégias sequenciais (a menos de arredondamento do float);
+- execução sequencial automática para trilhas pequenas (abaixo do limite padrão);
+- com processos, cada trabalhador recebe a sua parte dos cursos serializada e calcula
+  o progresso dela (trabalhadores_utilizados mostra que o cálculo saiu do processo principal).
+"""
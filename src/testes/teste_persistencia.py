@@ -0,0 +1,87 @@
+import io
+from datetime import datetime, timedelta
+from model.TarefaLeitura import TarefaLeitura
+from model.TarefaQuiz import TarefaQuiz
+from model.TarefaComPrazo import TarefaComPrazo
+from model.SerializadorTrilha import SerializadorTrilha
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from testes.teste_aula_curso_trilha import montar_trilha_exemplo
+
+
+def montar_trilha_com_prazo():
+    """Trilha de exemplo + uma tarefa com prazo já vencido e concluída com atraso."""
+    trilha = montar_trilha_exemplo()
+
+    tarefa_atrasada = TarefaComPrazo(
+        TarefaLeitura("Artigo Decorator", total_paginas=10, paginas_lidas=10),
+        prazo=datetime.now() - timedelta(days=1),
+        penalidade=0.5,
+    )
+    tarefa_atrasada.concluir()
+    trilha.cursos[1].aulas[0].adicionar_tarefa(tarefa_atrasada)
+
+    return trilha
+
+
+def testar_salvar_e_carregar():
+    print("\n=== PERSISTÊNCIA EM JSON LINES ===")
+    trilha = montar_trilha_com_prazo()
+
+    arquivo = io.StringIO()
+    SerializadorTrilha.salvar(trilha, arquivo)
+
+    conteudo = arquivo.getvalue()
+    print(f"Linhas gravadas: {len(conteudo.splitlines())}")
+    print(conteudo.splitlines()[-1])
+
+    # carregar() lê linha a linha; aqui as linhas vêm de um StringIO.
+    arquivo.seek(0)
+    trilha_carregada = SerializadorTrilha.carregar(arquivo)
+
+    print()
+    print(trilha_carregada)
+    for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia()):
+        original = trilha.progresso(estrategia)
+        carregado = trilha_carregada.progresso(estrategia)
+        print(f"{estrategia.__class__.__name__}: original {original:.4f} | carregado {carregado:.4f}")
+
+    # Salvar novamente a trilha carregada gera exatamente o mesmo conteúdo.
+    arquivo_novo = io.StringIO()
+    SerializadorTrilha.salvar(trilha_carregada, arquivo_novo)
+    print(f"Conteúdo idêntico ao salvar de novo: {arquivo_novo.getvalue() == conteudo}")
+
+
+def testar_tarefas_com_mesma_chave():
+    print("\n=== TAREFAS COM A MESMA CHAVE (RENOMEAÇÃO) ===")
+    trilha = montar_trilha_exemplo()
+    aula = trilha.cursos[0].aulas[0]
+
+    # A TarefaFactory usa títulos padrão ("Quiz"): a segunda tarefa igual sem data é recusada.
+    aula.adicionar_tarefa(TarefaQuiz("Quiz", nota=9))
+    try:
+        aula.adicionar_tarefa(TarefaQuiz("Quiz", nota=3))
+    except ValueError as erro:
+        print(f"Segundo 'Quiz' sem data: {erro}")
+
+    # Renomear uma tarefa para a chave de outra mantém as duas na aula, e elas sobrevivem
+    # a salvar e carregar.
+    aula.buscar_tarefa("Quiz POO básico").titulo = "Quiz"
+    arquivo = io.StringIO()
+    SerializadorTrilha.salvar(trilha, arquivo)
+    arquivo.seek(0)
+    aula_carregada = SerializadorTrilha.carregar(arquivo).cursos[0].aulas[0]
+    print(f"Tarefas na aula: original {len(aula.tarefas)} | carregada {len(aula_carregada.tarefas)}")
+    print(f"Progresso: original {aula.progresso():.4f} | carregada {aula_carregada.progresso():.4f}")
+
+
+if __name__ == "__main__":
+    testar_salvar_e_carregar()
+    testar_tarefas_com_mesma_chave()
+
+"""
+Mostra:
+- gravação de uma trilha (cursos, aulas, tarefas e TarefaComPrazo) em JSON Lines;
+- reconstrução da trilha pela TarefaFactory, com o mesmo progresso da original;
+- tarefas com a mesma chave (renomeadas) salvas e carregadas sem perda.
+"""
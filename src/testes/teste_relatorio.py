@@ -0,0 +1,152 @@
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from model.RelatorioTrilha import RelatorioTrilha
+from model.RelatorioLinhas import RelatorioLinhas
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.StatusTarefa import StatusTarefa
+from testes.benchmark_modelo import gerar_trilha
+
+
+def relatorio_ingenuo(trilha, estrategia, recuo="  "):
+    """Mesmo texto montado do jeito direto: exibir_dados() de tudo e um join no final."""
+    def recuar(texto, nivel):
+        return "\n".join(recuo * nivel + linha for linha in texto.split("\n"))
+
+    blocos = [trilha.exibir_dados(estrategia)]
+    for curso in trilha.cursos:
+        blocos.append(recuar(curso.exibir_dados(), 1))
+        for aula in curso.aulas:
+            blocos.append(recuar(aula.exibir_dados(), 2))
+            for tarefa in aula.tarefas:
+                blocos.append(recuar(tarefa.exibir_dados(), 3))
+    return "\n\n".join(blocos) + "\n"
+
+
+def testar_relatorio_pequeno():
+    print("\n=== RELATÓRIO DE UMA TRILHA PEQUENA (direto no console) ===")
+    trilha = gerar_trilha(1, 1, 3, fracao_prazo=0.5)
+    with RelatorioTrilha(trilha, MediaSimplesEstrategia()) as relatorio:
+        relatorio.escrever(sys.stdout)
+
+
+def testar_relatorio_com_cache():
+    print("\n=== RELATÓRIO COM CACHE (20 cursos x 10 aulas x 25 tarefas) ===")
+    estrategia = MediaSimplesEstrategia()
+    trilha = gerar_trilha(20, 10, 25)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+
+    inicio = time.perf_counter()
+    esperado = relatorio_ingenuo(trilha, estrategia)
+    tempo_ingenuo = time.perf_counter() - inicio
+
+    relatorio = RelatorioTrilha(trilha, estrategia)
+    inicio = time.perf_counter()
+    primeiro = relatorio.texto()
+    tempo_primeiro = time.perf_counter() - inicio
+    print(f"Primeiro relatório igual ao exibir_dados de cada nó: {primeiro == esperado}")
+
+    # 1% das tarefas muda entre um relatório e o seguinte.
+    for tarefa in tarefas[::100]:
+        tarefa.descricao = "Revisar antes da prova"
+        tarefa.concluir()
+
+    pasta = tempfile.mkdtemp()
+    caminho = os.path.join(pasta, "relatorio.txt")
+    inicio = time.perf_counter()
+    relatorio.escrever(caminho)
+    tempo_segundo = time.perf_counter() - inicio
+
+    with open(caminho, encoding="utf-8") as arquivo:
+        print(f"Relatório após alterações igual ao caminho direto: {arquivo.read() == relatorio_ingenuo(trilha, estrategia)}")
+    print(f"Textos de tarefas: {relatorio.estatisticas}")
+    print(f"Caminho direto:            {tempo_ingenuo * 1000:7.1f} ms")
+    print(f"Relatório (cache vazio):   {tempo_primeiro * 1000:7.1f} ms")
+    print(f"Relatório (1% alterado):   {tempo_segundo * 1000:7.1f} ms (arquivo {os.path.getsize(caminho) // 1024} KiB)")
+    os.remove(caminho)
+    os.rmdir(pasta)
+
+    # Tarefa removida sai do cache e deixa de ser observada.
+    aula = trilha.cursos[0].aulas[0]
+    removida = aula.tarefas[0]
+    aula.remover_tarefa(removida)
+    relatorio.escrever(io.StringIO())
+    print(f"Tarefa removida ainda tem observadores: {removida.possui_observadores}")
+    relatorio.fechar()
+
+
+def testar_linhas_formatos():
+    print("\n=== LINHAS DO RELATÓRIO EM CSV, JSON E MARKDOWN ===")
+    trilha = gerar_trilha(1, 1, 3, fracao_prazo=0.5)
+    trilha.cursos[0].aulas[0].tarefas[1].concluir()
+
+    for nome, escrever in (
+        ("CSV", RelatorioLinhas.escrever_csv),
+        ("JSON", RelatorioLinhas.escrever_json),
+        ("Markdown", RelatorioLinhas.escrever_markdown),
+    ):
+        print(f"\n--- {nome} ---")
+        escrever(trilha, sys.stdout)
+
+
+def coorte(quantidade, cursos=20, aulas=10, tarefas=25):
+    """Gera as trilhas de uma coorte uma de cada vez (só uma fica em memória)."""
+    for numero in range(quantidade):
+        trilha = gerar_trilha(cursos, aulas, tarefas, semente=numero)
+        trilha.nome = f"Aluno {numero:03d}"
+        yield trilha
+
+
+def testar_linhas_coorte():
+    print("\n=== COORTE EM CSV COM MEMÓRIA LIMITADA ===")
+    # As médias calculadas na mesma passada conferem com o progresso de cada nó.
+    trilha = gerar_trilha(20, 10, 25)
+    valores = {caminho: progresso for caminho, nivel, _, _, progresso, _, _ in RelatorioLinhas.linhas(trilha) if nivel != "tarefa"}
+    confere = abs(valores[trilha.nome] - trilha.progresso(MediaSimplesEstrategia())) < 1e-9 and all(
+        abs(valores[f"{trilha.nome}/{curso.titulo}/{aula.titulo}"] - aula.progresso()) < 1e-9
+        and abs(valores[f"{trilha.nome}/{curso.titulo}"] - curso.progresso()) < 1e-9
+        for curso in trilha.cursos for aula in curso.aulas
+    )
+    print(f"Médias de aulas, cursos e trilha iguais ao progresso(): {confere}")
+
+    pendentes = sum(
+        1 for _, nivel, _, status, _, _, _ in RelatorioLinhas.linhas(trilha)
+        if nivel == "tarefa" and status != StatusTarefa.CONCLUIDA
+    )
+    print(f"Tarefas pendentes (filtro direto no gerador): {pendentes}")
+
+    pasta = tempfile.mkdtemp()
+    caminho = os.path.join(pasta, "coorte.csv")
+    for alunos in (5, 20):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        quantidade = RelatorioLinhas.escrever_csv(coorte(alunos), caminho)
+        tempo = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{alunos:3d} alunos: {quantidade} linhas, {os.path.getsize(caminho) // 1024} KiB em {tempo:.1f}s "
+            f"| pico de memória: {pico / 2**20:.1f} MiB"
+        )
+    os.remove(caminho)
+    os.rmdir(pasta)
+
+
+if __name__ == "__main__":
+    testar_relatorio_pequeno()
+    testar_relatorio_com_cache()
+    testar_linhas_formatos()
+    testar_linhas_coorte()
+
+"""
+Mostra:
+- RelatorioTrilha escrevendo a trilha inteira direto no console e em arquivo;
+- o texto igual ao exibir_dados() de cada trilha/curso/aula/tarefa, recuado por nível;
+- o reaproveitamento do texto das tarefas que não mudaram entre dois relatórios;
+- RelatorioLinhas: uma linha por tarefa (mais resumos de aula, curso e trilha calculados
+  na mesma passada) em CSV, JSON e Markdown;
+- uma coorte gerada aos poucos escrita em CSV com o pico de memória de uma trilha só.
+"""
@@ -0,0 +1,139 @@
+import random
+import time
+from datetime import datetime, timedelta
+from model.Aula import Aula
+from model.Curso import Curso
+from model.HistoricoProgresso import HistoricoProgresso
+from model.SerieTemporalProgresso import SerieTemporalProgresso
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.TarefaLeitura import TarefaLeitura
+from testes.benchmark_modelo import gerar_trilha
+from testes.teste_historico import Relogio, estudar
+
+
+def simular_dias(trilha, relogio, inicio, dias, alteracoes_por_dia, semente=11):
+    """
+    Estuda durante "dias" dias (alterações entre 8h e 20h) e devolve, para cada dia,
+    o progresso medido ao vivo às 23h: (dia, simples, ponderada, {curso: progresso}).
+    """
+    gerador = random.Random(semente)
+    tarefas = [tarefa for curso in trilha.cursos for aula in curso.aulas for tarefa in aula.tarefas]
+    medidos = []
+    for dia in range(dias):
+        for alteracao in range(alteracoes_por_dia):
+            segundos = 8 * 3600 + alteracao * (12 * 3600 // alteracoes_por_dia)
+            relogio.agora = inicio + timedelta(days=dia, seconds=segundos)
+            estudar(gerador.choice(tarefas), gerador)
+        relogio.agora = inicio + timedelta(days=dia, hours=23)
+        medidos.append((
+            (inicio + timedelta(days=dia)).date(),
+            trilha.progresso(MediaSimplesEstrategia()),
+            trilha.progresso(MediaPonderadaPorCargaEstrategia()),
+            {curso.titulo: curso.progresso() for curso in trilha.cursos},
+        ))
+    return medidos
+
+
+def testar_periodos_por_dia_e_hora():
+    print("\n=== PROGRESSO POR DIA E POR HORA (atualizado a cada alteração) ===")
+    inicio = datetime(2025, 3, 3)
+    relogio = Relogio(inicio)
+    trilha = gerar_trilha(6, 4, 10, fracao_prazo=0.3)
+    serie = SerieTemporalProgresso(trilha, relogio=relogio)
+
+    medidos = simular_dias(trilha, relogio, inicio, dias=14, alteracoes_por_dia=120)
+
+    print("Dia        | abertura | fechamento | mínimo | máximo  (média simples)")
+    for dia, abertura, fechamento, minimo, maximo in serie.por_dia()[:5]:
+        print(f"{dia:%d-%m-%Y} | {abertura * 100:7.2f}% | {fechamento * 100:9.2f}% | "
+              f"{minimo * 100:5.1f}% | {maximo * 100:5.1f}%")
+
+    por_dia = serie.por_dia()
+    por_dia_ponderada = serie.por_dia(estrategia=MediaPonderadaPorCargaEstrategia())
+    iguais = all(
+        abs(linha[2] - simples) < 1e-9 and abs(linha_ponderada[2] - ponderada) < 1e-9
+        for (_, simples, ponderada, _), linha, linha_ponderada in zip(medidos, por_dia, por_dia_ponderada)
+    )
+    print(f"Fechamento de cada dia igual ao progresso medido às 23h (simples e ponderada): {iguais}")
+
+    cursos_iguais = all(
+        abs(serie.por_dia(dia, dia, curso=titulo)[0][2] - valor) < 1e-12
+        for dia, _, _, cursos in medidos for titulo, valor in cursos.items()
+    )
+    print(f"Fechamento diário de cada curso igual ao curso.progresso(): {cursos_iguais}")
+
+    dia = medidos[2][0]
+    horas = serie.por_hora(datetime(dia.year, dia.month, dia.day, 7), datetime(dia.year, dia.month, dia.day, 21))
+    print(f"Horas de {dia:%d-%m-%Y} (7h às 21h): {len(horas)} períodos; "
+          f"7h repete o fechamento da véspera: {horas[0][2] == por_dia[1][2]}")
+
+    # Dias sem estudo repetem o fechamento do último dia com alterações.
+    relogio.agora = inicio + timedelta(days=20)
+    ultimos = serie.por_dia(inicio + timedelta(days=13))
+    print(f"Dias até hoje sem alteração: {len(ultimos) - 1} | valores repetidos: "
+          f"{all(linha[1:] == (ultimos[0][2],) * 4 for linha in ultimos[1:])}")
+
+    # Curso novo: entra em sincronizar().
+    curso_novo = Curso("Curso Extra", carga_horas=80)
+    aula_nova = Aula("Aula Extra")
+    aula_nova.adicionar_tarefa(TarefaLeitura("Leitura extra", total_paginas=10, paginas_lidas=10))
+    curso_novo.adicionar_aula(aula_nova)
+    trilha.adicionar_curso(curso_novo)
+    print(f"sincronizar(): {serie.sincronizar()} curso(s) incluído(s)")
+    print(f"Progresso atual igual à trilha (simples / ponderada): "
+          f"{abs(serie.progresso_atual() - trilha.progresso(MediaSimplesEstrategia())) < 1e-12} / "
+          f"{abs(serie.progresso_atual(estrategia=MediaPonderadaPorCargaEstrategia()) - trilha.progresso(MediaPonderadaPorCargaEstrategia())) < 1e-12}")
+    print(f"Curso novo aparece só a partir de hoje: {[linha[0].day for linha in serie.por_dia(curso='Curso Extra')]}")
+    print(f"Estatísticas: {serie.estatisticas}")
+    serie.fechar()
+
+
+def testar_painel_do_mes():
+    print("\n=== PAINEL DE 30 DIAS: SÉRIE PRONTA x RECONSTRUÇÃO PELO HISTÓRICO ===")
+    inicio = datetime(2025, 4, 1)
+    relogio = Relogio(inicio)
+    trilha = gerar_trilha(20, 10, 25, fracao_prazo=0.2)
+    historico = HistoricoProgresso(trilha, relogio=relogio)
+    serie = SerieTemporalProgresso(trilha, relogio=relogio)
+
+    inicio_escrita = time.perf_counter()
+    simular_dias(trilha, relogio, inicio, dias=30, alteracoes_por_dia=500)
+    tempo_escrita = time.perf_counter() - inicio_escrita
+
+    fins_de_dia = [inicio + timedelta(days=dia, hours=23, minutes=59) for dia in range(30)]
+
+    inicio_consulta = time.perf_counter()
+    reconstruido = historico.serie(fins_de_dia)
+    cursos_reconstruidos = [historico.progresso_cursos_em(momento) for momento in fins_de_dia]
+    tempo_historico = time.perf_counter() - inicio_consulta
+
+    inicio_consulta = time.perf_counter()
+    diario = serie.por_dia(inicio, fins_de_dia[-1])
+    cursos_diarios = {curso.titulo: serie.por_dia(inicio, fins_de_dia[-1], curso=curso) for curso in trilha.cursos}
+    tempo_serie = time.perf_counter() - inicio_consulta
+
+    iguais = all(abs(linha[2] - valor) < 1e-9 for linha, valor in zip(diario, reconstruido)) and all(
+        abs(cursos_diarios[titulo][dia][2] - valor) < 1e-9
+        for dia, cursos in enumerate(cursos_reconstruidos) for titulo, valor in cursos.items()
+    )
+    print(f"15 mil alterações em 30 dias (histórico + série ligados): {tempo_escrita:.2f}s")
+    print(f"Trilha + 20 cursos, 30 dias, reconstruindo pelo histórico: {tempo_historico * 1000:8.1f} ms")
+    print(f"Trilha + 20 cursos, 30 dias, lidos da série:               {tempo_serie * 1000:8.1f} ms")
+    print(f"Mesmos valores: {iguais}")
+    historico.fechar()
+    serie.fechar()
+
+
+if __name__ == "__main__":
+    testar_periodos_por_dia_e_hora()
+    testar_painel_do_mes()
+
+"""
+Mostra:
+- SerieTemporalProgresso guardando, para cada dia e cada hora, abertura, fechamento, mínimo e
+  máximo do progresso da trilha (média simples e ponderada) e de cada curso;
+- o fechamento de cada dia igual ao progresso medido naquele dia;
+- dias sem alteração repetindo o fechamento anterior, e cursos novos entrando com sincronizar();
+- um painel de 30 dias lido direto da série, comparado a reconstruir cada dia pelo HistoricoProgresso.
+"""
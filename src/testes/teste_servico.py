@@ -0,0 +1,231 @@
+import asyncio
+import json
+import logging
+import time
+from model.EstrategiaProgresso import EstrategiaProgresso
+from model.RegistroEstrategias import RegistroEstrategias
+from model.ServicoProgresso import ServicoProgresso
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from testes.benchmark_modelo import gerar_trilha
+
+
+def alterar_todas_as_tarefas(trilha):
+    """Muda todas as tarefas, obrigando o próximo progresso a recalcular a trilha inteira."""
+    for curso in trilha.cursos:
+        for aula in curso.aulas:
+            for tarefa in aula.tarefas:
+                tarefa.descricao = "revisada"
+                if hasattr(tarefa, "nota"):
+                    tarefa.nota = 10
+
+
+class EstrategiaComDefeito(EstrategiaProgresso):
+    """Estratégia que sempre falha, para ver a resposta 500 do endpoint."""
+
+    def calcular(self, trilha):
+        return 1 / 0
+
+
+class EstrategiaComChaveInexistente(EstrategiaProgresso):
+    """Estratégia com um KeyError interno: é erro do cálculo (500), não "não encontrado"."""
+
+    def calcular(self, trilha):
+        return {}["curso"]
+
+
+class GuardarRegistros(logging.Handler):
+    """Guarda as mensagens de log em uma lista (em vez de imprimir o traceback)."""
+
+    def __init__(self):
+        super().__init__()
+        self.mensagens = []
+
+    def emit(self, registro):
+        self.mensagens.append(registro.getMessage())
+
+
+async def testar_agrupamento():
+    print("\n=== PEDIDOS SIMULTÂNEOS AGRUPADOS ===")
+    trilha = gerar_trilha(20, 10, 25)
+
+    async with ServicoProgresso([trilha]) as servico:
+        pedidos = [servico.progresso(trilha.nome) for _ in range(100)]
+        pedidos += [servico.progresso(trilha.nome, "ponderada") for _ in range(100)]
+        resultados = await asyncio.gather(*pedidos)
+
+        print(f"Estatísticas: {servico.estatisticas}")
+        print(f"Simples igual ao síncrono: {resultados[0] == trilha.progresso(MediaSimplesEstrategia())}")
+        print(
+            "Ponderada igual ao síncrono: "
+            f"{resultados[-1] == trilha.progresso(MediaPonderadaPorCargaEstrategia())}"
+        )
+
+        # Alterações pela thread do modelo; o pedido seguinte já enxerga o novo valor.
+        await servico.alterar(trilha.nome, alterar_todas_as_tarefas)
+        print(f"Após alterar(): {await servico.progresso(trilha.nome):.4f}")
+
+
+async def medir_maior_pausa(trabalho):
+    """Maior intervalo entre batidas de 1 ms do event loop enquanto trabalho() roda."""
+    maior_pausa = 0.0
+    terminou = False
+
+    async def batimento():
+        nonlocal maior_pausa
+        anterior = time.perf_counter()
+        while not terminou:
+            await asyncio.sleep(0.001)
+            agora = time.perf_counter()
+            maior_pausa = max(maior_pausa, agora - anterior)
+            anterior = agora
+
+    tarefa_batimento = asyncio.create_task(batimento())
+    await asyncio.sleep(0.01)
+    await trabalho()
+    terminou = True
+    await tarefa_batimento
+    return maior_pausa
+
+
+async def testar_event_loop_livre():
+    print("\n=== EVENT LOOP LIVRE DURANTE O RECÁLCULO (40 mil tarefas alteradas) ===")
+    trilha = gerar_trilha(100, 10, 40)
+
+    async with ServicoProgresso([trilha]) as servico:
+        async def direto_no_loop():
+            alterar_todas_as_tarefas(trilha)
+            trilha.progresso(MediaSimplesEstrategia())
+
+        async def pelo_servico():
+            await servico.alterar(trilha.nome, alterar_todas_as_tarefas)
+            await servico.progresso(trilha.nome)
+
+        pausa_direto = await medir_maior_pausa(direto_no_loop)
+        pausa_servico = await medir_maior_pausa(pelo_servico)
+
+    print(f"Maior pausa do loop calculando direto: {pausa_direto * 1000:.1f} ms")
+    print(f"Maior pausa do loop com o serviço:     {pausa_servico * 1000:.1f} ms")
+
+
+async def pedir(leitor, escritor, caminho, metodo="GET", corpo=b""):
+    cabecalho = f"{metodo} {caminho} HTTP/1.1\r\nHost: localhost\r\n"
+    if corpo:
+        cabecalho += f"Content-Length: {len(corpo)}\r\n"
+    escritor.write(cabecalho.encode("latin-1") + b"\r\n" + corpo)
+    await escritor.drain()
+
+    linha_status = await leitor.readline()
+    tamanho = 0
+    while True:
+        linha = await leitor.readline()
+        if linha in (b"\r\n", b""):
+            break
+        nome, _, valor = linha.decode("latin-1").partition(":")
+        if nome.lower() == "content-length":
+            tamanho = int(valor)
+
+    corpo = await leitor.readexactly(tamanho)
+    return int(linha_status.split()[1]), json.loads(corpo)
+
+
+async def testar_http():
+    print("\n=== ENDPOINT HTTP/JSON (200 conexões x 10 pedidos) ===")
+    trilha = gerar_trilha(20, 10, 25)
+
+    estrategias = dict(
+        RegistroEstrategias.todas(),
+        com_defeito=EstrategiaComDefeito(),
+        chave_inexistente=EstrategiaComChaveInexistente(),
+    )
+    log = logging.getLogger("model.ServicoProgresso")
+    guardar = GuardarRegistros()
+    log.addHandler(guardar)
+    log.propagate = False
+
+    async with ServicoProgresso([trilha], estrategias) as servico:
+        servidor = await servico.servir(porta=0)
+        porta = servidor.sockets[0].getsockname()[1]
+        caminho = f"/trilhas/{trilha.nome.replace(' ', '%20')}/progresso?estrategia=ponderada"
+
+        async def cliente():
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            respostas = [await pedir(leitor, escritor, caminho) for _ in range(10)]
+            escritor.close()
+            await escritor.wait_closed()
+            return respostas
+
+        async with servidor:
+            inicio = time.perf_counter()
+            respostas = [r for lista in await asyncio.gather(*(cliente() for _ in range(200))) for r in lista]
+            tempo = time.perf_counter() - inicio
+
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            print(f"GET /trilhas -> {await pedir(leitor, escritor, '/trilhas')}")
+            print(f"GET /trilhas/Inexistente/progresso -> {await pedir(leitor, escritor, '/trilhas/Inexistente/progresso')}")
+            print(f"GET /estatisticas -> {await pedir(leitor, escritor, '/estatisticas')}")
+            # Erro dentro da estratégia: resposta 500 em JSON e a conexão continua aberta.
+            com_defeito = caminho.replace("ponderada", "com_defeito")
+            print(f"GET ...?estrategia=com_defeito -> {await pedir(leitor, escritor, com_defeito)}")
+            print(f"Mesma conexão depois do erro -> {(await pedir(leitor, escritor, caminho))[0]} | "
+                  f"log: {guardar.mensagens}")
+            # KeyError dentro da estratégia: 500 (só trilha e estratégia inexistentes são 404).
+            chave_inexistente = caminho.replace("ponderada", "chave_inexistente")
+            print(f"GET ...?estrategia=chave_inexistente -> {await pedir(leitor, escritor, chave_inexistente)}")
+            print(f"GET ...?estrategia=nenhuma -> {await pedir(leitor, escritor, caminho.replace('ponderada', 'nenhuma'))}")
+            # O corpo de um pedido é lido e descartado: o pedido seguinte da conexão não se perde.
+            corpo = json.dumps({"nota": 10}).encode("utf-8")
+            print(f"POST com corpo -> {await pedir(leitor, escritor, caminho, 'POST', corpo)}")
+            print(f"GET depois do POST -> {(await pedir(leitor, escritor, caminho))[0]}")
+            escritor.close()
+            await escritor.wait_closed()
+
+            # Linha maior que o limite do StreamReader (64 KiB): 400 e a conexão é fechada.
+            leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            print(f"Linha de 100 KiB -> {await pedir(leitor, escritor, '/' + 'x' * 100_000)}")
+            print(f"Conexão fechada pelo servidor: {await leitor.read() == b''}")
+            escritor.close()
+
+    esperado = trilha.progresso(MediaPonderadaPorCargaEstrategia())
+    print(f"Respostas: {len(respostas)} | todas 200 e corretas: "
+          f"{all(codigo == 200 and corpo['progresso'] == esperado for codigo, corpo in respostas)}")
+    print(f"Vazão: {len(respostas) / tempo:.0f} pedidos/s")
+
+
+async def testar_estrategias_por_pedido():
+    print("\n=== ESTRATÉGIAS PROCURADAS A CADA PEDIDO ===")
+    trilha = gerar_trilha(2, 2, 5)
+
+    # Dicionário vazio: nenhuma estratégia (não vira o registro inteiro).
+    async with ServicoProgresso([trilha], {}) as servico:
+        try:
+            await servico.progresso(trilha.nome)
+        except KeyError as erro:
+            print(f"Serviço com estrategias={{}}: KeyError {erro}")
+
+    # Sem estrategias, o registro é consultado a cada pedido.
+    async with ServicoProgresso([trilha]) as servico:
+        RegistroEstrategias.registrar("simples_nova", MediaSimplesEstrategia())
+        try:
+            valor = await servico.progresso(trilha.nome, "simples_nova")
+            print(f"Registrada depois da criação do serviço: {valor == trilha.progresso(MediaSimplesEstrategia())}")
+        finally:
+            RegistroEstrategias.remover("simples_nova")
+
+
+if __name__ == "__main__":
+    asyncio.run(testar_agrupamento())
+    asyncio.run(testar_event_loop_livre())
+    asyncio.run(testar_estrategias_por_pedido())
+    asyncio.run(testar_http())
+
+"""
+Mostra:
+- ServicoProgresso agrupando 200 pedidos simultâneos em um cálculo por estratégia;
+- alterações pela thread do modelo com alterar();
+- o event loop continuando a responder enquanto o recálculo roda no executor;
+- o endpoint HTTP/JSON local atendendo várias conexões keep-alive;
+- um erro dentro de uma estratégia virando resposta 500 (registrada no log), sem derrubar a conexão;
+- 404 só para trilha ou estratégia inexistente, corpo de pedido descartado e linha longa demais (400);
+- estratégias procuradas no RegistroEstrategias a cada pedido.
+"""
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from model.Aula import Aula
+from model.Curso import Curso
+from model.Trilha import Trilha
+from model.TarefaQuiz import TarefaQuiz
+from model.TarefaComPrazo import TarefaComPrazo
+from model.SnapshotTrilha import SnapshotTrilha
+from model.MediaSimplesEstrategia import MediaSimplesEstrategia
+from model.MediaPonderadaPorCargaEstrategia import MediaPonderadaPorCargaEstrategia
+from model.EstrategiaPorNiveis import EstrategiaPorNiveis
+from model.SerializadorTrilha import SerializadorTrilha
+from testes.teste_colunar import montar_trilha_aleatoria
+
+
+def testar_snapshot():
+    print("\n=== SNAPSHOT BINÁRIO COM MMAP ===")
+    trilha = montar_trilha_aleatoria(cursos=20, aulas=10, tarefas=25)
+
+    pasta = tempfile.mkdtemp()
+    caminho = os.path.join(pasta, "trilha.snap")
+    SnapshotTrilha.salvar(trilha, caminho)
+    print(f"Tamanho do arquivo: {os.path.getsize(caminho)} bytes")
+
+    with SnapshotTrilha.abrir(caminho) as snapshot:
+        print(snapshot)
+
+        # Progresso calculado direto dos registros, sem criar as tarefas.
+        for estrategia in (MediaSimplesEstrategia(), MediaPonderadaPorCargaEstrategia()):
+            original = trilha.progresso(estrategia)
+            lido = snapshot.progresso(estrategia)
+            print(f"{estrategia.__class__.__name__}: {original:.6f} | snapshot {lido:.6f} | igual: {original == lido}")
+
+        # Outras estratégias recebem a trilha materializada (calcular).
+        gargalo = EstrategiaPorNiveis("gargalo", combinar_aulas=EstrategiaPorNiveis.minimo)
+        print(f"EstrategiaPorNiveis (gargalo): {trilha.progresso(gargalo):.6f} | "
+              f"snapshot {snapshot.progresso(gargalo):.6f}")
+
+        # Criação sob demanda de uma única tarefa.
+        tarefa = snapshot.tarefa(7)
+        print(f"\nTarefa 7 (criada sob demanda): {tarefa}")
+        print(f"Progresso: {tarefa.progresso():.4f} | snapshot: {snapshot.progresso_tarefa(7):.4f}")
+
+        # A trilha materializada é idêntica à original.
+        trilha_materializada = snapshot.materializar()
+        iguais = list(SerializadorTrilha.registros(trilha)) == list(
+            SerializadorTrilha.registros(trilha_materializada)
+        )
+        print(f"Trilha materializada igual à original: {iguais}")
+
+    os.remove(caminho)
+    os.rmdir(pasta)
+
+
+def testar_datas_com_fuso():
+    print("\n=== SNAPSHOT COM DATAS COM FUSO ===")
+    fuso_brasilia = timezone(timedelta(hours=-3))
+    realizacao = datetime(2024, 6, 1, 9, 30, tzinfo=fuso_brasilia)
+    prazo = datetime(2024, 6, 2, 23, 59, tzinfo=fuso_brasilia)
+
+    aula = Aula("Aula com fuso")
+    aula.adicionar_tarefa(TarefaComPrazo(TarefaQuiz("Quiz", nota=8, data_realizacao=realizacao), prazo=prazo))
+    curso = Curso("Curso com fuso")
+    curso.adicionar_aula(aula)
+    trilha = Trilha("Trilha com fuso")
+    trilha.adicionar_curso(curso)
+
+    pasta = tempfile.mkdtemp()
+    caminho = os.path.join(pasta, "fuso.snap")
+    SnapshotTrilha.salvar(trilha, caminho)
+    with SnapshotTrilha.abrir(caminho) as snapshot:
+        # As datas voltam sem fuso, já convertidas para UTC.
+        tarefa = snapshot.tarefa(0)
+        print(f"Prazo gravado: {prazo.isoformat()} -> lido: {tarefa.prazo.isoformat()} (UTC)")
+        print(f"Mesmo instante: {tarefa.prazo.replace(tzinfo=timezone.utc) == prazo}")
+        print(f"Realização: {tarefa.tarefa_base.data_realizacao.isoformat()}")
+
+    os.remove(caminho)
+    os.rmdir(pasta)
+
+
+def testar_tempo_abertura():
+    print("\n=== TEMPO DE ABERTURA (100 cursos x 20 aulas x 50 tarefas) ===")
+    trilha = montar_trilha_aleatoria(cursos=100, aulas=20, tarefas=50)
+    pasta = tempfile.mkdtemp()
+    caminho_snapshot = os.path.join(pasta, "trilha.snap")
+    caminho_jsonl = os.path.join(pasta, "trilha.jsonl")
+    SnapshotTrilha.salvar(trilha, caminho_snapshot)
+    SerializadorTrilha.salvar(trilha, caminho_jsonl)
+    estrategia = MediaSimplesEstrategia()
+
+    inicio = time.perf_counter()
+    SerializadorTrilha.carregar(caminho_jsonl).progresso(estrategia)
+    tempo_jsonl = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    with SnapshotTrilha.abrir(caminho_snapshot) as snapshot:
+        snapshot.progresso(estrategia)
+    tempo_snapshot = time.perf_counter() - inicio
+
+    print(f"JSON Lines (carregar + progresso): {tempo_jsonl * 1000:.0f} ms")
+    print(f"Snapshot   (abrir + progresso):    {tempo_snapshot * 1000:.0f} ms")
+
+    os.remove(caminho_snapshot)
+    os.remove(caminho_jsonl)
+    os.rmdir(pasta)
+
+
+if __name__ == "__main__":
+    testar_snapshot()
+    testar_datas_com_fuso()
+    testar_tempo_abertura()
+
+"""
+Mostra:
+- gravação de uma trilha em formato binário e abertura com mmap;
+- cálculo do progresso sem criar os objetos de tarefa;
+- criação sob demanda de tarefas individuais e da trilha completa;
+- datas com fuso gravadas em UTC (sem o TypeError da subtração pela época sem fuso).
+"""